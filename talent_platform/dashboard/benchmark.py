@@ -0,0 +1,361 @@
+"""
+End-to-end benchmark of the dashboard endpoints (see the benchmark_endpoints
+command).
+
+seed_dataset() creates a synthetic dataset through the ORM, so the signals
+maintaining stored scores, search documents and score buckets run as they do
+in production. run_scenario() resolves a scenario's URL and calls the real
+view with an authenticated dashboard admin: filters, relevance scoring,
+serialization, sharing lookups and rendering are all included. Rate limiting
+is left out so repeated requests aren't throttled.
+
+Each measured request records wall time and, through
+dashboard.metrics.collect_request_metrics(), query count, database time,
+serializer time and cache hits/misses. Queries run by other threads (the
+concurrent multi-type search) aren't counted.
+"""
+import json
+import math
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import date
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.urls import resolve, reverse
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from users.models import BaseUser
+from profiles.models import (
+    ITEM_MODELS, TalentUserProfile, TalentMedia, VisualWorker, ExpressiveWorker, HybridWorker,
+    BackGroundJobsProfile, Band, BandMembership
+)
+
+from .metrics import collect_request_metrics
+from .models import SharedMediaPost
+
+BENCHMARK_ADMIN_EMAIL = 'benchmark_admin@example.com'
+
+LOCATIONS = [('Dubai', 'ae'), ('Riyadh', 'sa'), ('Cairo', 'eg'), ('Amman', 'jo'), ('Doha', 'qa'), ('Beirut', 'lb')]
+
+# Extra fields of each item type
+ITEM_FIELDS = {
+    'props': lambda rng: {'material': rng.choice(['wood', 'steel', 'plastic'])},
+    'costumes': lambda rng: {'era': rng.choice(['medieval', 'victorian', 'modern']), 'size': rng.choice('SML')},
+    'locations': lambda rng: {'address': f'{rng.randint(1, 200)} Main Street', 'capacity': rng.randint(10, 500)},
+    'memorabilia': lambda rng: {'signed_by': rng.choice(['Messi', 'Fairuz', 'Umm Kulthum'])},
+    'vehicles': lambda rng: {'make': rng.choice(['Ford', 'Toyota', 'Mercedes']), 'year': rng.randint(1950, 2024)},
+    'artistic_materials': lambda rng: {'type': rng.choice(['paint', 'canvas', 'clay'])},
+    'music_items': lambda rng: {'instrument_type': rng.choice(['oud', 'guitar', 'piano'])},
+    'rare_items': lambda rng: {'is_one_of_a_kind': rng.random() < 0.3},
+}
+
+
+def choices(model, field_name):
+    return [value for value, _ in model._meta.get_field(field_name).choices]
+
+
+def get_benchmark_admin():
+    return BaseUser.objects.get(email=BENCHMARK_ADMIN_EMAIL)
+
+
+def dataset_summary():
+    """Row counts of the seeded tables"""
+    return {
+        'talents': TalentUserProfile.objects.count(),
+        'media': TalentMedia.objects.count(),
+        'shared_media': SharedMediaPost.objects.count(),
+        'bands': Band.objects.count(),
+        'backgrounds': BackGroundJobsProfile.objects.count(),
+        'items': sum(model.objects.count() for model in ITEM_MODELS.values()),
+    }
+
+
+@transaction.atomic
+def seed_dataset(talents=200, media_per_talent=3, bands=20, backgrounds=20, items_per_background=5,
+                 shared_fraction=0.1, seed=0):
+    """
+    Create the benchmark admin and a synthetic dataset. Every fourth talent has
+    no specialization; the others are visual, expressive or hybrid workers.
+    `shared_fraction` of the media is shared to the gallery.
+    """
+    rng = random.Random(seed)
+    admin = BaseUser.objects.create(
+        email=BENCHMARK_ADMIN_EMAIL, first_name='Benchmark', last_name='Admin',
+        is_dashboard=True, is_dashboard_admin=True
+    )
+    media_content_type = ContentType.objects.get_for_model(TalentMedia)
+
+    profiles = []
+    for index in range(talents):
+        city, country = rng.choice(LOCATIONS)
+        user = BaseUser.objects.create(
+            email=f'bench_talent_{index}@example.com', first_name='Talent', last_name=str(index),
+            is_talent=True, email_verified=rng.random() < 0.6
+        )
+        profile = TalentUserProfile.objects.create(
+            user=user,
+            account_type=rng.choice(choices(TalentUserProfile, 'account_type')),
+            gender=rng.choice(choices(TalentUserProfile, 'gender')),
+            city=city,
+            country=country,
+            date_of_birth=date(rng.randint(1960, 2005), rng.randint(1, 12), rng.randint(1, 28)),
+            is_verified=rng.random() < 0.5,
+            aboutyou='Benchmark talent profile',
+        )
+        profiles.append(profile)
+
+        specialization = index % 4
+        years = rng.randint(0, 20)
+        if specialization == 0:
+            VisualWorker.objects.create(
+                profile=profile, years_experience=years,
+                primary_category=rng.choice(choices(VisualWorker, 'primary_category'))
+            )
+        elif specialization == 1:
+            ExpressiveWorker.objects.create(
+                profile=profile, years_experience=years,
+                performer_type=rng.choice(choices(ExpressiveWorker, 'performer_type')),
+                height=rng.randint(150, 200), weight=rng.randint(45, 110)
+            )
+        elif specialization == 2:
+            HybridWorker.objects.create(
+                profile=profile, years_experience=years,
+                hybrid_type=rng.choice(choices(HybridWorker, 'hybrid_type'))
+            )
+
+        for media_index in range(media_per_talent):
+            media = TalentMedia.objects.create(
+                talent=profile, name=f'Media {media_index}', media_info='Benchmark media',
+                media_type='video' if media_index % 4 == 3 else 'image'
+            )
+            if rng.random() < shared_fraction:
+                SharedMediaPost.objects.create(
+                    shared_by=admin, content_type=media_content_type, object_id=media.id,
+                    category=rng.choice(choices(SharedMediaPost, 'category'))
+                )
+
+    band_types = choices(Band, 'band_type')
+    for index in range(bands if profiles else 0):
+        creator = rng.choice(profiles)
+        band = Band.objects.create(
+            name=f'Benchmark Band {index}', creator=creator, band_type=rng.choice(band_types),
+            location=rng.choice(LOCATIONS)[0], description='Benchmark band'
+        )
+        BandMembership.objects.create(band=band, talent_user=creator, role='admin')
+        for member in rng.sample(profiles, min(len(profiles), rng.randint(1, 4))):
+            if member != creator:
+                BandMembership.objects.create(band=band, talent_user=member, role='member')
+
+    item_types = list(ITEM_MODELS)
+    for index in range(backgrounds):
+        user = BaseUser.objects.create(
+            email=f'bench_background_{index}@example.com', first_name='Background', last_name=str(index),
+            is_background=True
+        )
+        profile = BackGroundJobsProfile.objects.create(
+            user=user,
+            country=rng.choice(LOCATIONS)[1],
+            gender=rng.choice(choices(BackGroundJobsProfile, 'gender')),
+            account_type=rng.choice(choices(BackGroundJobsProfile, 'account_type')),
+        )
+        for item_index in range(items_per_background):
+            item_type = item_types[(index + item_index) % len(item_types)]
+            ITEM_MODELS[item_type].objects.create(
+                BackGroundJobsProfile=profile,
+                name=f'{item_type} {index}-{item_index}',
+                description='Benchmark item',
+                price=rng.randint(5, 1000),
+                is_for_rent=rng.random() < 0.5,
+                is_for_sale=rng.random() < 0.5,
+                **ITEM_FIELDS[item_type](rng)
+            )
+    return admin
+
+
+class Scenario:
+    """
+    One benchmarked request: a dashboard URL name, its query parameters and,
+    for detail routes, a function returning the URL kwargs
+    """
+
+    def __init__(self, name, url_name, params=None, kwargs=None):
+        self.name = name
+        self.url_name = url_name
+        self.params = params or {}
+        self.kwargs = kwargs
+
+    def get_path(self):
+        return reverse(f'dashboard:{self.url_name}', kwargs=self.kwargs() if self.kwargs else None)
+
+
+def first_id(model):
+    return lambda: {'pk': model.objects.order_by('pk').values_list('pk', flat=True).first()}
+
+
+SCENARIOS = [
+    Scenario('talent-search', 'unified-search', {'profile_type': 'talent'}),
+    Scenario('talent-search-filtered', 'unified-search', {
+        'profile_type': 'talent', 'gender': 'Female', 'city': 'Dubai', 'account_type': 'premium',
+    }),
+    Scenario('talent-text-search', 'unified-search', {'profile_type': 'talent', 'q': 'Dubai'}),
+    Scenario('visual-search-with-media', 'unified-search', {'profile_type': 'visual', 'include_media': 'true'}),
+    Scenario('expressive-search-filtered', 'unified-search', {
+        'profile_type': 'expressive', 'min_height': '165', 'max_weight': '90',
+    }),
+    Scenario('hybrid-search', 'unified-search', {'profile_type': 'hybrid', 'min_years_experience': '2'}),
+    Scenario('background-search', 'unified-search', {'profile_type': 'background'}),
+    Scenario('props-search', 'unified-search', {'profile_type': 'props'}),
+    Scenario('band-search', 'unified-search', {'profile_type': 'bands'}),
+    Scenario('multi-type-search', 'unified-search', {'profile_type': 'all'}),
+    Scenario('item-catalogue', 'item-catalogue', {'max_price': '500', 'ordering': 'price'}),
+    Scenario('search-export', 'search-export', {'profile_type': 'talent', 'export_format': 'ndjson'}),
+    Scenario('all-profiles', 'all-profiles'),
+    Scenario('talent-detail', 'talent-profile-detail', kwargs=first_id(TalentUserProfile)),
+    Scenario('band-detail', 'band-detail', kwargs=first_id(Band)),
+    Scenario('score-distribution', 'score-distribution', kwargs=lambda: {'entity_type': 'talent'}),
+    Scenario('analytics', 'dashboard-analytics'),
+]
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        'min': round(values[0], 3),
+        'mean': round(sum(values) / len(values), 3),
+        'p50': round(percentile(values, 0.5), 3),
+        'p95': round(percentile(values, 0.95), 3),
+        'p99': round(percentile(values, 0.99), 3),
+        'max': round(values[-1], 3),
+    }
+
+
+def call_view(view, path, params, user, match):
+    request = APIRequestFactory().get(path, params)
+    force_authenticate(request, user=user)
+    response = view(request, *match.args, **match.kwargs)
+    if getattr(response, 'streaming', False):
+        for _ in response.streaming_content:
+            pass
+    elif hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+def run_scenario(scenario, user, iterations=20, warmup=2):
+    """
+    Request the scenario `warmup` times unmeasured, then `iterations` times
+    measured. A view raising an exception ends the scenario with an 'error'.
+    """
+    path = scenario.get_path()
+    try:
+        return measure_scenario(scenario, path, user, iterations, warmup)
+    except Exception as exc:
+        return {'name': scenario.name, 'path': path, 'params': scenario.params, 'error': f'{type(exc).__name__}: {exc}'}
+
+
+def measure_scenario(scenario, path, user, iterations, warmup):
+    match = resolve(path)
+    view = match.func.view_class.as_view(**match.func.view_initkwargs, throttle_classes=[])
+
+    for _ in range(warmup):
+        call_view(view, path, scenario.params, user, match)
+
+    latencies, queries, db_times, serializer_times = [], [], [], []
+    status_codes = Counter()
+    cache_hits = cache_misses = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        with collect_request_metrics() as metrics:
+            response = call_view(view, path, scenario.params, user, match)
+        latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(metrics.queries)
+        db_times.append(metrics.db_time * 1000)
+        serializer_times.append(metrics.serializer_time * 1000)
+        cache_hits += metrics.cache_hits
+        cache_misses += metrics.cache_misses
+        status_codes[response.status_code] += 1
+
+    return {
+        'name': scenario.name,
+        'path': path,
+        'params': scenario.params,
+        'iterations': iterations,
+        'status_codes': {str(code): count for code, count in sorted(status_codes.items())},
+        'latency_ms': summarize(latencies),
+        'queries': {key: value for key, value in summarize(queries).items() if key in ('min', 'mean', 'max')},
+        'db_ms': summarize(db_times),
+        'serializer_ms_mean': round(sum(serializer_times) / iterations, 3),
+        'cache_hits': cache_hits,
+        'cache_misses': cache_misses,
+    }
+
+
+def git_commit():
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmark(user, scenarios=None, iterations=20, warmup=2):
+    """Results of the given scenarios (all by default) as a JSON-serializable document"""
+    # Requests are built by APIRequestFactory, for the 'testserver' host
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+        scenario_results = [run_scenario(scenario, user, iterations, warmup) for scenario in scenarios or SCENARIOS]
+    return {
+        'created_at': timezone.now().isoformat(),
+        'commit': git_commit(),
+        'database': connection.vendor,
+        'iterations': iterations,
+        'warmup': warmup,
+        'dataset': dataset_summary(),
+        'scenarios': scenario_results,
+    }
+
+
+def load_results(path):
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def compare_results(baseline, results):
+    """
+    [{'name', 'metric', 'baseline', 'current', 'change'}] for the p50/p95
+    latency and mean query count of scenarios present in both documents;
+    change is relative (0.1 = 10% slower/more). Failed scenarios are skipped.
+    """
+    baseline_scenarios = {scenario['name']: scenario for scenario in baseline['scenarios']}
+    rows = []
+    for scenario in results['scenarios']:
+        previous = baseline_scenarios.get(scenario['name'])
+        if previous is None or 'error' in previous or 'error' in scenario:
+            continue
+        for metric, read in (
+            ('p50_ms', lambda s: s['latency_ms']['p50']),
+            ('p95_ms', lambda s: s['latency_ms']['p95']),
+            ('queries', lambda s: s['queries']['mean']),
+        ):
+            before, after = read(previous), read(scenario)
+            rows.append({
+                'name': scenario['name'],
+                'metric': metric,
+                'baseline': before,
+                'current': after,
+                'change': round((after - before) / before, 3) if before else None,
+            })
+    return rows
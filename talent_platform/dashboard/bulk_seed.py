@@ -0,0 +1,274 @@
+"""
+Bulk synthetic data for load and capacity testing (`generate_test_users --bulk`).
+
+Rows are built in memory and written with bulk_create: each task writes one
+batch of talents (users, profiles, specializations, media) or background
+profiles (users, profiles, items). Tasks run in a process pool, every worker
+with its own database connection. Media, profile pictures and item images
+point at a small set of placeholder JPEGs drawn locally with Pillow, so
+nothing is downloaded and a million rows don't need a million files.
+
+bulk_create skips save() and the post_save signals, so finish_bulk_seed()
+rebuilds the stored profile scores, search documents and location trigrams
+once at the end and invalidates cached search results.
+"""
+import colorsys
+import io
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, connections, transaction
+from PIL import Image, ImageDraw
+
+from users.models import BaseUser
+from profiles.models import (
+    ITEM_MODELS, TalentUserProfile, TalentMedia, VisualWorker, ExpressiveWorker, HybridWorker,
+    BackGroundJobsProfile
+)
+
+from .benchmark import ITEM_FIELDS, LOCATIONS, choices
+
+PLACEHOLDER_DIR = 'seed_placeholders'
+
+FIRST_NAMES = ['Omar', 'Layla', 'Karim', 'Nour', 'Sami', 'Yara', 'Hadi', 'Rania', 'Ziad', 'Maya', 'Adam', 'Lina']
+LAST_NAMES = ['Haddad', 'Khalil', 'Nasser', 'Saleh', 'Aziz', 'Farah', 'Mansour', 'Younes', 'Darwish', 'Rahman']
+
+
+def create_placeholder_images(count=12, size=400):
+    """Draw `count` square placeholder JPEGs into the default storage (once); returns their storage names"""
+    names = []
+    for index in range(count):
+        name = f'{PLACEHOLDER_DIR}/placeholder_{size}_{index}.jpg'
+        if not default_storage.exists(name):
+            color = tuple(int(channel * 255) for channel in colorsys.hsv_to_rgb(index / count, 0.45, 0.85))
+            image = Image.new('RGB', (size, size), color)
+            draw = ImageDraw.Draw(image)
+            margin = size // 8
+            draw.rectangle([margin, margin, size - margin, size - margin], outline=(255, 255, 255), width=max(2, size // 100))
+            draw.text((margin + 8, margin + 8), f'placeholder {index}', fill=(255, 255, 255))
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=70)
+            name = default_storage.save(name, ContentFile(buffer.getvalue()))
+        names.append(name)
+    return names
+
+
+def random_choices(model, rng):
+    """A random value for each of the model's choice fields"""
+    return {
+        field.name: rng.choice(field.flatchoices)[0]
+        for field in model._meta.concrete_fields
+        if field.choices
+    }
+
+
+def bulk_create_with_ids(model, objects, key, batch_size=None):
+    """
+    bulk_create, then load the primary keys the database didn't return
+    (backends without RETURNING) through the unique field `key`
+    """
+    created = model.objects.bulk_create(objects, batch_size=batch_size)
+    if created and created[0].pk is None:
+        ids = dict(
+            model.objects.filter(**{f'{key}__in': [getattr(obj, key) for obj in created]}).values_list(key, 'pk')
+        )
+        for obj in created:
+            obj.pk = ids[getattr(obj, key)]
+    return created
+
+
+def build_user(rng, email, password, **flags):
+    city, country = rng.choice(LOCATIONS)
+    return BaseUser(
+        email=email,
+        password=password,
+        first_name=rng.choice(FIRST_NAMES),
+        last_name=rng.choice(LAST_NAMES),
+        email_verified=rng.random() < 0.6,
+        gender=rng.choice(choices(BaseUser, 'gender')),
+        date_of_birth=date(rng.randint(1960, 2005), rng.randint(1, 12), rng.randint(1, 28)),
+        city=city,
+        country=country,
+        **flags
+    )
+
+
+def seed_talent_batch(start, count, options):
+    """Talents start..start+count with their specializations and media; returns row counts"""
+    rng = random.Random(f"{options['seed']}:talent:{start}")
+    placeholders = options['placeholders']
+    with transaction.atomic():
+        users = bulk_create_with_ids(BaseUser, [
+            build_user(rng, f"testuser_bulk_{options['run_id']}_talent_{index}@example.com", options['password'], is_talent=True)
+            for index in range(start, start + count)
+        ], 'email')
+
+        profiles = bulk_create_with_ids(TalentUserProfile, [
+            TalentUserProfile(
+                user_id=user.pk,
+                city=user.city,
+                country=user.country,
+                gender=rng.choice(choices(TalentUserProfile, 'gender')),
+                date_of_birth=user.date_of_birth,
+                account_type=rng.choice(choices(TalentUserProfile, 'account_type')),
+                is_verified=rng.random() < 0.3,
+                profile_complete=rng.random() < 0.5,
+                aboutyou='Generated for load testing',
+                profile_picture=rng.choice(placeholders),
+            )
+            for user in users
+        ], 'user_id')
+
+        # Every fourth talent has no specialization
+        specializations = {VisualWorker: [], ExpressiveWorker: [], HybridWorker: []}
+        for index, profile in enumerate(profiles):
+            kind = (start + index) % 4
+            if kind == 3:
+                continue
+            model = (VisualWorker, ExpressiveWorker, HybridWorker)[kind]
+            fields = random_choices(model, rng)
+            fields['years_experience'] = rng.randint(0, 25)
+            if model is not VisualWorker:
+                fields.update(height=rng.uniform(150, 200), weight=rng.uniform(45, 110))
+            specializations[model].append(model(profile_id=profile.pk, **fields))
+        for model, workers in specializations.items():
+            model.objects.bulk_create(workers)
+
+        media = []
+        for profile in profiles:
+            for media_index in range(options['media_per_talent']):
+                image = rng.choice(placeholders)
+                media.append(TalentMedia(
+                    talent_id=profile.pk,
+                    name=f'Generated media {media_index + 1}',
+                    media_info='Generated for load testing',
+                    media_type='video' if media_index % 4 == 3 else 'image',
+                    media_file=image,
+                    thumbnail=image,
+                ))
+        TalentMedia.objects.bulk_create(media, batch_size=options['batch_size'])
+
+    return Counter({
+        'users': len(users), 'talent_profiles': len(profiles), 'media': len(media),
+        'specializations': sum(len(workers) for workers in specializations.values()),
+    })
+
+
+def seed_background_batch(start, count, options):
+    """Background profiles start..start+count with their items; returns row counts"""
+    rng = random.Random(f"{options['seed']}:background:{start}")
+    placeholders = options['placeholders']
+    item_types = list(ITEM_MODELS)
+    with transaction.atomic():
+        users = bulk_create_with_ids(BaseUser, [
+            build_user(rng, f"testuser_bulk_{options['run_id']}_background_{index}@example.com", options['password'], is_background=True)
+            for index in range(start, start + count)
+        ], 'email')
+
+        profiles = bulk_create_with_ids(BackGroundJobsProfile, [
+            BackGroundJobsProfile(
+                user_id=user.pk,
+                country=user.country,
+                date_of_birth=user.date_of_birth,
+                gender=rng.choice(choices(BackGroundJobsProfile, 'gender')),
+                account_type=rng.choice(choices(BackGroundJobsProfile, 'account_type')),
+                profile_picture=rng.choice(placeholders),
+            )
+            for user in users
+        ], 'user_id')
+
+        items = {item_type: [] for item_type in item_types}
+        for index, profile in enumerate(profiles):
+            for item_index in range(options['items_per_background']):
+                item_type = item_types[(start + index + item_index) % len(item_types)]
+                items[item_type].append(ITEM_MODELS[item_type](
+                    BackGroundJobsProfile_id=profile.pk,
+                    name=f'{item_type.replace("_", " ")} {start + index}-{item_index}',
+                    description='Generated for load testing',
+                    price=rng.randint(5, 5000),
+                    is_for_rent=rng.random() < 0.5,
+                    is_for_sale=rng.random() < 0.5,
+                    image=rng.choice(placeholders),
+                    **ITEM_FIELDS[item_type](rng)
+                ))
+        for item_type, rows in items.items():
+            ITEM_MODELS[item_type].objects.bulk_create(rows, batch_size=options['batch_size'])
+
+    return Counter({
+        'users': len(users), 'background_profiles': len(profiles),
+        'items': sum(len(rows) for rows in items.values()),
+    })
+
+
+def setup_worker():
+    """Process pool initializer (needed with the spawn start method; a no-op after fork)"""
+    import django
+    django.setup()
+
+
+def finish_bulk_seed():
+    """Rebuild what the skipped signals maintain and invalidate cached searches"""
+    from .fuzzy import rebuild_location_trigrams, uses_pg_trgm
+    from .profile_scores import rebuild_profile_scores
+    from .search_index import rebuild_search_documents
+    from .utils import invalidate_namespace
+
+    rebuild_profile_scores(entity_types=['talent', 'background'])
+    rebuild_search_documents()
+    if not uses_pg_trgm():
+        rebuild_location_trigrams()
+    invalidate_namespace('search_results')
+
+
+def bulk_seed(talents=0, backgrounds=0, media_per_talent=5, items_per_background=6, batch_size=1000,
+              workers=None, seed=0, image_size=400, rebuild=True, progress=None):
+    """
+    Generate `talents` talent and `backgrounds` background users with their
+    related rows in batches of `batch_size` over `workers` processes (CPU count
+    by default; always 1 on SQLite, which has a single writer). `progress` is
+    called with the running row counts after every batch. Returns the counts.
+    """
+    if connection.vendor == 'sqlite':
+        workers = 1
+    workers = workers or os.cpu_count() or 1
+    options = {
+        'run_id': f'{int(time.time()):x}',
+        'seed': seed,
+        'media_per_talent': media_per_talent,
+        'items_per_background': items_per_background,
+        'batch_size': batch_size,
+        'password': make_password('testpass123'),
+        'placeholders': create_placeholder_images(size=image_size),
+    }
+    tasks = [
+        (seed_talent_batch, start, min(batch_size, talents - start)) for start in range(0, talents, batch_size)
+    ] + [
+        (seed_background_batch, start, min(batch_size, backgrounds - start)) for start in range(0, backgrounds, batch_size)
+    ]
+
+    totals = Counter()
+    if workers == 1:
+        for task, start, count in tasks:
+            totals.update(task(start, count, options))
+            if progress:
+                progress(totals)
+    else:
+        # Forked workers must open their own connections, not share the parent's
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=setup_worker) as pool:
+            futures = [pool.submit(task, start, count, options) for task, start, count in tasks]
+            for future in as_completed(futures):
+                totals.update(future.result())
+                if progress:
+                    progress(totals)
+
+    if rebuild:
+        finish_bulk_seed()
+    return totals
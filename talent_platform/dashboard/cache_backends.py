@@ -0,0 +1,306 @@
+"""
+Cache backends.
+
+MetricsCacheMixin counts hits and misses in the request metrics (see
+dashboard.metrics); InstrumentedLocMemCache, InstrumentedDatabaseCache and
+InstrumentedRedisCache are the instrumented local-memory, database and Redis
+backends.
+
+TwoTierCache keeps a small, bounded LRU of recently read values in each
+process in front of a shared cache (another CACHES alias), so hot,
+rarely-changing keys (the cache generation counters, see dashboard.utils) are
+read without a network round trip. Writes go through to the shared cache and
+evict the key locally; with INVALIDATION_URL (a Redis URL) the evicted keys
+are also published to the other processes, which drop them from their own
+tier. Without it, other processes see a change once their copy expires
+(LOCAL_TIMEOUT seconds).
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from .metrics import record_cache_lookups, uncounted_cache_lookups
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class MetricsCacheMixin:
+    """Count get()/get_many() lookups as hits or misses of the current request"""
+
+    def get(self, key, default=None, version=None):
+        # DatabaseCache.get() is built on get_many()
+        with uncounted_cache_lookups():
+            value = super().get(key, _MISSING, version=version)
+        if value is _MISSING:
+            record_cache_lookups(0, 1)
+            return default
+        record_cache_lookups(1, 0)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        with uncounted_cache_lookups():
+            found = super().get_many(keys, version=version)
+        record_cache_lookups(len(found), len(keys) - len(found))
+        return found
+
+
+class InstrumentedLocMemCache(MetricsCacheMixin, LocMemCache):
+    pass
+
+
+class InstrumentedDatabaseCache(MetricsCacheMixin, DatabaseCache):
+    pass
+
+
+class InstrumentedRedisCache(MetricsCacheMixin, RedisCache):
+    pass
+
+
+class LocalTier:
+    """
+    The per-process LRU of one TwoTierCache, shared by its per-thread backend
+    instances: {key: (value, expires_at)}, at most `max_entries` long
+    """
+
+    def __init__(self, max_entries, timeout):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every eviction, so a read racing a write doesn't store the old value
+        self.epoch = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, timeout=None, epoch=None):
+        """Store a value read from or written to the shared cache, unless keys were evicted since `epoch`"""
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        with self._lock:
+            if epoch is not None and epoch != self.epoch:
+                return
+            if timeout <= 0:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (value, time.monotonic() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict(self, keys=None):
+        """Drop the given keys, or everything"""
+        with self._lock:
+            self.epoch += 1
+            if keys is None:
+                self._entries.clear()
+                return
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class RedisInvalidationChannel:
+    """
+    Publishes evicted keys on a Redis pub/sub channel and evicts the keys
+    other processes publish from the local tier. The listener thread is
+    started on first use in each process (so after a pre-fork), and the whole
+    tier is dropped whenever it reconnects, since messages may have been missed.
+    """
+
+    def __init__(self, url, channel, tier):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.channel = channel
+        self.tier = tier
+        self._pid = None
+        self._sender = None
+        self._lock = threading.Lock()
+
+    def ensure_listening(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._sender = uuid.uuid4().hex
+            threading.Thread(target=self._listen, name='cache-invalidation', daemon=True).start()
+
+    def publish(self, keys):
+        self.ensure_listening()
+        try:
+            self.client.publish(self.channel, json.dumps({'sender': self._sender, 'keys': keys}))
+        except Exception:
+            logger.exception('Could not publish cache invalidation on %s', self.channel)
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self.tier.evict()
+                for message in pubsub.listen():
+                    data = json.loads(message['data'])
+                    if data['sender'] != self._sender:
+                        self.tier.evict(data['keys'])
+            except Exception:
+                logger.exception('Cache invalidation listener on %s failed; reconnecting', self.channel)
+                time.sleep(1)
+
+
+# One local tier (and invalidation channel) per TwoTierCache location in each process
+_tiers = {}
+_tiers_lock = threading.Lock()
+
+
+class TwoTierCache(BaseCache):
+    """
+    Per-process LRU in front of a shared cache (see module docstring).
+
+    OPTIONS:
+        SHARED_CACHE: alias of the shared cache (default 'default')
+        LOCAL_MAX_ENTRIES: most values kept per process (default 1000)
+        LOCAL_TIMEOUT: seconds a value is kept locally at most (default 5)
+        INVALIDATION_URL: Redis URL to broadcast evictions over (optional)
+        INVALIDATION_CHANNEL: pub/sub channel name (default 'cache-invalidation:<LOCATION>')
+    """
+
+    def __init__(self, location, params):
+        options = params.get('OPTIONS', {})
+        super().__init__(params)
+        self.location = location or 'two-tier'
+        self.shared_alias = options.get('SHARED_CACHE', 'default')
+        with _tiers_lock:
+            if self.location not in _tiers:
+                tier = LocalTier(
+                    int(options.get('LOCAL_MAX_ENTRIES', 1000)),
+                    float(options.get('LOCAL_TIMEOUT', 5)),
+                )
+                channel = None
+                if options.get('INVALIDATION_URL'):
+                    channel = RedisInvalidationChannel(
+                        options['INVALIDATION_URL'],
+                        options.get('INVALIDATION_CHANNEL', f'cache-invalidation:{self.location}'),
+                        tier,
+                    )
+                _tiers[self.location] = (tier, channel)
+        self.tier, self.channel = _tiers[self.location]
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _local_timeout(self, timeout):
+        timeout = self.get_backend_timeout(timeout)
+        return None if timeout is None else max(timeout - time.time(), 0)
+
+    def _invalidate(self, keys):
+        """Evict keys (None for all) here and, with a channel, in every other process"""
+        self.tier.evict(keys)
+        if self.channel is not None:
+            self.channel.publish(keys)
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        value = self.tier.get(local_key)
+        if value is not _MISSING:
+            record_cache_lookups(1, 0)
+            return value
+        epoch = self.tier.epoch
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self.tier.set(local_key, value, epoch=epoch)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remote = []
+        for key in keys:
+            value = self.tier.get(self.make_and_validate_key(key, version=version))
+            if value is _MISSING:
+                remote.append(key)
+            else:
+                found[key] = value
+        record_cache_lookups(len(found), 0)
+        if remote:
+            epoch = self.tier.epoch
+            fetched = self.shared.get_many(remote, version=version)
+            for key, value in fetched.items():
+                self.tier.set(self.make_and_validate_key(key, version=version), value, epoch=epoch)
+            found.update(fetched)
+        return found
+
+    def has_key(self, key, version=None):
+        if self.tier.get(self.make_and_validate_key(key, version=version)) is not _MISSING:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self.shared.set(key, value, timeout, version=version)
+        self._invalidate([local_key])
+        self.tier.set(local_key, value, self._local_timeout(timeout))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._invalidate([local_key])
+            self.tier.set(local_key, value, self._local_timeout(timeout))
+        return added
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        self._invalidate([self.make_and_validate_key(key, version=version) for key in data])
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.shared.incr(key, delta, version=version)
+        self._invalidate([self.make_and_validate_key(key, version=version)])
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def delete(self, key, version=None):
+        deleted = self.shared.delete(key, version=version)
+        self._invalidate([self.make_and_validate_key(key, version=version)])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.shared.delete_many(keys, version=version)
+        self._invalidate([self.make_and_validate_key(key, version=version) for key in keys])
+
+    def clear(self):
+        self.shared.clear()
+        self._invalidate(None)
+
+    def clear_local(self):
+        """Drop this process's copies only"""
+        self.tier.evict()
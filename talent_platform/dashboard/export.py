@@ -0,0 +1,44 @@
+"""
+Streaming CSV / NDJSON writers for search exports.
+
+Rows are plain dicts (from QuerySet.values()) and are encoded one at a time as
+the response is consumed, so memory stays flat however many rows are exported.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    """File-like object whose write() returns the value instead of buffering it"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(columns, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(['' if row.get(column) is None else row.get(column) for column in columns])
+
+
+def iter_ndjson(columns, rows):
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    for row in rows:
+        yield encoder.encode({column: row.get(column) for column in columns}) + '\n'
+
+
+def streaming_export(export_format, columns, rows, filename):
+    """StreamingHttpResponse writing `rows` as CSV or NDJSON"""
+    writer = iter_csv if export_format == 'csv' else iter_ndjson
+    response = StreamingHttpResponse(writer(columns, rows), content_type=EXPORT_FORMATS[export_format])
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{export_format}"'
+    return response
@@ -1,21 +1,32 @@
 import django_filters
+from django_filters.constants import EMPTY_VALUES
 import datetime
 from profiles.models import (
     TalentUserProfile, VisualWorker, ExpressiveWorker, HybridWorker, BackGroundJobsProfile,
     Prop, Costume, Location, Memorabilia, Vehicle, ArtisticMaterial, MusicItem, RareItem,
     Band
 )
+from .fuzzy import location_match
+
+
+class FuzzyLocationFilter(django_filters.CharFilter):
+    """City/country/location filter: substring or trigram-similar matches (see dashboard.fuzzy)"""
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        return qs.filter(location_match(self.field_name, value))
 
 class TalentUserProfileFilter(django_filters.FilterSet):
     gender = django_filters.CharFilter(lookup_expr='iexact')
-    city = django_filters.CharFilter(lookup_expr='icontains')
-    country = django_filters.CharFilter(lookup_expr='icontains')
+    city = FuzzyLocationFilter()
+    country = FuzzyLocationFilter()
     account_type = django_filters.CharFilter(lookup_expr='iexact')
     is_verified = django_filters.BooleanFilter()
     age = django_filters.NumberFilter(method='filter_by_age')
 
     def filter_by_age(self, queryset, name, value):
         today = datetime.date.today()
+        value = int(value)
         dob_start = today.replace(year=today.year - value - 1) + datetime.timedelta(days=1)
         dob_end = today.replace(year=today.year - value)
         return queryset.filter(date_of_birth__gte=dob_start, date_of_birth__lte=dob_end)
@@ -29,8 +40,8 @@ class VisualWorkerFilter(django_filters.FilterSet):
     experience_level = django_filters.CharFilter(lookup_expr='iexact')
     min_years_experience = django_filters.NumberFilter(field_name='years_experience', lookup_expr='gte')
     max_years_experience = django_filters.NumberFilter(field_name='years_experience', lookup_expr='lte')
-    city = django_filters.CharFilter(lookup_expr='icontains')
-    country = django_filters.CharFilter(lookup_expr='icontains')
+    city = FuzzyLocationFilter()
+    country = FuzzyLocationFilter()
     profile_gender = django_filters.CharFilter(field_name='profile__gender', lookup_expr='iexact')
     profile_age = django_filters.NumberFilter(method='filter_by_profile_age')
 
@@ -71,8 +82,8 @@ class ExpressiveWorkerFilter(django_filters.FilterSet):
     voice_type = django_filters.CharFilter(lookup_expr='iexact')
     body_type = django_filters.CharFilter(lookup_expr='iexact')
     availability = django_filters.CharFilter(lookup_expr='iexact')
-    city = django_filters.CharFilter(field_name='profile__city', lookup_expr='icontains')
-    country = django_filters.CharFilter(field_name='profile__country', lookup_expr='icontains')
+    city = FuzzyLocationFilter(field_name='profile__city')
+    country = FuzzyLocationFilter(field_name='profile__country')
     profile_gender = django_filters.CharFilter(field_name='profile__gender', lookup_expr='iexact')
     profile_age = django_filters.NumberFilter(method='filter_by_profile_age')
 
@@ -124,8 +135,8 @@ class HybridWorkerFilter(django_filters.FilterSet):
     risk_levels = django_filters.CharFilter(lookup_expr='iexact')
     availability = django_filters.CharFilter(lookup_expr='iexact')
     willing_to_relocate = django_filters.BooleanFilter()
-    city = django_filters.CharFilter(field_name='profile__city', lookup_expr='icontains')
-    country = django_filters.CharFilter(field_name='profile__country', lookup_expr='icontains')
+    city = FuzzyLocationFilter(field_name='profile__city')
+    country = FuzzyLocationFilter(field_name='profile__country')
     profile_gender = django_filters.CharFilter(field_name='profile__gender', lookup_expr='iexact')
     profile_age = django_filters.NumberFilter(method='filter_by_profile_age')
 
@@ -150,7 +161,7 @@ class HybridWorkerFilter(django_filters.FilterSet):
 
 class BackGroundJobsProfileFilter(django_filters.FilterSet):
     gender = django_filters.CharFilter(lookup_expr='iexact')
-    country = django_filters.CharFilter(lookup_expr='icontains')
+    country = FuzzyLocationFilter()
     account_type = django_filters.CharFilter(lookup_expr='iexact')
     min_age = django_filters.DateFilter(field_name='date_of_birth', lookup_expr='lte')
     max_age = django_filters.DateFilter(field_name='date_of_birth', lookup_expr='gte')
@@ -334,7 +345,7 @@ class RareItemFilter(django_filters.FilterSet):
 class BandFilter(django_filters.FilterSet):
     name = django_filters.CharFilter(lookup_expr='icontains')
     band_type = django_filters.CharFilter(lookup_expr='iexact')
-    location = django_filters.CharFilter(lookup_expr='icontains')
+    location = FuzzyLocationFilter()
     min_members = django_filters.NumberFilter(method='filter_by_min_members')
     max_members = django_filters.NumberFilter(method='filter_by_max_members')
     
@@ -0,0 +1,210 @@
+"""
+Full-text search over SearchDocument title and search_text.
+
+PostgreSQL: a `search_vector` tsvector column kept current by a trigger and
+indexed with GIN. SQLite: an FTS5 external-content table kept current by
+triggers. Both are installed by migration 0004 (`install_fulltext_index`).
+Other backends, or a database where the index is not installed, fall back to
+icontains matching on search_text.
+"""
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .models import SearchDocument
+
+TABLE = SearchDocument._meta.db_table
+FTS_TABLE = f'{TABLE}_fts'
+
+# Upper bound on query terms taken from the q= parameter
+MAX_TERMS = 8
+
+POSTGRES_INSTALL = [
+    f"ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    f"""
+    CREATE OR REPLACE FUNCTION {TABLE}_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.search_text, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"DROP TRIGGER IF EXISTS {TABLE}_search_vector_trigger ON {TABLE}",
+    f"""
+    CREATE TRIGGER {TABLE}_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, search_text ON {TABLE}
+    FOR EACH ROW EXECUTE FUNCTION {TABLE}_search_vector_update()
+    """,
+    f"""
+    UPDATE {TABLE} SET search_vector =
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(search_text, '')), 'B')
+    """,
+    f"CREATE INDEX IF NOT EXISTS {TABLE}_search_vector_gin ON {TABLE} USING GIN (search_vector)",
+]
+
+POSTGRES_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {TABLE}_search_vector_trigger ON {TABLE}",
+    f"DROP FUNCTION IF EXISTS {TABLE}_search_vector_update()",
+    f"DROP INDEX IF EXISTS {TABLE}_search_vector_gin",
+    f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+    USING fts5(title, search_text, content='{TABLE}', content_rowid='id')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, search_text) VALUES (new.id, new.title, new.search_text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, search_text) VALUES ('delete', old.id, old.title, old.search_text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, search_text) VALUES ('delete', old.id, old.title, old.search_text);
+        INSERT INTO {FTS_TABLE}(rowid, title, search_text) VALUES (new.id, new.title, new.search_text);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# Aliases whose full-text index has been seen installed
+_installed = set()
+
+
+def _run(connection, statements):
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def sqlite_has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if cursor.fetchone()[0]:
+            return True
+        # Some builds ship FTS5 without advertising the compile option
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+            cursor.execute("DROP TABLE temp.fts5_probe")
+            return True
+        except Exception:
+            return False
+
+
+def install_fulltext_index(connection):
+    """Create the backend's full-text index over SearchDocument (no-op elsewhere)"""
+    if connection.vendor == 'postgresql':
+        _run(connection, POSTGRES_INSTALL)
+    elif connection.vendor == 'sqlite' and sqlite_has_fts5(connection):
+        _run(connection, SQLITE_INSTALL)
+    _installed.discard(connection.alias)
+
+
+def uninstall_fulltext_index(connection):
+    if connection.vendor == 'postgresql':
+        _run(connection, POSTGRES_UNINSTALL)
+    elif connection.vendor == 'sqlite':
+        _run(connection, SQLITE_UNINSTALL)
+    _installed.discard(connection.alias)
+
+
+def fulltext_backend(using='default'):
+    """'postgresql' or 'sqlite' when the full-text index is installed, otherwise None"""
+    connection = connections[using]
+    if using in _installed:
+        return connection.vendor
+
+    installed = False
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            columns = connection.introspection.get_table_description(cursor, TABLE)
+        installed = any(column.name == 'search_vector' for column in columns)
+    elif connection.vendor == 'sqlite':
+        installed = FTS_TABLE in connection.introspection.table_names()
+
+    if installed:
+        _installed.add(using)
+        return connection.vendor
+    return None
+
+
+class DocumentSQL(RawSQL):
+    """
+    RawSQL over the SearchDocument row, which it names `{table}`: replaced with
+    the table's alias in the query being compiled, so the expression also works
+    in subqueries (where Django renames the table)
+    """
+
+    def as_sql(self, compiler, connection):
+        alias = next(
+            (alias for alias, join in compiler.query.alias_map.items() if join.table_name == TABLE), TABLE
+        )
+        return '(%s)' % self.sql.format(table=connection.ops.quote_name(alias)), self.params
+
+
+def search_terms(query):
+    """Word tokens of a free-text query, lower-cased and de-duplicated"""
+    terms = []
+    for term in re.findall(r'\w+', (query or '').lower()):
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_TERMS]
+
+
+def apply_fulltext(documents, query):
+    """
+    Restrict a SearchDocument queryset to rows matching every term of `query`
+    (prefix match, so "sing" finds "singer") and annotate `text_rank`, where
+    higher means more relevant. The result can be used as a subquery, including
+    a correlated one (object_id=OuterRef(...)).
+    """
+    terms = search_terms(query)
+    if not terms:
+        return documents.none()
+
+    backend = fulltext_backend(documents.db)
+
+    if backend == 'postgresql':
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        return documents.filter(
+            DocumentSQL("{table}.search_vector @@ to_tsquery('simple', %s)", [tsquery], output_field=BooleanField())
+        ).annotate(
+            text_rank=DocumentSQL("ts_rank({table}.search_vector, to_tsquery('simple', %s))", [tsquery], output_field=FloatField())
+        )
+
+    if backend == 'sqlite':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return documents.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        ).annotate(
+            # bm25() is lower-is-better; title matches weigh double
+            text_rank=DocumentSQL(
+                f"SELECT -bm25({FTS_TABLE}, 2.0, 1.0) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = {{table}}.id",
+                [match], output_field=FloatField()
+            )
+        )
+
+    # No full-text index: plain substring matching
+    condition = Q()
+    for term in terms:
+        condition &= Q(search_text__icontains=term) | Q(title__icontains=term)
+    return documents.filter(condition).annotate(text_rank=Value(1.0, output_field=FloatField()))
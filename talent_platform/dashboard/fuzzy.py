@@ -0,0 +1,168 @@
+"""
+Fuzzy matching for city, country and band location searches.
+
+Similarity is pg_trgm's: the share of trigrams two strings have in common, so
+"Dubay" matches "Dubai" (0.5). PostgreSQL uses pg_trgm directly, with GIN
+trigram indexes on the location columns (migration 0005). Other databases look
+the query's trigrams up in the LocationTrigram side table to find the similar
+stored values, then match the location column against those values.
+
+Matching still accepts plain substring matches, so fuzzy matching only ever
+adds results.
+"""
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, Count, F, IntegerField, Max, Q, Value, When
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThanOrEqual
+
+from .models import LocationTrigram
+
+# Location columns that are fuzzy-searchable, as (model, field)
+LOCATION_FIELDS = [
+    ('profiles.TalentUserProfile', 'city'),
+    ('profiles.TalentUserProfile', 'country'),
+    ('profiles.BackGroundJobsProfile', 'country'),
+    ('profiles.Band', 'location'),
+    ('dashboard.SearchDocument', 'city'),
+    ('dashboard.SearchDocument', 'country'),
+]
+
+BATCH_SIZE = 500
+
+
+def _trigram_indexes():
+    for model_label, field in LOCATION_FIELDS:
+        table = apps.get_model(model_label)._meta.db_table
+        yield f'{table}_{field}_trgm', table, field
+
+
+def install_trigram_indexes(connection):
+    """Enable pg_trgm and add GIN trigram indexes on the location columns (PostgreSQL only)"""
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, field in _trigram_indexes():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING GIN ({field} gin_trgm_ops)")
+
+
+def uninstall_trigram_indexes(connection):
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for name, _, _ in _trigram_indexes():
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def uses_pg_trgm():
+    return connection.vendor == 'postgresql'
+
+
+def trigrams(text):
+    """pg_trgm-style trigrams: each lower-cased word padded with two spaces before and one after"""
+    grams = set()
+    for word in re.findall(r'[^\W_]+', (text or '').lower()):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similar_values(value, threshold=None):
+    """{stored location value: similarity} for side-table values at least `threshold` similar to `value`"""
+    if threshold is None:
+        threshold = settings.FUZZY_LOCATION_THRESHOLD
+    grams = trigrams(value)
+    if not grams:
+        return {}
+
+    candidates = LocationTrigram.objects.filter(trigram__in=grams).values('value').annotate(
+        shared=Count('id'),
+        total=Max('trigram_count'),
+    )
+    matches = {}
+    for row in candidates:
+        score = row['shared'] / (len(grams) + row['total'] - row['shared'])
+        if score >= threshold:
+            matches[row['value']] = score
+    return matches
+
+
+def _pg_similar(field, value):
+    # `%` uses the GIN trigram index but matches at pg_trgm.similarity_threshold,
+    # which each connection sets to FUZZY_LOCATION_THRESHOLD (see
+    # dashboard.models.set_trigram_threshold); the explicit bound still applies
+    # the threshold if that setting was changed later in the session
+    return Q(TrigramSimilar(F(field), Value(value))) & Q(
+        GreaterThanOrEqual(TrigramSimilarity(F(field), Value(value)), settings.FUZZY_LOCATION_THRESHOLD)
+    )
+
+
+def location_match(field, value):
+    """Q for rows whose `field` contains `value` or is trigram-similar to it"""
+    contains = Q(**{f'{field}__icontains': value})
+    if not settings.FUZZY_LOCATION_MATCHING:
+        return contains
+    if uses_pg_trgm():
+        return contains | _pg_similar(field, value)
+    similar = similar_values(value)
+    if not similar:
+        return contains
+    return contains | Q(**{f'{field}__in': list(similar)})
+
+
+def location_points(field, value, weight):
+    """Integer expression: `weight` scaled by the row's similarity to `value`, 0 when not similar"""
+    if not settings.FUZZY_LOCATION_MATCHING:
+        return Value(0)
+    if uses_pg_trgm():
+        scaled = Cast(TrigramSimilarity(F(field), Value(value)) * Value(float(weight)), IntegerField())
+        return Case(When(_pg_similar(field, value), then=scaled), default=Value(0), output_field=IntegerField())
+    return Case(
+        *[When(**{field: stored}, then=Value(round(weight * score))) for stored, score in similar_values(value).items()],
+        default=Value(0),
+        output_field=IntegerField()
+    )
+
+
+def index_location_values(values):
+    """Add side-table rows for location values not indexed yet (no-op with pg_trgm)"""
+    if uses_pg_trgm():
+        return
+    values = list({value for value in values if value and trigrams(value)})
+    for start in range(0, len(values), BATCH_SIZE):
+        batch = values[start:start + BATCH_SIZE]
+        known = set(LocationTrigram.objects.filter(value__in=batch).values_list('value', flat=True))
+        rows = []
+        for value in batch:
+            if value in known:
+                continue
+            grams = trigrams(value)
+            rows.extend(LocationTrigram(value=value, trigram=gram, trigram_count=len(grams)) for gram in grams)
+        LocationTrigram.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def stored_location_values():
+    values = set()
+    for model_label, field in LOCATION_FIELDS:
+        queryset = apps.get_model(model_label).objects.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+        values.update(queryset.values_list(field, flat=True).distinct())
+    return values
+
+
+def rebuild_location_trigrams():
+    """
+    Sync the side table with the location values currently stored, dropping
+    values nothing uses any more. Returns the number of indexed values.
+    """
+    values = stored_location_values()
+    stale = list(set(LocationTrigram.objects.values_list('value', flat=True).distinct()) - values)
+    for start in range(0, len(stale), BATCH_SIZE):
+        LocationTrigram.objects.filter(value__in=stale[start:start + BATCH_SIZE]).delete()
+    index_location_values(values)
+    return len(values)
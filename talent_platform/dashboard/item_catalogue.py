@@ -0,0 +1,106 @@
+"""
+Unified catalogue of background items across the eight item tables.
+
+Each item type has its own table, so the catalogue is a UNION ALL of one
+SELECT per type over the columns shared through profiles.models.Item. Filters
+are applied inside every branch, where each table's price/rent/sale indexes
+apply. The database orders and slices the combined rows, so one page of a
+cross-type search is one query.
+"""
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import CharField, F, Q, Value
+from rest_framework.exceptions import ValidationError
+
+from profiles.models import ITEM_MODELS
+
+from .relevance import parse_bool
+
+# Columns of a catalogue row (annotations included), identical in every branch
+CATALOGUE_FIELDS = (
+    'id', 'name', 'description', 'price', 'is_for_rent', 'is_for_sale', 'created_at',
+    'item_type', 'genre_id', 'genre_name', 'profile_id',
+)
+
+CATALOGUE_ORDERING_FIELDS = ('price', 'created_at', 'name')
+DEFAULT_CATALOGUE_ORDERING = '-created_at'
+
+
+def parse_price(name, value):
+    if value is None or value == '':
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValidationError({name: f'Invalid price "{value}".'})
+
+
+def parse_item_types(value):
+    if not value:
+        return list(ITEM_MODELS)
+    item_types = [item_type.strip() for item_type in value.split(',') if item_type.strip()]
+    invalid = [item_type for item_type in item_types if item_type not in ITEM_MODELS]
+    if invalid:
+        raise ValidationError({
+            'item_type': f'Invalid item type(s): {", ".join(invalid)}. Must be one of: {", ".join(ITEM_MODELS)}'
+        })
+    return item_types
+
+
+def parse_ordering(value):
+    ordering = value or DEFAULT_CATALOGUE_ORDERING
+    if ordering.lstrip('-') not in CATALOGUE_ORDERING_FIELDS:
+        raise ValidationError({'ordering': f'Must be one of: {", ".join(CATALOGUE_ORDERING_FIELDS)} (prefix - for descending)'})
+    return ordering
+
+
+def catalogue_filter(min_price=None, max_price=None, is_for_rent=None, is_for_sale=None, genre=None, text=None):
+    """Q applied to every item table"""
+    condition = Q()
+    if min_price is not None:
+        condition &= Q(price__gte=min_price)
+    if max_price is not None:
+        condition &= Q(price__lte=max_price)
+    if is_for_rent is not None:
+        condition &= Q(is_for_rent=is_for_rent)
+    if is_for_sale is not None:
+        condition &= Q(is_for_sale=is_for_sale)
+    if genre:
+        condition &= Q(genre_id=genre) if str(genre).isdigit() else Q(genre__name__iexact=genre)
+    if text:
+        condition &= Q(name__icontains=text) | Q(description__icontains=text)
+    return condition
+
+
+def catalogue_branch(item_type, condition):
+    return ITEM_MODELS[item_type].objects.filter(condition).annotate(
+        item_type=Value(item_type, output_field=CharField()),
+        genre_name=F('genre__name'),
+        profile_id=F('BackGroundJobsProfile_id'),
+    ).order_by().values(*CATALOGUE_FIELDS)
+
+
+def item_catalogue(item_types=None, ordering=DEFAULT_CATALOGUE_ORDERING, **filters):
+    """
+    Items of the given types (all by default) matching `filters` (see
+    catalogue_filter), as one ordered UNION ALL queryset of CATALOGUE_FIELDS
+    dicts. Ties are broken by (item_type, id) so pages are stable.
+    """
+    condition = catalogue_filter(**filters)
+    branches = [catalogue_branch(item_type, condition) for item_type in item_types or ITEM_MODELS]
+    queryset = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+    return queryset.order_by(ordering, 'item_type', 'id')
+
+
+def catalogue_from_params(params):
+    """item_catalogue() for request query parameters"""
+    return item_catalogue(
+        item_types=parse_item_types(params.get('item_type')),
+        ordering=parse_ordering(params.get('ordering')),
+        min_price=parse_price('min_price', params.get('min_price')),
+        max_price=parse_price('max_price', params.get('max_price')),
+        is_for_rent=parse_bool(params['is_for_rent']) if params.get('is_for_rent') else None,
+        is_for_sale=parse_bool(params['is_for_sale']) if params.get('is_for_sale') else None,
+        genre=params.get('genre') or None,
+        text=(params.get('q') or '').strip() or None,
+    )
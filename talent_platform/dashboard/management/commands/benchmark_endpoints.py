@@ -0,0 +1,104 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from dashboard.benchmark import (
+    BENCHMARK_ADMIN_EMAIL, SCENARIOS, compare_results, get_benchmark_admin, load_results,
+    run_benchmark, seed_dataset
+)
+from users.models import BaseUser
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the dashboard search and listing endpoints end to end on a seeded test database, '
+        'reporting p50/p95/p99 latency and query counts per scenario'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--talents', type=int, default=200, help='Number of talent profiles to seed')
+        parser.add_argument('--media-per-talent', type=int, default=3, help='Media rows per talent profile')
+        parser.add_argument('--bands', type=int, default=20, help='Number of bands to seed')
+        parser.add_argument('--backgrounds', type=int, default=20, help='Number of background profiles to seed')
+        parser.add_argument('--items-per-background', type=int, default=5, help='Items per background profile')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed of the generated dataset')
+        parser.add_argument('--iterations', type=int, default=20, help='Measured requests per scenario')
+        parser.add_argument('--warmup', type=int, default=2, help='Unmeasured requests per scenario before measuring')
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=[scenario.name for scenario in SCENARIOS],
+            help='Scenario to run (repeatable); all by default'
+        )
+        parser.add_argument('--output', help='Write the results as JSON to this file')
+        parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Keep the benchmark database (and its dataset) for the next run instead of destroying it'
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+        baseline = load_results(options['compare']) if options['compare'] else None
+        scenarios = [scenario for scenario in SCENARIOS if scenario.name in options['scenario']] if options['scenario'] else None
+
+        # Always a separate test database: the benchmark writes its own dataset
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False, keepdb=options['keepdb'])
+        try:
+            if BaseUser.objects.filter(email=BENCHMARK_ADMIN_EMAIL).exists():
+                self.stdout.write('Using the dataset kept from an earlier run')
+                admin = get_benchmark_admin()
+            else:
+                self.stdout.write('Seeding dataset...')
+                admin = seed_dataset(
+                    talents=options['talents'],
+                    media_per_talent=options['media_per_talent'],
+                    bands=options['bands'],
+                    backgrounds=options['backgrounds'],
+                    items_per_background=options['items_per_background'],
+                    seed=options['seed'],
+                )
+
+            results = run_benchmark(admin, scenarios, options['iterations'], options['warmup'])
+        finally:
+            if not options['keepdb']:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.write_results(results)
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+        if baseline:
+            self.write_comparison(compare_results(baseline, results), baseline)
+
+    def write_results(self, results):
+        dataset = ', '.join(f'{count} {name}' for name, count in results['dataset'].items())
+        self.stdout.write(f"\nDataset: {dataset} ({results['database']}, commit {results['commit'] or 'unknown'})")
+        self.stdout.write(f"{'scenario':<28} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8} {'db ms':>8}  status")
+        for scenario in results['scenarios']:
+            if 'error' in scenario:
+                self.stdout.write(self.style.ERROR(f"{scenario['name']:<28} failed: {scenario['error']}"))
+                continue
+            latency = scenario['latency_ms']
+            status = ', '.join(f'{code}x{count}' for code, count in scenario['status_codes'].items())
+            line = (
+                f"{scenario['name']:<28} {latency['p50']:>9.2f} {latency['p95']:>9.2f} {latency['p99']:>9.2f} "
+                f"{scenario['queries']['mean']:>8.1f} {scenario['db_ms']['mean']:>8.2f}  {status}"
+            )
+            if set(scenario['status_codes']) != {'200'}:
+                line = self.style.WARNING(line)
+            self.stdout.write(line)
+
+    def write_comparison(self, rows, baseline):
+        self.stdout.write(f"\nCompared with {baseline.get('commit') or 'baseline'} ({baseline.get('created_at')}):")
+        for row in rows:
+            change = '' if row['change'] is None else f"{row['change']:+.1%}"
+            line = f"{row['name']:<28} {row['metric']:<8} {row['baseline']:>9} -> {row['current']:>9} {change:>8}"
+            if row['change'] is not None and row['change'] > 0.1:
+                line = self.style.WARNING(line)
+            self.stdout.write(line)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.utils import CACHE_NAMESPACES, invalidate_namespace
+
+
+class Command(BaseCommand):
+    help = (
+        'Invalidate cached dashboard values (sharing statuses, media counts, user stats, search results) '
+        'by bumping their namespace generations; run after bulk changes that skip model signals'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--namespace',
+            action='append',
+            choices=CACHE_NAMESPACES,
+            dest='namespaces',
+            help='Namespace to invalidate (repeatable, default: all)'
+        )
+
+    def handle(self, *args, **options):
+        for namespace in options['namespaces'] or CACHE_NAMESPACES:
+            invalidate_namespace(namespace)
+            self.stdout.write(f'{namespace}: invalidated')
+
+        self.stdout.write(self.style.SUCCESS('Dashboard caches invalidated'))
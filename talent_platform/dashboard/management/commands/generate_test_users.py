@@ -3,6 +3,7 @@ from django.core.files.base import ContentFile
 from faker import Faker
 import requests
 import random
+import time
 from datetime import datetime, timedelta
 from django.utils import timezone
 from django.db import transaction
@@ -35,6 +36,46 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing test users before creating new ones'
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Bulk mode: write rows with bulk_create in batches over a process pool, '
+                 'with locally generated placeholder images (for load testing datasets)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Bulk mode: users per batch'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Bulk mode: worker processes (default: CPU count; always 1 on SQLite)'
+        )
+        parser.add_argument(
+            '--media-per-talent',
+            type=int,
+            default=5,
+            help='Bulk mode: media rows per talent'
+        )
+        parser.add_argument(
+            '--items-per-background',
+            type=int,
+            default=6,
+            help='Bulk mode: items per background user'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Bulk mode: random seed'
+        )
+        parser.add_argument(
+            '--skip-rebuild',
+            action='store_true',
+            help='Bulk mode: skip rebuilding profile scores, search documents and location trigrams afterwards'
+        )
 
     def __init__(self):
         super().__init__()
@@ -106,6 +147,10 @@ class Command(BaseCommand):
             self.stdout.write('Clearing existing test users...')
             self.clear_test_users()
         
+        if options['bulk']:
+            self.bulk_create_users(talent_count, background_count, options)
+            return
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f'Creating {talent_count} talent users and {background_count} background users...'
@@ -127,6 +172,39 @@ class Command(BaseCommand):
             )
         )
 
+    def bulk_create_users(self, talent_count, background_count, options):
+        """Generate users and their related rows in bulk (see dashboard.bulk_seed)"""
+        from dashboard.bulk_seed import bulk_seed
+        
+        start_time = time.time()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Bulk creating {talent_count} talent users and {background_count} background users...'
+            )
+        )
+        
+        def progress(counts):
+            done = counts['talent_profiles'] + counts['background_profiles']
+            rate = done / max(time.time() - start_time, 0.001)
+            self.stdout.write(f'{done}/{talent_count + background_count} users ({rate:.0f}/s)')
+        
+        counts = bulk_seed(
+            talents=talent_count,
+            backgrounds=background_count,
+            media_per_talent=options['media_per_talent'],
+            items_per_background=options['items_per_background'],
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            seed=options['seed'],
+            rebuild=not options['skip_rebuild'],
+            progress=progress,
+        )
+        
+        rows = ', '.join(f'{count} {name}' for name, count in sorted(counts.items()))
+        self.stdout.write(
+            self.style.SUCCESS(f'Created {rows} in {time.time() - start_time:.1f}s')
+        )
+
     def clear_test_users(self):
         """Clear existing test users (those with test emails)"""
         test_users = BaseUser.objects.filter(email__contains='testuser')
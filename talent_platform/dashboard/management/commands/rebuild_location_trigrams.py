@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+import time
+
+from dashboard.fuzzy import rebuild_location_trigrams, uses_pg_trgm
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the trigram side table used for fuzzy location search (not needed with pg_trgm)'
+
+    def handle(self, *args, **options):
+        if uses_pg_trgm():
+            self.stdout.write('PostgreSQL uses pg_trgm indexes; nothing to rebuild')
+            return
+
+        start_time = time.time()
+        count = rebuild_location_trigrams()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {count} location values in {time.time() - start_time:.2f}s'
+        ))
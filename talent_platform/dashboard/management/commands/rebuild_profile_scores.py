@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+import time
+
+from dashboard.models import ProfileScore
+from dashboard.profile_scores import rebuild_profile_scores
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored profile scores of talent profiles, background profiles and bands'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity-type',
+            action='append',
+            choices=[choice for choice, _ in ProfileScore.ENTITY_TYPES],
+            dest='entity_types',
+            help='Entity type to rebuild (repeatable, default: all)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of scores written per query'
+        )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+
+        counts = rebuild_profile_scores(
+            entity_types=options['entity_types'],
+            batch_size=options['batch_size']
+        )
+
+        for entity_type, count in counts.items():
+            self.stdout.write(f'{entity_type}: {count} scores')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Profile scores rebuilt in {time.time() - start_time:.2f}s'
+        ))
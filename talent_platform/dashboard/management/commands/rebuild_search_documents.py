@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+import time
+
+from dashboard.models import SearchDocument
+from dashboard.search_index import rebuild_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized search documents used by dashboard search'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity-type',
+            action='append',
+            choices=[choice for choice, _ in SearchDocument.ENTITY_TYPES],
+            dest='entity_types',
+            help='Entity type to rebuild (repeatable, default: all)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of documents written per query'
+        )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+
+        counts = rebuild_search_documents(
+            entity_types=options['entity_types'],
+            batch_size=options['batch_size']
+        )
+
+        for entity_type, count in counts.items():
+            self.stdout.write(f'{entity_type}: {count} documents')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Search documents rebuilt in {time.time() - start_time:.2f}s'
+        ))
@@ -0,0 +1,341 @@
+"""
+Per-endpoint request metrics.
+
+RequestMetricsMiddleware measures every request that resolves to a named URL:
+wall time, time spent in database queries and their number, cache hits and
+misses (counted by cache backends with MetricsCacheMixin, see
+dashboard.cache_backends) and time spent serializing (where views wrap it in
+measure_serializer()).
+
+Measurements are added to counters in the shared cache, one set per endpoint
+per METRICS_WINDOW_SECONDS window. Only the last METRICS_WINDOWS windows are
+read, so the numbers are rolling. Request wall time also goes into a
+fixed-bucket histogram, from which percentiles are estimated. On Redis a
+request's counters are written in one pipelined round trip; other backends
+get one incr() per counter. Each endpoint seen also gets a marker key
+(written with add(), so concurrent first requests can't drop each other);
+the report reads the markers of every named URL to find them.
+
+Counters only add up across processes in a shared cache, so metrics are on
+by default only when Redis (REDIS_CACHE_URL) or a METRICS_CACHE is configured.
+
+Read with endpoint_metrics() (MetricsView) or prometheus_metrics() (text
+exposition format, PrometheusMetricsView).
+"""
+import logging
+import time
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.urls import URLResolver, get_resolver
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the wall time histogram buckets; one more bucket holds slower requests
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Counters summed per endpoint and window; times are in microseconds so they stay integers
+COUNTERS = ('requests', 'errors', 'wall_us', 'db_us', 'queries', 'cache_hits', 'cache_misses', 'serializer_us')
+
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Measurements of the request being handled; also the execute_wrapper counting its queries"""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serializer_time = 0.0
+        self.count_cache_lookups = True
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+
+def record_cache_lookups(hits, misses):
+    """Called by cache backends; counted against the current request, if any"""
+    metrics = _current.get()
+    if metrics is not None and metrics.count_cache_lookups:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+@contextmanager
+def uncounted_cache_lookups():
+    """Don't count the lookups inside (a get_many() built on get() is counted once)"""
+    metrics = _current.get()
+    if metrics is None or not metrics.count_cache_lookups:
+        yield
+        return
+    metrics.count_cache_lookups = False
+    try:
+        yield
+    finally:
+        metrics.count_cache_lookups = True
+
+
+@contextmanager
+def collect_request_metrics():
+    """
+    Collect the metrics of the code inside (queries on this thread's
+    connections, cache lookups, serializer time) into the RequestMetrics yielded
+    """
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(metrics))
+            yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def measure_serializer():
+    """Add the time spent inside to the current request's serializer time"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.serializer_time += time.perf_counter() - start
+
+
+def metrics_cache():
+    return caches[settings.METRICS_CACHE]
+
+
+def current_window():
+    return int(time.time() // settings.METRICS_WINDOW_SECONDS)
+
+
+def counter_key(window, endpoint, name):
+    return f'metrics:{window}:{endpoint}:{name}'
+
+
+def endpoint_key(endpoint):
+    return f'metrics:endpoint:{endpoint}'
+
+
+def bucket_name(index):
+    return f'bucket{index}'
+
+
+def url_names(patterns=None, namespace=''):
+    """Every named URL as the view_name it resolves to ('namespace:name')"""
+    names = []
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            names += url_names(pattern.url_patterns, f'{namespace}{pattern.namespace}:' if pattern.namespace else namespace)
+        elif pattern.name:
+            names.append(namespace + pattern.name)
+    return names
+
+
+def _incr(cache, key, delta, timeout):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # First value in this window; another process may have just added it
+        if not cache.add(key, delta, timeout):
+            cache.incr(key, delta)
+
+
+def write_counters(cache, counters, timeout, marker):
+    """Add {key: delta} to the counters (expiring after `timeout`) and add() the `marker` key"""
+    counters = {key: delta for key, delta in counters.items() if delta}
+    if isinstance(cache, RedisCache):
+        # Django stores ints unpickled, so INCRBY works on the cache's own keys
+        keys = {key: cache.make_and_validate_key(key) for key in [*counters, marker]}
+        pipeline = cache._cache.get_client(keys[marker], write=True).pipeline(transaction=False)
+        for key, delta in counters.items():
+            pipeline.incrby(keys[key], delta)
+            pipeline.expire(keys[key], timeout)
+        pipeline.set(keys[marker], 1, nx=True)
+        pipeline.execute()
+        return
+
+    for key, delta in counters.items():
+        _incr(cache, key, delta, timeout)
+    cache.add(marker, 1, None)
+
+
+def record_request(endpoint, wall_time, metrics, error=False):
+    """Add one request's measurements to the endpoint's counters for the current window"""
+    cache = metrics_cache()
+    window = current_window()
+    timeout = settings.METRICS_WINDOW_SECONDS * (settings.METRICS_WINDOWS + 1)
+    values = {
+        'requests': 1,
+        'errors': int(error),
+        'wall_us': int(wall_time * 1e6),
+        'db_us': int(metrics.db_time * 1e6),
+        'queries': metrics.queries,
+        'cache_hits': metrics.cache_hits,
+        'cache_misses': metrics.cache_misses,
+        'serializer_us': int(metrics.serializer_time * 1e6),
+        bucket_name(bisect_left(LATENCY_BUCKETS, wall_time)): 1,
+    }
+    counters = {counter_key(window, endpoint, name): value for name, value in values.items()}
+    write_counters(cache, counters, timeout, endpoint_key(endpoint))
+
+
+def load_totals():
+    """{endpoint: {counter: total, 'buckets': [count per LATENCY_BUCKETS bucket]}} over the kept windows"""
+    cache = metrics_cache()
+    markers = {endpoint_key(endpoint): endpoint for endpoint in url_names()}
+    endpoints = sorted(markers[key] for key in cache.get_many(list(markers)))
+    last = current_window()
+    windows = range(last - settings.METRICS_WINDOWS + 1, last + 1)
+    names = COUNTERS + tuple(bucket_name(index) for index in range(len(LATENCY_BUCKETS) + 1))
+
+    keys = {
+        counter_key(window, endpoint, name): (endpoint, name)
+        for endpoint in endpoints for window in windows for name in names
+    }
+    totals = {endpoint: dict.fromkeys(names, 0) for endpoint in endpoints}
+    for key, value in cache.get_many(list(keys)).items():
+        endpoint, name = keys[key]
+        totals[endpoint][name] += value
+
+    for endpoint, counters in list(totals.items()):
+        if not counters['requests']:
+            del totals[endpoint]
+            continue
+        counters['buckets'] = [counters.pop(bucket_name(index)) for index in range(len(LATENCY_BUCKETS) + 1)]
+    return totals
+
+
+def latency_percentile(buckets, fraction):
+    """Upper bound (seconds) of the bucket holding the given fraction of requests; None past the last bound"""
+    target = fraction * sum(buckets)
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, buckets):
+        seen += count
+        if seen >= target:
+            return bound
+    return None
+
+
+def _ms(microseconds, requests):
+    return round(microseconds / requests / 1000, 2)
+
+
+def endpoint_metrics():
+    """Per-endpoint averages and wall time percentiles, the endpoints with the most total wall time first"""
+    results = []
+    for endpoint, counters in load_totals().items():
+        requests = counters['requests']
+        lookups = counters['cache_hits'] + counters['cache_misses']
+        percentiles = {
+            f'p{int(fraction * 100)}': latency_percentile(counters['buckets'], fraction)
+            for fraction in (0.5, 0.95, 0.99)
+        }
+        results.append({
+            'endpoint': endpoint,
+            'requests': requests,
+            'errors': counters['errors'],
+            'total_wall_ms': round(counters['wall_us'] / 1000, 2),
+            'avg_wall_ms': _ms(counters['wall_us'], requests),
+            'wall_ms_percentiles': {
+                name: None if bound is None else bound * 1000 for name, bound in percentiles.items()
+            },
+            'avg_db_ms': _ms(counters['db_us'], requests),
+            'avg_queries': round(counters['queries'] / requests, 2),
+            'avg_serializer_ms': _ms(counters['serializer_us'], requests),
+            'cache_hits': counters['cache_hits'],
+            'cache_misses': counters['cache_misses'],
+            'cache_hit_rate': round(counters['cache_hits'] / lookups, 3) if lookups else None,
+            'latency_histogram': [
+                {'le_ms': None if bound is None else bound * 1000, 'count': count}
+                for bound, count in zip(LATENCY_BUCKETS + (None,), counters['buckets'])
+            ],
+        })
+    results.sort(key=lambda result: result['total_wall_ms'], reverse=True)
+    return results
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_metrics():
+    """
+    The counters in Prometheus text exposition format. They cover a rolling
+    span, so every family is a gauge (they can go down as windows expire).
+    """
+    totals = load_totals()
+    span = settings.METRICS_WINDOW_SECONDS * settings.METRICS_WINDOWS
+    families = (
+        ('requests', 'dashboard_endpoint_requests', 'Requests', 1),
+        ('errors', 'dashboard_endpoint_errors', 'Requests answered with a 5xx status', 1),
+        ('wall_us', 'dashboard_endpoint_wall_seconds', 'Total request wall time', 1e-6),
+        ('db_us', 'dashboard_endpoint_db_seconds', 'Total time in database queries', 1e-6),
+        ('queries', 'dashboard_endpoint_queries', 'Database queries', 1),
+        ('serializer_us', 'dashboard_endpoint_serializer_seconds', 'Total time serializing', 1e-6),
+        ('cache_hits', 'dashboard_endpoint_cache_hits', 'Cache lookups that hit', 1),
+        ('cache_misses', 'dashboard_endpoint_cache_misses', 'Cache lookups that missed', 1),
+    )
+    lines = []
+    for counter, name, description, scale in families:
+        lines.append(f'# HELP {name} {description} in the last {span}s')
+        lines.append(f'# TYPE {name} gauge')
+        for endpoint, counters in totals.items():
+            value = counters[counter] if scale == 1 else round(counters[counter] * scale, 6)
+            lines.append(f'{name}{{endpoint="{_label(endpoint)}"}} {value}')
+
+    name = 'dashboard_endpoint_latency_seconds_bucket'
+    lines.append(f'# HELP {name} Requests at most `le` seconds long in the last {span}s')
+    lines.append(f'# TYPE {name} gauge')
+    for endpoint, counters in totals.items():
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), counters['buckets']):
+            cumulative += count
+            lines.append(f'{name}{{endpoint="{_label(endpoint)}",le="{bound}"}} {cumulative}')
+    return '\n'.join(lines) + '\n'
+
+
+class RequestMetricsMiddleware:
+    """
+    Record wall time, database time and query count, cache hits/misses and
+    serializer time of every request to a named URL (see module docstring).
+    Enabled with METRICS_ENABLED. Recording failures are logged, never raised.
+
+    Queries run by other threads (e.g. the concurrent multi-type search) and
+    the streaming of streamed responses aren't included.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with collect_request_metrics() as metrics:
+            response = self.get_response(request)
+        wall_time = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        if match is not None and match.url_name:
+            try:
+                record_request(match.view_name, wall_time, metrics, error=response.status_code >= 500)
+            except Exception:
+                logger.exception('Could not record request metrics for %s', match.view_name)
+        return response
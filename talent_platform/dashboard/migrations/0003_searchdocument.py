@@ -0,0 +1,52 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_update_shared_media_constraint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('talent', 'Talent Profile'), ('background', 'Background Profile'), ('band', 'Band')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('account_type', models.CharField(blank=True, default='free', max_length=20)),
+                ('search_boost', models.FloatField(default=0.0)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('email_verified', models.BooleanField(default=False)),
+                ('profile_complete', models.BooleanField(default=False)),
+                ('gender', models.CharField(blank=True, default='', max_length=20)),
+                ('city', models.CharField(blank=True, default='', max_length=255)),
+                ('country', models.CharField(blank=True, default='', max_length=25)),
+                ('date_of_birth', models.DateField(blank=True, null=True)),
+                ('age_bucket', models.PositiveSmallIntegerField(blank=True, help_text='Lower bound of the 5-year age band at indexing time', null=True)),
+                ('image_count', models.PositiveIntegerField(default=0)),
+                ('video_count', models.PositiveIntegerField(default=0)),
+                ('media_count', models.PositiveIntegerField(default=0, help_text='Media excluding test videos')),
+                ('all_media_count', models.PositiveIntegerField(default=0)),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('is_visual', models.BooleanField(default=False)),
+                ('is_expressive', models.BooleanField(default=False)),
+                ('is_hybrid', models.BooleanField(default=False)),
+                ('specialization_count', models.PositiveSmallIntegerField(default=0)),
+                ('search_text', models.TextField(blank=True, default='')),
+                ('indexed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('entity_type', 'object_id')},
+                'indexes': [
+                    models.Index(fields=['entity_type', 'account_type'], name='dashboard_s_entity__72f23a_idx'),
+                    models.Index(fields=['entity_type', 'country'], name='dashboard_s_entity__dd1238_idx'),
+                    models.Index(fields=['entity_type', 'city'], name='dashboard_s_entity__f581ed_idx'),
+                    models.Index(fields=['entity_type', 'gender', 'age_bucket'], name='dashboard_s_entity__6ffe95_idx'),
+                    models.Index(fields=['entity_type', 'date_of_birth'], name='dashboard_s_entity__25bb25_idx'),
+                    models.Index(fields=['entity_type', '-search_boost'], name='dashboard_s_entity__d25885_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+def install_fulltext_index(apps, schema_editor):
+    from dashboard.fulltext import install_fulltext_index
+    install_fulltext_index(schema_editor.connection)
+
+
+def uninstall_fulltext_index(apps, schema_editor):
+    from dashboard.fulltext import uninstall_fulltext_index
+    uninstall_fulltext_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchdocument',
+            name='entity_type',
+            field=models.CharField(choices=[('talent', 'Talent Profile'), ('background', 'Background Profile'), ('band', 'Band'), ('prop', 'Prop'), ('costume', 'Costume'), ('location', 'Location'), ('memorabilia', 'Memorabilia'), ('vehicle', 'Vehicle'), ('artistic_material', 'Artistic Material'), ('music_item', 'Music Item'), ('rare_item', 'Rare Item')], max_length=20),
+        ),
+        # tsvector column + GIN index on PostgreSQL, FTS5 table on SQLite
+        migrations.RunPython(install_fulltext_index, uninstall_fulltext_index),
+    ]
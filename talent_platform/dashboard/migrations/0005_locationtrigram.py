@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+
+def install_trigram_indexes(apps, schema_editor):
+    from dashboard.fuzzy import install_trigram_indexes
+    install_trigram_indexes(schema_editor.connection)
+
+
+def uninstall_trigram_indexes(apps, schema_editor):
+    from dashboard.fuzzy import uninstall_trigram_indexes
+    uninstall_trigram_indexes(schema_editor.connection)
+
+
+def index_location_values(apps, schema_editor):
+    from dashboard.fuzzy import rebuild_location_trigrams
+    if schema_editor.connection.vendor != 'postgresql':
+        rebuild_location_trigrams()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0004_searchdocument_fulltext'),
+        ('profiles', '0025_talentuserprofile_add_missing_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LocationTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=255)),
+                ('trigram', models.CharField(max_length=3)),
+                ('trigram_count', models.PositiveSmallIntegerField(help_text='Number of distinct trigrams in value')),
+            ],
+            options={
+                'unique_together': {('value', 'trigram')},
+                'indexes': [
+                    models.Index(fields=['trigram', 'value'], name='dashboard_l_trigram_6509f0_idx'),
+                ],
+            },
+        ),
+        # pg_trgm + GIN trigram indexes on PostgreSQL
+        migrations.RunPython(install_trigram_indexes, uninstall_trigram_indexes),
+        # Populate the side table everywhere else
+        migrations.RunPython(index_location_values, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_locationtrigram'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sharedmediapost',
+            index=models.Index(fields=['is_active', '-shared_at', '-id'], name='dashboard_s_is_acti_ae016a_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0006_sharedmediapost_gallery_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('talent', 'Talent Profile'), ('background', 'Background Profile'), ('band', 'Band')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('total', models.PositiveSmallIntegerField(default=0)),
+                ('breakdown', models.JSONField(default=dict)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('entity_type', 'object_id')},
+                'indexes': [
+                    models.Index(fields=['entity_type', '-total'], name='dashboard_p_entity__e8ea52_idx'),
+                ],
+            },
+        ),
+    ]
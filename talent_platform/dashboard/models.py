@@ -1,10 +1,14 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from users.models import BaseUser
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.db.backends.signals import connection_created
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+import logging
+
+logger = logging.getLogger(__name__)
 
 class BulkEmail(models.Model):
     """Model for tracking bulk email campaigns sent to talent"""
@@ -119,6 +123,10 @@ class SharedMediaPost(models.Model):
     class Meta:
         ordering = ['-shared_at']
         unique_together = ['content_type', 'object_id']  # Prevent duplicate shares of same media by any admin
+        indexes = [
+            # Gallery keyset pagination: WHERE is_active ORDER BY shared_at DESC, id DESC
+            models.Index(fields=['is_active', '-shared_at', '-id']),
+        ]
         
     def __str__(self):
         return f"Shared by {self.shared_by.email} at {self.shared_at}"
@@ -186,3 +194,384 @@ def clear_sharing_status_cache(sender, instance, **kwargs):
     except Exception as e:
         # Log error but don't fail the operation
         print(f"Error clearing sharing status cache: {e}")
+
+
+@receiver([post_save, post_delete])
+def bump_search_generation(sender, raw=False, **kwargs):
+    """
+    Invalidate cached search results that depend on the saved/deleted model,
+    unless the save only touched SEARCH_CACHE_IGNORED_FIELDS. Bumped again on commit, so results cached from a read racing the
+    transaction don't outlive it.
+    """
+    if raw:
+        return
+    try:
+        from .utils import SEARCH_CACHE_IGNORED_FIELDS, SEARCH_CACHE_MODELS, bump_generation
+        label = sender._meta.label
+        update_fields = kwargs.get('update_fields')
+        if update_fields and SEARCH_CACHE_IGNORED_FIELDS.get(label, set()).issuperset(update_fields):
+            return
+        if label in SEARCH_CACHE_MODELS:
+            bump_generation(label)
+            transaction.on_commit(lambda: bump_generation(label))
+    except Exception as e:
+        logger.error(f"Error bumping search cache generation for {sender}: {e}")
+
+
+class SearchDocument(models.Model):
+    """
+    Denormalized search row, one per searchable entity (talent profile,
+    background profile, band or background item).
+
+    Carries the values dashboard search filters and ranks on (precomputed media
+    counts, specialization flags, account boost, verification, age bucket and
+    the searchable text) so searches read a single narrow table instead of
+    joining profiles, users, media and the worker tables on every request.
+    Kept in sync by the signal handlers below; rebuild with
+    `python manage.py rebuild_search_documents`.
+    """
+    ENTITY_TYPES = [
+        ('talent', 'Talent Profile'),
+        ('background', 'Background Profile'),
+        ('band', 'Band'),
+        ('prop', 'Prop'),
+        ('costume', 'Costume'),
+        ('location', 'Location'),
+        ('memorabilia', 'Memorabilia'),
+        ('vehicle', 'Vehicle'),
+        ('artistic_material', 'Artistic Material'),
+        ('music_item', 'Music Item'),
+        ('rare_item', 'Rare Item'),
+    ]
+    # Item models indexed under each item entity type
+    ITEM_MODELS = {
+        'profiles.Prop': 'prop',
+        'profiles.Costume': 'costume',
+        'profiles.Location': 'location',
+        'profiles.Memorabilia': 'memorabilia',
+        'profiles.Vehicle': 'vehicle',
+        'profiles.ArtisticMaterial': 'artistic_material',
+        'profiles.MusicItem': 'music_item',
+        'profiles.RareItem': 'rare_item',
+    }
+    entity_type = models.CharField(max_length=20, choices=ENTITY_TYPES)
+    object_id = models.PositiveIntegerField()
+    
+    # Display name (user's full name, band name or item name)
+    title = models.CharField(max_length=255, blank=True, default='')
+    
+    # Account and verification
+    account_type = models.CharField(max_length=20, blank=True, default='free')
+    search_boost = models.FloatField(default=0.0)
+    is_verified = models.BooleanField(default=False)
+    email_verified = models.BooleanField(default=False)
+    profile_complete = models.BooleanField(default=False)
+    
+    # Demographics and location (bands store their location in `city`)
+    gender = models.CharField(max_length=20, blank=True, default='')
+    city = models.CharField(max_length=255, blank=True, default='')
+    country = models.CharField(max_length=25, blank=True, default='')
+    date_of_birth = models.DateField(blank=True, null=True)
+    age_bucket = models.PositiveSmallIntegerField(blank=True, null=True, help_text="Lower bound of the 5-year age band at indexing time")
+    
+    # Precomputed counts
+    image_count = models.PositiveIntegerField(default=0)
+    video_count = models.PositiveIntegerField(default=0)
+    media_count = models.PositiveIntegerField(default=0, help_text="Media excluding test videos")
+    all_media_count = models.PositiveIntegerField(default=0)
+    member_count = models.PositiveIntegerField(default=0)
+    
+    # Specialization flags (talent only)
+    is_visual = models.BooleanField(default=False)
+    is_expressive = models.BooleanField(default=False)
+    is_hybrid = models.BooleanField(default=False)
+    specialization_count = models.PositiveSmallIntegerField(default=0)
+    
+    # Lower-cased searchable text (names, about, location, categories, item details)
+    search_text = models.TextField(blank=True, default='')
+    
+    indexed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ['entity_type', 'object_id']
+        indexes = [
+            models.Index(fields=['entity_type', 'account_type']),
+            models.Index(fields=['entity_type', 'country']),
+            models.Index(fields=['entity_type', 'city']),
+            models.Index(fields=['entity_type', 'gender', 'age_bucket']),
+            models.Index(fields=['entity_type', 'date_of_birth']),
+            models.Index(fields=['entity_type', '-search_boost']),
+        ]
+    
+    def __str__(self):
+        return f"{self.entity_type}:{self.object_id} {self.title}"
+
+
+class LocationTrigram(models.Model):
+    """
+    Trigram side table for fuzzy city/country/location matching on databases
+    without pg_trgm (see dashboard.fuzzy). One row per trigram of every distinct
+    location value stored on profiles and bands, so similar values are found
+    through the trigram index instead of scanning the profile tables.
+    Kept in sync by the signal handlers below; rebuild with
+    `python manage.py rebuild_location_trigrams`.
+    """
+    value = models.CharField(max_length=255)
+    trigram = models.CharField(max_length=3)
+    trigram_count = models.PositiveSmallIntegerField(help_text="Number of distinct trigrams in value")
+    
+    class Meta:
+        unique_together = ['value', 'trigram']
+        indexes = [
+            models.Index(fields=['trigram', 'value']),
+        ]
+    
+    def __str__(self):
+        return f"{self.value}: '{self.trigram}'"
+
+
+class ProfileScore(models.Model):
+    """
+    Stored get_profile_score() breakdown of a talent profile, background profile
+    or band. Score reads become a single row lookup instead of recomputing the
+    breakdown (16 queries for a background profile), and `total` can be sorted
+    and filtered on in SQL (see dashboard.profile_scores.profile_score_subquery).
+    Kept in sync by the signal handlers below; rebuild with
+    `python manage.py rebuild_profile_scores`.
+    """
+    ENTITY_TYPES = [
+        ('talent', 'Talent Profile'),
+        ('background', 'Background Profile'),
+        ('band', 'Band'),
+    ]
+    # Scored models and their entity types
+    SCORED_MODELS = {
+        'profiles.TalentUserProfile': 'talent',
+        'profiles.BackGroundJobsProfile': 'background',
+        'profiles.Band': 'band',
+    }
+    entity_type = models.CharField(max_length=20, choices=ENTITY_TYPES)
+    object_id = models.PositiveIntegerField()
+    total = models.PositiveSmallIntegerField(default=0)
+    breakdown = models.JSONField(default=dict)
+    computed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ['entity_type', 'object_id']
+        indexes = [
+            models.Index(fields=['entity_type', '-total']),
+        ]
+    
+    def __str__(self):
+        return f"{self.entity_type}:{self.object_id} {self.total}"
+
+
+class ScoreBucket(models.Model):
+    """
+    Score histogram: the number of stored ProfileScores of each entity type with
+    each total (0-100). Percentiles and top-N% thresholds are read from at most
+    101 rows per type (see dashboard.profile_scores.score_percentile) instead of
+    scoring or counting every profile. Updated with ProfileScore rows in
+    dashboard.profile_scores.save_scores/remove_score; rebuilt by
+    `python manage.py rebuild_profile_scores`.
+    """
+    entity_type = models.CharField(max_length=20, choices=ProfileScore.ENTITY_TYPES)
+    score = models.PositiveSmallIntegerField()
+    count = models.IntegerField(default=0)
+    
+    class Meta:
+        unique_together = ['entity_type', 'score']
+    
+    def __str__(self):
+        return f"{self.entity_type}:{self.score} x{self.count}"
+
+
+def _saves_fields(update_fields, fields):
+    """Whether a save may have changed any of `fields` (every field when update_fields isn't given)"""
+    return update_fields is None or not fields.isdisjoint(update_fields)
+
+
+def _sync_search_document(action, *args):
+    """
+    Run a search index update without failing the triggering save/delete.
+    Documents are kept even with SEARCH_DOCUMENTS_ENABLED off: full-text (q=)
+    searches always read them.
+    """
+    try:
+        from . import search_index
+        # Savepoint, so a failed update doesn't leave the caller's transaction broken
+        with transaction.atomic():
+            getattr(search_index, action)(*args)
+    except Exception as e:
+        logger.error(f"Error updating search document ({action}{args}): {e}")
+
+
+@receiver(post_save, sender='profiles.TalentUserProfile')
+def sync_talent_profile_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_search_document('index_talent_profile', instance.pk)
+
+
+@receiver(post_delete, sender='profiles.TalentUserProfile')
+def delete_talent_profile_document(sender, instance, **kwargs):
+    _sync_search_document('remove_document', 'talent', instance.pk)
+
+
+@receiver([post_save, post_delete], sender='profiles.TalentMedia')
+@receiver([post_save, post_delete], sender='profiles.VisualWorker')
+@receiver([post_save, post_delete], sender='profiles.ExpressiveWorker')
+@receiver([post_save, post_delete], sender='profiles.HybridWorker')
+def sync_talent_related_document(sender, instance, raw=False, **kwargs):
+    """Media and specializations change a talent profile's document."""
+    if not raw:
+        profile_id = getattr(instance, 'talent_id', None) or getattr(instance, 'profile_id', None)
+        _sync_search_document('index_talent_profile', profile_id)
+
+
+# User fields the talent and background documents read
+USER_DOCUMENT_FIELDS = {'first_name', 'last_name', 'email', 'email_verified'}
+
+
+@receiver(post_save, sender=BaseUser)
+def sync_user_profile_documents(sender, instance, raw=False, created=False, update_fields=None, **kwargs):
+    """Name and email verification live on the user (saves of other fields, e.g. last_login, are skipped)."""
+    if not raw and not created and _saves_fields(update_fields, USER_DOCUMENT_FIELDS):
+        _sync_search_document('index_user_profiles', instance.pk)
+
+
+@receiver(post_save, sender='profiles.BackGroundJobsProfile')
+def sync_background_profile_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_search_document('index_background_profile', instance.pk)
+
+
+@receiver(post_delete, sender='profiles.BackGroundJobsProfile')
+def delete_background_profile_document(sender, instance, **kwargs):
+    _sync_search_document('remove_document', 'background', instance.pk)
+
+
+@receiver(post_save, sender='profiles.Band')
+def sync_band_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_search_document('index_band', instance.pk)
+
+
+@receiver(post_delete, sender='profiles.Band')
+def delete_band_document(sender, instance, **kwargs):
+    _sync_search_document('remove_document', 'band', instance.pk)
+
+
+@receiver(post_save, sender='profiles.TalentUserProfile')
+@receiver(post_save, sender='profiles.BackGroundJobsProfile')
+@receiver(post_save, sender='profiles.Band')
+def sync_location_trigrams(sender, instance, raw=False, **kwargs):
+    """New city/country/location values become fuzzy-searchable."""
+    if raw:
+        return
+    try:
+        from .fuzzy import index_location_values
+        index_location_values([getattr(instance, field, None) for field in ('city', 'country', 'location')])
+    except Exception as e:
+        logger.error(f"Error updating location trigrams for {sender.__name__} {instance.pk}: {e}")
+
+
+@receiver(connection_created)
+def set_trigram_threshold(sender, connection, **kwargs):
+    """pg_trgm's `%` matches at pg_trgm.similarity_threshold (0.3 by default); use FUZZY_LOCATION_THRESHOLD."""
+    if connection.vendor == 'postgresql' and settings.FUZZY_LOCATION_MATCHING:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('pg_trgm.similarity_threshold', %s, false)",
+                [str(settings.FUZZY_LOCATION_THRESHOLD)]
+            )
+
+
+@receiver([post_save, post_delete], sender='profiles.BandMembership')
+@receiver([post_save, post_delete], sender='profiles.BandMedia')
+def sync_band_related_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_search_document('index_band', instance.band_id)
+
+
+def sync_item_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_search_document('index_object', SearchDocument.ITEM_MODELS[sender._meta.label], instance.pk)
+
+
+def delete_item_document(sender, instance, **kwargs):
+    _sync_search_document('remove_document', SearchDocument.ITEM_MODELS[sender._meta.label], instance.pk)
+
+
+for item_model in SearchDocument.ITEM_MODELS:
+    post_save.connect(sync_item_document, sender=item_model, dispatch_uid=f'sync_item_document:{item_model}')
+    post_delete.connect(delete_item_document, sender=item_model, dispatch_uid=f'delete_item_document:{item_model}')
+
+
+def _sync_profile_score(action, *args):
+    """Run a profile score update without failing the triggering save/delete."""
+    try:
+        from . import profile_scores
+        # Savepoint, so a failed update doesn't leave the caller's transaction broken
+        with transaction.atomic():
+            getattr(profile_scores, action)(*args)
+    except Exception as e:
+        logger.error(f"Error updating profile score ({action}{args}): {e}")
+
+
+@receiver(post_save, sender='profiles.TalentUserProfile')
+@receiver(post_save, sender='profiles.BackGroundJobsProfile')
+@receiver(post_save, sender='profiles.Band')
+def sync_profile_score(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_profile_score('refresh_score', ProfileScore.SCORED_MODELS[sender._meta.label], instance.pk)
+
+
+@receiver(post_delete, sender='profiles.TalentUserProfile')
+@receiver(post_delete, sender='profiles.BackGroundJobsProfile')
+@receiver(post_delete, sender='profiles.Band')
+def delete_profile_score(sender, instance, **kwargs):
+    _sync_profile_score('remove_score', ProfileScore.SCORED_MODELS[sender._meta.label], instance.pk)
+
+
+@receiver([post_save, post_delete], sender='profiles.TalentMedia')
+@receiver([post_save, post_delete], sender='profiles.VisualWorker')
+@receiver([post_save, post_delete], sender='profiles.ExpressiveWorker')
+@receiver([post_save, post_delete], sender='profiles.HybridWorker')
+@receiver([post_save, post_delete], sender='profiles.SocialMediaLinks')
+def sync_talent_related_score(sender, instance, raw=False, **kwargs):
+    """Media, specializations and social links count towards a talent profile's score."""
+    if not raw:
+        profile_id = (
+            getattr(instance, 'talent_id', None) or getattr(instance, 'profile_id', None)
+            or getattr(instance, 'user_id', None)
+        )
+        _sync_profile_score('refresh_score', 'talent', profile_id)
+
+
+# User fields a talent profile's score reads
+USER_SCORE_FIELDS = {'email_verified'}
+
+
+@receiver(post_save, sender=BaseUser)
+def sync_user_profile_scores(sender, instance, raw=False, created=False, update_fields=None, **kwargs):
+    """Email verification lives on the user (saves of other fields, e.g. last_login, are skipped)."""
+    if not raw and not created and _saves_fields(update_fields, USER_SCORE_FIELDS):
+        _sync_profile_score('refresh_user_scores', instance.pk)
+
+
+@receiver([post_save, post_delete], sender='profiles.BandMembership')
+@receiver([post_save, post_delete], sender='profiles.BandMedia')
+def sync_band_related_score(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _sync_profile_score('refresh_score', 'band', instance.band_id)
+
+
+def sync_item_owner_score(sender, instance, raw=False, **kwargs):
+    """Item counts and types make up a background profile's score."""
+    if not raw:
+        _sync_profile_score('refresh_score', 'background', instance.BackGroundJobsProfile_id)
+
+
+for item_model in SearchDocument.ITEM_MODELS:
+    post_save.connect(sync_item_owner_score, sender=item_model, dispatch_uid=f'sync_item_owner_score_save:{item_model}')
+    post_delete.connect(sync_item_owner_score, sender=item_model, dispatch_uid=f'sync_item_owner_score_delete:{item_model}')
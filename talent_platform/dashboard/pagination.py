@@ -0,0 +1,252 @@
+"""
+Pagination for dashboard search results and the shared media gallery.
+
+KeysetPagination pages on the queryset's ordering plus the primary key
+(e.g. (relevance_score, id) or (shared_at, id)). The opaque cursor carries the
+last row's sort values, so every page is a `WHERE (score, id) < (...) LIMIT n`
+range scan: page 500 costs the same as page 1, and rows inserted between
+requests don't shift pages. Totals are only computed on request
+(?count=exact, or ?count=approx for a planner estimate on PostgreSQL).
+
+KeysetOrPageNumberPagination keeps page numbers as the default and switches to
+keyset pagination for ?pagination=cursor or when a ?cursor= is given.
+"""
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from collections import OrderedDict
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+UNIQUE_ORDERING = ('pk', '-pk', 'id', '-id')
+
+
+def _json_default(value):
+    # Full precision: a truncated timestamp would skip or repeat rows
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def estimate_count(queryset):
+    """Planner row estimate on PostgreSQL (no table scan); an exact COUNT elsewhere"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def keyset_condition(ordering, position, reverse=False):
+    """Q selecting rows after `position` in `ordering` (before it when `reverse`)"""
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, position):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on (ordering fields..., pk).
+
+    The ordering comes from `ordering` on the class, else the queryset's
+    order_by(), else '-pk'; a primary key tie-breaker is always appended.
+    Ordering fields must not be NULL for rows being paged.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    ordering = None
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                size = int(request.query_params[self.page_size_query_param])
+                if size > 0:
+                    return min(size, self.max_page_size) if self.max_page_size else size
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, queryset):
+        ordering = list(self.ordering or queryset.query.order_by or ['-pk'])
+        if any(not isinstance(field, str) for field in ordering):
+            raise NotFound('Cursor pagination is not available for this ordering.')
+        if ordering[-1] not in UNIQUE_ORDERING:
+            ordering.append('-pk')
+        return ordering
+
+    def encode_cursor(self, payload):
+        data = json.dumps(payload, default=_json_default, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            if not isinstance(payload, dict):
+                raise ValueError
+            return payload
+        except (TypeError, ValueError):
+            raise NotFound('Invalid cursor.')
+
+    def get_position(self, row, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            if name == 'pk':
+                values.append(row.pk)
+                continue
+            value = row
+            for attr in name.split('__'):
+                value = getattr(value, attr)
+            values.append(value)
+        return values
+
+    def get_total(self, queryset, request):
+        mode = request.query_params.get(self.count_query_param)
+        if mode == 'exact':
+            return queryset.count()
+        if mode == 'approx':
+            return estimate_count(queryset)
+        return None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.offset = None
+        cursor = self.decode_cursor(request)
+
+        # Bounded in-memory results (e.g. free-text matches) are paged by position
+        if isinstance(queryset, list):
+            return self.paginate_list(queryset, cursor)
+
+        ordering = self.get_ordering(queryset)
+        self.count = self.get_total(queryset, request)
+        reverse = bool(cursor and cursor.get('r'))
+
+        if reverse:
+            queryset = queryset.order_by(*[field[1:] if field.startswith('-') else f'-{field}' for field in ordering])
+        else:
+            queryset = queryset.order_by(*ordering)
+        if cursor and 'p' in cursor:
+            if len(cursor['p']) != len(ordering):
+                raise NotFound('Invalid cursor.')
+            queryset = queryset.filter(keyset_condition(ordering, cursor['p'], reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.first_position = self.get_position(rows[0], ordering) if rows else None
+        self.last_position = self.get_position(rows[-1], ordering) if rows else None
+        return rows
+
+    def paginate_list(self, results, cursor):
+        offset = cursor.get('o', 0) if cursor else 0
+        if not isinstance(offset, int) or offset < 0:
+            raise NotFound('Invalid cursor.')
+        self.count = len(results)
+        self.has_next = offset + self.page_size < len(results)
+        self.has_previous = offset > 0
+        self.offset = offset
+        self.first_position = self.last_position = None
+        return results[offset:offset + self.page_size]
+
+    def get_link(self, payload):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(payload))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.offset is not None:
+            return self.get_link({'o': self.offset + self.page_size})
+        if self.last_position is None:
+            return None
+        return self.get_link({'p': self.last_position})
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.offset is not None:
+            return self.get_link({'o': max(self.offset - self.page_size, 0)})
+        if self.first_position is None:
+            return None
+        return self.get_link({'p': self.first_position, 'r': True})
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'nullable': True},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class KeysetOrPageNumberPagination(PageNumberPagination):
+    """Page-number pagination by default; keyset pagination with ?pagination=cursor or ?cursor="""
+    mode_query_param = 'pagination'
+    keyset_class = KeysetPagination
+
+    def use_keyset(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.use_keyset(request):
+            self.keyset = self.keyset_class()
+            self.keyset.page_size = self.page_size
+            self.keyset.page_size_query_param = self.page_size_query_param
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,304 @@
+"""
+Builds and maintains ProfileScore rows.
+
+The score itself is still computed by the models' get_profile_score(); this
+module stores the result when something it reads changes (see the signal
+handlers in dashboard.models), so reads are a lookup on one indexed table.
+Scores are stored without their explanation (only the state it is rendered
+from); get_stored_score(explain=True) renders it on read.
+
+Scoring is batched: the querysets below load every input a score reads
+(related rows and media/member counts) in the same query, and background item
+counts are filled with one UNION ALL query, so scoring a page or a whole table
+takes a fixed number of queries per batch (see score_profiles).
+
+A histogram of stored totals per entity type (ScoreBucket) is updated in the
+same transaction as the scores, so percentiles and top-N% thresholds read at
+most 101 rows (see score_percentile and score_thresholds).
+
+Scores are written in bulk, which sends no model signals, so every write bumps
+the SCORES_LABEL cache generation itself: cached search results ordered or
+filtered on profile_score list it as a dependency.
+"""
+import logging
+import math
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+
+from profiles.models import TalentUserProfile, BackGroundJobsProfile, Band
+from profiles.score_explanations import add_explanation
+
+from .models import ProfileScore, ScoreBucket
+from .utils import bump_generation
+
+logger = logging.getLogger(__name__)
+
+# Cache generation bumped whenever stored scores change
+SCORES_LABEL = ProfileScore._meta.label
+
+
+def talent_queryset():
+    return TalentUserProfile.with_score_inputs()
+
+
+def background_queryset():
+    return BackGroundJobsProfile.objects.select_related('user')
+
+
+def band_queryset():
+    return Band.with_score_inputs()
+
+
+SCORE_QUERYSETS = {
+    'talent': talent_queryset,
+    'background': background_queryset,
+    'band': band_queryset,
+}
+
+
+def load_score_inputs(entity_type, objects):
+    """Load the inputs the querysets above can't annotate, for a whole batch"""
+    if entity_type == 'background':
+        BackGroundJobsProfile.load_item_counts(objects)
+
+
+def score_profiles(entity_type, objects):
+    """
+    Score breakdowns {pk: breakdown} for a batch of profiles or bands (instances
+    or primary keys). Reloads them with their score inputs, so the cost is a
+    fixed number of queries whatever the batch size.
+    """
+    ids = [getattr(obj, 'pk', obj) for obj in objects]
+    batch = list(SCORE_QUERYSETS[entity_type]().filter(pk__in=ids))
+    load_score_inputs(entity_type, batch)
+    return {obj.pk: obj.get_profile_score(explain=False) for obj in batch}
+
+
+def build_score(entity_type, obj):
+    breakdown = obj.get_profile_score(explain=False)
+    return ProfileScore(entity_type=entity_type, object_id=obj.pk, total=breakdown['total'], breakdown=breakdown)
+
+
+def scores_changed():
+    """Invalidate cached results that depend on stored scores; again on commit, like the model signals"""
+    bump_generation(SCORES_LABEL)
+    transaction.on_commit(lambda: bump_generation(SCORES_LABEL))
+
+
+def adjust_buckets(deltas):
+    """Apply {(entity_type, score): change} to the score histogram"""
+    deltas = {key: change for key, change in deltas.items() if change}
+    if not deltas:
+        return
+    ScoreBucket.objects.bulk_create(
+        [ScoreBucket(entity_type=entity_type, score=score) for entity_type, score in deltas],
+        ignore_conflicts=True,
+    )
+    for (entity_type, score), change in deltas.items():
+        ScoreBucket.objects.filter(entity_type=entity_type, score=score).update(count=F('count') + change)
+
+
+def save_scores(scores):
+    """Insert or update scores in one statement, moving their histogram counts"""
+    if not scores:
+        return
+    deltas = Counter((score.entity_type, score.total) for score in scores)
+    with transaction.atomic():
+        for entity_type in {score.entity_type for score in scores}:
+            previous = ProfileScore.objects.select_for_update().filter(
+                entity_type=entity_type,
+                object_id__in=[score.object_id for score in scores if score.entity_type == entity_type],
+            ).values_list('total', flat=True)
+            for total in previous:
+                deltas[(entity_type, total)] -= 1
+        ProfileScore.objects.bulk_create(
+            scores,
+            update_conflicts=True,
+            unique_fields=['entity_type', 'object_id'],
+            update_fields=['total', 'breakdown', 'computed_at'],
+        )
+        adjust_buckets(deltas)
+    scores_changed()
+
+
+def remove_score(entity_type, object_id):
+    with transaction.atomic():
+        total = ProfileScore.objects.select_for_update().filter(
+            entity_type=entity_type, object_id=object_id
+        ).values_list('total', flat=True).first()
+        if total is not None:
+            ProfileScore.objects.filter(entity_type=entity_type, object_id=object_id).delete()
+            adjust_buckets({(entity_type, total): -1})
+    if total is not None:
+        scores_changed()
+
+
+def refresh_score(entity_type, object_id):
+    """Recompute and store one entity's score; returns the breakdown (None if the entity is gone)"""
+    if object_id is None:
+        return None
+    obj = SCORE_QUERYSETS[entity_type]().filter(pk=object_id).first()
+    if obj is None:
+        remove_score(entity_type, object_id)
+        return None
+    load_score_inputs(entity_type, [obj])
+    score = build_score(entity_type, obj)
+    save_scores([score])
+    return score.breakdown
+
+
+def refresh_user_scores(user_id):
+    """Refresh the scores of a user's talent profile (email verification is scored)"""
+    for profile_id in TalentUserProfile.objects.filter(user_id=user_id).values_list('pk', flat=True):
+        refresh_score('talent', profile_id)
+
+
+def load_stored_scores(entity_type, object_ids):
+    """
+    Stored score breakdowns {object_id: breakdown} in one query; missing scores
+    are computed as one batch but not stored, so reads never write (storing is
+    left to the signal handlers and rebuild_profile_scores).
+    """
+    object_ids = list(object_ids)
+    breakdowns = dict(ProfileScore.objects.filter(
+        entity_type=entity_type, object_id__in=object_ids
+    ).values_list('object_id', 'breakdown'))
+    missing = [object_id for object_id in object_ids if object_id not in breakdowns]
+    if missing:
+        breakdowns.update(score_profiles(entity_type, missing))
+    return breakdowns
+
+
+def attach_stored_scores(objects):
+    """Set _stored_score on profiles/bands of one model (read by get_stored_score) with one query"""
+    objects = [obj for obj in objects if obj is not None]
+    if not objects:
+        return
+    breakdowns = load_stored_scores(ProfileScore.SCORED_MODELS[objects[0]._meta.label], [obj.pk for obj in objects])
+    for obj in objects:
+        obj._stored_score = breakdowns.get(obj.pk)
+
+
+def get_stored_score(obj, explain=False):
+    """
+    Stored score breakdown for a talent profile, background profile or band;
+    computed (without storing it) when there is none yet. With `explain`, a
+    copy with the English/Arabic details and improvement tips added.
+    """
+    entity_type = ProfileScore.SCORED_MODELS[obj._meta.label]
+    breakdown = getattr(obj, '_stored_score', None)
+    if breakdown is None:
+        breakdown = ProfileScore.objects.filter(
+            entity_type=entity_type, object_id=obj.pk
+        ).values_list('breakdown', flat=True).first()
+    if breakdown is None:
+        breakdown = score_profiles(entity_type, [obj.pk]).get(obj.pk)
+    if explain and breakdown is not None:
+        return add_explanation(dict(breakdown), entity_type)
+    return breakdown
+
+
+def profile_score_subquery(entity_type, object_field='pk'):
+    """Stored score total of the row's entity, for annotate()/order_by()/filter()"""
+    return Subquery(
+        ProfileScore.objects.filter(
+            entity_type=entity_type, object_id=OuterRef(object_field)
+        ).values('total')[:1]
+    )
+
+
+def _rebuild_batch(entity_type, objects):
+    load_score_inputs(entity_type, objects)
+    save_scores([build_score(entity_type, obj) for obj in objects])
+    return len(objects)
+
+
+def rebuild_profile_scores(entity_types=None, batch_size=500):
+    """
+    Recompute scores for all entities of the given types (all types by default)
+    and delete scores whose entity is gone. Returns {entity_type: count}.
+    """
+    counts = {}
+    for entity_type in entity_types or SCORE_QUERYSETS:
+        queryset = SCORE_QUERYSETS[entity_type]()
+
+        batch = []
+        count = 0
+        for obj in queryset.iterator(chunk_size=batch_size):
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                count += _rebuild_batch(entity_type, batch)
+                batch = []
+        count += _rebuild_batch(entity_type, batch)
+
+        ProfileScore.objects.filter(entity_type=entity_type).exclude(
+            object_id__in=queryset.model.objects.values('pk')
+        ).delete()
+        rebuild_score_buckets(entity_type)
+        scores_changed()
+
+        counts[entity_type] = count
+        logger.info(f"Rebuilt {count} {entity_type} profile scores")
+    return counts
+
+
+def rebuild_score_buckets(entity_type):
+    """Recount an entity type's score histogram from the stored scores"""
+    counts = ProfileScore.objects.filter(entity_type=entity_type).order_by().values_list(
+        'total'
+    ).annotate(count=Count('id'))
+    with transaction.atomic():
+        ScoreBucket.objects.filter(entity_type=entity_type).delete()
+        ScoreBucket.objects.bulk_create([
+            ScoreBucket(entity_type=entity_type, score=total, count=count) for total, count in counts
+        ])
+
+
+def score_distribution(entity_type):
+    """[(score, count), ...] from the highest score down, zero counts left out"""
+    return list(ScoreBucket.objects.filter(
+        entity_type=entity_type, count__gt=0
+    ).order_by('-score').values_list('score', 'count'))
+
+
+def score_percentile(entity_type, total, distribution=None):
+    """
+    Where a score ranks among the stored scores of its type:
+    {'rank', 'out_of', 'percentile' (share of scores below it), 'top_percent'}
+    """
+    if distribution is None:
+        distribution = score_distribution(entity_type)
+    out_of = sum(count for _, count in distribution)
+    above = sum(count for score, count in distribution if score > total)
+    below = sum(count for score, count in distribution if score < total)
+    if not out_of:
+        return {'rank': None, 'out_of': 0, 'percentile': None, 'top_percent': None}
+    return {
+        'rank': above + 1,
+        'out_of': out_of,
+        'percentile': round(below * 100 / out_of, 2),
+        'top_percent': round((above + 1) * 100 / out_of, 2),
+    }
+
+
+def score_thresholds(entity_type, percents=(1, 5, 10), distribution=None):
+    """{percent: lowest score inside the top `percent`%} for each requested percent"""
+    if distribution is None:
+        distribution = score_distribution(entity_type)
+    out_of = sum(count for _, count in distribution)
+    thresholds = {}
+    for percent in percents:
+        if not out_of:
+            thresholds[percent] = None
+            continue
+        # Score of the last profile inside the top `percent`% (at least one profile)
+        needed = max(1, math.floor(out_of * percent / 100))
+        seen = 0
+        for score, count in distribution:
+            seen += count
+            if seen >= needed:
+                thresholds[percent] = score
+                break
+    return thresholds
@@ -0,0 +1,195 @@
+"""
+Query counting and N+1 detection.
+
+QueryRecorder records every query run on the current thread's database
+connections (through connection.execute_wrapper, so DEBUG isn't needed). It
+groups the queries by SQL shape: literals and IN lists are replaced by
+placeholders, so `WHERE id = 1` and `WHERE id = 2` count as the same query. A
+shape repeated many times in one request is the signature of an N+1 loop, and
+the recorder reports the project code location that issued each one.
+
+Used by QueryBudgetMiddleware (per-request budgets, logged or enforced) and by
+QueryBudgetMixin in tests (`with self.assertQueryBudget(10): ...`).
+"""
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:%s|\?|'\?')\s*,)+\s*(?:%s|\?|'\?')\s*\)")
+WHITESPACE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request or test block ran more queries than its budget allows"""
+
+
+def sql_shape(sql):
+    """SQL with literal values and IN lists replaced, so repeated queries compare equal"""
+    shape = STRING_LITERAL.sub("'?'", sql)
+    shape = NUMBER_LITERAL.sub('?', shape)
+    shape = PLACEHOLDER_LIST.sub('(...)', shape)
+    return WHITESPACE.sub(' ', shape).strip()
+
+
+def caller_location():
+    """'path:line in function' of the innermost project frame outside this module"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(PROJECT_ROOT)
+            and filename != __file__
+            and 'site-packages' not in filename
+        ):
+            return f'{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return 'unknown'
+
+
+class QueryRecorder:
+    """
+    Context manager recording the queries run on this thread's connections.
+
+    Queries run by other threads (e.g. the concurrent multi-type search) use
+    their own connections and aren't recorded.
+    """
+
+    def __init__(self, using=None):
+        self.aliases = [using] if using else list(connections)
+        self.queries = []
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for alias in self.aliases:
+            self._stack.enter_context(connections[alias].execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'sql': sql,
+                'shape': sql_shape(sql),
+                'location': caller_location(),
+                'duration': time.perf_counter() - start,
+            })
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(query['duration'] for query in self.queries)
+
+    def repeated_shapes(self, threshold):
+        """
+        [{'shape', 'count', 'locations': {location: count}}] for shapes run at
+        least `threshold` times, most repeated first
+        """
+        counts = Counter(query['shape'] for query in self.queries)
+        locations = defaultdict(Counter)
+        for query in self.queries:
+            if counts[query['shape']] >= threshold:
+                locations[query['shape']][query['location']] += 1
+        return [
+            {'shape': shape, 'count': count, 'locations': dict(locations[shape].most_common())}
+            for shape, count in counts.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, repeat_threshold):
+        lines = [f'{self.count} queries in {self.duration * 1000:.1f}ms']
+        for repeated in self.repeated_shapes(repeat_threshold):
+            lines.append(f"  {repeated['count']}x {repeated['shape'][:200]}")
+            for location, count in repeated['locations'].items():
+                lines.append(f'      {count}x from {location}')
+        return '\n'.join(lines)
+
+
+def check_budget(recorder, max_queries=None, max_repeats=None):
+    """Problems with a recording: the query count over `max_queries`, shapes repeated more than `max_repeats` times"""
+    problems = []
+    if max_queries is not None and recorder.count > max_queries:
+        problems.append(f'{recorder.count} queries (budget {max_queries})')
+    if max_repeats is not None:
+        for repeated in recorder.repeated_shapes(max_repeats + 1):
+            problems.append(f"query repeated {repeated['count']}x (allowed {max_repeats}): {repeated['shape'][:120]}")
+    return problems
+
+
+def get_view_budget(request):
+    """The `query_budget` of the view that handled a request, or QUERY_BUDGET_DEFAULT"""
+    match = getattr(request, 'resolver_match', None)
+    view = getattr(match, 'func', None)
+    view_class = getattr(view, 'view_class', None) or getattr(view, 'cls', None)
+    budget = getattr(view_class, 'query_budget', None)
+    return settings.QUERY_BUDGET_DEFAULT if budget is None else budget
+
+
+class QueryBudgetMiddleware:
+    """
+    Count each request's queries and flag requests over their view's budget
+    (a `query_budget` attribute on the view class, else QUERY_BUDGET_DEFAULT)
+    or repeating one query shape more than QUERY_BUDGET_MAX_REPEATS times.
+
+    Problems are logged with the code locations that issued the repeated
+    queries; with QUERY_BUDGET_STRICT (e.g. in the test suite) they raise
+    QueryBudgetExceeded instead. Enabled with QUERY_BUDGET_ENABLED.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_BUDGET_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+
+        budget = get_view_budget(request)
+        max_repeats = settings.QUERY_BUDGET_MAX_REPEATS
+        if settings.DEBUG:
+            response['X-Query-Count'] = str(recorder.count)
+
+        problems = check_budget(recorder, budget, max_repeats)
+        if problems:
+            message = f"Query budget exceeded for {request.method} {request.path}: {'; '.join(problems)}\n{recorder.report(max_repeats + 1)}"
+            if settings.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+
+class QueryBudgetMixin:
+    """TestCase mixin: fail when a block runs too many queries or repeats a query shape"""
+
+    @contextmanager
+    def assertQueryBudget(self, max_queries=None, max_repeats=None, using=None):
+        with QueryRecorder(using=using) as recorder:
+            yield recorder
+        problems = check_budget(recorder, max_queries, max_repeats)
+        if problems:
+            threshold = (max_repeats + 1) if max_repeats is not None else 2
+            self.fail(f"{'; '.join(problems)}\n{recorder.report(threshold)}")
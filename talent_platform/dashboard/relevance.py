@@ -0,0 +1,280 @@
+"""
+Declarative relevance scoring for the dashboard search views.
+
+Each search view describes how a row earns (or loses) points as a list of
+criteria. ``RelevanceScore`` compiles the criteria that apply to the current
+query parameters into a single SQL expression, so results can be annotated,
+ordered and paginated by the database instead of being scored in Python.
+
+Example:
+    relevance = RelevanceScore([
+        ExactMatch('primary_category', 25),
+        Minimum('min_years_experience', 'years_experience', bonus=15, penalty=10),
+        FuzzyLocationMatch('city', 15, reverse_weight=10),
+        Tiered('relevance_media_count', ((10, 15), (5, 10), (0, 5))),
+    ], annotations={'relevance_media_count': Count('profile__media', distinct=True)})
+
+    queryset = relevance.annotate(queryset, params).order_by('-relevance_score', '-id')
+"""
+from django.db.models import Case, CharField, ExpressionWrapper, F, FloatField, IntegerField, Q, Value, When
+from django.db.models.functions import Abs, Least
+from django.db.models.lookups import GreaterThan, IContains, LessThan, LessThanOrEqual
+
+from .fuzzy import location_points
+
+TRUE_VALUES = ('true', '1', 'yes')
+
+
+def parse_bool(value):
+    """Interpret a query parameter the way the search views always have."""
+    return str(value).lower() in TRUE_VALUES
+
+
+def points(condition, weight):
+    """`weight` points when `condition` (a Q or lookup) holds, otherwise 0."""
+    return Case(
+        When(condition, then=Value(weight)),
+        default=Value(0),
+        output_field=IntegerField()
+    )
+
+
+def choice_value(field, mapping, default, output_field=None):
+    """Map the values of `field` to constants, e.g. account type -> search boost."""
+    return Case(
+        *[When(**{field: key}, then=Value(value)) for key, value in mapping.items()],
+        default=Value(default),
+        output_field=output_field or FloatField()
+    )
+
+
+class Criterion:
+    """
+    A single scoring rule.
+
+    Rules bound to a query parameter only apply when that parameter is present
+    (and not blank); rules without a parameter always apply. `otherwise` is an
+    optional rule used when the parameter is missing.
+    """
+    def __init__(self, param=None, field=None, otherwise=None):
+        self.param = param
+        self.field = field or param
+        self.otherwise = otherwise
+
+    def parse(self, value):
+        """Convert the raw parameter; raise ValueError/TypeError to skip the rule."""
+        return value
+
+    def expression(self, value):
+        raise NotImplementedError
+
+    def compile(self, params):
+        if self.param is None:
+            return self.expression(None)
+        if self.param not in params:
+            return self.otherwise.compile(params) if self.otherwise else None
+        raw = params[self.param]
+        if raw is None or raw == '':
+            return None
+        try:
+            value = self.parse(raw)
+        except (ValueError, TypeError):
+            return None
+        return self.expression(value)
+
+
+class ExactMatch(Criterion):
+    """+weight when the field equals the requested value."""
+    def __init__(self, param, weight, field=None, case_sensitive=True, cast=None, otherwise=None):
+        super().__init__(param, field, otherwise)
+        self.weight = weight
+        self.case_sensitive = case_sensitive
+        self.cast = cast
+
+    def parse(self, value):
+        return self.cast(value) if self.cast else value
+
+    def expression(self, value):
+        lookup = self.field if self.case_sensitive else f'{self.field}__iexact'
+        return points(Q(**{lookup: value}), self.weight)
+
+
+class BooleanMatch(ExactMatch):
+    """+weight when a boolean field matches a true/false style parameter."""
+    def __init__(self, param, weight, field=None, otherwise=None):
+        super().__init__(param, weight, field, cast=parse_bool, otherwise=otherwise)
+
+
+class PartialMatch(Criterion):
+    """
+    Case-insensitive text match: +weight when the requested text is contained
+    in the field, +reverse_weight when the field is contained in the text.
+    Empty fields never match.
+    """
+    def __init__(self, param, weight, field=None, reverse_weight=0):
+        super().__init__(param, field)
+        self.weight = weight
+        self.reverse_weight = reverse_weight
+
+    def whens(self, value):
+        present = Q(**{f'{self.field}__isnull': False}) & ~Q(**{self.field: ''})
+        whens = [When(present & Q(**{f'{self.field}__icontains': value}), then=Value(self.weight))]
+        if self.reverse_weight:
+            contained = IContains(Value(value, output_field=CharField()), F(self.field))
+            whens.append(When(present & Q(contained), then=Value(self.reverse_weight)))
+        return whens
+
+    def expression(self, value):
+        return Case(*self.whens(value), default=Value(0), output_field=IntegerField())
+
+
+class FuzzyLocationMatch(PartialMatch):
+    """
+    PartialMatch for city/country/location fields that also tolerates
+    misspellings: rows that match neither way but are trigram-similar to the
+    text score weight * similarity (e.g. "Dubay" vs "Dubai" earns half).
+    """
+    def expression(self, value):
+        return Case(
+            *self.whens(value),
+            default=location_points(self.field, value, self.weight),
+            output_field=IntegerField()
+        )
+
+
+class Distance(Criterion):
+    """
+    Points by closeness: `tiers` is ((limit, points), ...) in ascending order of
+    limit, checked against abs(field - value). Limits are exclusive unless
+    `inclusive` is set. Rows with no value score nothing.
+    """
+    def __init__(self, param, tiers, field=None, cast=float, inclusive=False):
+        super().__init__(param, field)
+        self.tiers = tiers
+        self.cast = cast
+        self.inclusive = inclusive
+
+    def parse(self, value):
+        return self.cast(value)
+
+    def expression(self, value):
+        diff = Abs(F(self.field) - Value(value))
+        within = LessThanOrEqual if self.inclusive else LessThan
+        return Case(
+            When(**{f'{self.field}__isnull': True}, then=Value(0)),
+            *[When(within(diff, limit), then=Value(weight)) for limit, weight in self.tiers],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+
+
+class Minimum(Criterion):
+    """
+    +bonus when field >= value; otherwise a penalty of `penalty` points per unit
+    the field falls short, e.g. ``-10 * (min_exp - years_experience)``.
+    """
+    def __init__(self, param, field, bonus, penalty, cast=int):
+        super().__init__(param, field)
+        self.bonus = bonus
+        self.penalty = penalty
+        self.cast = cast
+
+    def parse(self, value):
+        return self.cast(value)
+
+    def expression(self, value):
+        return Case(
+            When(**{f'{self.field}__isnull': True}, then=Value(0)),
+            When(**{f'{self.field}__gte': value}, then=Value(self.bonus)),
+            default=(F(self.field) - Value(value)) * Value(self.penalty),
+            output_field=IntegerField()
+        )
+
+
+class Maximum(Minimum):
+    """+bonus when field <= value; otherwise `penalty` points per unit over."""
+    def expression(self, value):
+        return Case(
+            When(**{f'{self.field}__isnull': True}, then=Value(0)),
+            When(**{f'{self.field}__lte': value}, then=Value(self.bonus)),
+            default=(Value(value) - F(self.field)) * Value(self.penalty),
+            output_field=IntegerField()
+        )
+
+
+class Tiered(Criterion):
+    """
+    Always applied: points for the first threshold the field exceeds.
+    `tiers` is ((threshold, points), ...) in descending order of threshold.
+    """
+    def __init__(self, field, tiers):
+        super().__init__(field=field)
+        self.tiers = tiers
+
+    def expression(self, value):
+        return Case(
+            *[When(GreaterThan(F(self.field), threshold), then=Value(weight)) for threshold, weight in self.tiers],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+
+
+class Bonus(Criterion):
+    """Always applied: +weight for rows matching `condition`."""
+    def __init__(self, condition, weight):
+        super().__init__()
+        self.condition = condition
+        self.weight = weight
+
+    def expression(self, value):
+        return points(self.condition, self.weight)
+
+
+class RelevanceScore:
+    """
+    A complete scoring spec for one search view.
+
+    Args:
+        criteria: rules summed on top of `base`
+        base: starting score for every row
+        multiplier: optional expression; the summed score is multiplied by (1 + multiplier)
+        bonuses: rules added after the multiplier
+        cap: optional upper bound on the final score
+        annotations: expressions (or callables returning them) the rules refer to,
+            e.g. media counts; added first
+    """
+    def __init__(self, criteria, base=100, multiplier=None, bonuses=(), cap=None, annotations=None):
+        self.criteria = list(criteria)
+        self.base = base
+        self.multiplier = multiplier
+        self.bonuses = list(bonuses)
+        self.cap = cap
+        self.annotations = annotations or {}
+
+    def _sum(self, start, criteria, params):
+        total = start
+        for criterion in criteria:
+            expression = criterion.compile(params)
+            if expression is not None:
+                total = total + expression
+        return total
+
+    def expression(self, params):
+        score = self._sum(Value(self.base), self.criteria, params)
+        if self.multiplier is not None:
+            score = score * (Value(1.0) + self.multiplier)
+        score = self._sum(score, self.bonuses, params)
+        if self.cap is not None:
+            score = Least(score, Value(self.cap))
+        return score
+
+    def annotate(self, queryset, params, name='relevance_score'):
+        """Annotate `queryset` with the score for `params` under `name`."""
+        if self.annotations:
+            # Callables are evaluated per query (e.g. expressions that depend on today's date)
+            queryset = queryset.annotate(**{
+                alias: expression() if callable(expression) else expression
+                for alias, expression in self.annotations.items()
+            })
+        output_field = FloatField() if self.multiplier is not None else IntegerField()
+        return queryset.annotate(**{name: ExpressionWrapper(self.expression(params), output_field=output_field)})
@@ -0,0 +1,86 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from users.permissions import IsAdminDashboardUser, IsDashboardUser
+
+from .models import ProfileScore
+from .profile_scores import (
+    score_distribution, score_percentile, score_profiles, score_thresholds
+)
+
+# Top percentages whose score thresholds are reported
+THRESHOLD_PERCENTS = (1, 5, 10)
+
+ENTITY_TYPES = [choice for choice, _ in ProfileScore.ENTITY_TYPES]
+
+
+def invalid_entity_type(entity_type):
+    return Response(
+        {'error': f'Invalid entity type: {entity_type}. Must be one of: {", ".join(ENTITY_TYPES)}'},
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+def format_thresholds(thresholds):
+    return {f'top_{percent}': score for percent, score in thresholds.items()}
+
+
+class ScoreDistributionView(APIView):
+    """
+    Profile score distribution of talent profiles, background profiles or bands.
+
+    Returns the number of profiles with each score and the lowest score inside
+    the top 1/5/10%, read from the maintained score histogram.
+
+    Example:
+    - /api/dashboard/scores/talent/
+    """
+    permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+
+    def get(self, request, entity_type):
+        if entity_type not in ENTITY_TYPES:
+            return invalid_entity_type(entity_type)
+
+        distribution = score_distribution(entity_type)
+        return Response({
+            'entity_type': entity_type,
+            'out_of': sum(count for _, count in distribution),
+            'thresholds': format_thresholds(score_thresholds(entity_type, THRESHOLD_PERCENTS, distribution)),
+            'distribution': [{'score': score, 'count': count} for score, count in distribution],
+        })
+
+
+class ProfileScoreRankView(APIView):
+    """
+    Where one talent profile, background profile or band ranks by profile score.
+
+    Returns its stored score (computed without storing it when missing), rank,
+    percentile (share of profiles scoring lower) and the top 1/5/10% thresholds.
+
+    Example:
+    - /api/dashboard/scores/talent/42/
+    """
+    permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+
+    def get(self, request, entity_type, object_id):
+        if entity_type not in ENTITY_TYPES:
+            return invalid_entity_type(entity_type)
+
+        total = ProfileScore.objects.filter(
+            entity_type=entity_type, object_id=object_id
+        ).values_list('total', flat=True).first()
+        if total is None:
+            # Not stored yet: compute it without writing on a GET
+            breakdown = score_profiles(entity_type, [object_id]).get(object_id)
+            if breakdown is None:
+                return Response({'error': f'No {entity_type} with id {object_id}'}, status=status.HTTP_404_NOT_FOUND)
+            total = breakdown['total']
+
+        distribution = score_distribution(entity_type)
+        return Response({
+            'entity_type': entity_type,
+            'object_id': object_id,
+            'total': total,
+            **score_percentile(entity_type, total, distribution),
+            'thresholds': format_thresholds(score_thresholds(entity_type, THRESHOLD_PERCENTS, distribution)),
+        })
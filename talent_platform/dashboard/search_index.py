@@ -0,0 +1,278 @@
+"""
+Builds and maintains SearchDocument rows.
+
+Each entity type has a queryset (annotated with everything its document needs)
+and a builder that turns one row into a SearchDocument, so the incremental
+updates triggered by signals and the full rebuild share one code path.
+"""
+import logging
+from datetime import date
+from functools import partial
+
+from django.db.models import Count, Q
+
+from django.apps import apps
+
+from profiles.models import TalentUserProfile, BackGroundJobsProfile, Band
+
+from .models import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+AGE_BUCKET_SIZE = 5
+
+# Fields refreshed when a document already exists
+DOCUMENT_UPDATE_FIELDS = [
+    field.name for field in SearchDocument._meta.concrete_fields
+    if field.name not in ('id', 'entity_type', 'object_id')
+]
+
+
+def calculate_age(date_of_birth, today=None):
+    if not date_of_birth:
+        return None
+    today = today or date.today()
+    return today.year - date_of_birth.year - ((today.month, today.day) < (date_of_birth.month, date_of_birth.day))
+
+
+def age_bucket(date_of_birth, today=None):
+    """Lower bound of the 5-year age band, e.g. 25 for ages 25-29"""
+    age = calculate_age(date_of_birth, today)
+    if age is None or age < 0:
+        return None
+    return age - age % AGE_BUCKET_SIZE
+
+
+def search_text(*parts):
+    return ' '.join(str(part).strip().lower() for part in parts if part)
+
+
+def full_name(user):
+    return f"{user.first_name} {user.last_name}".strip() or user.email
+
+
+# Talent profiles
+
+def talent_queryset():
+    return TalentUserProfile.objects.select_related(
+        'user', 'visual_worker', 'expressive_worker', 'hybrid_worker'
+    ).annotate(
+        image_count=Count('media', filter=Q(media__media_type='image', media__is_test_video=False)),
+        video_count=Count('media', filter=Q(media__media_type='video', media__is_test_video=False)),
+        total_media=Count('media', filter=Q(media__is_test_video=False)),
+        all_media_count=Count('media'),
+    )
+
+
+def talent_document(profile):
+    user = profile.user
+    visual = getattr(profile, 'visual_worker', None)
+    expressive = getattr(profile, 'expressive_worker', None)
+    hybrid = getattr(profile, 'hybrid_worker', None)
+
+    return SearchDocument(
+        entity_type='talent',
+        object_id=profile.pk,
+        title=full_name(user),
+        account_type=profile.account_type,
+        search_boost=profile.get_search_boost(),
+        is_verified=profile.is_verified,
+        email_verified=user.email_verified,
+        profile_complete=profile.profile_complete,
+        gender=profile.gender or '',
+        city=profile.city or '',
+        country=profile.country or '',
+        date_of_birth=profile.date_of_birth,
+        age_bucket=age_bucket(profile.date_of_birth),
+        image_count=profile.image_count,
+        video_count=profile.video_count,
+        media_count=profile.total_media,
+        all_media_count=profile.all_media_count,
+        is_visual=visual is not None,
+        is_expressive=expressive is not None,
+        is_hybrid=hybrid is not None,
+        specialization_count=sum(1 for worker in (visual, expressive, hybrid) if worker is not None),
+        search_text=search_text(
+            user.first_name, user.last_name, profile.aboutyou, profile.city, profile.country,
+            visual and visual.primary_category,
+            expressive and expressive.performer_type,
+            hybrid and hybrid.hybrid_type,
+        ),
+    )
+
+
+# Background profiles
+
+def background_queryset():
+    return BackGroundJobsProfile.objects.select_related('user')
+
+
+def background_document(profile):
+    user = profile.user
+    country = profile.country if profile.country != 'country' else ''
+
+    return SearchDocument(
+        entity_type='background',
+        object_id=profile.pk,
+        title=full_name(user),
+        account_type=profile.account_type,
+        search_boost=TalentUserProfile.SEARCH_BOOSTS.get(profile.account_type, TalentUserProfile.SEARCH_BOOSTS['free']),
+        email_verified=user.email_verified,
+        gender=profile.gender or '',
+        country=country,
+        date_of_birth=profile.date_of_birth,
+        age_bucket=age_bucket(profile.date_of_birth),
+        search_text=search_text(user.first_name, user.last_name, country),
+    )
+
+
+# Bands
+
+def band_queryset():
+    return Band.objects.select_related('creator__user').annotate(
+        _member_count=Count('bandmembership', distinct=True),
+        media_total=Count('media', distinct=True),
+    )
+
+
+def band_document(band):
+    creator = band.creator
+
+    return SearchDocument(
+        entity_type='band',
+        object_id=band.pk,
+        title=band.name,
+        account_type=creator.account_type if creator else 'free',
+        search_boost=creator.get_search_boost() if creator else 0.0,
+        email_verified=bool(creator and creator.user.email_verified),
+        city=band.location or '',
+        media_count=band.media_total,
+        all_media_count=band.media_total,
+        member_count=band.member_count,
+        search_text=search_text(band.name, band.description, band.location, band.band_type),
+    )
+
+
+# Background items (props, costumes, locations, ...)
+
+# Type-specific text fields indexed for each item entity type
+ITEM_TEXT_FIELDS = {
+    'prop': ('material', 'used_in_movie', 'condition'),
+    'costume': ('size', 'worn_by', 'era'),
+    'location': ('address',),
+    'memorabilia': ('signed_by',),
+    'vehicle': ('make', 'model', 'year'),
+    'artistic_material': ('type', 'condition'),
+    'music_item': ('instrument_type', 'used_by'),
+    'rare_item': ('provenance',),
+}
+
+
+def item_queryset(model_label):
+    return apps.get_model(model_label).objects.select_related('BackGroundJobsProfile__user', 'genre')
+
+
+def item_document(entity_type, item):
+    owner = item.BackGroundJobsProfile
+    country = owner.country if owner and owner.country != 'country' else ''
+
+    return SearchDocument(
+        entity_type=entity_type,
+        object_id=item.pk,
+        title=item.name,
+        account_type=owner.account_type if owner else 'free',
+        email_verified=bool(owner and owner.user.email_verified),
+        country=country,
+        search_text=search_text(
+            item.name, item.description, item.genre and item.genre.name, country,
+            *(getattr(item, field) for field in ITEM_TEXT_FIELDS[entity_type])
+        ),
+    )
+
+
+DOCUMENT_BUILDERS = {
+    'talent': (talent_queryset, talent_document),
+    'background': (background_queryset, background_document),
+    'band': (band_queryset, band_document),
+}
+DOCUMENT_BUILDERS.update({
+    entity_type: (partial(item_queryset, model_label), partial(item_document, entity_type))
+    for model_label, entity_type in SearchDocument.ITEM_MODELS.items()
+})
+
+
+def save_documents(documents):
+    """Insert or update documents in one statement"""
+    if documents:
+        SearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['entity_type', 'object_id'],
+            update_fields=DOCUMENT_UPDATE_FIELDS,
+        )
+
+
+def remove_document(entity_type, object_id):
+    SearchDocument.objects.filter(entity_type=entity_type, object_id=object_id).delete()
+
+
+def index_object(entity_type, object_id):
+    """Rebuild one entity's document, dropping it if the entity no longer exists"""
+    if object_id is None:
+        return
+    build_queryset, build_document = DOCUMENT_BUILDERS[entity_type]
+    obj = build_queryset().filter(pk=object_id).first()
+    if obj is None:
+        remove_document(entity_type, object_id)
+        return
+    save_documents([build_document(obj)])
+
+
+def index_talent_profile(profile_id):
+    index_object('talent', profile_id)
+
+
+def index_background_profile(profile_id):
+    index_object('background', profile_id)
+
+
+def index_band(band_id):
+    index_object('band', band_id)
+
+
+def index_user_profiles(user_id):
+    """Refresh the documents of every profile owned by a user"""
+    for profile_id in TalentUserProfile.objects.filter(user_id=user_id).values_list('pk', flat=True):
+        index_talent_profile(profile_id)
+    for profile_id in BackGroundJobsProfile.objects.filter(user_id=user_id).values_list('pk', flat=True):
+        index_background_profile(profile_id)
+
+
+def rebuild_search_documents(entity_types=None, batch_size=500):
+    """
+    Rebuild documents for all entities of the given types (all types by default)
+    and delete documents whose entity is gone. Returns {entity_type: count}.
+    """
+    counts = {}
+    for entity_type in entity_types or DOCUMENT_BUILDERS:
+        build_queryset, build_document = DOCUMENT_BUILDERS[entity_type]
+        queryset = build_queryset()
+
+        batch = []
+        count = 0
+        for obj in queryset.iterator(chunk_size=batch_size):
+            batch.append(build_document(obj))
+            if len(batch) >= batch_size:
+                save_documents(batch)
+                count += len(batch)
+                batch = []
+        save_documents(batch)
+        count += len(batch)
+
+        SearchDocument.objects.filter(entity_type=entity_type).exclude(
+            object_id__in=queryset.model.objects.values('pk')
+        ).delete()
+
+        counts[entity_type] = count
+        logger.info(f"Rebuilt {count} {entity_type} search documents")
+    return counts
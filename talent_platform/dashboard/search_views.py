@@ -1,12 +1,24 @@
 from rest_framework import generics, filters
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.urls import reverse
-from django.db.models import Q, F, ExpressionWrapper, FloatField, Count, Case, When, Value, IntegerField, CharField
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import (
+    Q, F, ExpressionWrapper, FloatField, Count, Case, When, Value, IntegerField, CharField, OuterRef, Subquery
+)
 from django.db.models.functions import Coalesce, Concat
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import datetime, date, timedelta
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import logging
 import math
+import os
+import threading
+import time
 from django.contrib.contenttypes.models import ContentType
 
 from users.permissions import IsDashboardUser, IsAdminDashboardUser
@@ -27,7 +39,7 @@ from .serializers import (
     PropDashboardSerializer, CostumeDashboardSerializer, LocationDashboardSerializer, 
     MemorabilaDashboardSerializer, VehicleDashboardSerializer,
     ArtisticMaterialDashboardSerializer, MusicItemDashboardSerializer, 
-    RareItemDashboardSerializer
+    RareItemDashboardSerializer, ItemCatalogueSerializer, SharingStatusMixin
 )
 
 # Import filters
@@ -38,57 +50,746 @@ from .filters import (
     VehicleFilter, ArtisticMaterialFilter, MusicItemFilter, RareItemFilter
 )
 
-# Import shared media post model
-from .models import SharedMediaPost
+# Import relevance scoring
+from .relevance import (
+    RelevanceScore, ExactMatch, BooleanMatch, PartialMatch, FuzzyLocationMatch, Distance,
+    Minimum, Maximum, Tiered, Bonus, choice_value, parse_bool
+)
+
+# Import shared media post and search document models
+from .models import SharedMediaPost, SearchDocument
+from .fulltext import apply_fulltext
+from .fuzzy import location_match
+from .pagination import KeysetOrPageNumberPagination
+from .export import EXPORT_FORMATS, streaming_export
+from .item_catalogue import catalogue_from_params
+from .metrics import measure_serializer
+from .profile_scores import SCORES_LABEL, attach_stored_scores, get_stored_score, profile_score_subquery
+from .utils import (
+    CACHE_TIMEOUTS, SharingStatusResolver, get_cache_key, get_generations, namespace_label,
+    wants_score_explanation
+)
+
+logger = logging.getLogger(__name__)
+
+# The process's multi-type search pool (see fanout_executor)
+_fanout_executor = None
+_fanout_pid = None
+_fanout_lock = threading.Lock()
+
+
+def fanout_executor():
+    """
+    The thread pool multi-type searches run in: one per process (created on
+    first use, so after a pre-fork), SEARCH_FANOUT_MAX_WORKERS threads shared
+    by all requests, which bounds the database connections they hold
+    """
+    global _fanout_executor, _fanout_pid
+    with _fanout_lock:
+        if _fanout_executor is None or _fanout_pid != os.getpid():
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=settings.SEARCH_FANOUT_MAX_WORKERS, thread_name_prefix='search-fanout'
+            )
+            _fanout_pid = os.getpid()
+        return _fanout_executor
+
+
+# Seconds between checks for queued multi-type searches having started (see wait_for_searches)
+FANOUT_QUEUE_POLL = 0.05
+
+
+# Query parameters used for routing/output rather than as search criteria
+RESERVED_SEARCH_PARAMS = {
+    'profile_type', 'format', 'include_media', 'page', 'page_size', 'ordering', 'q',
+    'pagination', 'cursor', 'count', 'per_type', 'facets', 'export_format', 'explain',
+}
+
+# Parameters that don't change the result set (only which part of it is returned or how)
+RESULT_CACHE_IGNORED_PARAMS = {
+    'format', 'include_media', 'page', 'page_size', 'cursor', 'count', 'per_type', 'facets', 'export_format',
+    'explain',
+}
+
+# Models each kind of search result depends on, for result cache invalidation;
+# SCORES_LABEL covers the stored profile scores results can be ordered by
+TALENT_CACHE_DEPENDENCIES = (
+    'profiles.TalentUserProfile', 'profiles.TalentMedia', 'users.BaseUser',
+    'profiles.VisualWorker', 'profiles.ExpressiveWorker', 'profiles.HybridWorker',
+    SCORES_LABEL,
+)
+BAND_CACHE_DEPENDENCIES = (
+    'profiles.Band', 'profiles.BandMembership', 'profiles.BandMedia',
+    'profiles.TalentUserProfile', 'users.BaseUser', SCORES_LABEL,
+)
+
+
+class SearchResultsPagination(KeysetOrPageNumberPagination):
+    """
+    Database-side pagination for relevance-ranked search results: page numbers
+    by default, keyset on (relevance_score, id) with ?pagination=cursor
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+
+
+def age_expression(date_field):
+    """Age in whole years computed by the database from a date of birth field"""
+    today = timezone.now()
+    return Case(
+        When(
+            **{f'{date_field}__isnull': False},
+            then=today.year - F(f'{date_field}__year') - 
+                 Case(
+                     When(
+                         Q(**{f'{date_field}__month__gt': today.month}) |
+                         Q(**{f'{date_field}__month': today.month, f'{date_field}__day__gt': today.day}),
+                         then=Value(1)
+                     ),
+                     default=Value(0)
+                 )
+        ),
+        default=Value(None),
+        output_field=IntegerField()
+    )
+
+
+# Relevance criteria shared by the visual, expressive and hybrid worker searches
+WORKER_LOCATION_CRITERIA = [
+    FuzzyLocationMatch('city', 15, reverse_weight=10),
+    FuzzyLocationMatch('country', 15, reverse_weight=10),
+]
+
+WORKER_PROFILE_CRITERIA = [
+    # Score profile completeness through the related TalentUserProfile
+    Bonus(Q(profile__profile_complete=True), 5),
+    # Media content bonus
+    Tiered('relevance_media_count', ((10, 15), (5, 10), (0, 5))),
+    # Email verification bonus
+    Bonus(Q(profile__user__email_verified=True), 10),
+    # Add premium account bonuses - prioritize paid accounts
+    Bonus(Q(profile__account_type='platinum'), 15),
+    Bonus(Q(profile__account_type='premium'), 10),
+]
+
+WORKER_RELEVANCE_ANNOTATIONS = {
+    'relevance_media_count': Count('profile__media', distinct=True),
+}
+
+
+# Facets shared by the worker searches, read through the related TalentUserProfile
+WORKER_FACET_FIELDS = {
+    'gender': 'profile__gender',
+    'account_type': 'profile__account_type',
+    'is_verified': 'profile__is_verified',
+    'country': 'profile__country',
+    'city': 'profile__city',
+}
+
+# Columns shared by the worker search exports
+WORKER_EXPORT_FIELDS = (
+    'id', 'profile_id', 'profile__user__email', 'profile__user__first_name', 'profile__user__last_name',
+    'profile__gender', 'profile__city', 'profile__country', 'profile__account_type',
+)
+
+# Facets shared by the item searches
+ITEM_FACET_FIELDS = {
+    'genre': 'genre__name',
+    'is_for_rent': 'is_for_rent',
+    'is_for_sale': 'is_for_sale',
+}
+
+
+def worker_experience_criteria():
+    return [
+        # Reward meeting the requested experience, penalize per missing/extra year
+        Minimum('min_years_experience', 'years_experience', bonus=15, penalty=10),
+        Maximum('max_years_experience', 'years_experience', bonus=10, penalty=5),
+    ]
+
+
+def worker_body_criteria():
+    return [
+        # Height and weight scoring - closer to target = better score
+        Distance('height', ((1, 15), (3, 10), (5, 5))),
+        Distance('weight', ((2, 15), (5, 10), (10, 5))),
+    ]
+
 
 # Define a common mixin for all search views
 class SearchViewMixin:
-    """Mixin with common attributes for all search views"""
+    """
+    Mixin with the common search pipeline for all search views.
+
+    list() runs: filter backends -> apply_search_filters() -> relevance
+    annotation and ordering in the database -> pagination -> decorate_results()
+    on the current page only.
+
+    Views configure it with:
+        relevance: RelevanceScore used to rank results when search criteria are given
+        detail_url_name / detail_url_field: detail route added to every result
+        empty_message: returned as {"message": ...} when nothing matches
+        media_path: dotted path to the media manager (e.g. 'profile.media')
+        always_include_media: include media without the include_media parameter
+        document_type: SearchDocument entity type of this view's rows; enables
+            free-text search with ?q= (see get_text_search_results)
+        document_object_field: field of this view's rows holding the document object_id
+        document_relevance: when SEARCH_DOCUMENTS_ENABLED is set, filter and rank on
+            SearchDocument rows instead (see apply_document_filters), then load only
+            the current page of model rows
+        cache_dependencies: model labels the results depend on; when set, the ordered
+            result ids and scores are cached per query (see get_results_cache_key)
+            and only the requested page is loaded from the database
+        facet_fields: {facet name: field path} counted for ?facets= (see get_facets);
+            paths must be single-valued (fields or forward relations)
+        export_fields: field paths written by the search export (see export_results);
+            defaults to the model's concrete fields
+        profile_score_source: dotted path from a row to its scored profile or band
+            ('' for the row itself); the page's stored scores are then loaded in one
+            query (see attach_profile_scores)
+        query_budget: most queries one request may run (see dashboard.query_budget);
+            a page costs a fixed number of queries whatever its size
+    """
     format_kwarg = 'format'
+    pagination_class = SearchResultsPagination
+    relevance = None
+    detail_url_name = None
+    detail_url_field = 'profile_url'
+    empty_message = None
+    media_path = None
+    always_include_media = False
+    document_type = None
+    document_object_field = 'pk'
+    document_relevance = None
+    cache_dependencies = None
+    facet_fields = {}
+    export_fields = None
+    profile_score_source = None
+    query_budget = 25
+    
+    @cached_property
+    def sharing_status_resolver(self):
+        """Sharing statuses of everything this request renders, loaded together"""
+        return SharingStatusResolver()
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['sharing_status_resolver'] = self.sharing_status_resolver
+        return context
+    
+    def get_sharing_status_objects(self, rows):
+        """Media and items a page of rows renders a sharing status for"""
+        objects = []
+        if issubclass(self.get_serializer_class(), SharingStatusMixin):
+            objects.extend(rows)
+        if self.include_media():
+            for obj in rows:
+                objects.extend(self.get_media(obj))
+        return objects
     
     def get_sharing_status(self, media):
         """
-        Get sharing status for a media item using centralized utility.
-        Returns sharing information if the media is already shared.
-        Guarantees to always return a valid sharing status object.
+        Sharing status of a media item, resolved together with the rest of the
+        page (see get_sharing_status_objects)
+        """
+        return self.sharing_status_resolver.get(media)
+    
+    def get_search_params(self):
+        """Query parameters that are search criteria (routing/output parameters excluded)"""
+        return {k: v for k, v in self.request.query_params.items() if k not in RESERVED_SEARCH_PARAMS}
+    
+    def apply_search_filters(self, queryset, search_params):
+        """Additional strict filtering for fields not handled by the filter backend"""
+        return queryset
+    
+    def calculate_profile_score(self, obj):
+        """Profile score added to each result; None to leave it out"""
+        return None
+    
+    def include_media(self):
+        if self.media_path is None:
+            return False
+        if self.always_include_media:
+            return True
+        return parse_bool(self.request.query_params.get('include_media', ''))
+    
+    def get_media(self, obj):
+        manager = obj
+        for attr in self.media_path.split('.'):
+            manager = getattr(manager, attr)
+        return manager.all()
+    
+    def serialize_media(self, media):
+        request = self.request
+        # Get sharing status with guaranteed fallback
+        sharing_status = self.get_sharing_status(media)
+        if not sharing_status or not isinstance(sharing_status, dict):
+            sharing_status = {'is_shared': False}
+        
+        return {
+            'id': media.id,
+            'name': media.name,
+            'media_info': media.media_info,
+            'media_type': media.media_type,
+            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
+            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
+            'created_at': media.created_at,
+            'is_test_video': media.is_test_video,
+            'is_about_yourself_video': media.is_about_yourself_video,
+            'sharing_status': sharing_status
+        }
+    
+    def get_search_queryset(self, search_params):
+        """
+        Filtered queryset, annotated with relevance_score and ordered by it when
+        search criteria are given, so ranking and LIMIT/OFFSET run in the database.
+        Returns (queryset, ranked).
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if search_params:
+            queryset = self.apply_search_filters(queryset, search_params)
+        
+        ranked = bool(search_params) and self.relevance is not None
+        if ranked:
+            queryset = self.relevance.annotate(queryset, search_params)
+        
+        # An explicit ?ordering= from the OrderingFilter takes precedence, except
+        # with cursor pagination, which needs the ranking order (non-null keys)
+        if 'ordering' not in self.request.query_params or self.paginator.use_keyset(self.request):
+            queryset = queryset.order_by('-relevance_score', '-id') if ranked else queryset.order_by('-id')
+        return queryset, ranked
+    
+    def use_search_documents(self):
+        return self.document_relevance is not None and getattr(settings, 'SEARCH_DOCUMENTS_ENABLED', False)
+    
+    def apply_document_filters(self, documents, search_params):
+        """Strict filtering on SearchDocument rows, mirroring the filterset and apply_search_filters"""
+        return documents
+    
+    def get_document_queryset(self, search_params):
+        """
+        SearchDocument rows for this view's entity type, filtered and ranked on
+        the single denormalized table. Returns (queryset, ranked).
+        """
+        documents = SearchDocument.objects.filter(entity_type=self.document_type)
+        if search_params:
+            documents = self.apply_document_filters(documents, search_params)
+        
+        ranked = bool(search_params) and self.document_relevance is not None
+        if ranked:
+            documents = self.document_relevance.annotate(documents, search_params)
+            return documents.order_by('-relevance_score', '-object_id'), ranked
+        return documents.order_by('-object_id'), ranked
+    
+    def hydrate_documents(self, documents, ranked):
+        """Load the model rows for a page of documents, keeping the document order"""
+        objects = self.get_queryset().in_bulk([document.object_id for document in documents])
+        rows = []
+        for document in documents:
+            obj = objects.get(document.object_id)
+            if obj is None:
+                # Document is stale; the next signal or rebuild removes it
+                continue
+            if ranked:
+                obj.relevance_score = document.relevance_score
+            rows.append(obj)
+        return rows
+    
+    def get_text_query(self):
+        if self.document_type is None:
+            return ''
+        return self.request.query_params.get('q', '').strip()
+    
+    def get_text_documents(self, text_query, queryset):
+        """
+        SearchDocument rows matching the query whose objects are in `queryset`
+        (the view's filtered rows), with `text_rank` annotated
+        """
+        object_ids = queryset.model._default_manager.filter(
+            pk__in=queryset.order_by().values('pk')
+        ).values(self.document_object_field)
+        documents = SearchDocument.objects.filter(entity_type=self.document_type, object_id__in=object_ids)
+        return apply_fulltext(documents, text_query)
+    
+    def get_text_matches(self, text_query, queryset):
+        """{object_id: text_rank} of the best FULLTEXT_MAX_RESULTS documents matching the query within `queryset`"""
+        documents = self.get_text_documents(text_query, queryset)
+        documents = documents.order_by('-text_rank', '-object_id')[:settings.FULLTEXT_MAX_RESULTS]
+        return dict(documents.values_list('object_id', 'text_rank'))
+    
+    def get_text_search_results(self, text_query, search_params):
+        """
+        Free-text search: the top matches from the full-text index among the rows
+        passing the view's usual filters, ordered by text rank (relevance_score
+        breaks ties). The filters are applied in the document query, before the
+        FULLTEXT_MAX_RESULTS cap, so filtered-out documents don't take up slots.
+        Returns ([(pk, text_rank, relevance_score), ...], ranked); the list is at
+        most FULLTEXT_MAX_RESULTS long, so it is paginated in memory.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if search_params:
+            queryset = self.apply_search_filters(queryset, search_params)
+        
+        matches = self.get_text_matches(text_query, queryset)
+        queryset = queryset.filter(**{f'{self.document_object_field}__in': list(matches)})
+        
+        ranked = bool(search_params) and self.relevance is not None
+        if ranked:
+            queryset = self.relevance.annotate(queryset, search_params)
+            fields = ('pk', self.document_object_field, 'relevance_score')
+        else:
+            fields = ('pk', self.document_object_field)
+        
+        results = [
+            (row[0], matches[row[1]], row[2] if ranked else None)
+            for row in queryset.values_list(*fields)
+        ]
+        results.sort(key=lambda result: (-result[1], -(result[2] or 0), -result[0]))
+        return results, ranked
+    
+    def get_results_cache_key(self, search_params, text_query, prefix='search_results', *extra):
+        """
+        Cache key for this query's ordered results, or None when results aren't
+        cached. Built from the normalized result-affecting parameters and the
+        generation counters of cache_dependencies, so any save or delete of a
+        dependency switches to a fresh key; invalidate_namespace('search_results')
+        drops every cached result and facet count.
+        """
+        if not self.cache_dependencies or not settings.SEARCH_RESULT_CACHE_ENABLED:
+            return None
+        params = {
+            key: value.strip() for key, value in self.request.query_params.items()
+            if key not in RESULT_CACHE_IGNORED_PARAMS and value.strip()
+        }
+        if self.paginator is not None and self.paginator.use_keyset(self.request):
+            params['pagination'] = 'cursor'
+        return get_cache_key(
+            prefix, type(self).__name__, *extra,
+            *get_generations([namespace_label('search_results'), *self.cache_dependencies]), **params
+        )
+    
+    def get_result_list(self, queryset, ranked, documents=False):
+        """
+        The whole ordered result set as [(pk, text_rank, relevance_score), ...],
+        or None when it is larger than SEARCH_RESULT_CACHE_MAX_IDS.
+        """
+        pk_field = 'object_id' if documents else 'pk'
+        fields = (pk_field, 'relevance_score') if ranked else (pk_field,)
+        limit = settings.SEARCH_RESULT_CACHE_MAX_IDS
+        rows = list(queryset.values_list(*fields)[:limit + 1])
+        if len(rows) > limit:
+            return None
+        return [(row[0], None, row[1] if ranked else None) for row in rows]
+    
+    def hydrate_results(self, results, ranked):
+        """Load the model rows for a page of (pk, text_rank, relevance_score) results, keeping their order"""
+        objects = self.get_queryset().in_bulk([pk for pk, _, _ in results])
+        rows = []
+        for pk, text_rank, relevance_score in results:
+            obj = objects.get(pk)
+            if obj is None:
+                # Deleted since the results were computed
+                continue
+            if text_rank is not None:
+                obj.text_rank = text_rank
+            if ranked:
+                obj.relevance_score = relevance_score
+            rows.append(obj)
+        return rows
+    
+    def decorate_results(self, rows, data, ranked):
+        """Add relevance scores, profile scores, detail URLs and media to serialized rows"""
+        request = self.request
+        include_media = self.include_media()
+        explain = self.profile_score_source is not None and wants_score_explanation(request)
+        
+        for obj, item in zip(rows, data):
+            if ranked:
+                item['relevance_score'] = obj.relevance_score
+            
+            if hasattr(obj, 'text_rank'):
+                item['text_rank'] = obj.text_rank
+            
+            profile_score = self.calculate_profile_score(obj)
+            if profile_score is not None:
+                item['profile_score'] = profile_score
+            
+            if explain:
+                item['profile_score_breakdown'] = get_stored_score(self.get_scored_object(obj), explain=True)
+            
+            if self.detail_url_name:
+                item[self.detail_url_field] = request.build_absolute_uri(reverse(self.detail_url_name, args=[item['id']]))
+            
+            if include_media:
+                item['media_items'] = [self.serialize_media(media) for media in self.get_media(obj)]
+        
+        return data
+    
+    def get_results(self, search_params, text_query):
+        """
+        Returns (results, ranked, kind): a queryset of model rows ('rows'), a
+        queryset of SearchDocuments ('documents'), or an ordered list of
+        (pk, text_rank, relevance_score) tuples ('list'), possibly from the cache.
         """
-        from .utils import get_sharing_status
-        return get_sharing_status(media)
+        cache_key = self.get_results_cache_key(search_params, text_query)
+        if cache_key:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                results, ranked = cached
+                return results, ranked, 'list'
+        
+        if text_query:
+            results, ranked = self.get_text_search_results(text_query, search_params)
+            kind = 'list'
+        elif self.use_search_documents():
+            results, ranked = self.get_document_queryset(search_params)
+            kind = 'documents'
+        else:
+            results, ranked = self.get_search_queryset(search_params)
+            kind = 'rows'
+        
+        if cache_key:
+            if kind != 'list':
+                result_list = self.get_result_list(results, ranked, documents=kind == 'documents')
+                if result_list is not None:
+                    results, kind = result_list, 'list'
+            if kind == 'list':
+                cache.set(cache_key, (results, ranked), CACHE_TIMEOUTS['search_results'])
+        return results, ranked, kind
     
-    def calculate_simple_relevance_score(self, item, query_params, field_mappings):
+    def load_rows(self, items, ranked, kind):
+        """Model rows for a slice of get_results() output"""
+        if kind == 'list':
+            rows = self.hydrate_results(items, ranked)
+        elif kind == 'documents':
+            rows = self.hydrate_documents(items, ranked)
+        else:
+            rows = list(items)
+        self.attach_profile_scores(rows)
+        self.sharing_status_resolver.add(self.get_sharing_status_objects(rows))
+        return rows
+    
+    def get_scored_object(self, row):
+        """The profile or band whose score a row shows (see profile_score_source)"""
+        obj = row
+        for attr in filter(None, self.profile_score_source.split('.')):
+            obj = getattr(obj, attr)
+        return obj
+    
+    def attach_profile_scores(self, rows):
+        """Load the stored scores of a page of rows in one query, scoring missing ones as a batch"""
+        if self.profile_score_source is None or not rows:
+            return
+        objects = [self.get_scored_object(row) for row in rows]
+        attach_stored_scores(objects)
+        for row, obj in zip(rows, objects):
+            if getattr(row, 'profile_score', None) is None and obj._stored_score:
+                row.profile_score = obj._stored_score['total']
+    
+    def get_top_results(self, limit):
+        """Serialized best `limit` results for the current request, without pagination"""
+        results, ranked, kind = self.get_results(self.get_search_params(), self.get_text_query())
+        rows = self.load_rows(results[:limit], ranked, kind)
+        serializer = self.get_serializer(rows, many=True)
+        with measure_serializer():
+            return self.decorate_results(rows, serializer.data, ranked)
+    
+    def get_facet_names(self):
+        """Facets requested with ?facets= (a comma-separated list, or 'all') that this view supports"""
+        requested = self.request.query_params.get('facets', '').strip().lower()
+        if requested == 'all':
+            return list(self.facet_fields)
+        names = [name.strip() for name in requested.split(',')]
+        return [name for name in dict.fromkeys(names) if name in self.facet_fields]
+    
+    def get_facets(self, names):
         """
-        Simple relevance scoring based on field matches.
+        {facet: [{'value': ..., 'count': n}, ...]} over the rows matching the
+        current filters (and q=), most common value first.
         
-        Args:
-            item: The model instance
-            query_params: Request query parameters
-            field_mappings: Dict mapping query param names to model field names and weights
-                Example: {'name': ('name', 20), 'city': ('city', 15)}
+        All facets come from one grouped query: rows are counted per combination
+        of the facet fields and each facet's counts are summed from those groups.
+        Counts are cached like search results.
+        """
+        search_params = self.get_search_params()
+        text_query = self.get_text_query()
+        cache_key = self.get_results_cache_key(search_params, text_query, 'search_facets', *names)
+        if cache_key:
+            facets = cache.get(cache_key)
+            if facets is not None:
+                return facets
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        if search_params:
+            queryset = self.apply_search_filters(queryset, search_params)
+        if text_query:
+            # Every match, not just the FULLTEXT_MAX_RESULTS listed
+            documents = apply_fulltext(SearchDocument.objects.filter(entity_type=self.document_type), text_query)
+            queryset = queryset.filter(**{f'{self.document_object_field}__in': documents.values('object_id')})
+        
+        # Group the bare table by primary key membership, so the view's own
+        # aggregate annotations don't end up in the GROUP BY
+        paths = [self.facet_fields[name] for name in names]
+        groups = queryset.model._default_manager.filter(
+            pk__in=queryset.order_by().values('pk')
+        ).values(*paths).annotate(facet_count=Count('pk')).order_by()
+        
+        counts = {name: {} for name in names}
+        for group in groups:
+            for name, path in zip(names, paths):
+                value = group[path]
+                counts[name][value] = counts[name].get(value, 0) + group['facet_count']
+        
+        facets = {
+            name: [
+                {'value': value, 'count': count}
+                for value, count in sorted(values.items(), key=lambda entry: (-entry[1], str(entry[0])))
+            ]
+            for name, values in counts.items()
+        }
+        if cache_key:
+            cache.set(cache_key, facets, CACHE_TIMEOUTS['search_results'])
+        return facets
+    
+    def get_export_fields(self):
+        if self.export_fields:
+            return list(self.export_fields)
+        return [field.attname for field in self.get_queryset().model._meta.concrete_fields]
+    
+    def export_results(self):
+        """
+        (columns, rows) for every result of the current request, in result order.
+        Rows are dicts read with .values() and streamed from the database in
+        SEARCH_EXPORT_CHUNK_SIZE batches; relevance is computed once, in the query.
+        """
+        search_params = self.get_search_params()
+        text_query = self.get_text_query()
+        fields = self.get_export_fields()
         
-        Returns:
-            int: Relevance score (0-100)
+        if text_query:
+            queryset, ranked = self.get_text_export_queryset(text_query, search_params)
+            columns = fields + ['text_rank'] + (['relevance_score'] if ranked else [])
+        else:
+            queryset, ranked = self.get_search_queryset(search_params)
+            columns = fields + (['relevance_score'] if ranked else [])
+        rows = queryset.prefetch_related(None).values(*columns).iterator(chunk_size=settings.SEARCH_EXPORT_CHUNK_SIZE)
+        return columns, rows
+    
+    def get_text_export_queryset(self, text_query, search_params):
+        """
+        Every filtered row matching the free-text query, with its document's
+        text_rank annotated and ordered like get_text_search_results, but
+        uncapped and sorted in SQL so the export can stream it. Returns
+        (queryset, ranked).
         """
-        score = 0
-        
-        for param_name, (field_name, weight) in field_mappings.items():
-            if param_name in query_params and query_params[param_name]:
-                field_value = getattr(item, field_name, None)
-                if field_value:
-                    if isinstance(field_value, str):
-                        if query_params[param_name].lower() in field_value.lower():
-                            score += weight
-                    elif field_value == query_params[param_name]:
-                        score += weight
-        
-        return min(score, 100)  # Cap at 100
+        queryset = self.filter_queryset(self.get_queryset())
+        if search_params:
+            queryset = self.apply_search_filters(queryset, search_params)
+        
+        documents = apply_fulltext(SearchDocument.objects.filter(entity_type=self.document_type), text_query)
+        object_field = self.document_object_field
+        queryset = queryset.filter(**{f'{object_field}__in': documents.values('object_id')}).annotate(
+            text_rank=Subquery(documents.filter(object_id=OuterRef(object_field)).values('text_rank')[:1])
+        )
+        
+        ranked = bool(search_params) and self.relevance is not None
+        if ranked:
+            queryset = self.relevance.annotate(queryset, search_params)
+            return queryset.order_by('-text_rank', '-relevance_score', '-pk'), ranked
+        return queryset.order_by('-text_rank', '-pk'), ranked
+    
+    def list(self, request, *args, **kwargs):
+        search_params = self.get_search_params()
+        text_query = self.get_text_query()
+        results, ranked, kind = self.get_results(search_params, text_query)
+        
+        # Only the current page is materialized
+        page = self.paginate_queryset(results)
+        rows = self.load_rows(page if page is not None else results, ranked, kind)
+        
+        if not rows and self.empty_message:
+            return Response({"message": self.empty_message}, status=200)
+        
+        serializer = self.get_serializer(rows, many=True)
+        with measure_serializer():
+            data = self.decorate_results(rows, serializer.data, ranked)
+        
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
 
 class TalentUserProfileSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = TalentUserProfile.objects.all().prefetch_related('media')
     serializer_class = TalentDashboardSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = TalentUserProfileFilter
-    ordering_fields = ['date_of_birth', 'created_at', 'city', 'country', 'account_type']
+    ordering_fields = ['date_of_birth', 'created_at', 'city', 'country', 'account_type', 'profile_score']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    detail_url_name = 'dashboard:talent-profile-detail'
+    empty_message = "No profiles match your search criteria."
+    media_path = 'media'
+    cache_dependencies = TALENT_CACHE_DEPENDENCIES
+    profile_score_source = ''
+    facet_fields = {
+        'gender': 'gender',
+        'account_type': 'account_type',
+        'is_verified': 'is_verified',
+        'country': 'country',
+        'city': 'city',
+    }
+    export_fields = (
+        'id', 'user__email', 'user__first_name', 'user__last_name', 'gender', 'date_of_birth',
+        'city', 'country', 'account_type', 'is_verified', 'profile_complete',
+    )
+    
+    relevance = RelevanceScore(
+        [
+            ExactMatch('gender', 20, case_sensitive=False),
+            # Partial match can still get points
+            FuzzyLocationMatch('city', 15, reverse_weight=10),
+            FuzzyLocationMatch('country', 15, reverse_weight=10),
+            # Score based on how close the age is
+            Distance('age', ((0, 20), (2, 15), (5, 10), (10, 5)), cast=int, inclusive=True),
+            ExactMatch('account_type', 10),
+            # Bonus for email verified profiles even if not explicitly requested
+            BooleanMatch('is_verified', 15, field='user__email_verified',
+                         otherwise=Bonus(Q(user__email_verified=True), 5)),
+            Bonus(Q(profile_complete=True), 10),
+            # Profiles with more media might be more appealing
+            Tiered('relevance_media_count', ((10, 15), (5, 10), (0, 5))),
+        ],
+        # Apply account type boost
+        multiplier=choice_value('account_type', TalentUserProfile.SEARCH_BOOSTS, TalentUserProfile.SEARCH_BOOSTS['free']),
+        bonuses=[
+            # Additional boost for email verified profiles (paid only)
+            Bonus(Q(user__email_verified=True) & ~Q(account_type='free'), 20),
+            # Platinum users get featured placement boost
+            Bonus(Q(account_type='platinum'), 10),
+        ],
+        annotations={'relevance_media_count': Count('media', distinct=True)},
+    )
+    
+    # Same scoring over SearchDocument columns, without any joins
+    document_type = 'talent'
+    document_relevance = RelevanceScore(
+        [
+            ExactMatch('gender', 20, case_sensitive=False),
+            FuzzyLocationMatch('city', 15, reverse_weight=10),
+            FuzzyLocationMatch('country', 15, reverse_weight=10),
+            Distance('age', ((0, 20), (2, 15), (5, 10), (10, 5)), cast=int, inclusive=True),
+            ExactMatch('account_type', 10),
+            BooleanMatch('is_verified', 15, field='email_verified',
+                         otherwise=Bonus(Q(email_verified=True), 5)),
+            Bonus(Q(profile_complete=True), 10),
+            Tiered('all_media_count', ((10, 15), (5, 10), (0, 5))),
+        ],
+        multiplier=F('search_boost'),
+        bonuses=[
+            Bonus(Q(email_verified=True) & ~Q(account_type='free'), 20),
+            Bonus(Q(account_type='platinum'), 10),
+        ],
+        annotations={'age': lambda: age_expression('date_of_birth')},
+    )
     
     def get_queryset(self):
         """
@@ -107,22 +808,7 @@ class TalentUserProfileSearchView(SearchViewMixin, generics.ListAPIView):
             video_count=Count('media', filter=Q(media__media_type='video', media__is_test_video=False)),
             total_media=Count('media', filter=Q(media__is_test_video=False)),
             # Annotate age calculation
-            age=Case(
-                When(
-                    date_of_birth__isnull=False,
-                    then=timezone.now().year - F('date_of_birth__year') - 
-                         Case(
-                             When(
-                                 Q(date_of_birth__month__gt=timezone.now().month) |
-                                 Q(date_of_birth__month=timezone.now().month, date_of_birth__day__gt=timezone.now().day),
-                                 then=Value(1)
-                             ),
-                             default=Value(0)
-                         )
-                ),
-                default=Value(None),
-                output_field=IntegerField()
-            ),
+            age=age_expression('date_of_birth'),
             # Annotate specialization count
             specialization_count=Case(
                 When(visual_worker__isnull=False, then=Value(1)),
@@ -136,311 +822,96 @@ class TalentUserProfileSearchView(SearchViewMixin, generics.ListAPIView):
                 When(hybrid_worker__isnull=False, then=Value(1)),
                 default=Value(0),
                 output_field=IntegerField()
-            )
+            ),
+            # Stored score, so it can be sorted on and read without recomputing
+            profile_score=profile_score_subquery('talent')
         )
     
-    def calculate_relevance_score(self, queryset, filters):
+    def calculate_profile_score(self, profile):
         """
-        Calculate a relevance score for each result based on how closely it matches the filter criteria
-        Higher score = better match
+        Get the stored profile score (annotated on the queryset).
         """
-        query_params = self.request.query_params
+        if profile.profile_score is not None:
+            return profile.profile_score
+        from .utils import get_profile_score_cached
+        return get_profile_score_cached(profile)['total']
+    
+    def apply_search_filters(self, queryset, search_params):
+        if 'gender' in search_params and search_params['gender']:
+            queryset = queryset.filter(gender__iexact=search_params['gender'])
         
-        # Create a list of profiles with their relevance scores
-        profiles_with_scores = []
+        if 'city' in search_params and search_params['city']:
+            queryset = queryset.filter(location_match('city', search_params['city']))
         
-        for profile in queryset:
-            score = 100  # Start with a perfect score
-            
-            # Score gender match
-            if 'gender' in query_params and profile.gender:
-                score += 20 if profile.gender.lower() == query_params['gender'].lower() else 0
-            
-            # Score city match (partial match can still get points)
-            if 'city' in query_params and profile.city:
-                if query_params['city'].lower() in profile.city.lower():
-                    score += 15
-                elif profile.city.lower() in query_params['city'].lower():
-                    score += 10
-            
-            # Score country match
-            if 'country' in query_params and profile.country:
-                if query_params['country'].lower() in profile.country.lower():
-                    score += 15
-                elif profile.country.lower() in query_params['country'].lower():
-                    score += 10
-            
-            # Score age match
-            if 'age' in query_params and profile.date_of_birth:
-                target_age = int(query_params['age'])
-                today = datetime.today()
-                age = today.year - profile.date_of_birth.year - ((today.month, today.day) < 
-                     (profile.date_of_birth.month, profile.date_of_birth.day))
-                
-                # Calculate score based on how close the age is
-                age_diff = abs(age - target_age)
-                if age_diff == 0:
-                    score += 20
-                elif age_diff <= 2:
-                    score += 15
-                elif age_diff <= 5:
-                    score += 10
-                elif age_diff <= 10:
-                    score += 5
-            
-            # Score account type match
-            if 'account_type' in query_params:
-                score += 10 if profile.account_type == query_params['account_type'] else 0
-            
-            # Score email verified profiles higher
-            if 'is_verified' in query_params:
-                req_verified = query_params['is_verified'].lower() in ('true', '1', 'yes')
-                score += 15 if profile.user.email_verified == req_verified else 0
-            elif profile.user.email_verified:
-                # Bonus for email verified profiles even if not explicitly requested
-                score += 5
-            
-            # Score profile completion
-            if profile.profile_complete:
-                score += 10
-            
-            # Score media count - profiles with more media might be more appealing
-            media_count = profile.media.count()
-            if media_count > 10:
-                score += 15
-            elif media_count > 5:
-                score += 10
-            elif media_count > 0:
-                score += 5
-                
-            # Apply account type boost
-            account_boost = profile.get_search_boost()
-            score = score * (1 + account_boost)
-            
-            # Additional boost for email verified profiles (paid only)
-            if profile.user.email_verified and profile.account_type != 'free':
-                score += 20
-            
-            # Platinum users get featured placement boost
-            if profile.can_get_featured_placement():
-                score += 10
-            
-            profiles_with_scores.append((profile, score))
+        if 'country' in search_params and search_params['country']:
+            queryset = queryset.filter(location_match('country', search_params['country']))
         
-        # Sort by score descending
-        profiles_with_scores.sort(key=lambda x: x[1], reverse=True)
+        if 'account_type' in search_params and search_params['account_type']:
+            queryset = queryset.filter(account_type__iexact=search_params['account_type'])
         
-        # Return the sorted profiles and their scores
-        return profiles_with_scores
-    
-    def calculate_profile_score(self, profile):
-        """
-        Get the profile score from the model's method.
-        """
-        score_breakdown = profile.get_profile_score()
-        return score_breakdown['total']
+        if 'is_verified' in search_params:
+            is_verified = parse_bool(search_params['is_verified'])
+            queryset = queryset.filter(is_verified=is_verified)
+        
+        if 'age' in search_params:
+            try:
+                target_age = int(search_params['age'])
+                today = datetime.today()
+                # Calculate the date range for the target age
+                start_date = date(today.year - target_age - 1, today.month, today.day) + timedelta(days=1)
+                end_date = date(today.year - target_age, today.month, today.day)
+                queryset = queryset.filter(date_of_birth__gte=start_date, date_of_birth__lte=end_date)
+            except (ValueError, TypeError):
+                # If age isn't a valid integer, ignore this filter
+                pass
+        
+        # Filter by specialization type
+        if 'specialization' in search_params:
+            spec_type = search_params['specialization'].lower()
+            if spec_type == 'visual':
+                queryset = queryset.filter(visual_worker__isnull=False)
+            elif spec_type == 'expressive':
+                queryset = queryset.filter(expressive_worker__isnull=False)
+            elif spec_type == 'hybrid':
+                queryset = queryset.filter(hybrid_worker__isnull=False)
+        
+        return queryset
     
-    def list(self, request, *args, **kwargs):
-        # Start with the full queryset
-        original_queryset = self.get_queryset()
+    def apply_document_filters(self, documents, search_params):
+        if search_params.get('gender'):
+            documents = documents.filter(gender__iexact=search_params['gender'])
         
-        # Apply filters from filter backends (Django-filter)
-        filtered_queryset = self.filter_queryset(original_queryset)
+        if search_params.get('city'):
+            documents = documents.filter(location_match('city', search_params['city']))
         
-        # Apply additional custom filtering for fields that aren't covered by the filter class
-        query_params = self.request.query_params
+        if search_params.get('country'):
+            documents = documents.filter(location_match('country', search_params['country']))
         
-        # Skip the default profile_type parameter, it's used for routing
-        search_params = {k: v for k, v in query_params.items() if k != 'profile_type' and k != 'format' and k != 'include_media'}
+        if search_params.get('account_type'):
+            documents = documents.filter(account_type__iexact=search_params['account_type'])
         
-        # Check if media should be included
-        include_media = query_params.get('include_media', '').lower() in ('true', '1', 'yes')
+        if 'is_verified' in search_params:
+            documents = documents.filter(is_verified=parse_bool(search_params['is_verified']))
         
-        # Apply explicit filters only if search parameters are provided
-        if search_params:
-            # Additional strict filtering for fields not directly handled by the filter backend
-            if 'gender' in search_params and search_params['gender']:
-                filtered_queryset = filtered_queryset.filter(gender__iexact=search_params['gender'])
-            
-            if 'city' in search_params and search_params['city']:
-                filtered_queryset = filtered_queryset.filter(city__icontains=search_params['city'])
-            
-            if 'country' in search_params and search_params['country']:
-                filtered_queryset = filtered_queryset.filter(country__icontains=search_params['country'])
-            
-            if 'account_type' in search_params and search_params['account_type']:
-                filtered_queryset = filtered_queryset.filter(account_type__iexact=search_params['account_type'])
-            
-            if 'is_verified' in search_params:
-                is_verified = search_params['is_verified'].lower() in ('true', '1', 'yes')
-                filtered_queryset = filtered_queryset.filter(is_verified=is_verified)
-            
-            if 'age' in search_params:
-                try:
-                    target_age = int(search_params['age'])
-                    today = datetime.today()
-                    # Calculate the date range for the target age
-                    start_date = date(today.year - target_age - 1, today.month, today.day) + timedelta(days=1)
-                    end_date = date(today.year - target_age, today.month, today.day)
-                    filtered_queryset = filtered_queryset.filter(date_of_birth__gte=start_date, date_of_birth__lte=end_date)
-                except (ValueError, TypeError):
-                    # If age isn't a valid integer, ignore this filter
-                    pass
-            
-            # Filter by specialization type
-            if 'specialization' in search_params:
-                spec_type = search_params['specialization'].lower()
-                if spec_type == 'visual':
-                    filtered_queryset = filtered_queryset.filter(visual_worker__isnull=False)
-                elif spec_type == 'expressive':
-                    filtered_queryset = filtered_queryset.filter(expressive_worker__isnull=False)
-                elif spec_type == 'hybrid':
-                    filtered_queryset = filtered_queryset.filter(hybrid_worker__isnull=False)
-        
-        # If filter parameters are applied, calculate relevance score for sorting the filtered results
-        if search_params and filtered_queryset.exists():
-            profiles_with_scores = self.calculate_relevance_score(filtered_queryset, search_params)
-            
-            # Extract just the profiles from the scored results
-            queryset = [profile for profile, score in profiles_with_scores]
-            
-            # Paginate
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                # Add relevance scores, profile scores, and profile URLs to the results
-                for i, item in enumerate(data):
-                    item['relevance_score'] = profiles_with_scores[i][1]
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:talent-profile-detail', args=[item['id']]))
-                    
-                    # Include media data if requested
-                    if include_media:
-                        item['media_items'] = []
-                        for media in page[i].media.all():
-                            # Get sharing status with guaranteed fallback
-                            sharing_status = self.get_sharing_status(media)
-                            if not sharing_status or not isinstance(sharing_status, dict):
-                                sharing_status = {'is_shared': False}
-                            
-                            media_data = {
-                                'id': media.id,
-                                'name': media.name,
-                                'media_info': media.media_info,
-                                'media_type': media.media_type,
-                                'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                                'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                                'created_at': media.created_at,
-                                'is_test_video': media.is_test_video,
-                                'is_about_yourself_video': media.is_about_yourself_video,
-                                'sharing_status': sharing_status
-                            }
-                            item['media_items'].append(media_data)
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            # Add relevance scores, profile scores, and profile URLs to the results
-            for i, item in enumerate(data):
-                item['relevance_score'] = profiles_with_scores[i][1]
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:talent-profile-detail', args=[item['id']]))
-                
-                # Include media data if requested
-                if include_media:
-                    item['media_items'] = []
-                    for media in queryset[i].media.all():
-                        # Get sharing status with guaranteed fallback
-                        sharing_status = self.get_sharing_status(media)
-                        if not sharing_status or not isinstance(sharing_status, dict):
-                            sharing_status = {'is_shared': False}
-                        
-                        media_data = {
-                            'id': media.id,
-                            'name': media.name,
-                            'media_info': media.media_info,
-                            'media_type': media.media_type,
-                            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                            'created_at': media.created_at,
-                            'is_test_video': media.is_test_video,
-                            'is_about_yourself_video': media.is_about_yourself_video,
-                            'sharing_status': sharing_status
-                        }
-                        item['media_items'].append(media_data)
-            
-            return Response(data)
-        else:
-            # No valid filters applied or no results after filtering
-            if search_params and not filtered_queryset.exists():
-                return Response({"message": "No profiles match your search criteria."}, status=200)
-            
-            # If no search criteria, return the default sorted results
-            page = self.paginate_queryset(filtered_queryset.order_by('-id'))
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                for i, item in enumerate(data):
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:talent-profile-detail', args=[item['id']]))
-                    
-                    # Include media data if requested
-                    if include_media:
-                        item['media_items'] = []
-                        for media in page[i].media.all():
-                            # Get sharing status with guaranteed fallback
-                            sharing_status = self.get_sharing_status(media)
-                            if not sharing_status or not isinstance(sharing_status, dict):
-                                sharing_status = {'is_shared': False}
-                            
-                            media_data = {
-                                'id': media.id,
-                                'name': media.name,
-                                'media_info': media.media_info,
-                                'media_type': media.media_type,
-                                'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                                'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                                'created_at': media.created_at,
-                                'is_test_video': media.is_test_video,
-                                'is_about_yourself_video': media.is_about_yourself_video,
-                                'sharing_status': sharing_status
-                            }
-                            item['media_items'].append(media_data)
-                return self.get_paginated_response(data)
-    
-            serializer = self.get_serializer(filtered_queryset.order_by('-id'), many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['profile_score'] = self.calculate_profile_score(filtered_queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:talent-profile-detail', args=[item['id']]))
-                
-                # Include media data if requested
-                if include_media:
-                    item['media_items'] = []
-                    for media in filtered_queryset[i].media.all():
-                        # Get sharing status with guaranteed fallback
-                        sharing_status = self.get_sharing_status(media)
-                        if not sharing_status or not isinstance(sharing_status, dict):
-                            sharing_status = {'is_shared': False}
-                        
-                        media_data = {
-                            'id': media.id,
-                            'name': media.name,
-                            'media_info': media.media_info,
-                            'media_type': media.media_type,
-                            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                            'created_at': media.created_at,
-                            'is_test_video': media.is_test_video,
-                            'is_about_yourself_video': media.is_about_yourself_video,
-                            'sharing_status': sharing_status
-                        }
-                        item['media_items'].append(media_data)
-            return Response(data)
+        if 'age' in search_params:
+            try:
+                target_age = int(search_params['age'])
+                today = datetime.today()
+                start_date = date(today.year - target_age - 1, today.month, today.day) + timedelta(days=1)
+                end_date = date(today.year - target_age, today.month, today.day)
+                documents = documents.filter(date_of_birth__gte=start_date, date_of_birth__lte=end_date)
+            except (ValueError, TypeError):
+                pass
+        
+        spec_type = search_params.get('specialization', '').lower()
+        if spec_type == 'visual':
+            documents = documents.filter(is_visual=True)
+        elif spec_type == 'expressive':
+            documents = documents.filter(is_expressive=True)
+        elif spec_type == 'hybrid':
+            documents = documents.filter(is_hybrid=True)
+        
+        return documents
 
 class VisualWorkerSearchView(SearchViewMixin, generics.ListAPIView):
     def get_queryset(self):
@@ -448,7 +919,8 @@ class VisualWorkerSearchView(SearchViewMixin, generics.ListAPIView):
         Optimized queryset with annotations to reduce database queries
         """
         return VisualWorker.objects.select_related(
-            'profile', 'profile__user'
+            'profile', 'profile__user',
+            'profile__visual_worker', 'profile__expressive_worker', 'profile__hybrid_worker'
         ).prefetch_related(
             'profile__media'
         ).annotate(
@@ -463,150 +935,62 @@ class VisualWorkerSearchView(SearchViewMixin, generics.ListAPIView):
             city=F('profile__city'),
             country=F('profile__country'),
             # Annotate age calculation
-            age=Case(
-                When(
-                    profile__date_of_birth__isnull=False,
-                    then=timezone.now().year - F('profile__date_of_birth__year') - 
-                         Case(
-                             When(
-                                 Q(profile__date_of_birth__month__gt=timezone.now().month) |
-                                 Q(profile__date_of_birth__month=timezone.now().month, profile__date_of_birth__day__gt=timezone.now().day),
-                                 then=Value(1)
-                             ),
-                             default=Value(0)
-                         )
-                ),
-                default=Value(None),
-                output_field=IntegerField()
-            )
+            age=age_expression('profile__date_of_birth'),
+            # Stored score of the talent profile
+            profile_score=profile_score_subquery('talent', 'profile_id')
         )
     
     serializer_class = VisualWorkerDashboardSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = VisualWorkerFilter
-    ordering_fields = ['years_experience', 'created_at', 'city', 'country', 'primary_category', 'experience_level']
+    ordering_fields = ['years_experience', 'created_at', 'city', 'country', 'primary_category', 'experience_level', 'profile_score']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    detail_url_name = 'dashboard:visual-worker-detail'
+    document_type = 'talent'
+    document_object_field = 'profile_id'
+    cache_dependencies = TALENT_CACHE_DEPENDENCIES
+    profile_score_source = 'profile'
+    empty_message = "No visual workers match your search criteria."
+    media_path = 'profile.media'
+    facet_fields = {
+        **WORKER_FACET_FIELDS,
+        'primary_category': 'primary_category',
+        'experience_level': 'experience_level',
+        'availability': 'availability',
+        'rate_range': 'rate_range',
+        'willing_to_relocate': 'willing_to_relocate',
+    }
+    export_fields = (
+        *WORKER_EXPORT_FIELDS, 'primary_category', 'experience_level', 'years_experience',
+        'availability', 'rate_range', 'willing_to_relocate',
+    )
+    
+    relevance = RelevanceScore(
+        [
+            ExactMatch('primary_category', 25),
+            ExactMatch('experience_level', 20),
+            *worker_experience_criteria(),
+            # Having a portfolio is a plus
+            Bonus(Q(portfolio_link__isnull=False) & ~Q(portfolio_link=''), 10),
+            *WORKER_LOCATION_CRITERIA,
+            ExactMatch('availability', 15),
+            ExactMatch('rate_range', 15),
+            BooleanMatch('willing_to_relocate', 10),
+            *WORKER_PROFILE_CRITERIA,
+        ],
+        annotations=WORKER_RELEVANCE_ANNOTATIONS,
+    )
     
     def calculate_profile_score(self, worker):
         """
-        Get the profile score from the associated talent profile's method with caching.
+        Get the associated talent profile's stored score (annotated on the queryset).
         """
+        if worker.profile_score is not None:
+            return worker.profile_score
         from .utils import get_profile_score_cached
-        profile = worker.profile
-        score_breakdown = get_profile_score_cached(profile)
-        return score_breakdown['total']
+        return get_profile_score_cached(worker.profile)['total']
     
-    def calculate_relevance_score(self, queryset, filters):
-        """
-        Calculate a relevance score for each result based on how closely it matches the filter criteria
-        Higher score = better match
-        """
-        query_params = self.request.query_params
-        
-        # Create a list of profiles with their relevance scores
-        workers_with_scores = []
-        
-        for worker in queryset:
-            score = 100  # Start with a perfect score
-            
-            # Score primary category match
-            if 'primary_category' in query_params:
-                score += 25 if worker.primary_category == query_params['primary_category'] else 0
-            
-            # Score experience level match
-            if 'experience_level' in query_params:
-                score += 20 if worker.experience_level == query_params['experience_level'] else 0
-            
-            # Score years of experience match
-            if 'min_years_experience' in query_params:
-                min_exp = int(query_params['min_years_experience'])
-                if worker.years_experience >= min_exp:
-                    # Exact or higher than requested
-                    score += 15
-                else:
-                    # Penalize for less experience
-                    score -= 10 * (min_exp - worker.years_experience)
-            
-            if 'max_years_experience' in query_params:
-                max_exp = int(query_params['max_years_experience'])
-                if worker.years_experience <= max_exp:
-                    # At or below maximum requested
-                    score += 10
-                else:
-                    # Penalize for being over-experienced
-                    score -= 5 * (worker.years_experience - max_exp)
-            
-            # Score portfolio link - having a portfolio is a plus
-            if worker.portfolio_link:
-                score += 10
-            
-            # Score location match
-            if 'city' in query_params and worker.city:
-                if query_params['city'].lower() in worker.city.lower():
-                    score += 15
-                elif worker.city.lower() in query_params['city'].lower():
-                    score += 10
-                    
-            if 'country' in query_params and worker.country:
-                if query_params['country'].lower() in worker.country.lower():
-                    score += 15
-                elif worker.country.lower() in query_params['country'].lower():
-                    score += 10
-            
-            # Score availability match
-            if 'availability' in query_params:
-                score += 15 if worker.availability == query_params['availability'] else 0
-            
-            # Score rate range match
-            if 'rate_range' in query_params:
-                score += 15 if worker.rate_range == query_params['rate_range'] else 0
-            
-            # Score willing to relocate
-            if 'willing_to_relocate' in query_params:
-                req_relocate = query_params['willing_to_relocate'].lower() in ('true', '1', 'yes')
-                score += 10 if worker.willing_to_relocate == req_relocate else 0
-            
-            # Score profile completeness through the related TalentUserProfile
-            if worker.profile.profile_complete:
-                score += 5
-            
-            # Media content bonus
-            media_count = worker.profile.media.count()
-            if media_count > 10:
-                score += 15
-            elif media_count > 5:
-                score += 10
-            elif media_count > 0:
-                score += 5
-            
-            # Email verification bonus
-            if worker.profile.user.email_verified:
-                score += 10
-                
-            # Add premium account bonuses - prioritize paid accounts
-            if worker.profile.account_type == 'platinum':
-                score += 15  # Highest tier gets biggest bonus
-            elif worker.profile.account_type == 'premium':
-                score += 10  # Premium tier gets medium bonus
-            # Free accounts get no bonus
-            
-            workers_with_scores.append((worker, score))
-        
-        # Sort by score descending
-        workers_with_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        return workers_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        # Check if media should be included
-        include_media = request.query_params.get('include_media', '').lower() == 'true'
-        
-        # First, apply filtering with the filter_queryset method
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # Apply additional strict filtering for all parameters
-        query_params = self.request.query_params
-        
+    def apply_search_filters(self, queryset, query_params):
         # Apply strict filtering to all parameters
         if 'primary_category' in query_params and query_params['primary_category']:
             queryset = queryset.filter(primary_category=query_params['primary_category'])
@@ -630,10 +1014,10 @@ class VisualWorkerSearchView(SearchViewMixin, generics.ListAPIView):
         
         # Location filters
         if 'city' in query_params and query_params['city']:
-            queryset = queryset.filter(city__icontains=query_params['city'])
+            queryset = queryset.filter(location_match('city', query_params['city']))
         
         if 'country' in query_params and query_params['country']:
-            queryset = queryset.filter(country__icontains=query_params['country'])
+            queryset = queryset.filter(location_match('country', query_params['country']))
         
         if 'availability' in query_params and query_params['availability']:
             queryset = queryset.filter(availability=query_params['availability'])
@@ -642,155 +1026,10 @@ class VisualWorkerSearchView(SearchViewMixin, generics.ListAPIView):
             queryset = queryset.filter(rate_range=query_params['rate_range'])
         
         if 'willing_to_relocate' in query_params:
-            willing_to_relocate = query_params['willing_to_relocate'].lower() in ('true', '1', 'yes')
+            willing_to_relocate = parse_bool(query_params['willing_to_relocate'])
             queryset = queryset.filter(willing_to_relocate=willing_to_relocate)
         
-        # If filter parameters are applied, calculate relevance score for the filtered results
-        if request.query_params and len(request.query_params) > 0 and queryset.exists():
-            workers_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            
-            # Extract just the workers from the scored results
-            queryset = [worker for worker, score in workers_with_scores]
-            
-            # Paginate
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                # Add relevance scores, profile scores, and profile URLs to the results
-                for i, item in enumerate(data):
-                    item['relevance_score'] = workers_with_scores[i][1]
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:visual-worker-detail', args=[item['id']]))
-                    
-                    # Include media data if requested
-                    if include_media:
-                        item['media_items'] = []
-                        for media in page[i].profile.media.all():
-                            # Get sharing status with guaranteed fallback
-                            sharing_status = self.get_sharing_status(media)
-                            if not sharing_status or not isinstance(sharing_status, dict):
-                                sharing_status = {'is_shared': False}
-                            
-                            media_data = {
-                                'id': media.id,
-                                'name': media.name,
-                                'media_info': media.media_info,
-                                'media_type': media.media_type,
-                                'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                                'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                                'created_at': media.created_at,
-                                'is_test_video': media.is_test_video,
-                                'is_about_yourself_video': media.is_about_yourself_video,
-                                'sharing_status': sharing_status
-                            }
-                            item['media_items'].append(media_data)
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            # Add relevance scores, profile scores, and profile URLs to the results
-            for i, item in enumerate(data):
-                item['relevance_score'] = workers_with_scores[i][1]
-                item['profile_score'] = self.calculate_profile_score(page[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:visual-worker-detail', args=[item['id']]))
-                
-                # Include media data if requested
-                if include_media:
-                    item['media_items'] = []
-                    for media in queryset[i].profile.media.all():
-                        # Get sharing status with guaranteed fallback
-                        sharing_status = self.get_sharing_status(media)
-                        if not sharing_status or not isinstance(sharing_status, dict):
-                            sharing_status = {'is_shared': False}
-                        
-                        media_data = {
-                            'id': media.id,
-                            'name': media.name,
-                            'media_info': media.media_info,
-                            'media_type': media.media_type,
-                            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                            'created_at': media.created_at,
-                            'is_test_video': media.is_test_video,
-                            'is_about_yourself_video': media.is_about_yourself_video,
-                            'sharing_status': sharing_status
-                        }
-                        item['media_items'].append(media_data)
-            
-            return Response(data)
-        else:
-            # No filters applied or no results after filtering
-            if not queryset.exists():
-                return Response({"message": "No visual workers match your search criteria."}, status=200)
-            
-            # Return results sorted by a default field
-            page = self.paginate_queryset(queryset.order_by('-id'))
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                for i, item in enumerate(data):
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:visual-worker-detail', args=[item['id']]))
-                    
-                    # Include media data if requested
-                    if include_media:
-                        item['media_items'] = []
-                        for media in page[i].profile.media.all():
-                            # Get sharing status with guaranteed fallback
-                            sharing_status = self.get_sharing_status(media)
-                            if not sharing_status or not isinstance(sharing_status, dict):
-                                sharing_status = {'is_shared': False}
-                            
-                            media_data = {
-                                'id': media.id,
-                                'name': media.name,
-                                'media_info': media.media_info,
-                                'media_type': media.media_type,
-                                'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                                'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                                'created_at': media.created_at,
-                                'is_test_video': media.is_test_video,
-                                'is_about_yourself_video': media.is_about_yourself_video,
-                                'sharing_status': sharing_status
-                            }
-                            item['media_items'].append(media_data)
-                
-                return self.get_paginated_response(data)
-    
-            serializer = self.get_serializer(queryset.order_by('-id'), many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:visual-worker-detail', args=[item['id']]))
-                
-                # Include media data if requested
-                if include_media:
-                    item['media_items'] = []
-                    for media in queryset[i].profile.media.all():
-                        # Get sharing status with guaranteed fallback
-                        sharing_status = self.get_sharing_status(media)
-                        if not sharing_status or not isinstance(sharing_status, dict):
-                            sharing_status = {'is_shared': False}
-                        
-                        media_data = {
-                            'id': media.id,
-                            'name': media.name,
-                            'media_info': media.media_info,
-                            'media_type': media.media_type,
-                            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                            'created_at': media.created_at,
-                            'is_test_video': media.is_test_video,
-                            'is_about_yourself_video': media.is_about_yourself_video,
-                            'sharing_status': sharing_status
-                        }
-                        item['media_items'].append(media_data)
-            
-            return Response(data)
+        return queryset
 
 class ExpressiveWorkerSearchView(SearchViewMixin, generics.ListAPIView):
     def get_queryset(self):
@@ -798,7 +1037,8 @@ class ExpressiveWorkerSearchView(SearchViewMixin, generics.ListAPIView):
         Optimized queryset with annotations to reduce database queries
         """
         return ExpressiveWorker.objects.select_related(
-            'profile', 'profile__user'
+            'profile', 'profile__user',
+            'profile__visual_worker', 'profile__expressive_worker', 'profile__hybrid_worker'
         ).prefetch_related(
             'profile__media'
         ).annotate(
@@ -813,22 +1053,9 @@ class ExpressiveWorkerSearchView(SearchViewMixin, generics.ListAPIView):
             city=F('profile__city'),
             country=F('profile__country'),
             # Annotate age calculation
-            age=Case(
-                When(
-                    profile__date_of_birth__isnull=False,
-                    then=timezone.now().year - F('profile__date_of_birth__year') - 
-                         Case(
-                             When(
-                                 Q(profile__date_of_birth__month__gt=timezone.now().month) |
-                                 Q(profile__date_of_birth__month=timezone.now().month, profile__date_of_birth__day__gt=timezone.now().day),
-                                 then=Value(1)
-                             ),
-                             default=Value(0)
-                         )
-                ),
-                default=Value(None),
-                output_field=IntegerField()
-            )
+            age=age_expression('profile__date_of_birth'),
+            # Stored score of the talent profile
+            profile_score=profile_score_subquery('talent', 'profile_id')
         )
     
     serializer_class = ExpressiveWorkerDashboardSerializer
@@ -841,144 +1068,59 @@ class ExpressiveWorkerSearchView(SearchViewMixin, generics.ListAPIView):
         'beard_color', 'beard_length', 'mustache_color', 'mustache_length',
         'distinctive_facial_marks', 'distinctive_body_marks', 'voice_type',
         'body_type', 'availability', 'city', 'country',
-        'created_at', 'updated_at'
+        'created_at', 'updated_at', 'profile_score'
     ]
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    detail_url_name = 'dashboard:expressive-worker-detail'
+    document_type = 'talent'
+    document_object_field = 'profile_id'
+    cache_dependencies = TALENT_CACHE_DEPENDENCIES
+    profile_score_source = 'profile'
+    empty_message = "No expressive workers match your search criteria."
+    facet_fields = {
+        **WORKER_FACET_FIELDS,
+        'performer_type': 'performer_type',
+        'hair_color': 'hair_color',
+        'hair_type': 'hair_type',
+        'eye_color': 'eye_color',
+        'skin_tone': 'skin_tone',
+        'body_type': 'body_type',
+        'availability': 'availability',
+    }
+    export_fields = (
+        *WORKER_EXPORT_FIELDS, 'performer_type', 'years_experience', 'height', 'weight',
+        'hair_color', 'hair_type', 'eye_color', 'skin_tone', 'body_type', 'availability',
+    )
+    # Always include media items with sharing status
+    media_path = 'profile.media'
+    always_include_media = True
+    
+    relevance = RelevanceScore(
+        [
+            ExactMatch('performer_type', 25),
+            *worker_experience_criteria(),
+            # Score physical attributes
+            ExactMatch('hair_color', 10),
+            ExactMatch('eye_color', 10),
+            ExactMatch('body_type', 10),
+            *WORKER_LOCATION_CRITERIA,
+            ExactMatch('availability', 15),
+            *worker_body_criteria(),
+            *WORKER_PROFILE_CRITERIA,
+        ],
+        annotations=WORKER_RELEVANCE_ANNOTATIONS,
+    )
     
     def calculate_profile_score(self, worker):
         """
-        Get the profile score from the associated talent profile's method with caching.
+        Get the associated talent profile's stored score (annotated on the queryset).
         """
+        if worker.profile_score is not None:
+            return worker.profile_score
         from .utils import get_profile_score_cached
-        profile = worker.profile
-        score_breakdown = get_profile_score_cached(profile)
-        return score_breakdown['total']
+        return get_profile_score_cached(worker.profile)['total']
     
-    def calculate_relevance_score(self, queryset, filters):
-        """
-        Calculate a relevance score for each result based on how closely it matches the filter criteria
-        Higher score = better match
-        """
-        query_params = self.request.query_params
-        
-        # Create a list of profiles with their relevance scores
-        workers_with_scores = []
-        
-        for worker in queryset:
-            score = 100  # Start with a perfect score
-            
-            # Score performer type match
-            if 'performer_type' in query_params:
-                score += 25 if worker.performer_type == query_params['performer_type'] else 0
-            
-            # Score years of experience match
-            if 'min_years_experience' in query_params:
-                min_exp = int(query_params['min_years_experience'])
-                if worker.years_experience >= min_exp:
-                    # Exact or higher than requested
-                    score += 15
-                else:
-                    # Penalize for less experience
-                    score -= 10 * (min_exp - worker.years_experience)
-            
-            if 'max_years_experience' in query_params:
-                max_exp = int(query_params['max_years_experience'])
-                if worker.years_experience <= max_exp:
-                    # At or below maximum requested
-                    score += 10
-                else:
-                    # Penalize for being over-experienced
-                    score -= 5 * (worker.years_experience - max_exp)
-            
-            # Score physical attributes
-            if 'hair_color' in query_params:
-                score += 10 if worker.hair_color == query_params['hair_color'] else 0
-                
-            if 'eye_color' in query_params:
-                score += 10 if worker.eye_color == query_params['eye_color'] else 0
-                
-            if 'body_type' in query_params:
-                score += 10 if worker.body_type == query_params['body_type'] else 0
-            
-            # Score location match
-            if 'city' in query_params and worker.city:
-                if query_params['city'].lower() in worker.city.lower():
-                    score += 15
-                elif worker.city.lower() in query_params['city'].lower():
-                    score += 10
-                    
-            if 'country' in query_params and worker.country:
-                if query_params['country'].lower() in worker.country.lower():
-                    score += 15
-                elif worker.country.lower() in query_params['country'].lower():
-                    score += 10
-            
-            # Score availability match
-            if 'availability' in query_params:
-                score += 15 if worker.availability == query_params['availability'] else 0
-            
-            # Height and weight scoring - closer to target = better score
-            if 'height' in query_params:
-                target_height = float(query_params['height'])
-                height_diff = abs(worker.height - target_height)
-                if height_diff < 1:
-                    score += 15
-                elif height_diff < 3:
-                    score += 10
-                elif height_diff < 5:
-                    score += 5
-            
-            if 'weight' in query_params:
-                target_weight = float(query_params['weight'])
-                weight_diff = abs(worker.weight - target_weight)
-                if weight_diff < 2:
-                    score += 15
-                elif weight_diff < 5:
-                    score += 10
-                elif weight_diff < 10:
-                    score += 5
-            
-            # Score profile completeness through the related TalentUserProfile
-            if worker.profile.profile_complete:
-                score += 5
-            
-            # Media content bonus
-            media_count = worker.profile.media.count()
-            if media_count > 10:
-                score += 15
-            elif media_count > 5:
-                score += 10
-            elif media_count > 0:
-                score += 5
-            
-            # Email verification bonus
-            if worker.profile.user.email_verified:
-                score += 10
-                
-            # Add premium account bonuses - prioritize paid accounts
-            if worker.profile.account_type == 'platinum':
-                score += 15  # Highest tier gets biggest bonus
-            elif worker.profile.account_type == 'premium':
-                score += 10  # Premium tier gets medium bonus
-            # Free accounts get no bonus
-            
-            workers_with_scores.append((worker, score))
-        
-        # Sort by score descending
-        workers_with_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        return workers_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        # Always include media items with sharing status
-        include_media = True
-        
-        # First, apply filtering with the filter_queryset method
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # Apply additional strict filtering for all parameters
-        query_params = self.request.query_params
-        
+    def apply_search_filters(self, queryset, query_params):
         # Apply strict filtering to all parameters
         if 'performer_type' in query_params and query_params['performer_type']:
             queryset = queryset.filter(performer_type=query_params['performer_type'])
@@ -1035,135 +1177,15 @@ class ExpressiveWorkerSearchView(SearchViewMixin, generics.ListAPIView):
         
         # Location filters
         if 'city' in query_params and query_params['city']:
-            queryset = queryset.filter(city__icontains=query_params['city'])
+            queryset = queryset.filter(location_match('city', query_params['city']))
         
         if 'country' in query_params and query_params['country']:
-            queryset = queryset.filter(country__icontains=query_params['country'])
-        
-        if 'availability' in query_params and query_params['availability']:
-            queryset = queryset.filter(availability=query_params['availability'])
-        
-        # If filter parameters are applied, calculate relevance score for the filtered results
-        if request.query_params and len(request.query_params) > 0 and queryset.exists():
-            workers_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            
-            # Extract just the workers from the scored results
-            queryset = [worker for worker, score in workers_with_scores]
-            
-            # Paginate
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                # Add relevance scores, profile scores, and profile URLs to the results
-                for i, item in enumerate(data):
-                    item['relevance_score'] = workers_with_scores[i][1]
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:expressive-worker-detail', args=[item['id']]))
-                
-                    # Always include media data with sharing status
-                    item['media_items'] = []
-                    for media in page[i].profile.media.all():
-                        sharing_status = self.get_sharing_status(media)
-                        if not sharing_status or not isinstance(sharing_status, dict):
-                            sharing_status = {'is_shared': False}
-                        media_data = {
-                            'id': media.id,
-                            'name': media.name,
-                            'media_info': media.media_info,
-                            'media_type': media.media_type,
-                            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                            'created_at': media.created_at,
-                            'is_test_video': media.is_test_video,
-                            'is_about_yourself_video': media.is_about_yourself_video,
-                            'sharing_status': sharing_status
-                        }
-                        item['media_items'].append(media_data)
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['relevance_score'] = workers_with_scores[i][1]
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:expressive-worker-detail', args=[item['id']]))
-                # Always include media data with sharing status
-                item['media_items'] = []
-                for media in queryset[i].profile.media.all():
-                    sharing_status = self.get_sharing_status(media)
-                    if not sharing_status or not isinstance(sharing_status, dict):
-                        sharing_status = {'is_shared': False}
-                    media_data = {
-                        'id': media.id,
-                        'name': media.name,
-                        'media_info': media.media_info,
-                        'media_type': media.media_type,
-                        'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                        'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                        'created_at': media.created_at,
-                        'is_test_video': media.is_test_video,
-                        'is_about_yourself_video': media.is_about_yourself_video,
-                        'sharing_status': sharing_status
-                    }
-                    item['media_items'].append(media_data)
-            return Response(data)
-        else:
-            if not queryset.exists():
-                return Response({"message": "No expressive workers match your search criteria."}, status=200)
-            page = self.paginate_queryset(queryset.order_by('-id'))
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                for i, item in enumerate(data):
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:expressive-worker-detail', args=[item['id']]))
-                    # Always include media data with sharing status
-                    item['media_items'] = []
-                    for media in page[i].profile.media.all():
-                        sharing_status = self.get_sharing_status(media)
-                        if not sharing_status or not isinstance(sharing_status, dict):
-                            sharing_status = {'is_shared': False}
-                        media_data = {
-                            'id': media.id,
-                            'name': media.name,
-                            'media_info': media.media_info,
-                            'media_type': media.media_type,
-                            'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                            'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                            'created_at': media.created_at,
-                            'is_test_video': media.is_test_video,
-                            'is_about_yourself_video': media.is_about_yourself_video,
-                            'sharing_status': sharing_status
-                        }
-                        item['media_items'].append(media_data)
-                return self.get_paginated_response(data)
-            serializer = self.get_serializer(queryset.order_by('-id'), many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:expressive-worker-detail', args=[item['id']]))
-                # Always include media data with sharing status
-                item['media_items'] = []
-                for media in queryset[i].profile.media.all():
-                    sharing_status = self.get_sharing_status(media)
-                    if not sharing_status or not isinstance(sharing_status, dict):
-                        sharing_status = {'is_shared': False}
-                    media_data = {
-                        'id': media.id,
-                        'name': media.name,
-                        'media_info': media.media_info,
-                        'media_type': media.media_type,
-                        'media_file': request.build_absolute_uri(media.media_file.url) if media.media_file else None,
-                        'thumbnail': request.build_absolute_uri(media.thumbnail.url) if media.thumbnail else None,
-                        'created_at': media.created_at,
-                        'is_test_video': media.is_test_video,
-                        'is_about_yourself_video': media.is_about_yourself_video,
-                        'sharing_status': sharing_status
-                    }
-                    item['media_items'].append(media_data)
-            return Response(data)
+            queryset = queryset.filter(location_match('country', query_params['country']))
+        
+        if 'availability' in query_params and query_params['availability']:
+            queryset = queryset.filter(availability=query_params['availability'])
+        
+        return queryset
 
 class HybridWorkerSearchView(SearchViewMixin, generics.ListAPIView):
     def get_queryset(self):
@@ -1171,7 +1193,8 @@ class HybridWorkerSearchView(SearchViewMixin, generics.ListAPIView):
         Optimized queryset with annotations to reduce database queries
         """
         return HybridWorker.objects.select_related(
-            'profile', 'profile__user'
+            'profile', 'profile__user',
+            'profile__visual_worker', 'profile__expressive_worker', 'profile__hybrid_worker'
         ).prefetch_related(
             'profile__media'
         ).annotate(
@@ -1186,302 +1209,108 @@ class HybridWorkerSearchView(SearchViewMixin, generics.ListAPIView):
             city=F('profile__city'),
             country=F('profile__country'),
             # Annotate age calculation
-            age=Case(
-                When(
-                    profile__date_of_birth__isnull=False,
-                    then=timezone.now().year - F('profile__date_of_birth__year') - 
-                         Case(
-                             When(
-                                 Q(profile__date_of_birth__month__gt=timezone.now().month) |
-                                 Q(profile__date_of_birth__month=timezone.now().month, profile__date_of_birth__day__gt=timezone.now().day),
-                                 then=Value(1)
-                             ),
-                             default=Value(0)
-                         )
-                ),
-                default=Value(None),
-                output_field=IntegerField()
-            )
+            age=age_expression('profile__date_of_birth'),
+            # Stored score of the talent profile
+            profile_score=profile_score_subquery('talent', 'profile_id')
         )
     
     serializer_class = HybridWorkerDashboardSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = HybridWorkerFilter
-    ordering_fields = ['years_experience', 'created_at', 'city', 'country', 'hybrid_type', 'hair_color', 'eye_color', 'skin_tone', 'body_type', 'fitness_level', 'risk_levels']
+    ordering_fields = ['years_experience', 'created_at', 'city', 'country', 'hybrid_type', 'hair_color', 'eye_color', 'skin_tone', 'body_type', 'fitness_level', 'risk_levels', 'profile_score']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    detail_url_name = 'dashboard:hybrid-worker-detail'
+    document_type = 'talent'
+    document_object_field = 'profile_id'
+    cache_dependencies = TALENT_CACHE_DEPENDENCIES
+    profile_score_source = 'profile'
+    facet_fields = {
+        **WORKER_FACET_FIELDS,
+        'hybrid_type': 'hybrid_type',
+        'hair_color': 'hair_color',
+        'eye_color': 'eye_color',
+        'skin_tone': 'skin_tone',
+        'body_type': 'body_type',
+        'fitness_level': 'fitness_level',
+        'availability': 'availability',
+    }
+    export_fields = (
+        *WORKER_EXPORT_FIELDS, 'hybrid_type', 'years_experience', 'height', 'weight',
+        'hair_color', 'eye_color', 'skin_tone', 'body_type', 'fitness_level', 'availability',
+    )
+    
+    relevance = RelevanceScore(
+        [
+            ExactMatch('hybrid_type', 25),
+            *worker_experience_criteria(),
+            # Score physical attributes
+            ExactMatch('hair_color', 10),
+            ExactMatch('eye_color', 10),
+            ExactMatch('skin_tone', 10),
+            ExactMatch('body_type', 10),
+            ExactMatch('fitness_level', 15),
+            ExactMatch('risk_levels', 15),
+            *WORKER_LOCATION_CRITERIA,
+            ExactMatch('availability', 15),
+            BooleanMatch('willing_to_relocate', 10),
+            *worker_body_criteria(),
+            *WORKER_PROFILE_CRITERIA,
+        ],
+        annotations=WORKER_RELEVANCE_ANNOTATIONS,
+    )
     
     def calculate_profile_score(self, worker):
         """
-        Get the profile score from the associated talent profile's method with caching.
+        Get the associated talent profile's stored score (annotated on the queryset).
         """
+        if worker.profile_score is not None:
+            return worker.profile_score
         from .utils import get_profile_score_cached
-        profile = worker.profile
-        score_breakdown = get_profile_score_cached(profile)
-        return score_breakdown['total']
-    
-    def calculate_relevance_score(self, queryset, filters):
-        """
-        Calculate a relevance score for each result based on how closely it matches the filter criteria
-        Higher score = better match
-        """
-        query_params = self.request.query_params
-        
-        # Create a list of profiles with their relevance scores
-        workers_with_scores = []
-        
-        for worker in queryset:
-            score = 100  # Start with a perfect score
-            
-            # Score hybrid type match
-            if 'hybrid_type' in query_params:
-                score += 25 if worker.hybrid_type == query_params['hybrid_type'] else 0
-            
-            # Score years of experience match
-            if 'min_years_experience' in query_params:
-                min_exp = int(query_params['min_years_experience'])
-                if worker.years_experience >= min_exp:
-                    # Exact or higher than requested
-                    score += 15
-                else:
-                    # Penalize for less experience
-                    score -= 10 * (min_exp - worker.years_experience)
-            
-            if 'max_years_experience' in query_params:
-                max_exp = int(query_params['max_years_experience'])
-                if worker.years_experience <= max_exp:
-                    # At or below maximum requested
-                    score += 10
-                else:
-                    # Penalize for being over-experienced
-                    score -= 5 * (worker.years_experience - max_exp)
-            
-            # Score physical attributes
-            if 'hair_color' in query_params:
-                score += 10 if worker.hair_color == query_params['hair_color'] else 0
-                
-            if 'eye_color' in query_params:
-                score += 10 if worker.eye_color == query_params['eye_color'] else 0
-                
-            if 'skin_tone' in query_params:
-                score += 10 if worker.skin_tone == query_params['skin_tone'] else 0
-                
-            if 'body_type' in query_params:
-                score += 10 if worker.body_type == query_params['body_type'] else 0
-                
-            if 'fitness_level' in query_params:
-                score += 15 if worker.fitness_level == query_params['fitness_level'] else 0
-                
-            if 'risk_levels' in query_params:
-                score += 15 if worker.risk_levels == query_params['risk_levels'] else 0
-            
-            # Score location match
-            if 'city' in query_params and worker.city:
-                if query_params['city'].lower() in worker.city.lower():
-                    score += 15
-                elif worker.city.lower() in query_params['city'].lower():
-                    score += 10
-                    
-            if 'country' in query_params and worker.country:
-                if query_params['country'].lower() in worker.country.lower():
-                    score += 15
-                elif worker.country.lower() in query_params['country'].lower():
-                    score += 10
-            
-            # Score availability match
-            if 'availability' in query_params:
-                score += 15 if worker.availability == query_params['availability'] else 0
-            
-            # Score willing to relocate
-            if 'willing_to_relocate' in query_params:
-                req_relocate = query_params['willing_to_relocate'].lower() in ('true', '1', 'yes')
-                score += 10 if worker.willing_to_relocate == req_relocate else 0
-            
-            # Height and weight scoring - closer to target = better score
-            if 'height' in query_params:
-                target_height = float(query_params['height'])
-                height_diff = abs(worker.height - target_height)
-                if height_diff < 1:
-                    score += 15
-                elif height_diff < 3:
-                    score += 10
-                elif height_diff < 5:
-                    score += 5
-            
-            if 'weight' in query_params:
-                target_weight = float(query_params['weight'])
-                weight_diff = abs(worker.weight - target_weight)
-                if weight_diff < 2:
-                    score += 15
-                elif weight_diff < 5:
-                    score += 10
-                elif weight_diff < 10:
-                    score += 5
-            
-            # Score profile completeness through the related TalentUserProfile
-            if worker.profile.profile_complete:
-                score += 5
-            
-            # Media content bonus
-            media_count = worker.profile.media.count()
-            if media_count > 10:
-                score += 15
-            elif media_count > 5:
-                score += 10
-            elif media_count > 0:
-                score += 5
-            
-            # Email verification bonus
-            if worker.profile.user.email_verified:
-                score += 10
-                
-            # Add premium account bonuses - prioritize paid accounts
-            if worker.profile.account_type == 'platinum':
-                score += 15  # Highest tier gets biggest bonus
-            elif worker.profile.account_type == 'premium':
-                score += 10  # Premium tier gets medium bonus
-            # Free accounts get no bonus
-            
-            workers_with_scores.append((worker, score))
-        
-        # Sort by score descending
-        workers_with_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        return workers_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # If filter parameters are applied, calculate relevance score
-        if request.query_params and len(request.query_params) > 0:
-            workers_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            
-            # Extract just the workers from the scored results
-            queryset = [worker for worker, score in workers_with_scores]
-            
-            # Paginate
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                # Add relevance scores and profile URLs to the results
-                for i, item in enumerate(data):
-                    item['relevance_score'] = workers_with_scores[i][1]
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:hybrid-worker-detail', args=[item['id']]))
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            # Add relevance scores and profile URLs to the results
-            for i, item in enumerate(data):
-                item['relevance_score'] = workers_with_scores[i][1]
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:hybrid-worker-detail', args=[item['id']]))
-            
-            return Response(data)
-        else:
-            # No filters applied, just return all results
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                for i, item in enumerate(data):
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:hybrid-worker-detail', args=[item['id']]))
-                return self.get_paginated_response(data)
-    
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:hybrid-worker-detail', args=[item['id']]))
-            return Response(data)
+        return get_profile_score_cached(worker.profile)['total']
 
 class BackGroundJobsProfileSearchView(SearchViewMixin, generics.ListAPIView):
-    queryset = BackGroundJobsProfile.objects.all().select_related('user')
+    queryset = BackGroundJobsProfile.objects.all().select_related('user').annotate(
+        profile_score=profile_score_subquery('background')
+    )
     serializer_class = BackGroundDashboardSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = BackGroundJobsProfileFilter
-    ordering_fields = ['date_of_birth', 'country', 'account_type']
+    ordering_fields = ['date_of_birth', 'country', 'account_type', 'profile_score']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    detail_url_name = 'dashboard:background-profile-detail'
+    document_type = 'background'
+    cache_dependencies = ('profiles.BackGroundJobsProfile', 'users.BaseUser', SCORES_LABEL)
+    profile_score_source = ''
+    facet_fields = {
+        'gender': 'gender',
+        'account_type': 'account_type',
+        'country': 'country',
+    }
+    export_fields = (
+        'id', 'user__email', 'user__first_name', 'user__last_name', 'gender', 'date_of_birth',
+        'country', 'account_type',
+    )
+    
+    relevance = RelevanceScore([
+        ExactMatch('gender', 20),
+        FuzzyLocationMatch('country', 15),
+        ExactMatch('account_type', 15),
+    ])
+
+    def load_rows(self, items, ranked, kind):
+        """Rows with their item counts loaded for the whole page in one query"""
+        rows = super().load_rows(items, ranked, kind)
+        BackGroundJobsProfile.load_item_counts(rows)
+        return rows
 
     def calculate_profile_score(self, profile):
         """
-        Get the profile score from the model's method.
+        Get the stored profile score (annotated on the queryset).
         """
-        score_breakdown = profile.get_profile_score()
-        return score_breakdown['total']
-    
-    def calculate_relevance_score(self, queryset, filters):
-        """Calculate relevance score for background profiles"""
-        query_params = self.request.query_params
-        profiles_with_scores = []
-        
-        for profile in queryset:
-            score = 100
-            
-            if 'gender' in query_params:
-                score += 20 if profile.gender == query_params['gender'] else 0
-            
-            if 'country' in query_params and profile.country:
-                if query_params['country'].lower() in profile.country.lower():
-                    score += 15
-            
-            if 'account_type' in query_params:
-                score += 15 if profile.account_type == query_params['account_type'] else 0
-            
-            profiles_with_scores.append((profile, score))
-        
-        profiles_with_scores.sort(key=lambda x: x[1], reverse=True)
-        return profiles_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        if request.query_params and len(request.query_params) > 0:
-            profiles_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            queryset = [profile for profile, score in profiles_with_scores]
-            
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                for i, item in enumerate(data):
-                    item['relevance_score'] = profiles_with_scores[i][1]
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:background-profile-detail', args=[item['id']]))
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            for i, item in enumerate(data):
-                item['relevance_score'] = profiles_with_scores[i][1]
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:background-profile-detail', args=[item['id']]))
-            
-            return Response(data)
-        else:
-            page = self.paginate_queryset(queryset.order_by('-id'))
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                for i, item in enumerate(data):
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['profile_url'] = request.build_absolute_uri(reverse('dashboard:background-profile-detail', args=[item['id']]))
-                return self.get_paginated_response(data)
-    
-            serializer = self.get_serializer(queryset.order_by('-id'), many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['profile_url'] = request.build_absolute_uri(reverse('dashboard:background-profile-detail', args=[item['id']]))
-            return Response(data)
+        if profile.profile_score is not None:
+            return profile.profile_score
+        from .utils import get_profile_score_cached
+        return get_profile_score_cached(profile)['total']
 
 class PropSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = Prop.objects.select_related('BackGroundJobsProfile__user')
@@ -1490,51 +1319,16 @@ class PropSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = PropFilter
     ordering_fields = ['name', 'price', 'created_at']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'prop'
+    cache_dependencies = ('profiles.Prop', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
     
-    def calculate_relevance_score(self, queryset, filters):
-        query_params = self.request.query_params
-        items_with_scores = []
-        
-        # Simple field mappings for props
-        field_mappings = {
-            'name': ('name', 20),
-            'material': ('material', 15),
-            'condition': ('condition', 10)
-        }
-        
-        for item in queryset:
-            relevance_score = self.calculate_simple_relevance_score(item, query_params, field_mappings)
-            items_with_scores.append((item, relevance_score))
-        
-        items_with_scores.sort(key=lambda x: x[1], reverse=True)
-        return items_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        if request.query_params and len(request.query_params) > 0:
-            items_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            queryset = [item for item, score in items_with_scores]
-            
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                for i, item in enumerate(data):
-                    item['relevance_score'] = items_with_scores[i][1]
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            for i, item in enumerate(data):
-                item['relevance_score'] = items_with_scores[i][1]
-            
-            return Response(data)
-        else:
-            return super().list(request, *args, **kwargs)
+    # Simple field matches for props, capped at 100
+    relevance = RelevanceScore([
+        PartialMatch('name', 20),
+        PartialMatch('material', 15),
+        PartialMatch('condition', 10),
+    ], base=0, cap=100)
 
 class CostumeSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = Costume.objects.select_related('BackGroundJobsProfile__user')
@@ -1543,57 +1337,15 @@ class CostumeSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = CostumeFilter
     ordering_fields = ['name', 'price', 'created_at', 'size', 'era']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'costume'
+    cache_dependencies = ('profiles.Costume', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
     
-    def calculate_relevance_score(self, queryset, filters):
-        query_params = self.request.query_params
-        items_with_scores = []
-        
-        for item in queryset:
-            score = 100
-            
-            if 'name' in query_params and item.name:
-                if query_params['name'].lower() in item.name.lower():
-                    score += 20
-            
-            if 'size' in query_params and item.size:
-                if item.size == query_params['size']:
-                    score += 15
-            
-            if 'era' in query_params and item.era:
-                if query_params['era'].lower() in item.era.lower():
-                    score += 15
-            
-            items_with_scores.append((item, score))
-        
-        items_with_scores.sort(key=lambda x: x[1], reverse=True)
-        return items_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        if request.query_params and len(request.query_params) > 0:
-            items_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            queryset = [item for item, score in items_with_scores]
-            
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                for i, item in enumerate(data):
-                    item['relevance_score'] = items_with_scores[i][1]
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            for i, item in enumerate(data):
-                item['relevance_score'] = items_with_scores[i][1]
-            
-            return Response(data)
-        else:
-            return super().list(request, *args, **kwargs)
+    relevance = RelevanceScore([
+        PartialMatch('name', 20),
+        ExactMatch('size', 15),
+        PartialMatch('era', 15),
+    ])
 
 class LocationSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = Location.objects.select_related('BackGroundJobsProfile__user')
@@ -1602,58 +1354,15 @@ class LocationSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = LocationFilter
     ordering_fields = ['name', 'price', 'created_at', 'location_type']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'location'
+    cache_dependencies = ('profiles.Location', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
     
-    def calculate_relevance_score(self, queryset, filters):
-        query_params = self.request.query_params
-        items_with_scores = []
-        
-        for item in queryset:
-            score = 100
-            
-            if 'name' in query_params and item.name:
-                if query_params['name'].lower() in item.name.lower():
-                    score += 20
-            
-            if 'address' in query_params and item.address:
-                if query_params['address'].lower() in item.address.lower():
-                    score += 15
-            
-            if 'is_indoor' in query_params:
-                is_indoor = query_params['is_indoor'].lower() in ('true', '1', 'yes')
-                if item.is_indoor == is_indoor:
-                    score += 10
-            
-            items_with_scores.append((item, score))
-        
-        items_with_scores.sort(key=lambda x: x[1], reverse=True)
-        return items_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        if request.query_params and len(request.query_params) > 0:
-            items_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            queryset = [item for item, score in items_with_scores]
-            
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                for i, item in enumerate(data):
-                    item['relevance_score'] = items_with_scores[i][1]
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            for i, item in enumerate(data):
-                item['relevance_score'] = items_with_scores[i][1]
-            
-            return Response(data)
-        else:
-            return super().list(request, *args, **kwargs)
+    relevance = RelevanceScore([
+        PartialMatch('name', 20),
+        PartialMatch('address', 15),
+        BooleanMatch('is_indoor', 10),
+    ])
 
 class MemorabiliaSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = Memorabilia.objects.select_related('BackGroundJobsProfile__user')
@@ -1662,53 +1371,14 @@ class MemorabiliaSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = MemorabiliaFilter
     ordering_fields = ['name', 'price', 'created_at', 'signed_by']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'memorabilia'
+    cache_dependencies = ('profiles.Memorabilia', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
     
-    def calculate_relevance_score(self, queryset, filters):
-        query_params = self.request.query_params
-        items_with_scores = []
-        
-        for item in queryset:
-            score = 100
-            
-            if 'name' in query_params and item.name:
-                if query_params['name'].lower() in item.name.lower():
-                    score += 20
-            
-            if 'signed_by' in query_params and item.signed_by:
-                if query_params['signed_by'].lower() in item.signed_by.lower():
-                    score += 25
-            
-            items_with_scores.append((item, score))
-        
-        items_with_scores.sort(key=lambda x: x[1], reverse=True)
-        return items_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        if request.query_params and len(request.query_params) > 0:
-            items_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            queryset = [item for item, score in items_with_scores]
-            
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                for i, item in enumerate(data):
-                    item['relevance_score'] = items_with_scores[i][1]
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            for i, item in enumerate(data):
-                item['relevance_score'] = items_with_scores[i][1]
-            
-            return Response(data)
-        else:
-            return super().list(request, *args, **kwargs)
+    relevance = RelevanceScore([
+        PartialMatch('name', 20),
+        PartialMatch('signed_by', 25),
+    ])
 
 class VehicleSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = Vehicle.objects.select_related('BackGroundJobsProfile__user')
@@ -1717,61 +1387,15 @@ class VehicleSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = VehicleFilter
     ordering_fields = ['name', 'price', 'created_at', 'make', 'model', 'year']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'vehicle'
+    cache_dependencies = ('profiles.Vehicle', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
     
-    def calculate_relevance_score(self, queryset, filters):
-        query_params = self.request.query_params
-        items_with_scores = []
-        
-        for item in queryset:
-            score = 100
-            
-            if 'make' in query_params and item.make:
-                if query_params['make'].lower() in item.make.lower():
-                    score += 20
-            
-            if 'model' in query_params and item.model:
-                if query_params['model'].lower() in item.model.lower():
-                    score += 20
-            
-            if 'year' in query_params and item.year:
-                try:
-                    target_year = int(query_params['year'])
-                    if item.year == target_year:
-                        score += 15
-                except (ValueError, TypeError):
-                    pass
-            
-            items_with_scores.append((item, score))
-        
-        items_with_scores.sort(key=lambda x: x[1], reverse=True)
-        return items_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        if request.query_params and len(request.query_params) > 0:
-            items_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            queryset = [item for item, score in items_with_scores]
-            
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                for i, item in enumerate(data):
-                    item['relevance_score'] = items_with_scores[i][1]
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            for i, item in enumerate(data):
-                item['relevance_score'] = items_with_scores[i][1]
-            
-            return Response(data)
-        else:
-            return super().list(request, *args, **kwargs)
+    relevance = RelevanceScore([
+        PartialMatch('make', 20),
+        PartialMatch('model', 20),
+        ExactMatch('year', 15, cast=int),
+    ])
 
 class ArtisticMaterialSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = ArtisticMaterial.objects.select_related('BackGroundJobsProfile__user')
@@ -1780,6 +1404,9 @@ class ArtisticMaterialSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = ArtisticMaterialFilter
     ordering_fields = ['name', 'price', 'created_at', 'type']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'artistic_material'
+    cache_dependencies = ('profiles.ArtisticMaterial', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
 
 class MusicItemSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = MusicItem.objects.select_related('BackGroundJobsProfile__user')
@@ -1788,6 +1415,9 @@ class MusicItemSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = MusicItemFilter
     ordering_fields = ['name', 'price', 'created_at', 'instrument_type']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'music_item'
+    cache_dependencies = ('profiles.MusicItem', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
 
 class RareItemSearchView(SearchViewMixin, generics.ListAPIView):
     queryset = RareItem.objects.select_related('BackGroundJobsProfile__user')
@@ -1796,6 +1426,9 @@ class RareItemSearchView(SearchViewMixin, generics.ListAPIView):
     filterset_class = RareItemFilter
     ordering_fields = ['name', 'price', 'created_at', 'provenance']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    document_type = 'rare_item'
+    cache_dependencies = ('profiles.RareItem', 'profiles.BackGroundJobsProfile', 'profiles.Genre')
+    facet_fields = ITEM_FACET_FIELDS
 
 class BandSearchView(SearchViewMixin, generics.ListAPIView):
     def get_queryset(self):
@@ -1805,13 +1438,13 @@ class BandSearchView(SearchViewMixin, generics.ListAPIView):
         return Band.objects.select_related(
             'creator', 'creator__user'
         ).prefetch_related(
-            'members', 'media', 'bandmembership'
+            'members', 'media', 'bandmembership_set'
         ).annotate(
-            # Annotate member count to avoid N+1 queries
-            member_count=Count('bandmembership'),
-            admin_count=Count('bandmembership', filter=Q(bandmembership__role='admin')),
+            # Annotate member counts (read by Band.member_count/admin_count) to avoid N+1 queries
+            _member_count=Count('bandmembership', distinct=True),
+            _admin_count=Count('bandmembership', filter=Q(bandmembership__role='admin'), distinct=True),
             # Annotate media count
-            media_count=Count('media'),
+            media_count=Count('media', distinct=True),
             # Annotate creator info
             creator_email=F('creator__user__email'),
             creator_name=Case(
@@ -1830,139 +1463,56 @@ class BandSearchView(SearchViewMixin, generics.ListAPIView):
                 ),
                 default='creator__user__email',
                 output_field=CharField()
-            )
+            ),
+            # Stored band score
+            profile_score=profile_score_subquery('band')
         )
     
     serializer_class = BandDashboardSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = BandFilter
-    ordering_fields = ['name', 'created_at', 'band_type', 'location']
+    ordering_fields = ['name', 'created_at', 'band_type', 'location', 'profile_score']
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    detail_url_name = 'dashboard:band-detail'
+    detail_url_field = 'band_url'
+    document_type = 'band'
+    cache_dependencies = BAND_CACHE_DEPENDENCIES
+    profile_score_source = ''
+    facet_fields = {
+        'band_type': 'band_type',
+        'location': 'location',
+    }
+    export_fields = (
+        'id', 'name', 'band_type', 'location', 'creator_id', 'creator__user__email', 'created_at',
+    )
+    
+    relevance = RelevanceScore([
+        ExactMatch('band_type', 25),
+        # Partial match can still get points
+        PartialMatch('name', 20, reverse_weight=15),
+        FuzzyLocationMatch('location', 15, reverse_weight=10),
+        # Penalize for having fewer/more members than requested
+        Minimum('min_members', '_member_count', bonus=10, penalty=5),
+        Maximum('max_members', '_member_count', bonus=5, penalty=2),
+        # Bands with more media might be more appealing
+        Tiered('media_count', ((3, 15), (1, 10), (0, 5))),
+    ])
+    
+    def get_sharing_status_objects(self, rows):
+        # Band media are nested in the serialized bands
+        objects = super().get_sharing_status_objects(rows)
+        for band in rows:
+            objects.extend(band.media.all())
+        return objects
     
     def calculate_profile_score(self, band):
         """
-        Get the profile score from the band's method with caching.
+        Get the band's stored score (annotated on the queryset).
         """
+        if band.profile_score is not None:
+            return band.profile_score
         from .utils import get_profile_score_cached
-        score_breakdown = get_profile_score_cached(band)
-        return score_breakdown['total']
-    
-    def calculate_relevance_score(self, queryset, filters):
-        """
-        Calculate a relevance score for each result based on how closely it matches the filter criteria
-        Higher score = better match
-        """
-        query_params = self.request.query_params
-        
-        # Create a list of bands with their relevance scores
-        bands_with_scores = []
-        
-        for band in queryset:
-            score = 100  # Start with a perfect score
-            
-            # Score band type match
-            if 'band_type' in query_params:
-                score += 25 if band.band_type == query_params['band_type'] else 0
-            
-            # Score band name match (partial match can still get points)
-            if 'name' in query_params and band.name:
-                if query_params['name'].lower() in band.name.lower():
-                    score += 20
-                elif band.name.lower() in query_params['name'].lower():
-                    score += 15
-            
-            # Score location match
-            if 'location' in query_params and band.location:
-                if query_params['location'].lower() in band.location.lower():
-                    score += 15
-                elif band.location.lower() in query_params['location'].lower():
-                    score += 10
-            
-            # Score member count match
-            if 'min_members' in query_params:
-                min_members = int(query_params['min_members'])
-                if band.member_count >= min_members:
-                    score += 10
-                else:
-                    # Penalize for having fewer members than requested
-                    score -= 5 * (min_members - band.member_count)
-            
-            if 'max_members' in query_params:
-                max_members = int(query_params['max_members'])
-                if band.member_count <= max_members:
-                    score += 5
-                else:
-                    # Penalize for having more members than requested
-                    score -= 2 * (band.member_count - max_members)
-            
-            # Score media count - bands with more media might be more appealing
-            media_count = band.media.count()
-            if media_count > 3:
-                score += 15
-            elif media_count > 1:
-                score += 10
-            elif media_count > 0:
-                score += 5
-            
-            bands_with_scores.append((band, score))
-        
-        # Sort by score descending
-        bands_with_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return the sorted bands and their scores
-        return bands_with_scores
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # If filter parameters are applied, calculate relevance score
-        if request.query_params and len(request.query_params) > 0:
-            bands_with_scores = self.calculate_relevance_score(queryset, request.query_params)
-            
-            # Extract just the bands from the scored results
-            queryset = [band for band, score in bands_with_scores]
-            
-            # Paginate
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                
-                # Add relevance scores and band URLs to the results
-                for i, item in enumerate(data):
-                    item['relevance_score'] = bands_with_scores[i][1]
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['band_url'] = request.build_absolute_uri(reverse('dashboard:band-detail', args=[item['id']]))
-                
-                return self.get_paginated_response(data)
-            
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            
-            # Add relevance scores and band URLs to the results
-            for i, item in enumerate(data):
-                item['relevance_score'] = bands_with_scores[i][1]
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['band_url'] = request.build_absolute_uri(reverse('dashboard:band-detail', args=[item['id']]))
-            
-            return Response(data)
-        else:
-            # No filters applied, just return all results
-            page = self.paginate_queryset(queryset)
-            if page is not None:
-                serializer = self.get_serializer(page, many=True)
-                data = serializer.data
-                for i, item in enumerate(data):
-                    item['profile_score'] = self.calculate_profile_score(page[i])
-                    item['band_url'] = request.build_absolute_uri(reverse('dashboard:band-detail', args=[item['id']]))
-                return self.get_paginated_response(data)
-    
-            serializer = self.get_serializer(queryset, many=True)
-            data = serializer.data
-            for i, item in enumerate(data):
-                item['profile_score'] = self.calculate_profile_score(queryset[i])
-                item['band_url'] = request.build_absolute_uri(reverse('dashboard:band-detail', args=[item['id']]))
-            return Response(data)
+        return get_profile_score_cached(band)['total']
 
 class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
     """
@@ -1990,9 +1540,19 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
         - rare_items: RareItem
         - bands: Band
     
+        - all, or a comma-separated list (e.g. talent,bands,props): search several
+          types at once (see search_multiple_types)
+    
     Filter parameters:
     - All filter parameters for the selected profile_type can be used directly
     - Each profile type has its own specific filtering options
+    - q: free-text search over names, about text, band descriptions, item
+      names/descriptions and worker categories; results are ordered by text
+      relevance and include a text_rank
+    - facets: comma-separated facet names (or 'all') for a single profile_type;
+      the response gets per-value counts under 'facets' for the current filters
+    - explain=1: add each profile's score breakdown with its English/Arabic
+      details and improvement tips under profile_score_breakdown
     
     Response:
     - Returns a consistent response format with relevance scores
@@ -2003,9 +1563,168 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
     - /api/dashboard/search/?profile_type=visual&primary_category=photographer
     - /api/dashboard/search/?profile_type=bands&band_type=musical
     - /api/dashboard/search/?profile_type=props&min_price=100&max_price=500
+    - /api/dashboard/search/?profile_type=bands&q=jazz quartet
+    - /api/dashboard/search/?profile_type=talent,bands,props&q=guitar&per_type=5
+    - /api/dashboard/search/?profile_type=expressive&city=Dubai&facets=performer_type,hair_color
     """
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
     
+    # Map profile types to their respective view classes
+    profile_views = {
+        'talent': TalentUserProfileSearchView,
+        'visual': VisualWorkerSearchView,
+        'expressive': ExpressiveWorkerSearchView,
+        'hybrid': HybridWorkerSearchView,
+        'background': BackGroundJobsProfileSearchView,
+        'props': PropSearchView,
+        'costumes': CostumeSearchView,
+        'locations': LocationSearchView,
+        'memorabilia': MemorabiliaSearchView,
+        'vehicles': VehicleSearchView,
+        'artistic_materials': ArtisticMaterialSearchView,
+        'music_items': MusicItemSearchView,
+        'rare_items': RareItemSearchView,
+        'bands': BandSearchView
+    }
+    
+    def build_view(self, profile_type):
+        """An initialized search view for one profile type, sharing this request"""
+        view = self.profile_views[profile_type]()
+        view.request = self.request
+        view.format_kwarg = self.format_kwarg
+        view.kwargs = self.kwargs
+        view.args = self.args
+        return view
+    
+    def get_per_type_limit(self):
+        try:
+            limit = int(self.request.query_params.get('per_type', settings.SEARCH_FANOUT_PER_TYPE))
+        except ValueError:
+            limit = settings.SEARCH_FANOUT_PER_TYPE
+        return max(1, min(limit, settings.SEARCH_FANOUT_MAX_PER_TYPE))
+    
+    def search_profile_type(self, profile_type, limit, started, in_worker):
+        """One type's top results; records when it started running in `started`"""
+        started[profile_type] = time.monotonic()
+        if in_worker:
+            # Pool threads keep their connections between tasks (up to CONN_MAX_AGE);
+            # drop the expired or broken ones, as Django does around each request
+            close_old_connections()
+        try:
+            return self.build_view(profile_type).get_top_results(limit)
+        finally:
+            if in_worker:
+                close_old_connections()
+    
+    def wait_for_searches(self, futures, started):
+        """
+        Wait until each search finished or ran for SEARCH_FANOUT_TIMEOUT seconds,
+        timed from when it started, not from when it was queued. Returns the
+        futures still running at their deadline.
+        """
+        timeout = settings.SEARCH_FANOUT_TIMEOUT
+        pending = set(futures)
+        timed_out = set()
+        while pending:
+            now = time.monotonic()
+            waits = [started[futures[future]] + timeout - now for future in pending if futures[future] in started]
+            if len(waits) < len(pending):
+                # Queued searches start their clock when a pool thread picks them up
+                waits.append(FANOUT_QUEUE_POLL)
+            _, pending = wait(pending, timeout=max(min(waits), 0), return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            expired = {
+                future for future in pending
+                if futures[future] in started and now - started[futures[future]] >= timeout
+            }
+            timed_out |= expired
+            pending -= expired
+        return timed_out
+    
+    def search_multiple_types(self, profile_types, search_criteria):
+        """
+        Run the best `per_type` results of each profile type concurrently in the
+        shared fan-out pool (fanout_executor), then merge them by normalized score: each type's
+        text_rank (with q=) or relevance_score divided by that type's best, so
+        types with different scoring scales interleave fairly. Types that fail
+        are listed in `errors`; types that ran longer than SEARCH_FANOUT_TIMEOUT
+        seconds (from when they started, on either path) are listed in
+        `timed_out` and left out of the results.
+        """
+        limit = self.get_per_type_limit()
+        workers = min(len(profile_types), settings.SEARCH_FANOUT_MAX_WORKERS)
+        
+        outcomes = {}
+        timed_out = []
+        started = {}
+        if workers <= 1:
+            for profile_type in profile_types:
+                try:
+                    outcome = self.search_profile_type(profile_type, limit, started, False)
+                except Exception as e:
+                    outcome = e
+                # Same limit as in the pool, though it can only be applied once the search returns
+                if time.monotonic() - started[profile_type] >= settings.SEARCH_FANOUT_TIMEOUT:
+                    timed_out.append(profile_type)
+                else:
+                    outcomes[profile_type] = outcome
+        else:
+            executor = fanout_executor()
+            futures = {
+                executor.submit(self.search_profile_type, profile_type, limit, started, True): profile_type
+                for profile_type in profile_types
+            }
+            expired = self.wait_for_searches(futures, started)
+            for future, profile_type in futures.items():
+                if future in expired:
+                    # A running search finishes in its pool thread; its results are dropped
+                    timed_out.append(profile_type)
+                elif future.exception() is not None:
+                    outcomes[profile_type] = future.exception()
+                else:
+                    outcomes[profile_type] = future.result()
+        
+        merged = []
+        errors = {}
+        counts = {}
+        for type_index, profile_type in enumerate(profile_types):
+            outcome = outcomes.get(profile_type)
+            if isinstance(outcome, Exception):
+                logger.error(f"Error searching {profile_type} in multi-type search: {outcome}")
+                errors[profile_type] = str(outcome)
+                continue
+            if outcome is None:
+                continue
+            
+            counts[profile_type] = len(outcome)
+            raw_scores = [item.get('text_rank', item.get('relevance_score')) for item in outcome]
+            best = max((score for score in raw_scores if score is not None), default=None)
+            for position, (item, score) in enumerate(zip(outcome, raw_scores)):
+                if score is None or not best or best <= 0:
+                    normalized = 1.0
+                else:
+                    normalized = round(max(score, 0) / best, 4)
+                item['profile_type'] = profile_type
+                item['normalized_score'] = normalized
+                merged.append((-normalized, position, type_index, item))
+        
+        merged.sort(key=lambda entry: entry[:3])
+        results = [item for *_, item in merged]
+        
+        response_data = {
+            'success': True,
+            'profile_type': profile_types,
+            'count': len(results),
+            'counts': counts,
+            'search_criteria': search_criteria,
+            'results': results
+        }
+        if timed_out:
+            response_data['timed_out'] = timed_out
+        if errors:
+            response_data['errors'] = errors
+        return Response(response_data)
+    
     def get(self, request, *args, **kwargs):
         # Get profile type from request
         profile_type = request.query_params.get('profile_type', 'talent').lower()
@@ -2014,23 +1733,21 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
         search_criteria = {k: v for k, v in request.query_params.items() 
                           if k != 'format' and (k != 'profile_type' or k == 'profile_type' and profile_type != 'talent')}
         
-        # Map profile types to their respective view classes
-        profile_views = {
-            'talent': TalentUserProfileSearchView,
-            'visual': VisualWorkerSearchView,
-            'expressive': ExpressiveWorkerSearchView,
-            'hybrid': HybridWorkerSearchView,
-            'background': BackGroundJobsProfileSearchView,
-            'props': PropSearchView,
-            'costumes': CostumeSearchView,
-            'locations': LocationSearchView,
-            'memorabilia': MemorabiliaSearchView,
-            'vehicles': VehicleSearchView,
-            'artistic_materials': ArtisticMaterialSearchView,
-            'music_items': MusicItemSearchView,
-            'rare_items': RareItemSearchView,
-            'bands': BandSearchView
-        }
+        profile_views = self.profile_views
+        
+        # Several profile types at once
+        if profile_type == 'all' or ',' in profile_type:
+            if profile_type == 'all':
+                profile_types = list(profile_views)
+            else:
+                profile_types = list(dict.fromkeys(t.strip() for t in profile_type.split(',') if t.strip()))
+            invalid = [t for t in profile_types if t not in profile_views]
+            if invalid or not profile_types:
+                return Response(
+                    {'error': f'Invalid profile_type: {", ".join(invalid) or profile_type}. Must be "all" or a comma-separated list of: {", ".join(profile_views.keys())}'},
+                    status=400
+                )
+            return self.search_multiple_types(profile_types, search_criteria)
         
         # Check if the profile type is valid
         if profile_type not in profile_views:
@@ -2045,30 +1762,30 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
         logger.info(f"Search criteria: {search_criteria}")
         
         # Create an instance of the appropriate view
-        view_class = profile_views[profile_type]
-        view = view_class()
-        
-        # Properly initialize the view
-        view.request = request
-        view.format_kwarg = self.format_kwarg
-        view.kwargs = kwargs
-        view.args = args
+        view = self.build_view(profile_type)
         
         # Get response from the view
         try:
             original_response = view.list(request)
+            
+            # Value counts for the requested facets, from the same filters
+            facet_names = view.get_facet_names()
+            facets = view.get_facets(facet_names) if facet_names else None
         
             # Check if the response contains a message about no results
             if isinstance(original_response.data, dict) and 'message' in original_response.data:
                 # Include the profile type in the message for clarity
-                return Response({
+                response_data = {
                     'success': True,
                     'profile_type': profile_type,
                     'message': f"No {profile_type} profiles match your search criteria.",
                     'count': 0,
                     'search_criteria': search_criteria,
                     'results': []
-                })
+                }
+                if facets is not None:
+                    response_data['facets'] = facets
+                return Response(response_data)
             
             # For paginated responses, restructure the response
             if hasattr(original_response, 'data') and 'results' in original_response.data:
@@ -2094,6 +1811,8 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
                     response_data['next'] = next_link
                 if previous_link:
                     response_data['previous'] = previous_link
+                if facets is not None:
+                    response_data['facets'] = facets
                     
                 return Response(response_data)
             else:
@@ -2102,13 +1821,16 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
                 count = len(results)
                 
                 # Create enhanced response with metadata
-                return Response({
+                response_data = {
                     'success': True,
                     'profile_type': profile_type,
                     'count': count,
                     'search_criteria': search_criteria,
                     'results': results
-                })
+                }
+                if facets is not None:
+                    response_data['facets'] = facets
+                return Response(response_data)
             
         except Exception as e:
             # Log the error and provide a helpful message
@@ -2121,3 +1843,72 @@ class UnifiedSearchView(SearchViewMixin, generics.GenericAPIView):
                 'error': f'An error occurred while searching for {profile_type} profiles: {str(e)}'
             }, status=500)
 
+
+class SearchExportView(UnifiedSearchView):
+    """
+    Stream every result of a search as CSV or NDJSON.
+    
+    Takes the same profile_type, filter and q parameters as UnifiedSearchView,
+    without pagination. Rows are read with .values() and streamed in chunks, so
+    exports of any size use constant memory.
+    
+    Parameters:
+    - export_format: csv (default) or ndjson
+    
+    Example:
+    - /api/dashboard/search/export/?profile_type=expressive&hair_color=black&export_format=ndjson
+    """
+    
+    def get(self, request, *args, **kwargs):
+        profile_type = request.query_params.get('profile_type', 'talent').lower()
+        if profile_type not in self.profile_views:
+            return Response(
+                {'error': f'Invalid profile_type: {profile_type}. Must be one of: {", ".join(self.profile_views.keys())}'},
+                status=400
+            )
+        
+        export_format = request.query_params.get('export_format', 'csv').lower()
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': f'Invalid export_format: {export_format}. Must be one of: {", ".join(EXPORT_FORMATS)}'},
+                status=400
+            )
+        
+        view = self.build_view(profile_type)
+        columns, rows = view.export_results()
+        filename = f"{profile_type}-search-{timezone.now().strftime('%Y%m%d-%H%M%S')}"
+        return streaming_export(export_format, columns, rows, filename)
+
+
+class ItemCataloguePagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+
+
+class ItemCatalogueView(generics.ListAPIView):
+    """
+    Search every background item type at once.
+    
+    Rows come from one ordered, paginated UNION ALL query over the eight item
+    tables (see dashboard.item_catalogue), so a cross-type search doesn't go
+    through PropSearchView, CostumeSearchView, ... one by one.
+    
+    Parameters:
+    - item_type: comma-separated item types (props, costumes, ...); all by default
+    - min_price / max_price: price range
+    - is_for_rent / is_for_sale: true or false
+    - genre: genre id or name
+    - q: text matched against item names and descriptions
+    - ordering: price, created_at or name, prefixed with - for descending (default -created_at)
+    
+    Example:
+    - /api/dashboard/search/items/?max_price=200&is_for_rent=true&ordering=price
+    """
+    serializer_class = ItemCatalogueSerializer
+    pagination_class = ItemCataloguePagination
+    permission_classes = [IsDashboardUser | IsAdminDashboardUser]
+    query_budget = 5
+    
+    def get_queryset(self):
+        return catalogue_from_params(self.request.query_params)
@@ -9,7 +9,19 @@ import datetime
 from .models import SharedMediaPost
 from django.contrib.contenttypes.models import ContentType
 from payments.models_restrictions import RestrictedCountryUser
-from .utils import get_sharing_status
+from .utils import get_sharing_status, get_profile_score_cached, wants_score_explanation
+
+class SharingStatusMixin:
+    """
+    get_sharing_status for a `sharing_status` SerializerMethodField: read from
+    the view's SharingStatusResolver (context 'sharing_status_resolver'), which
+    loads a page's statuses together, or looked up per object without one
+    """
+    def get_sharing_status(self, obj):
+        resolver = self.context.get('sharing_status_resolver')
+        if resolver is None:
+            return get_sharing_status(obj)
+        return resolver.get(obj)
 
 class UserBasicSerializer(serializers.ModelSerializer):
     """Basic user serializer for restricted users view"""
@@ -50,15 +62,17 @@ class TalentDashboardSerializer(serializers.ModelSerializer):
         return specializations
     
     def get_media_count(self, obj):
+        # Count in Python so a prefetched `media` relation is reused
+        media_types = [media.media_type for media in obj.media.all()]
         return {
-            'images': obj.media.filter(media_type='image').count(),
-            'videos': obj.media.filter(media_type='video').count()
+            'images': media_types.count('image'),
+            'videos': media_types.count('video')
         }
     
     def get_profile_score(self, obj):
-        # Use the model's centralized score calculation method
+        # Stored result of the model's centralized score calculation
         # This ensures consistency across all API endpoints
-        return obj.get_profile_score()
+        return get_profile_score_cached(obj, explain=wants_score_explanation(self.context.get('request')))
 
 class VisualWorkerDashboardSerializer(serializers.ModelSerializer):
     profile = TalentDashboardSerializer(read_only=True)
@@ -99,10 +113,12 @@ class ExpressiveWorkerDashboardSerializer(serializers.ModelSerializer):
         ]
     
     def get_profile_score(self, obj):
-        # Use the profile's centralized score calculation method
+        # Stored result of the profile's centralized score calculation
         # This ensures consistency across all API endpoints
-        profile = obj.profile
-        score_breakdown = profile.get_profile_score()
+        profile_score = getattr(obj, 'profile_score', None)
+        if profile_score is not None:
+            return profile_score
+        score_breakdown = get_profile_score_cached(obj.profile)
         return score_breakdown['total']
 
     def to_representation(self, instance):
@@ -196,117 +212,15 @@ class BackGroundDashboardSerializer(serializers.ModelSerializer):
     
     def get_item_count(self, obj):
         # Count all items of different types related to this profile
-        item_counts = {
-            'props': Prop.objects.filter(BackGroundJobsProfile=obj).count(),
-            'costumes': Costume.objects.filter(BackGroundJobsProfile=obj).count(),
-            'locations': Location.objects.filter(BackGroundJobsProfile=obj).count(),
-            'memorabilia': Memorabilia.objects.filter(BackGroundJobsProfile=obj).count(),
-            'vehicles': Vehicle.objects.filter(BackGroundJobsProfile=obj).count(),
-            'artistic_materials': ArtisticMaterial.objects.filter(BackGroundJobsProfile=obj).count(),
-            'music_items': MusicItem.objects.filter(BackGroundJobsProfile=obj).count(),
-            'rare_items': RareItem.objects.filter(BackGroundJobsProfile=obj).count(),
-            'total': 0
-        }
-        item_counts['total'] = sum(count for key, count in item_counts.items() if key != 'total')
+        # (primed for a whole page by BackGroundJobsProfile.load_item_counts)
+        item_counts = dict(obj.get_item_counts())
+        item_counts['total'] = sum(item_counts.values())
         return item_counts
     
     def get_profile_score(self, obj):
-        # Start with breakdown of score components
-        score_breakdown = {
-            'total': 0,
-            'account_tier': 0,
-            'profile_completion': 0,
-            'item_diversity': 0,
-            'item_quantity': 0,
-            'details': {}
-        }
-        
-        # Score for account tier
-        if obj.account_type == 'back_ground_jobs':
-            score_breakdown['account_tier'] = 50
-            score_breakdown['details']['account_tier'] = 'Background Jobs account: +50 points'
-        else:
-            score_breakdown['account_tier'] = 10
-            score_breakdown['details']['account_tier'] = 'Free account: +10 points (upgrade for +40 points)'
-        
-        # Score for profile completeness - check basic fields
-        profile_complete = bool(obj.country and obj.date_of_birth and obj.gender)
-        if profile_complete:
-            score_breakdown['profile_completion'] = 15
-            score_breakdown['details']['profile_completion'] = 'Profile complete: +15 points'
-        else:
-            score_breakdown['details']['profile_completion'] = 'Profile incomplete: +0 points (complete your profile for +15 points)'
-        
-        # Score for item diversity (number of different item types)
-        item_types = [
-            Prop.objects.filter(BackGroundJobsProfile=obj).exists(),
-            Costume.objects.filter(BackGroundJobsProfile=obj).exists(),
-            Location.objects.filter(BackGroundJobsProfile=obj).exists(),
-            Memorabilia.objects.filter(BackGroundJobsProfile=obj).exists(),
-            Vehicle.objects.filter(BackGroundJobsProfile=obj).exists(),
-            ArtisticMaterial.objects.filter(BackGroundJobsProfile=obj).exists(),
-            MusicItem.objects.filter(BackGroundJobsProfile=obj).exists(),
-            RareItem.objects.filter(BackGroundJobsProfile=obj).exists()
-        ]
-        
-        item_type_count = sum(1 for t in item_types if t)
-        score_breakdown['item_diversity'] = item_type_count * 5
-        if item_type_count > 0:
-            score_breakdown['details']['item_diversity'] = f'{item_type_count} item types: +{item_type_count * 5} points'
-        else:
-            score_breakdown['details']['item_diversity'] = 'No item types: +0 points (add different item types for +5 points each)'
-        
-        # Score for total item quantity
-        total_items = sum([
-            Prop.objects.filter(BackGroundJobsProfile=obj).count(),
-            Costume.objects.filter(BackGroundJobsProfile=obj).count(),
-            Location.objects.filter(BackGroundJobsProfile=obj).count(),
-            Memorabilia.objects.filter(BackGroundJobsProfile=obj).count(),
-            Vehicle.objects.filter(BackGroundJobsProfile=obj).count(),
-            ArtisticMaterial.objects.filter(BackGroundJobsProfile=obj).count(),
-            MusicItem.objects.filter(BackGroundJobsProfile=obj).count(),
-            RareItem.objects.filter(BackGroundJobsProfile=obj).count()
-        ])
-        
-        if total_items > 20:
-            score_breakdown['item_quantity'] = 25
-            score_breakdown['details']['item_quantity'] = 'Large collection (20+ items): +25 points'
-        elif total_items > 10:
-            score_breakdown['item_quantity'] = 20
-            score_breakdown['details']['item_quantity'] = 'Medium collection (10-20 items): +20 points'
-        elif total_items > 5:
-            score_breakdown['item_quantity'] = 15
-            score_breakdown['details']['item_quantity'] = 'Small collection (5-10 items): +15 points'
-        elif total_items > 0:
-            score_breakdown['item_quantity'] = 10
-            score_breakdown['details']['item_quantity'] = 'Starter collection (1-5 items): +10 points'
-        else:
-            score_breakdown['details']['item_quantity'] = 'No items: +0 points (add items for up to +25 points)'
-        
-        # Calculate total score
-        score_breakdown['total'] = (
-            score_breakdown['account_tier'] + 
-            score_breakdown['profile_completion'] + 
-            score_breakdown['item_diversity'] + 
-            score_breakdown['item_quantity']
-        )
-        
-        # Cap the score at 100 for normalization
-        score_breakdown['total'] = min(score_breakdown['total'], 100)
-        
-        # Include tips for improvement if score is below 80
-        if score_breakdown['total'] < 80:
-            score_breakdown['improvement_tips'] = []
-            if obj.account_type != 'back_ground_jobs':
-                score_breakdown['improvement_tips'].append('Upgrade to Background Jobs account for +40 points')
-            if not profile_complete:
-                score_breakdown['improvement_tips'].append('Complete your profile for +15 points')
-            if item_type_count < 8:
-                score_breakdown['improvement_tips'].append('Add more item types for +5 points each')
-            if total_items < 5:
-                score_breakdown['improvement_tips'].append('Add more items for up to +25 points')
-        
-        return score_breakdown
+        # Stored result of the model's centralized score calculation
+        # This ensures consistency across all API endpoints
+        return get_profile_score_cached(obj, explain=wants_score_explanation(self.context.get('request')))
 
 class BackgroundProfileBasicSerializer(serializers.ModelSerializer):
     user_email = serializers.CharField(source='user.email', read_only=True)
@@ -321,7 +235,7 @@ class BackgroundProfileBasicSerializer(serializers.ModelSerializer):
             return f"{obj.user.first_name} {obj.user.last_name}"
         return obj.user.email
 
-class PropDashboardSerializer(serializers.ModelSerializer):
+class PropDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -331,12 +245,8 @@ class PropDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'material', 'used_in_movie', 'condition', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the prop using centralized utility"""
-        return get_sharing_status(obj)
 
-class CostumeDashboardSerializer(serializers.ModelSerializer):
+class CostumeDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -346,12 +256,8 @@ class CostumeDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'size', 'worn_by', 'era', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the costume using centralized utility"""
-        return get_sharing_status(obj)
 
-class LocationDashboardSerializer(serializers.ModelSerializer):
+class LocationDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -361,12 +267,8 @@ class LocationDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'address', 'capacity', 'is_indoor', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the location using centralized utility"""
-        return get_sharing_status(obj)
 
-class MemorabilaDashboardSerializer(serializers.ModelSerializer):
+class MemorabilaDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -376,12 +278,8 @@ class MemorabilaDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'signed_by', 'authenticity_certificate', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the memorabilia using centralized utility"""
-        return get_sharing_status(obj)
 
-class VehicleDashboardSerializer(serializers.ModelSerializer):
+class VehicleDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -391,12 +289,8 @@ class VehicleDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'make', 'model', 'year', 'condition', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the vehicle using centralized utility"""
-        return get_sharing_status(obj)
 
-class ArtisticMaterialDashboardSerializer(serializers.ModelSerializer):
+class ArtisticMaterialDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -406,12 +300,8 @@ class ArtisticMaterialDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'type', 'condition', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the artistic material using centralized utility"""
-        return get_sharing_status(obj)
 
-class MusicItemDashboardSerializer(serializers.ModelSerializer):
+class MusicItemDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -421,12 +311,8 @@ class MusicItemDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'instrument_type', 'condition', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the music item using centralized utility"""
-        return get_sharing_status(obj)
 
-class RareItemDashboardSerializer(serializers.ModelSerializer):
+class RareItemDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     owner = BackgroundProfileBasicSerializer(source='BackGroundJobsProfile', read_only=True)
     sharing_status = serializers.SerializerMethodField()
     email = serializers.CharField(source='BackGroundJobsProfile.user.email', read_only=True)
@@ -436,10 +322,20 @@ class RareItemDashboardSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'name', 'description', 'price', 'genre', 'is_for_rent', 'is_for_sale',
                  'provenance', 'is_one_of_a_kind', 'created_at', 'updated_at', 'image', 'owner', 'sharing_status']
         read_only_fields = ['id', 'email', 'owner', 'created_at', 'updated_at']
-    
-    def get_sharing_status(self, obj):
-        """Get sharing status information for the rare item using centralized utility"""
-        return get_sharing_status(obj)
+
+class ItemCatalogueSerializer(serializers.Serializer):
+    """Row of the cross-type item catalogue (see dashboard.item_catalogue)"""
+    id = serializers.IntegerField()
+    item_type = serializers.CharField()
+    name = serializers.CharField()
+    description = serializers.CharField(allow_null=True)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2)
+    is_for_rent = serializers.BooleanField()
+    is_for_sale = serializers.BooleanField()
+    genre_id = serializers.IntegerField(allow_null=True)
+    genre_name = serializers.CharField(allow_null=True)
+    profile_id = serializers.IntegerField(allow_null=True)
+    created_at = serializers.DateTimeField()
 
 class BandMemberDashboardSerializer(serializers.ModelSerializer):
     member_name = serializers.SerializerMethodField()
@@ -462,18 +358,12 @@ class BandMemberDashboardSerializer(serializers.ModelSerializer):
         model = BandMembership
         fields = ['id', 'member_name', 'profile_id', 'role', 'position', 'date_joined']
 
-class BandMediaDashboardSerializer(serializers.ModelSerializer):
+class BandMediaDashboardSerializer(SharingStatusMixin, serializers.ModelSerializer):
     sharing_status = serializers.SerializerMethodField()
     
     class Meta:
         model = BandMedia
         fields = ['id', 'name', 'media_info', 'media_type', 'media_file', 'created_at', 'sharing_status']
-    
-    def get_sharing_status(self, obj):
-        """
-        Get sharing status for a band media item using centralized utility.
-        """
-        return get_sharing_status(obj)
 
 class BandDashboardSerializer(serializers.ModelSerializer):
     members = serializers.SerializerMethodField()
@@ -498,106 +388,9 @@ class BandDashboardSerializer(serializers.ModelSerializer):
         return obj.creator.user.id if obj.creator and obj.creator.user else None
     
     def get_profile_score(self, obj):
-        # Start with breakdown of score components
-        score_breakdown = {
-            'total': 0,
-            'profile_completion': 0,
-            'media_content': 0,
-            'member_count': 0,
-            'band_details': 0,
-            'details': {}
-        }
-        
-        # Score for profile completion
-        profile_fields = [
-            bool(obj.name), bool(obj.description), bool(obj.band_type), 
-            bool(obj.profile_picture), bool(obj.contact_email or obj.contact_phone), 
-            bool(obj.location)
-        ]
-        completed_fields = sum(1 for f in profile_fields if f)
-        profile_percent = (completed_fields / len(profile_fields)) * 100
-        
-        if profile_percent == 100:
-            score_breakdown['profile_completion'] = 30
-            score_breakdown['details']['profile_completion'] = 'Complete band profile: +30 points'
-        elif profile_percent >= 75:
-            score_breakdown['profile_completion'] = 20
-            score_breakdown['details']['profile_completion'] = 'Mostly complete band profile: +20 points'
-        elif profile_percent >= 50:
-            score_breakdown['profile_completion'] = 10
-            score_breakdown['details']['profile_completion'] = 'Partially complete band profile: +10 points'
-        else:
-            score_breakdown['details']['profile_completion'] = 'Minimal band profile: +0 points (complete your band profile for up to +30 points)'
-        
-        # Score for media content
-        media_count = obj.media.count()
-        if media_count >= 6:
-            score_breakdown['media_content'] = 30
-            score_breakdown['details']['media_content'] = 'Maximum media (6 items): +30 points'
-        elif media_count >= 4:
-            score_breakdown['media_content'] = 20
-            score_breakdown['details']['media_content'] = 'Good media (4-5 items): +20 points'
-        elif media_count >= 2:
-            score_breakdown['media_content'] = 10
-            score_breakdown['details']['media_content'] = 'Basic media (2-3 items): +10 points'
-        elif media_count == 1:
-            score_breakdown['media_content'] = 5
-            score_breakdown['details']['media_content'] = 'Minimal media (1 item): +5 points'
-        else:
-            score_breakdown['details']['media_content'] = 'No media: +0 points (add media for up to +30 points)'
-        
-        # Score for member count
-        member_count = obj.member_count
-        if member_count >= 10:
-            score_breakdown['member_count'] = 30
-            score_breakdown['details']['member_count'] = 'Large band (10+ members): +30 points'
-        elif member_count >= 5:
-            score_breakdown['member_count'] = 20
-            score_breakdown['details']['member_count'] = 'Medium band (5-9 members): +20 points'
-        elif member_count >= 3:
-            score_breakdown['member_count'] = 10
-            score_breakdown['details']['member_count'] = 'Small band (3-4 members): +10 points'
-        elif member_count > 0:
-            score_breakdown['member_count'] = 5
-            score_breakdown['details']['member_count'] = 'Minimal band (1-2 members): +5 points'
-        else:
-            score_breakdown['details']['member_count'] = 'No members: +0 points (add members for up to +30 points)'
-        
-        # Score for band details (positions, etc.)
-        members_with_positions = BandMembership.objects.filter(band=obj, position__isnull=False).exclude(position='').count()
-        if members_with_positions == member_count and member_count > 0:
-            score_breakdown['band_details'] = 10
-            score_breakdown['details']['band_details'] = 'All members have positions: +10 points'
-        elif members_with_positions > 0:
-            score_breakdown['band_details'] = 5
-            score_breakdown['details']['band_details'] = 'Some members have positions: +5 points'
-        else:
-            score_breakdown['details']['band_details'] = 'No member positions: +0 points (add positions for up to +10 points)'
-        
-        # Calculate total score
-        score_breakdown['total'] = (
-            score_breakdown['profile_completion'] + 
-            score_breakdown['media_content'] + 
-            score_breakdown['member_count'] + 
-            score_breakdown['band_details']
-        )
-        
-        # Cap the score at 100 for normalization
-        score_breakdown['total'] = min(score_breakdown['total'], 100)
-        
-        # Include tips for improvement if score is below 80
-        if score_breakdown['total'] < 80:
-            score_breakdown['improvement_tips'] = []
-            if profile_percent < 100:
-                score_breakdown['improvement_tips'].append('Complete your band profile for up to +30 points')
-            if media_count < 6:
-                score_breakdown['improvement_tips'].append('Add more media for up to +30 points')
-            if member_count < 5:
-                score_breakdown['improvement_tips'].append('Add more members for up to +30 points')
-            if members_with_positions < member_count:
-                score_breakdown['improvement_tips'].append('Add positions for all members for up to +10 points')
-        
-        return score_breakdown
+        # Stored result of the model's centralized score calculation
+        # This ensures consistency across all API endpoints
+        return get_profile_score_cached(obj, explain=wants_score_explanation(self.context.get('request')))
     
     class Meta:
         model = Band
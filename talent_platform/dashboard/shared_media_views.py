@@ -8,6 +8,7 @@ from django.contrib.contenttypes.models import ContentType
 
 from users.permissions import IsDashboardUser, IsAdminDashboardUser
 from .models import SharedMediaPost
+from .pagination import KeysetPagination
 from .serializers import (
     ShareMediaSerializer, 
     SharedMediaPostSerializer,
@@ -140,6 +141,14 @@ class ShareMediaView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class SharedMediaGalleryPagination(KeysetPagination):
+    """Newest first, keyed on (shared_at, id) so deep gallery pages stay cheap"""
+    ordering = ('-shared_at', '-id')
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+
 class SharedMediaListView(generics.ListAPIView):
     """
     API endpoint to list shared media for gallery display.
@@ -155,6 +164,8 @@ class SharedMediaListView(generics.ListAPIView):
     - shared_by: Filter by who shared it (user ID)
     - content_type: Filter by content type (talent_media, band_media, etc.)
     - limit: Number of results per page
+    - cursor: Opaque cursor from the "next"/"previous" links
+    - count: "exact" for a total count, "approx" for a cheap estimate (omitted by default)
     
     Response:
     {
@@ -183,6 +194,7 @@ class SharedMediaListView(generics.ListAPIView):
     """
     serializer_class = SharedMediaPostListSerializer
     permission_classes = []  # Allow anonymous access for public gallery
+    pagination_class = SharedMediaGalleryPagination
     
     def get_queryset(self):
         queryset = SharedMediaPost.objects.filter(is_active=True).select_related(
@@ -1,3 +1,1346 @@
-from django.test import TestCase
+import datetime
+import json
+import tempfile
+import threading
+import time
 
-# Create your tests here.
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from users.models import BaseUser
+from profiles.models import (
+    ITEM_MODELS, TalentUserProfile, TalentMedia, VisualWorker, ExpressiveWorker, HybridWorker,
+    BackGroundJobsProfile, Prop, Costume, SocialMediaLinks, Band, BandMembership
+)
+from dashboard.bulk_seed import bulk_seed
+from dashboard.cache_backends import TwoTierCache
+from dashboard.benchmark import SCENARIOS, compare_results, run_benchmark, seed_dataset
+from dashboard.fulltext import fulltext_backend, install_fulltext_index, uninstall_fulltext_index
+from dashboard.fuzzy import location_match, rebuild_location_trigrams, similar_values
+from dashboard.metrics import LATENCY_BUCKETS, RequestMetrics, latency_percentile, load_totals, record_request
+from dashboard.models import LocationTrigram, ProfileScore, SearchDocument, SharedMediaPost
+from dashboard.pagination import KeysetPagination, keyset_condition
+from dashboard.profile_scores import (
+    get_stored_score, load_stored_scores, rebuild_score_buckets, remove_score, save_scores, score_distribution,
+    score_profiles
+)
+from dashboard.query_budget import (
+    QueryBudgetExceeded, QueryBudgetMiddleware, QueryBudgetMixin, QueryRecorder, sql_shape
+)
+from dashboard.relevance import FuzzyLocationMatch, RelevanceScore
+from dashboard.search_index import rebuild_search_documents
+from dashboard.search_views import (
+    CostumeSearchView, ItemCatalogueView, SearchExportView, TalentUserProfileSearchView, UnifiedSearchView,
+    VisualWorkerSearchView, fanout_executor
+)
+from dashboard.utils import (
+    CachedEntry, SharingStatusResolver, cached_compute, clear_profile_cache, clear_sharing_status_cache, get_generations,
+    get_media_counts_cached, invalidate_namespace
+)
+from dashboard.views import AllProfilesView, BackGroundJobsProfileDetailView
+
+
+def create_talent(index):
+    user = BaseUser.objects.create(
+        email=f'talent{index}@example.com', first_name='Talent', last_name=str(index), is_talent=True
+    )
+    profile = TalentUserProfile.objects.create(user=user, city='Dubai', country='ae')
+    TalentMedia.objects.create(talent=profile, name='photo', media_type='image', media_info='x')
+    VisualWorker.objects.create(profile=profile, years_experience=index, primary_category='photographer')
+    ExpressiveWorker.objects.create(profile=profile, years_experience=index, height=170, weight=60)
+    HybridWorker.objects.create(profile=profile, years_experience=index)
+    return profile
+
+
+class SqlShapeTest(TestCase):
+    def test_literals_are_replaced(self):
+        self.assertEqual(
+            sql_shape("SELECT * FROM t WHERE id = 12 AND name = 'it''s'"),
+            sql_shape("SELECT * FROM t WHERE id = 7 AND name = 'x'"),
+        )
+
+    def test_in_lists_of_any_length_match(self):
+        self.assertEqual(
+            sql_shape('SELECT * FROM t WHERE id IN (%s, %s)'),
+            sql_shape('SELECT * FROM t WHERE id IN (%s, %s, %s, %s)'),
+        )
+
+
+class QueryRecorderTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.users = [
+            BaseUser.objects.create(email=f'user{i}@example.com', first_name='a', last_name='b')
+            for i in range(4)
+        ]
+
+    def test_repeated_shape_reports_location(self):
+        with QueryRecorder() as recorder:
+            for user in self.users:
+                BaseUser.objects.get(pk=user.pk)
+
+        repeated = recorder.repeated_shapes(3)
+        self.assertEqual(len(repeated), 1)
+        self.assertEqual(repeated[0]['count'], 4)
+        location, = repeated[0]['locations']
+        self.assertIn('dashboard/tests.py', location)
+        self.assertIn('test_repeated_shape_reports_location', location)
+
+    def test_assert_query_budget(self):
+        with self.assertQueryBudget(1):
+            list(BaseUser.objects.filter(pk__in=[user.pk for user in self.users]))
+
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget(max_repeats=2):
+                for user in self.users:
+                    BaseUser.objects.get(pk=user.pk)
+
+
+class QueryBudgetMiddlewareTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def get_response(self, request):
+        from django.http import HttpResponse
+        for _ in range(3):
+            BaseUser.objects.filter(email='nobody@example.com').exists()
+        return HttpResponse()
+
+    @override_settings(QUERY_BUDGET_ENABLED=True, QUERY_BUDGET_STRICT=True, QUERY_BUDGET_DEFAULT=2, QUERY_BUDGET_MAX_REPEATS=10)
+    def test_strict_raises(self):
+        middleware = QueryBudgetMiddleware(self.get_response)
+        with self.assertRaises(QueryBudgetExceeded):
+            middleware(self.factory.get('/'))
+
+    @override_settings(QUERY_BUDGET_ENABLED=True, QUERY_BUDGET_STRICT=False, QUERY_BUDGET_DEFAULT=50, QUERY_BUDGET_MAX_REPEATS=2)
+    def test_repeats_are_logged(self):
+        middleware = QueryBudgetMiddleware(self.get_response)
+        with self.assertLogs('dashboard.query_budget', level='WARNING') as logs:
+            response = middleware(self.factory.get('/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('repeated 3x', logs.output[0])
+
+    @override_settings(QUERY_BUDGET_ENABLED=True, QUERY_BUDGET_STRICT=True, QUERY_BUDGET_DEFAULT=50, QUERY_BUDGET_MAX_REPEATS=10, DEBUG=True)
+    def test_query_count_header(self):
+        response = QueryBudgetMiddleware(self.get_response)(self.factory.get('/'))
+        self.assertEqual(response['X-Query-Count'], '3')
+
+
+class KeysetPaginationTest(TestCase):
+    """Cursor pages over tied sort values, forward and backward"""
+
+    def setUp(self):
+        # Scores tie in runs of three, so pages split ties
+        for index in range(10):
+            ProfileScore.objects.create(entity_type='talent', object_id=index, total=50 - index // 3 * 10)
+        self.queryset = ProfileScore.objects.order_by('-total')
+        self.expected = list(ProfileScore.objects.order_by('-total', '-pk').values_list('pk', flat=True))
+
+    def page(self, url='/', results=None):
+        paginator = KeysetPagination()
+        paginator.page_size = 3
+        request = Request(APIRequestFactory().get(url))
+        rows = paginator.paginate_queryset(self.queryset if results is None else results, request)
+        return rows, paginator
+
+    def test_forward_and_backward(self):
+        seen = []
+        url = '/'
+        pages = []
+        while url:
+            rows, paginator = self.page(url)
+            pages.append([row.pk for row in rows])
+            seen += pages[-1]
+            url = paginator.get_next_link()
+        self.assertEqual(seen, self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 3, 1])
+
+        # Walk back from the last page through the previous links
+        back = []
+        url = paginator.get_previous_link()
+        while url:
+            rows, paginator = self.page(url)
+            back.append([row.pk for row in rows])
+            url = paginator.get_previous_link()
+        self.assertEqual(back, pages[-2::-1])
+
+        # A page reached backwards links forward to the same next page
+        rows, paginator = self.page(paginator.get_next_link())
+        self.assertEqual([row.pk for row in rows], pages[1])
+
+    def test_first_page_links(self):
+        _, paginator = self.page()
+        self.assertIsNone(paginator.get_previous_link())
+        self.assertIsNone(paginator.count)
+
+    def test_count(self):
+        self.assertEqual(self.page('/?count=exact')[1].count, 10)
+        # A planner estimate on PostgreSQL; exact elsewhere
+        self.assertEqual(self.page('/?count=approx')[1].count, 10)
+
+    def test_invalid_cursor(self):
+        for cursor in ('not-base64!', 'bm90IGpzb24', KeysetPagination().encode_cursor({'p': [50]})):
+            with self.assertRaises(NotFound):
+                self.page(f'/?cursor={cursor}')
+        with self.assertRaises(NotFound):
+            self.page(f'/?cursor={KeysetPagination().encode_cursor({"o": -1})}', results=self.expected)
+
+    def test_list_results(self):
+        seen = []
+        url = '/'
+        while url:
+            rows, paginator = self.page(url, results=self.expected)
+            seen += rows
+            url = paginator.get_next_link()
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(paginator.count, 10)
+        rows, _ = self.page(paginator.get_previous_link(), results=self.expected)
+        self.assertEqual(rows, self.expected[6:9])
+
+    def test_keyset_condition(self):
+        # After the middle row of a tie
+        row = ProfileScore.objects.get(pk=self.expected[4])
+        condition = keyset_condition(['-total', '-pk'], [row.total, row.pk])
+        self.assertEqual(
+            list(ProfileScore.objects.filter(condition).order_by('-total', '-pk').values_list('pk', flat=True)),
+            self.expected[5:]
+        )
+        condition = keyset_condition(['-total', '-pk'], [row.total, row.pk], reverse=True)
+        self.assertEqual(
+            list(ProfileScore.objects.filter(condition).order_by('-total', '-pk').values_list('pk', flat=True)),
+            self.expected[:4]
+        )
+
+
+class ViewQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Listing views run a fixed number of queries per page, however many rows it holds"""
+
+    def setUp(self):
+        self.admin = BaseUser.objects.create(
+            email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True
+        )
+        self.profiles = [create_talent(i) for i in range(2)]
+        background_user = BaseUser.objects.create(
+            email='background@example.com', first_name='a', last_name='b', is_background=True
+        )
+        self.background = BackGroundJobsProfile.objects.create(user=background_user)
+
+    def call(self, view_class, **params):
+        request = APIRequestFactory().get('/', params)
+        force_authenticate(request, user=self.admin)
+        response = view_class.as_view()(request)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response
+
+    def count_queries(self, view_class, **params):
+        # Warm the caches the view reads through
+        self.call(view_class, **params)
+        with self.assertQueryBudget(view_class.query_budget, max_repeats=2) as recorder:
+            self.call(view_class, **params)
+        return recorder.count
+
+    def assertFlat(self, view_class, add_rows, **params):
+        before = self.count_queries(view_class, **params)
+        add_rows()
+        self.assertEqual(self.count_queries(view_class, **params), before)
+
+    def add_talents(self):
+        self.profiles += [create_talent(i) for i in range(2, 6)]
+
+    def add_items(self):
+        for i in range(4):
+            Prop.objects.create(BackGroundJobsProfile=self.background, name=f'prop{i}', material='wood', price=i)
+            Costume.objects.create(BackGroundJobsProfile=self.background, name=f'costume{i}', era='modern', price=i)
+
+    def test_talent_search(self):
+        self.assertFlat(UnifiedSearchView, self.add_talents, profile_type='talent')
+
+    def test_worker_search(self):
+        profile_types = ('visual', 'expressive', 'hybrid')
+        before = {profile_type: self.count_queries(UnifiedSearchView, profile_type=profile_type) for profile_type in profile_types}
+        self.add_talents()
+        after = {profile_type: self.count_queries(UnifiedSearchView, profile_type=profile_type) for profile_type in profile_types}
+        self.assertEqual(after, before)
+
+    def test_all_profiles(self):
+        self.assertFlat(AllProfilesView, self.add_talents)
+
+    def test_item_catalogue(self):
+        self.add_items()
+        self.assertFlat(ItemCatalogueView, self.add_items)
+
+    def test_sharing_status_uncached(self):
+        def count_queries(**params):
+            self.call(UnifiedSearchView, **params)
+            cache.clear()
+            with self.assertQueryBudget(UnifiedSearchView.query_budget, max_repeats=2) as recorder:
+                self.call(UnifiedSearchView, **params)
+            return recorder.count
+        
+        self.add_items()
+        before = [count_queries(profile_type='talent', include_media='true'), count_queries(profile_type='props')]
+        self.add_talents()
+        self.add_items()
+        after = [count_queries(profile_type='talent', include_media='true'), count_queries(profile_type='props')]
+        self.assertEqual(after, before)
+
+
+def baseline_text_points(query, value, weight, reverse_weight):
+    # Partial match can still get points: query inside field, or field inside query
+    if not value:
+        return 0
+    if query.lower() in value.lower():
+        return weight
+    if value.lower() in query.lower():
+        return reverse_weight
+    return 0
+
+
+def baseline_media_points(media_count):
+    if media_count > 10:
+        return 15
+    if media_count > 5:
+        return 10
+    if media_count > 0:
+        return 5
+    return 0
+
+
+def baseline_talent_relevance(profile, params):
+    """The Python scoring loop the talent search used before it moved to SQL"""
+    score = 100
+    if 'gender' in params and profile.gender:
+        score += 20 if profile.gender.lower() == params['gender'].lower() else 0
+    if 'city' in params:
+        score += baseline_text_points(params['city'], profile.city, 15, 10)
+    if 'country' in params:
+        score += baseline_text_points(params['country'], profile.country, 15, 10)
+    if 'age' in params and profile.date_of_birth:
+        today = datetime.date.today()
+        born = profile.date_of_birth
+        age = today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+        age_diff = abs(age - int(params['age']))
+        for limit, points in ((0, 20), (2, 15), (5, 10), (10, 5)):
+            if age_diff <= limit:
+                score += points
+                break
+    if 'account_type' in params:
+        score += 10 if profile.account_type == params['account_type'] else 0
+    if 'is_verified' in params:
+        score += 15 if profile.user.email_verified == (params['is_verified'].lower() in ('true', '1', 'yes')) else 0
+    elif profile.user.email_verified:
+        score += 5
+    if profile.profile_complete:
+        score += 10
+    score += baseline_media_points(profile.media.count())
+
+    score = score * (1 + TalentUserProfile.SEARCH_BOOSTS.get(profile.account_type, 0.1))
+    if profile.user.email_verified and profile.account_type != 'free':
+        score += 20
+    if profile.account_type == 'platinum':
+        score += 10
+    return score
+
+
+def baseline_visual_worker_relevance(worker, params):
+    """The Python scoring loop the visual worker search used before it moved to SQL"""
+    profile = worker.profile
+    score = 100
+    if 'primary_category' in params:
+        score += 25 if worker.primary_category == params['primary_category'] else 0
+    if 'experience_level' in params:
+        score += 20 if worker.experience_level == params['experience_level'] else 0
+    if 'min_years_experience' in params:
+        min_exp = int(params['min_years_experience'])
+        score += 15 if worker.years_experience >= min_exp else -10 * (min_exp - worker.years_experience)
+    if 'max_years_experience' in params:
+        max_exp = int(params['max_years_experience'])
+        score += 10 if worker.years_experience <= max_exp else -5 * (worker.years_experience - max_exp)
+    if worker.portfolio_link:
+        score += 10
+    if 'city' in params:
+        score += baseline_text_points(params['city'], profile.city, 15, 10)
+    if 'country' in params:
+        score += baseline_text_points(params['country'], profile.country, 15, 10)
+    if 'availability' in params:
+        score += 15 if worker.availability == params['availability'] else 0
+    if 'rate_range' in params:
+        score += 15 if worker.rate_range == params['rate_range'] else 0
+    if 'willing_to_relocate' in params:
+        score += 10 if worker.willing_to_relocate == (params['willing_to_relocate'].lower() in ('true', '1', 'yes')) else 0
+    if profile.profile_complete:
+        score += 5
+    score += baseline_media_points(profile.media.count())
+    if profile.user.email_verified:
+        score += 10
+    score += {'platinum': 15, 'premium': 10}.get(profile.account_type, 0)
+    return score
+
+
+def baseline_costume_relevance(costume, params):
+    """The Python scoring loop the costume search used before it moved to SQL"""
+    score = 100
+    if 'name' in params and costume.name and params['name'].lower() in costume.name.lower():
+        score += 20
+    if 'size' in params and costume.size and costume.size == params['size']:
+        score += 15
+    if 'era' in params and costume.era and params['era'].lower() in costume.era.lower():
+        score += 15
+    return score
+
+
+@override_settings(FUZZY_LOCATION_MATCHING=False)
+class RelevanceBaselineTest(TestCase):
+    """The SQL relevance scores match the Python loops they replaced"""
+
+    def setUp(self):
+        born = lambda age: datetime.date(datetime.date.today().year - age, 1, 1)
+        talents = [
+            # (gender, city, country, age, account type, email verified, complete, media)
+            ('Female', 'Dubai', 'ae', 30, 'platinum', True, True, 12),
+            ('Male', 'Dubai Marina', 'ae', 32, 'premium', True, False, 6),
+            ('Female', 'Marina', 'uae', 35, 'premium', False, True, 1),
+            ('female', 'Paris', 'fr', 40, 'free', True, False, 0),
+            ('Male', '', '', 41, 'free', False, False, 2),
+            ('Female', 'Abu Dhabi', 'ae', None, 'platinum', False, True, 0),
+        ]
+        self.profiles = []
+        for index, (gender, city, country, age, account_type, verified, complete, media) in enumerate(talents):
+            user = BaseUser.objects.create(
+                email=f'baseline{index}@example.com', first_name='Baseline', last_name=str(index),
+                is_talent=True, email_verified=verified,
+            )
+            profile = TalentUserProfile.objects.create(
+                user=user, gender=gender, city=city, country=country, account_type=account_type,
+                date_of_birth=born(age) if age is not None else None, profile_complete=complete,
+            )
+            TalentMedia.objects.bulk_create([
+                TalentMedia(talent=profile, name=f'media{i}', media_type='image', media_info='x')
+                for i in range(media)
+            ])
+            self.profiles.append(profile)
+
+    def assertMatchesBaseline(self, view_class, baseline, params):
+        view = view_class()
+        rows = view.relevance.annotate(view.get_queryset(), params)
+        self.assertTrue(rows)
+        for row in rows:
+            with self.subTest(params=params, pk=row.pk):
+                self.assertAlmostEqual(row.relevance_score, baseline(row, params))
+
+    def test_talent(self):
+        for params in [
+            {},
+            {'gender': 'FEMALE', 'account_type': 'premium'},
+            # "Dubai Marina" contains "Dubai" (full weight)
+            {'city': 'Dubai', 'country': 'ae'},
+            # Reverse partial matches: "Dubai", "Marina" and "ae" are inside the query
+            {'city': 'Dubai Marina', 'country': 'uae'},
+            # Age distance tiers: 0, 2, 5, 10 and 11 years away, and no date of birth
+            {'age': '30'},
+            {'is_verified': 'true', 'city': 'paris'},
+            {'is_verified': 'no'},
+        ]:
+            self.assertMatchesBaseline(TalentUserProfileSearchView, baseline_talent_relevance, params)
+
+    def test_talent_scores(self):
+        # Hand-computed for the first profile: (100 + 20 + 15 + 15 + 20 + 5 + 10 + 15) * 2 + 20 + 10
+        view = TalentUserProfileSearchView()
+        params = {'gender': 'female', 'city': 'Dubai', 'country': 'ae', 'age': '30'}
+        row = view.relevance.annotate(view.get_queryset(), params).get(pk=self.profiles[0].pk)
+        self.assertEqual(row.relevance_score, 430)
+
+    def test_visual_worker(self):
+        workers = [
+            ('photographer', 'expert', 2, 'https://example.com', 'full_time', 'low', True),
+            ('photographer', 'beginner', 6, None, 'part_time', 'mid', False),
+            ('videographer', 'expert', 10, '', 'full_time', 'high', True),
+        ]
+        for profile, (category, level, years, portfolio, availability, rate, relocate) in zip(self.profiles, workers):
+            VisualWorker.objects.create(
+                profile=profile, primary_category=category, experience_level=level, years_experience=years,
+                portfolio_link=portfolio, availability=availability, rate_range=rate, willing_to_relocate=relocate,
+            )
+        for params in [
+            {},
+            {'primary_category': 'photographer', 'experience_level': 'expert', 'availability': 'full_time'},
+            # Bonus inside the range, per-year penalties outside it
+            {'min_years_experience': '5', 'max_years_experience': '8'},
+            {'city': 'Dubai Marina', 'country': 'uae', 'rate_range': 'mid', 'willing_to_relocate': 'true'},
+        ]:
+            self.assertMatchesBaseline(VisualWorkerSearchView, baseline_visual_worker_relevance, params)
+
+    def test_item(self):
+        background_user = BaseUser.objects.create(email='props@example.com', first_name='a', last_name='b', is_background=True)
+        background = BackGroundJobsProfile.objects.create(user=background_user)
+        for name, size, era in [('Ball Gown', 'M', 'Victorian'), ('gown', 'L', None), ('Armour', None, 'Medieval')]:
+            Costume.objects.create(BackGroundJobsProfile=background, name=name, size=size, era=era, price=1)
+        for params in [
+            {},
+            {'name': 'GOWN', 'size': 'M'},
+            {'name': 'Armour', 'era': 'vic'},
+        ]:
+            self.assertMatchesBaseline(CostumeSearchView, baseline_costume_relevance, params)
+
+
+@override_settings(FUZZY_LOCATION_MATCHING=True, FUZZY_LOCATION_THRESHOLD=0.3)
+class FuzzyLocationTest(TestCase):
+    """Trigram matching through the LocationTrigram side table (databases without pg_trgm)"""
+
+    def setUp(self):
+        self.dubai = create_talent(0)
+        self.paris = create_talent(1)
+        self.paris.city = 'Paris'
+        self.paris.save()
+
+    def cities(self, value):
+        return set(TalentUserProfile.objects.filter(location_match('city', value)).values_list('city', flat=True))
+
+    def city_points(self, value):
+        relevance = RelevanceScore([FuzzyLocationMatch('city', 15, reverse_weight=10)], base=0)
+        return dict(relevance.annotate(TalentUserProfile.objects.all(), {'city': value}).values_list('city', 'relevance_score'))
+
+    def test_similar_values(self):
+        # "dubay" and "dubai" share 4 of their 8 distinct trigrams
+        self.assertEqual(similar_values('Dubay'), {'Dubai': 0.5})
+        self.assertEqual(similar_values('Dubay', threshold=0.6), {})
+        self.assertEqual(similar_values(''), {})
+
+    def test_location_match(self):
+        self.assertEqual(self.cities('Dubay'), {'Dubai'})
+        self.assertEqual(self.cities('ubai'), {'Dubai'})
+        self.assertEqual(self.cities('Tokyo'), set())
+        with override_settings(FUZZY_LOCATION_MATCHING=False):
+            self.assertEqual(self.cities('Dubay'), set())
+
+    def test_location_points(self):
+        # Misspellings earn the weight scaled by similarity; substring matches keep the full weight
+        self.assertEqual(self.city_points('Dubay'), {'Dubai': 8, 'Paris': 0})
+        self.assertEqual(self.city_points('dubai'), {'Dubai': 15, 'Paris': 0})
+        self.assertEqual(self.city_points('Dubai Marina'), {'Dubai': 10, 'Paris': 0})
+
+    def test_saves_index_new_values(self):
+        self.assertEqual(self.cities('Sharja'), set())
+        self.paris.city = 'Sharjah'
+        self.paris.save()
+        self.assertIn('Sharjah', LocationTrigram.objects.values_list('value', flat=True))
+        self.assertEqual(self.cities('Sharja'), {'Sharjah'})
+
+        # Values nothing uses any more are dropped by the rebuild
+        self.assertIn('Paris', LocationTrigram.objects.values_list('value', flat=True))
+        rebuild_location_trigrams()
+        self.assertNotIn('Paris', LocationTrigram.objects.values_list('value', flat=True))
+
+
+class FullTextSearchTest(TestCase):
+    """q= matches are taken from the rows passing the view's filters"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = BaseUser.objects.create(
+            email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True
+        )
+        background_user = BaseUser.objects.create(
+            email='background@example.com', first_name='a', last_name='b', is_background=True
+        )
+        background = BackGroundJobsProfile.objects.create(user=background_user)
+        # Oldest, so it ranks last among equally matching documents
+        self.metal = Prop.objects.create(BackGroundJobsProfile=background, name='Sword', material='metal', price=1)
+        self.wood = [
+            Prop.objects.create(BackGroundJobsProfile=background, name='Sword', material='wood', price=1)
+            for _ in range(3)
+        ]
+
+    def search(self, **params):
+        request = APIRequestFactory().get('/', params)
+        force_authenticate(request, user=self.admin)
+        response = UnifiedSearchView.as_view()(request)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def result_ids(self, **params):
+        return [row['id'] for row in self.search(**params)['results']]
+
+    @override_settings(FULLTEXT_MAX_RESULTS=2)
+    def test_filters_apply_before_cap(self):
+        self.assertEqual(len(self.result_ids(profile_type='props', q='sword')), 2)
+        self.assertEqual(self.result_ids(profile_type='props', q='sword', material='metal'), [self.metal.pk])
+
+    @override_settings(FULLTEXT_MAX_RESULTS=2)
+    def test_facets_count_every_match(self):
+        self.metal.is_for_rent = True
+        self.metal.save()
+        data = self.search(profile_type='props', q='sword', facets='is_for_rent')
+        self.assertEqual(data['facets']['is_for_rent'], [{'value': False, 'count': 3}, {'value': True, 'count': 1}])
+
+    def export(self, **params):
+        request = APIRequestFactory().get('/', {'export_format': 'ndjson', **params})
+        force_authenticate(request, user=self.admin)
+        response = SearchExportView.as_view()(request)
+        self.assertEqual(response.status_code, 200, getattr(response, 'data', None))
+        return [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+
+    @override_settings(FULLTEXT_MAX_RESULTS=2)
+    def test_export_is_uncapped(self):
+        expected = [prop.pk for prop in reversed(self.wood)] + [self.metal.pk]
+        rows = self.export(profile_type='props', q='sword')
+        self.assertEqual([row['id'] for row in rows], expected)
+        self.assertEqual(self.export(profile_type='props', q='sword', material='wood')[-1]['id'], self.wood[0].pk)
+
+        install_fulltext_index(connection)
+        self.addCleanup(uninstall_fulltext_index, connection)
+        if fulltext_backend() is None:
+            return
+        rows = self.export(profile_type='props', q='sword')
+        self.assertEqual(sorted(row['id'] for row in rows), sorted(expected))
+        self.assertTrue(all(row['text_rank'] > 0 for row in rows))
+
+
+class SearchDocumentSyncTest(TestCase):
+    """Signal handlers keep SearchDocument rows in step with the indexed models"""
+
+    def document(self, entity_type, object_id):
+        return SearchDocument.objects.filter(entity_type=entity_type, object_id=object_id).first()
+
+    def test_user_saves(self):
+        profile = create_talent(0)
+        user = profile.user
+
+        user.last_login = timezone.now()
+        with CaptureQueriesContext(connection) as queries:
+            user.save(update_fields=['last_login'])
+        self.assertEqual([query['sql'] for query in queries if 'dashboard_searchdocument' in query['sql']], [])
+
+        user.first_name = 'Renamed'
+        user.save(update_fields=['first_name'])
+        self.assertEqual(self.document('talent', profile.pk).title, 'Renamed 0')
+
+    def test_talent_profile(self):
+        profile = create_talent(0)
+        document = self.document('talent', profile.pk)
+        self.assertEqual((document.city, document.all_media_count, document.specialization_count), ('Dubai', 1, 3))
+
+        profile.city = 'Abu Dhabi'
+        profile.save()
+        TalentMedia.objects.create(talent=profile, name='clip', media_type='video', media_info='x')
+        profile.hybrid_worker.delete()
+        document = self.document('talent', profile.pk)
+        self.assertEqual((document.city, document.all_media_count, document.video_count), ('Abu Dhabi', 2, 1))
+        self.assertEqual((document.is_hybrid, document.specialization_count), (False, 2))
+
+        profile.delete()
+        self.assertIsNone(self.document('talent', profile.pk))
+
+    def test_items(self):
+        background_user = BaseUser.objects.create(email='props@example.com', first_name='a', last_name='b', is_background=True)
+        background = BackGroundJobsProfile.objects.create(user=background_user)
+        self.assertIsNotNone(self.document('background', background.pk))
+
+        prop = Prop.objects.create(BackGroundJobsProfile=background, name='Sword', material='metal', price=1)
+        self.assertIn('sword', self.document('prop', prop.pk).search_text)
+        prop.name = 'Shield'
+        prop.save()
+        self.assertIn('shield', self.document('prop', prop.pk).search_text)
+        prop.delete()
+        self.assertIsNone(self.document('prop', prop.pk))
+
+    def test_rebuild(self):
+        profile = create_talent(0)
+        background_user = BaseUser.objects.create(email='props@example.com', first_name='a', last_name='b', is_background=True)
+        background = BackGroundJobsProfile.objects.create(user=background_user)
+        prop = Prop.objects.create(BackGroundJobsProfile=background, name='Sword', material='metal', price=1)
+
+        fields = [field.name for field in SearchDocument._meta.concrete_fields if field.name not in ('id', 'indexed_at')]
+        indexed = list(SearchDocument.objects.order_by('entity_type', 'object_id').values(*fields))
+
+        # Lost and stale documents, e.g. after queryset updates and deletes
+        SearchDocument.objects.filter(entity_type='talent').delete()
+        SearchDocument.objects.filter(entity_type='prop').update(search_text='')
+        SearchDocument.objects.create(entity_type='prop', object_id=prop.pk + 100)
+
+        counts = rebuild_search_documents()
+        self.assertEqual((counts['talent'], counts['background'], counts['prop'], counts['band']), (1, 1, 1, 0))
+        self.assertEqual(list(SearchDocument.objects.order_by('entity_type', 'object_id').values(*fields)), indexed)
+        self.assertEqual(rebuild_search_documents(['talent']), {'talent': 1})
+        self.assertIsNotNone(self.document('talent', profile.pk))
+
+
+class ProfileScoreTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = BaseUser.objects.create(
+            email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True
+        )
+        background_user = BaseUser.objects.create(
+            email='background@example.com', first_name='a', last_name='b', is_background=True
+        )
+        self.background = BackGroundJobsProfile.objects.create(user=background_user)
+
+    def detail(self, **params):
+        request = APIRequestFactory().get('/', params)
+        force_authenticate(request, user=self.admin)
+        response = BackGroundJobsProfileDetailView.as_view()(request, pk=self.background.pk)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_background_score_explanation(self):
+        score = self.detail()['profile_score']
+        self.assertEqual(score['total'], self.background.get_profile_score(explain=False)['total'])
+        self.assertNotIn('details', score)
+
+        score = self.detail(explain='1')['profile_score']
+        self.assertEqual(score['details']['item_quantity'], 'No items: +0 points (add items for up to +25 points)')
+        self.assertIn('details_ar', score)
+
+    def test_background_score_values(self):
+        # The model's points: a flat 25 for the account (the old dashboard serializer gave 50/10)
+        self.background.country = 'ae'
+        self.background.gender = 'Female'
+        self.background.date_of_birth = datetime.date(1990, 1, 1)
+        self.background.save()
+        Prop.objects.create(BackGroundJobsProfile=self.background, name='Sword', price=1)
+        Costume.objects.create(BackGroundJobsProfile=self.background, name='Gown', price=1)
+
+        score = self.detail()['profile_score']
+        self.assertEqual(
+            {key: score[key] for key in ('total', 'account_tier', 'profile_completion', 'item_diversity', 'item_quantity')},
+            {'total': 60, 'account_tier': 25, 'profile_completion': 15, 'item_diversity': 10, 'item_quantity': 10},
+        )
+        # Explained scores also carry the `state` their details are rendered from
+        score = self.detail(explain='1')['profile_score']
+        self.assertEqual(score['total'], 60)
+        self.assertIn('state', score)
+        self.assertEqual(score['details']['account_tier'], 'All accounts paid: +25 points')
+
+    def test_buckets_follow_saved_scores(self):
+        def save(object_id, total):
+            save_scores([ProfileScore(entity_type='band', object_id=object_id, total=total, breakdown={'total': total})])
+
+        save(1, 30)
+        self.assertEqual(score_distribution('band'), [(30, 1)])
+        save(1, 40)
+        self.assertEqual(score_distribution('band'), [(40, 1)])
+        save(2, 40)
+        save(3, 30)
+        save(3, 30)
+        self.assertEqual(score_distribution('band'), [(40, 2), (30, 1)])
+
+        remove_score('band', 1)
+        remove_score('band', 99)
+        self.assertEqual(score_distribution('band'), [(40, 1), (30, 1)])
+        remove_score('band', 3)
+        self.assertEqual(score_distribution('band'), [(40, 1)])
+
+        rebuild_score_buckets('band')
+        self.assertEqual(score_distribution('band'), [(40, 1)])
+
+    def test_buckets_follow_profile_changes(self):
+        before = self.background.get_profile_score(explain=False)['total']
+        self.assertEqual(score_distribution('background'), [(before, 1)])
+
+        self.background.country = 'ae'
+        self.background.gender = 'Female'
+        self.background.date_of_birth = datetime.date(1990, 1, 1)
+        self.background.save()
+        after = self.background.get_profile_score(explain=False)['total']
+        self.assertGreater(after, before)
+        self.assertEqual(score_distribution('background'), [(after, 1)])
+
+        self.background.delete()
+        self.assertEqual(score_distribution('background'), [])
+        self.assertFalse(ProfileScore.objects.filter(entity_type='background').exists())
+
+    def test_login_does_not_rescore(self):
+        profile = create_talent(0)
+        user = profile.user
+        before = ProfileScore.objects.get(entity_type='talent', object_id=profile.pk).total
+
+        user.last_login = timezone.now()
+        with CaptureQueriesContext(connection) as queries:
+            user.save(update_fields=['last_login'])
+        self.assertEqual([query['sql'] for query in queries if 'dashboard_profilescore' in query['sql']], [])
+
+        user.email_verified = True
+        user.save(update_fields=['email_verified'])
+        self.assertGreater(ProfileScore.objects.get(entity_type='talent', object_id=profile.pk).total, before)
+
+    def test_reads_do_not_store_missing_scores(self):
+        ProfileScore.objects.all().delete()
+        total = self.background.get_profile_score(explain=False)['total']
+
+        self.assertEqual(get_stored_score(self.background)['total'], total)
+        self.assertEqual(load_stored_scores('background', [self.background.pk])[self.background.pk]['total'], total)
+        self.assertEqual(self.detail()['profile_score']['total'], total)
+        self.assertFalse(ProfileScore.objects.exists())
+
+    def test_rank_does_not_store_missing_scores(self):
+        ProfileScore.objects.all().delete()
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        response = client.get(f'/api/dashboard/scores/background/{self.background.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total'], self.background.get_profile_score(explain=False)['total'])
+        self.assertFalse(ProfileScore.objects.exists())
+
+        response = client.get(f'/api/dashboard/scores/background/{self.background.pk + 1}/')
+        self.assertEqual(response.status_code, 404)
+
+
+class BatchScoreTest(TestCase):
+    """score_profiles() agrees with each model's own get_profile_score()"""
+
+    def setUp(self):
+        bare_user = BaseUser.objects.create(email='bare@example.com', first_name='a', last_name='b', is_talent=True)
+        bare = TalentUserProfile.objects.create(user=bare_user)
+        full = create_talent(0)
+        full.account_type = 'platinum'
+        full.save()
+        full.user.email_verified = True
+        full.user.save()
+        SocialMediaLinks.objects.create(user=full, facebook='https://facebook.com/x', youtube='https://youtube.com/x')
+        create_talent(1)
+
+        for index, item_count in enumerate((0, 3, 12)):
+            user = BaseUser.objects.create(email=f'background{index}@example.com', first_name='a', last_name='b', is_background=True)
+            background = BackGroundJobsProfile.objects.create(
+                user=user, country='ae', gender='Female', date_of_birth=datetime.date(1990, 1, 1)
+            )
+            for i in range(item_count):
+                model = (Prop, Costume)[i % 2]
+                model.objects.create(BackGroundJobsProfile=background, name=f'item{i}', price=i)
+
+        Band.objects.create(name='Empty', creator=bare)
+        band = Band.objects.create(name='Quartet', creator=full, description='Jazz', location='Dubai')
+        BandMembership.objects.create(band=band, talent_user=full, role='admin')
+        BandMembership.objects.create(band=band, talent_user=bare)
+        self.models = {'talent': TalentUserProfile, 'background': BackGroundJobsProfile, 'band': Band}
+
+    def test_matches_model_scores(self):
+        for entity_type, model in self.models.items():
+            ids = list(model.objects.values_list('pk', flat=True))
+            scores = score_profiles(entity_type, ids)
+            self.assertEqual(sorted(scores), sorted(ids))
+            for object_id in ids:
+                with self.subTest(entity_type=entity_type, object_id=object_id):
+                    self.assertEqual(scores[object_id], model.objects.get(pk=object_id).get_profile_score(explain=False))
+
+    def test_missing_ids_are_skipped(self):
+        profile = TalentUserProfile.objects.first()
+        self.assertEqual(list(score_profiles('talent', [profile, profile.pk + 1000])), [profile.pk])
+
+
+class BackgroundItemCountsTest(TestCase):
+    """The UNION ALL item counts equal one count() per item table"""
+
+    def setUp(self):
+        self.profiles = []
+        for index in range(3):
+            user = BaseUser.objects.create(email=f'background{index}@example.com', first_name='a', last_name='b', is_background=True)
+            self.profiles.append(BackGroundJobsProfile.objects.create(user=user))
+        # Every item type, in different amounts per profile; the last profile has none
+        for offset, model in enumerate(ITEM_MODELS.values()):
+            for profile, count in zip(self.profiles, (offset + 1, offset % 3)):
+                for i in range(count):
+                    model.objects.create(BackGroundJobsProfile=profile, name=f'item{i}', price=i)
+
+    def expected_counts(self, profile):
+        return {
+            item_type: model.objects.filter(BackGroundJobsProfile=profile).count()
+            for item_type, model in ITEM_MODELS.items()
+        }
+
+    def test_load_item_counts(self):
+        profiles = list(BackGroundJobsProfile.objects.filter(pk__in=[profile.pk for profile in self.profiles]))
+        with self.assertNumQueries(1):
+            BackGroundJobsProfile.load_item_counts(profiles)
+        for profile in profiles:
+            with self.subTest(profile=profile.pk):
+                self.assertEqual(profile._item_counts, self.expected_counts(profile))
+        self.assertEqual(set(profiles[-1]._item_counts.values()), {0})
+
+        # Already loaded profiles aren't queried again
+        with self.assertNumQueries(0):
+            BackGroundJobsProfile.load_item_counts(profiles)
+
+    def test_item_counts_query(self):
+        rows = BackGroundJobsProfile.item_counts_query([profile.pk for profile in self.profiles])
+        counts = {(profile_id, item_type): count for profile_id, item_type, count in rows}
+        for profile in self.profiles:
+            for item_type, count in self.expected_counts(profile).items():
+                with self.subTest(profile=profile.pk, item_type=item_type):
+                    self.assertEqual(counts.get((profile.pk, item_type), 0), count)
+
+
+class ItemCatalogueTest(TestCase):
+    """Cross-type item catalogue: filters, orderings and stable pages"""
+
+    def setUp(self):
+        self.admin = BaseUser.objects.create(
+            email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.admin)
+        background_user = BaseUser.objects.create(email='background@example.com', first_name='a', last_name='b', is_background=True)
+        background = BackGroundJobsProfile.objects.create(user=background_user)
+        # Repeated prices and names, so orderings have ties to break
+        items = {
+            'props': [('lamp', 5), ('sword', 5), ('shield', 10), ('throne', 20), ('cup', 1)],
+            'costumes': [('gown', 5), ('lamp', 10), ('cape', 10), ('hat', 2)],
+            'vehicles': [('cart', 5), ('lamp', 7), ('tank', 30)],
+        }
+        self.items = []
+        for item_type, rows in items.items():
+            for index, (name, price) in enumerate(rows):
+                item = ITEM_MODELS[item_type].objects.create(
+                    BackGroundJobsProfile=background, name=name, price=price, is_for_rent=index % 2 == 0
+                )
+                item.refresh_from_db()
+                self.items.append({
+                    'key': (item_type, item.pk), 'name': name, 'price': price,
+                    'is_for_rent': item.is_for_rent, 'created_at': item.created_at,
+                })
+
+    def catalogue(self, **params):
+        response = self.api.get('/api/dashboard/search/items/', params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def keys(self, **params):
+        return [(row['item_type'], row['id']) for row in self.catalogue(page_size=50, **params)['results']]
+
+    def expected(self, ordering='-created_at', condition=lambda item: True):
+        # Like the database: by the ordering field, then (item_type, id) ascending
+        field = ordering.lstrip('-')
+        items = sorted((item for item in self.items if condition(item)), key=lambda item: item['key'])
+        items.sort(key=lambda item: item[field], reverse=ordering.startswith('-'))
+        return [item['key'] for item in items]
+
+    def test_filters(self):
+        self.assertEqual(
+            self.keys(min_price='5', max_price='10'),
+            self.expected(condition=lambda item: 5 <= item['price'] <= 10),
+        )
+        self.assertEqual(self.keys(is_for_rent='true'), self.expected(condition=lambda item: item['is_for_rent']))
+        self.assertEqual(self.keys(is_for_rent='false'), self.expected(condition=lambda item: not item['is_for_rent']))
+        self.assertEqual(
+            self.keys(item_type='props,vehicles', max_price='5'),
+            self.expected(condition=lambda item: item['key'][0] in ('props', 'vehicles') and item['price'] <= 5),
+        )
+        self.assertEqual(self.keys(item_type='locations'), [])
+
+    def test_invalid_parameters(self):
+        for params in ({'item_type': 'props,spaceships'}, {'min_price': 'cheap'}, {'ordering': 'profile_score'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.api.get('/api/dashboard/search/items/', params).status_code, 400)
+
+    def test_orderings(self):
+        for field in ('price', 'created_at', 'name'):
+            for ordering in (field, f'-{field}'):
+                with self.subTest(ordering=ordering):
+                    self.assertEqual(self.keys(ordering=ordering), self.expected(ordering))
+        self.assertEqual(self.keys(), self.expected('-created_at'))
+
+    def test_stable_pages(self):
+        for ordering in ('price', '-name'):
+            with self.subTest(ordering=ordering):
+                seen = []
+                page = 1
+                while True:
+                    data = self.catalogue(ordering=ordering, page_size=3, page=page)
+                    rows = [(row['item_type'], row['id']) for row in data['results']]
+                    # The same page twice gives the same rows
+                    again = self.catalogue(ordering=ordering, page_size=3, page=page)['results']
+                    self.assertEqual([(row['item_type'], row['id']) for row in again], rows)
+                    seen += rows
+                    if not data['next']:
+                        break
+                    page += 1
+                self.assertEqual(data['count'], len(self.items))
+                self.assertEqual(seen, self.expected(ordering))
+
+
+class SlowTalentSearchView(TalentUserProfileSearchView):
+    delay = 0.4
+
+    def get_top_results(self, limit):
+        time.sleep(self.delay)
+        return super().get_top_results(limit)
+
+
+class SlowUnifiedSearchView(UnifiedSearchView):
+    profile_views = {**UnifiedSearchView.profile_views, **{f'slow{i}': SlowTalentSearchView for i in range(10)}}
+
+
+class SearchFanoutTest(TransactionTestCase):
+    """Pool threads use their own connections, so the rows must be committed"""
+
+    def setUp(self):
+        self.admin = BaseUser.objects.create(
+            email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True
+        )
+        create_talent(0)
+
+    def search(self, view_class=UnifiedSearchView, **params):
+        request = APIRequestFactory().get('/', params)
+        force_authenticate(request, user=self.admin)
+        response = view_class.as_view()(request)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    @override_settings(SEARCH_FANOUT_TIMEOUT=0.6)
+    def test_timeout_counts_from_start(self):
+        # One more slow type than pool threads: the last waits a full delay in the queue
+        slow_types = [f'slow{i}' for i in range(fanout_executor()._max_workers + 1)]
+        data = self.search(SlowUnifiedSearchView, profile_type=','.join(slow_types))
+        self.assertNotIn('timed_out', data)
+        self.assertEqual(sorted(data['counts']), slow_types)
+
+    @override_settings(SEARCH_FANOUT_TIMEOUT=0.2)
+    def test_slow_types_time_out(self):
+        data = self.search(SlowUnifiedSearchView, profile_type='talent,slow0')
+        self.assertEqual(data['timed_out'], ['slow0'])
+        self.assertEqual(list(data['counts']), ['talent'])
+
+    @override_settings(SEARCH_FANOUT_TIMEOUT=0.2, SEARCH_FANOUT_MAX_WORKERS=1)
+    def test_sequential_timeout(self):
+        data = self.search(SlowUnifiedSearchView, profile_type='slow0,talent')
+        self.assertEqual(data['timed_out'], ['slow0'])
+        self.assertEqual(list(data['counts']), ['talent'])
+
+    def test_requests_share_one_pool(self):
+        executor = fanout_executor()
+        for _ in range(2):
+            data = self.search(profile_type='talent,visual')
+            self.assertEqual(sorted(data['counts']), ['talent', 'visual'])
+        self.assertIs(fanout_executor(), executor)
+        self.assertFalse(executor._shutdown)
+
+
+class SharingStatusResolverTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = BaseUser.objects.create(email='admin@example.com', first_name='Dash', last_name='Admin', is_dashboard=True)
+        self.media = [create_talent(i).media.get() for i in range(3)]
+        background = BackGroundJobsProfile.objects.create(
+            user=BaseUser.objects.create(email='background@example.com', first_name='a', last_name='b', is_background=True)
+        )
+        self.prop = Prop.objects.create(BackGroundJobsProfile=background, name='prop', material='wood', price=1)
+        self.post = SharedMediaPost.objects.create(
+            shared_by=self.admin, content_type=ContentType.objects.get_for_model(TalentMedia), object_id=self.media[1].id
+        )
+        ContentType.objects.get_for_model(Prop)
+        cache.clear()
+    
+    def test_one_query_per_content_type(self):
+        resolver = SharingStatusResolver(self.media + [self.prop])
+        with self.assertNumQueries(2):
+            statuses = [resolver.get(obj) for obj in self.media + [self.prop]]
+        self.assertEqual([status['is_shared'] for status in statuses], [False, True, False, False])
+        self.assertEqual(statuses[1]['shared_post_id'], self.post.id)
+        self.assertEqual(statuses[1]['shared_by'], 'Dash Admin')
+        
+        # Cached for the next request
+        resolver = SharingStatusResolver(self.media)
+        with self.assertNumQueries(0):
+            self.assertTrue(resolver.get(self.media[1])['is_shared'])
+    
+    def test_unshare_invalidates(self):
+        SharingStatusResolver(self.media).get(self.media[1])
+        self.post.delete()
+        self.assertFalse(SharingStatusResolver(self.media).get(self.media[1])['is_shared'])
+
+    def test_clear_all(self):
+        SharingStatusResolver(self.media).get(self.media[1])
+        SharedMediaPost.objects.filter(pk=self.post.pk).update(is_active=False)
+        self.assertTrue(SharingStatusResolver(self.media).get(self.media[1])['is_shared'])
+        clear_sharing_status_cache()
+        self.assertFalse(SharingStatusResolver(self.media).get(self.media[1])['is_shared'])
+
+
+class CacheInvalidationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.profile = create_talent(0)
+        self.other = create_talent(1)
+    
+    def test_profile_scope(self):
+        get_media_counts_cached(self.profile)
+        get_media_counts_cached(self.other)
+        TalentMedia.objects.create(talent=self.profile, name='clip', media_type='video', media_info='x')
+        TalentMedia.objects.create(talent=self.other, name='clip', media_type='video', media_info='x')
+        
+        clear_profile_cache(self.profile)
+        with self.assertNumQueries(2):
+            self.assertEqual(get_media_counts_cached(self.profile)['videos'], 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_media_counts_cached(self.other)['videos'], 0)
+    
+    def test_namespace(self):
+        get_media_counts_cached(self.profile)
+        get_media_counts_cached(self.other)
+        invalidate_namespace('media_counts')
+        with self.assertNumQueries(4):
+            get_media_counts_cached(self.profile)
+            get_media_counts_cached(self.other)
+    
+    def test_search_results(self):
+        admin = BaseUser.objects.create(email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        params = {'profile_type': 'talent', 'is_verified': 'true'}
+        self.assertEqual(client.get('/api/dashboard/search/', params).data['count'], 0)
+        # A queryset update skips the signals that bump the model generations
+        TalentUserProfile.objects.update(is_verified=True)
+        self.assertEqual(client.get('/api/dashboard/search/', params).data['count'], 0)
+        invalidate_namespace('search_results')
+        self.assertEqual(client.get('/api/dashboard/search/', params).data['count'], 2)
+
+    def test_score_ordering(self):
+        admin = BaseUser.objects.create(email='dashboard@example.com', first_name='a', last_name='b', is_dashboard=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        params = {'profile_type': 'talent', 'ordering': '-profile_score'}
+
+        def result_ids():
+            return [item['id'] for item in client.get('/api/dashboard/search/', params).data['results']]
+
+        first, last = result_ids()
+        # Social links live in their own table but raise the stored score
+        SocialMediaLinks.objects.create(
+            user=TalentUserProfile.objects.get(pk=last),
+            facebook='https://facebook.com/x', instagram='https://instagram.com/x',
+            youtube='https://youtube.com/x', tiktok='https://tiktok.com/x',
+        )
+        self.assertEqual(result_ids(), [last, first])
+
+    def test_login_keeps_search_results(self):
+        generation = get_generations(['users.BaseUser'])
+        user = self.profile.user
+        user.last_login = timezone.now()
+        user.save(update_fields=['last_login'])
+        self.assertEqual(get_generations(['users.BaseUser']), generation)
+        user.first_name = 'Renamed'
+        user.save(update_fields=['first_name'])
+        self.assertNotEqual(get_generations(['users.BaseUser']), generation)
+
+
+class CachedComputeTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+    
+    def compute(self, value='new', delay=0):
+        def compute():
+            self.calls += 1
+            time.sleep(delay)
+            return value
+        return compute
+    
+    def set_stale(self, key, value='old'):
+        cache.set(key, CachedEntry(value, time.time() - 1), 60)
+    
+    def test_fresh_value_is_not_recomputed(self):
+        self.assertEqual(cached_compute('key', self.compute(), 60), 'new')
+        self.assertEqual(cached_compute('key', self.compute('other'), 60), 'new')
+        self.assertEqual(self.calls, 1)
+    
+    @override_settings(CACHE_LOCK_WAIT=5)
+    def test_single_flight(self):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cached_compute('key', self.compute(delay=0.2), 60)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['new'] * 8)
+        self.assertEqual(self.calls, 1)
+    
+    @override_settings(CACHE_BACKGROUND_REFRESH=False)
+    def test_stale_served_while_locked(self):
+        self.set_stale('key')
+        cache.add('key:lock', 1)
+        self.assertEqual(cached_compute('key', self.compute(), 60), 'old')
+        self.assertEqual(self.calls, 0)
+        
+        cache.delete('key:lock')
+        self.assertEqual(cached_compute('key', self.compute(), 60), 'new')
+        self.assertEqual(self.calls, 1)
+    
+    @override_settings(CACHE_BACKGROUND_REFRESH=True)
+    def test_background_refresh(self):
+        self.set_stale('key')
+        self.assertEqual(cached_compute('key', self.compute(), 60), 'old')
+        for _ in range(50):
+            if cache.get('key').value == 'new':
+                break
+            time.sleep(0.02)
+        self.assertEqual(cached_compute('key', self.compute(), 60), 'new')
+        self.assertEqual(self.calls, 1)
+        self.assertIsNone(cache.get('key:lock'))
+    
+    @override_settings(CACHE_TTL_JITTER=0.2)
+    def test_jittered_expiry(self):
+        for index in range(20):
+            cached_compute(f'key{index}', self.compute(), 100)
+        fresh_for = {round(cache.get(f'key{index}').fresh_until - time.time()) for index in range(20)}
+        self.assertGreater(len(fresh_for), 1)
+        self.assertTrue(all(79 <= seconds <= 120 for seconds in fresh_for))
+
+
+class TwoTierCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+    
+    def make_cache(self, location, **options):
+        two_tier = TwoTierCache(location, {'OPTIONS': {'SHARED_CACHE': 'default', 'LOCAL_TIMEOUT': 60, **options}})
+        two_tier.clear_local()
+        return two_tier
+    
+    def test_reads_are_served_locally(self):
+        two_tier = self.make_cache('test-local')
+        cache.set('key', 'shared')
+        self.assertEqual(two_tier.get('key'), 'shared')
+        # Changed behind its back: the local copy is served until it expires
+        cache.set('key', 'changed')
+        self.assertEqual(two_tier.get('key'), 'shared')
+        self.assertEqual(two_tier.get_many(['key', 'missing']), {'key': 'shared'})
+        two_tier.clear_local()
+        self.assertEqual(two_tier.get('key'), 'changed')
+    
+    def test_writes_go_through(self):
+        # Two processes' tiers over the same shared cache
+        first, second = self.make_cache('test-first'), self.make_cache('test-second')
+        first.set('counter', 1)
+        self.assertEqual(second.get('counter'), 1)
+        self.assertEqual(first.incr('counter'), 2)
+        self.assertEqual(cache.get('counter'), 2)
+        self.assertEqual(first.get('counter'), 2)
+        self.assertFalse(first.add('counter', 5))
+        first.delete('counter')
+        self.assertIsNone(cache.get('counter'))
+        self.assertIsNone(first.get('counter'))
+        # Without a broadcast channel the other process keeps its copy until it expires
+        self.assertEqual(second.get('counter'), 1)
+        second.tier.evict([second.make_key('counter')])
+        self.assertIsNone(second.get('counter'))
+    
+    def test_bounded(self):
+        two_tier = self.make_cache('test-bounded', LOCAL_MAX_ENTRIES=2)
+        for key in ('a', 'b', 'c'):
+            two_tier.set(key, key)
+        self.assertEqual(len(two_tier.tier._entries), 2)
+        self.assertEqual(two_tier.get('a'), 'a')
+    
+    def test_local_timeout(self):
+        two_tier = self.make_cache('test-timeout', LOCAL_TIMEOUT=0.05)
+        two_tier.set('key', 'old')
+        cache.set('key', 'new')
+        time.sleep(0.06)
+        self.assertEqual(two_tier.get('key'), 'new')
+
+
+@override_settings(METRICS_ENABLED=True)
+class RequestMetricsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = BaseUser.objects.create(
+            email='admin@example.com', first_name='a', last_name='b', is_dashboard=True, is_dashboard_admin=True
+        )
+        self.client.force_authenticate(user=self.admin)
+        create_talent(0)
+
+    def test_latency_percentile(self):
+        buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        buckets[1], buckets[4], buckets[-1] = 90, 9, 1
+        self.assertEqual(latency_percentile(buckets, 0.5), LATENCY_BUCKETS[1])
+        self.assertEqual(latency_percentile(buckets, 0.95), LATENCY_BUCKETS[4])
+        self.assertIsNone(latency_percentile(buckets, 1))
+
+    def test_endpoint_metrics(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get('/api/dashboard/search/', {'profile_type': 'talent'}).status_code, 200)
+
+        response = self.client.get('/api/dashboard/metrics/')
+        self.assertEqual(response.status_code, 200)
+        metrics = {entry['endpoint']: entry for entry in response.data['endpoints']}
+        search = metrics['dashboard:unified-search']
+        self.assertEqual(search['requests'], 2)
+        self.assertGreater(search['avg_queries'], 0)
+        self.assertGreater(search['avg_serializer_ms'], 0)
+        self.assertEqual(sum(bucket['count'] for bucket in search['latency_histogram']), 2)
+
+    def test_cache_lookups_are_counted(self):
+        self.client.get('/api/dashboard/health/')
+        self.client.get('/api/dashboard/metrics/')
+        response = self.client.get('/api/dashboard/metrics/')
+        metrics = {entry['endpoint']: entry for entry in response.data['endpoints']}
+        # Reading the metrics looks up the endpoint list and every counter
+        self.assertGreater(metrics['dashboard:request-metrics']['cache_hits'], 0)
+        self.assertGreater(metrics['dashboard:request-metrics']['cache_misses'], 0)
+
+    def test_prometheus_format(self):
+        self.client.get('/api/dashboard/health/')
+        response = self.client.get('/api/dashboard/metrics/prometheus/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn('# TYPE dashboard_endpoint_requests gauge', body)
+        self.assertIn('dashboard_endpoint_requests{endpoint="dashboard:health-check"} 1', body)
+        self.assertIn('dashboard_endpoint_latency_seconds_bucket{endpoint="dashboard:health-check",le="+Inf"} 1', body)
+
+    def test_endpoints_are_registered(self):
+        for endpoint in ('dashboard:health-check', 'dashboard:unified-search', 'dashboard:health-check'):
+            record_request(endpoint, 0.01, RequestMetrics())
+        totals = load_totals()
+        self.assertEqual(sorted(totals), ['dashboard:health-check', 'dashboard:unified-search'])
+        self.assertEqual(totals['dashboard:health-check']['requests'], 2)
+
+    def test_admin_only(self):
+        user = BaseUser.objects.create(email='staff@example.com', first_name='a', last_name='b', is_dashboard=True)
+        self.client.force_authenticate(user=user)
+        self.assertEqual(self.client.get('/api/dashboard/metrics/').status_code, 403)
+
+
+class BenchmarkTest(TestCase):
+    def test_run_and_compare(self):
+        admin = seed_dataset(talents=8, media_per_talent=2, bands=2, backgrounds=2, items_per_background=3)
+        scenarios = [scenario for scenario in SCENARIOS if scenario.name in ('talent-search', 'item-catalogue')]
+        results = run_benchmark(admin, scenarios, iterations=3, warmup=1)
+
+        self.assertEqual(results['dataset']['talents'], 8)
+        self.assertEqual(results['dataset']['items'], 6)
+        for scenario in results['scenarios']:
+            self.assertEqual(scenario['status_codes'], {'200': 3})
+            self.assertLessEqual(scenario['latency_ms']['p50'], scenario['latency_ms']['p99'])
+            self.assertGreater(scenario['queries']['mean'], 0)
+
+        rows = compare_results(results, results)
+        self.assertEqual(len(rows), 6)
+        self.assertTrue(all(row['change'] == 0 for row in rows))
+
+
+class BulkSeedTest(TestCase):
+    def test_bulk_seed(self):
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            counts = bulk_seed(talents=10, backgrounds=3, media_per_talent=2, items_per_background=4, batch_size=4)
+
+        self.assertEqual(counts['talent_profiles'], 10)
+        self.assertEqual(counts['media'], 20)
+        self.assertEqual(counts['items'], 12)
+        self.assertEqual(TalentUserProfile.objects.filter(user__email__startswith='testuser_bulk_').count(), 10)
+        self.assertEqual(VisualWorker.objects.count() + ExpressiveWorker.objects.count() + HybridWorker.objects.count(), 8)
+        self.assertEqual(sum(model.objects.count() for model in ITEM_MODELS.values()), 12)
+        self.assertTrue(TalentMedia.objects.first().media_file.name.startswith('seed_placeholders/'))
+        # Signals don't run for bulk_create; stored scores are rebuilt afterwards
+        self.assertEqual(ProfileScore.objects.count(), 13)
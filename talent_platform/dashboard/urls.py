@@ -1,7 +1,8 @@
 from django.urls import path, include
 from . import views, email_views
-from .search_views import UnifiedSearchView
+from .search_views import UnifiedSearchView, SearchExportView, ItemCatalogueView
 from .views_restricted_api import RestrictedUsersAPIView
+from .score_views import ScoreDistributionView, ProfileScoreRankView
 from .shared_media_views import (
     ShareMediaView, SharedMediaListView, SharedMediaDetailView,
     DeleteSharedMediaView, MySharedMediaView, SharedMediaStatsView
@@ -14,6 +15,10 @@ urlpatterns = [
     # Health check endpoint
     path('health/', views.HealthCheckView.as_view(), name='health-check'),
     
+    # Request metrics (admin only; JSON and Prometheus text)
+    path('metrics/', views.MetricsView.as_view(), name='request-metrics'),
+    path('metrics/prometheus/', views.PrometheusMetricsView.as_view(), name='request-metrics-prometheus'),
+    
     # Dashboard Analytics
     path('analytics/', views.DashboardAnalyticsView.as_view(), name='dashboard-analytics'),
     
@@ -32,6 +37,8 @@ urlpatterns = [
     
     # Unified search endpoint - handles all search functionality
     path('search/', UnifiedSearchView.as_view(), name='unified-search'),
+    path('search/export/', SearchExportView.as_view(), name='search-export'),
+    path('search/items/', ItemCatalogueView.as_view(), name='item-catalogue'),
     
     # Profile detail endpoints for dashboard users
     path('profiles/talent/<int:pk>/', views.TalentProfileDetailView.as_view(), name='talent-profile-detail'),
@@ -41,6 +48,10 @@ urlpatterns = [
     path('profiles/hybrid/<int:pk>/', views.HybridWorkerDetailView.as_view(), name='hybrid-worker-detail'),
     path('profiles/band/<int:pk>/', views.BandDetailView.as_view(), name='band-detail'),
     
+    # Profile score distribution and ranking
+    path('scores/<str:entity_type>/', ScoreDistributionView.as_view(), name='score-distribution'),
+    path('scores/<str:entity_type>/<int:object_id>/', ProfileScoreRankView.as_view(), name='profile-score-rank'),
+    
     # Shared Media Management
     path('share-media/', ShareMediaView.as_view(), name='share-media'),
     path('shared-media/', SharedMediaListView.as_view(), name='shared-media-list'),
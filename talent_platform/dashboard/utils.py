@@ -1,9 +1,25 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from django.db import connections
 from django.db.models import Count, Q
+from django.utils.connection import ConnectionProxy
 from .models import SharedMediaPost
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import json
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Per-process LRU in front of the default cache (see dashboard.cache_backends.TwoTierCache),
+# for the generation counters every versioned key and cached search reads; the
+# default cache itself where no 'hot' alias is configured
+hot_cache = ConnectionProxy(caches, 'hot' if 'hot' in settings.CACHES else 'default')
 
 # Cache timeouts
 CACHE_TIMEOUTS = {
@@ -27,6 +43,170 @@ def get_cache_key(prefix, *args, **kwargs):
     key_string = "|".join(key_parts)
     return hashlib.md5(key_string.encode()).hexdigest()
 
+# Models whose saves/deletes invalidate cached search results
+# (see bump_search_generation in dashboard.models)
+SEARCH_CACHE_MODELS = {
+    'users.BaseUser',
+    'profiles.TalentUserProfile', 'profiles.TalentMedia',
+    'profiles.VisualWorker', 'profiles.ExpressiveWorker', 'profiles.HybridWorker',
+    'profiles.BackGroundJobsProfile', 'profiles.Genre',
+    'profiles.Prop', 'profiles.Costume', 'profiles.Location', 'profiles.Memorabilia',
+    'profiles.Vehicle', 'profiles.ArtisticMaterial', 'profiles.MusicItem', 'profiles.RareItem',
+    'profiles.Band', 'profiles.BandMembership', 'profiles.BandMedia',
+}
+
+# Fields no search filters, ranks or orders on: saves touching only these keep
+# the cached results (every login saves the user's last_login)
+SEARCH_CACHE_IGNORED_FIELDS = {
+    'users.BaseUser': {'last_login', 'password'},
+}
+
+# Key families built with get_versioned_cache_key; each embeds its namespace's
+# generation, so invalidate_namespace() drops the whole family at once
+CACHE_NAMESPACES = ('sharing_status', 'media_counts', 'user_stats', 'search_results')
+
+def _generation_key(name):
+    return f"generation:{name}"
+
+def get_generations(names):
+    """
+    Current generation counter of each name (a model label, namespace_label()
+    or scope_label()), in the order given. Counters start at the current time
+    in milliseconds, so a counter lost from the cache never restarts at a value
+    that older cache keys were built with.
+    """
+    keys = [_generation_key(name) for name in names]
+    generations = hot_cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            hot_cache.add(key, int(time.time() * 1000), None)
+            generations[key] = hot_cache.get(key)
+    return [generations[key] for key in keys]
+
+def bump_generation(name):
+    """Invalidate every cache entry built on the current generation of `name`"""
+    key = _generation_key(name)
+    try:
+        hot_cache.incr(key)
+    except ValueError:
+        hot_cache.add(key, int(time.time() * 1000), None)
+
+def namespace_label(namespace):
+    return f"namespace:{namespace}"
+
+def scope_label(*parts):
+    """Generation name of one object's cached values, e.g. scope_label('user', 12)"""
+    return "scope:" + ":".join(str(part) for part in parts)
+
+def profile_scope(profile_obj):
+    return scope_label(profile_obj._meta.model_name, profile_obj.id)
+
+def user_scope(user_id):
+    return scope_label('user', user_id)
+
+def get_versioned_cache_key(namespace, *args, scopes=(), **kwargs):
+    """
+    get_cache_key() with the current generations of `namespace` and of each
+    scope embedded: bumping any of them moves readers to fresh keys, and the
+    orphaned entries expire on their own
+    """
+    generations = get_generations([namespace_label(namespace), *scopes])
+    return get_cache_key(namespace, *args, *generations, **kwargs)
+
+def invalidate_namespace(namespace):
+    """Drop every cached value of a namespace (see CACHE_NAMESPACES) in O(1)"""
+    bump_generation(namespace_label(namespace))
+
+def invalidate_scope(scope):
+    """Drop every cached value built on one object's scope (profile_scope(), user_scope())"""
+    bump_generation(scope)
+
+# What cached_compute stores: the value and the time (epoch seconds) it turns stale
+CachedEntry = namedtuple('CachedEntry', ['value', 'fresh_until'])
+
+_refresh_executor = None
+_refresh_executor_lock = threading.Lock()
+
+def make_cache_entry(value, timeout):
+    """
+    (entry, cache timeout) for a value fresh for `timeout` seconds +/- CACHE_TTL_JITTER,
+    so entries written together don't all expire together, then kept
+    CACHE_STALE_FACTOR timeouts longer to be served while it is recomputed
+    """
+    jitter = settings.CACHE_TTL_JITTER
+    fresh_for = timeout * random.uniform(1 - jitter, 1 + jitter)
+    return CachedEntry(value, time.time() + fresh_for), fresh_for + timeout * settings.CACHE_STALE_FACTOR
+
+def read_cache_entry(entry):
+    """(value, fresh) of a cached entry; (None, None) for a miss or a value not written by cached_compute"""
+    if not isinstance(entry, CachedEntry):
+        return None, None
+    return entry.value, entry.fresh_until > time.time()
+
+def _store(key, compute, timeout):
+    value = compute()
+    entry, cache_timeout = make_cache_entry(value, timeout)
+    cache.set(key, entry, cache_timeout)
+    return value
+
+def _refresh(key, compute, timeout, lock_key):
+    try:
+        _store(key, compute, timeout)
+    except Exception:
+        logger.exception('Background refresh of cache key %s failed', key)
+    finally:
+        cache.delete(lock_key)
+        # Connections opened by this thread aren't closed by a request cycle
+        connections.close_all()
+
+def _refresh_in_background(key, compute, timeout, lock_key):
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cache-refresh')
+    _refresh_executor.submit(_refresh, key, compute, timeout, lock_key)
+
+def cached_compute(key, compute, timeout):
+    """
+    The cached value of `key`, computing it with `compute()` when needed, with
+    protection against cache stampedes:
+    
+    - single flight: only the worker holding the key's lock (cache.add)
+      recomputes it; on a miss the others wait up to CACHE_LOCK_WAIT seconds
+      for its result before computing it themselves
+    - stale-while-revalidate: past its (soft) timeout a value is still served
+      for CACHE_STALE_FACTOR timeouts while the lock holder refreshes it, in a
+      background thread with CACHE_BACKGROUND_REFRESH
+    - jittered expiry (see make_cache_entry)
+    """
+    value, fresh = read_cache_entry(cache.get(key))
+    if fresh:
+        return value
+    
+    lock_key = f"{key}:lock"
+    locked = cache.add(lock_key, 1, settings.CACHE_LOCK_TIMEOUT)
+    if fresh is not None:
+        # Stale: refresh it if nobody else is, serve the stale value meanwhile
+        if not locked:
+            return value
+        if settings.CACHE_BACKGROUND_REFRESH:
+            _refresh_in_background(key, compute, timeout, lock_key)
+            return value
+    
+    if not locked:
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            value, fresh = read_cache_entry(cache.get(key))
+            if fresh is not None:
+                return value
+        return _store(key, compute, timeout)
+    
+    try:
+        return _store(key, compute, timeout)
+    finally:
+        cache.delete(lock_key)
+
 def get_sharing_status(media_obj, cache_key=None):
     """
     Centralized function to get sharing status for any media object.
@@ -52,89 +232,44 @@ def get_sharing_status(media_obj, cache_key=None):
     # Create cache key if not provided
     if not cache_key:
         content_type = ContentType.objects.get_for_model(media_obj)
-        cache_key = get_cache_key('sharing_status', content_type.id, media_obj.id)
-    
-    # Try to get from cache first
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        return cached_result
+        cache_key = get_versioned_cache_key('sharing_status', content_type.id, media_obj.id)
     
-    try:
-        # Get the content type for this media
+    def compute():
         content_type = ContentType.objects.get_for_model(media_obj)
-        
-        # Check if this media is already shared
         shared_post = SharedMediaPost.objects.filter(
             content_type=content_type,
             object_id=media_obj.id,
             is_active=True
         ).select_related('shared_by').first()
-        
-        if shared_post:
-            # Get shared_by name consistently
-            shared_by_name = None
-            if shared_post.shared_by:
-                full_name = f"{shared_post.shared_by.first_name} {shared_post.shared_by.last_name}".strip()
-                shared_by_name = full_name if full_name else shared_post.shared_by.email
-            
-            result = {
-                'is_shared': True,
-                'shared_post_id': shared_post.id,
-                'shared_by': shared_by_name,
-                'shared_at': shared_post.shared_at,
-                'shared_caption': shared_post.caption,
-                'shared_category': shared_post.category
-            }
-        else:
-            result = {
-                'is_shared': False,
-                'shared_post_id': None,
-                'shared_by': None,
-                'shared_at': None,
-                'shared_caption': None,
-                'shared_category': None
-            }
-        
-        # Cache the result
-        cache.set(cache_key, result, CACHE_TIMEOUTS['sharing_status'])
-        return result
-        
+        return sharing_status_from_post(shared_post)
+    
+    try:
+        return cached_compute(cache_key, compute, CACHE_TIMEOUTS['sharing_status'])
     except Exception as e:
         # Always return a valid sharing status, even if there's an error
-        result = {
-            'is_shared': False,
-            'shared_post_id': None,
-            'shared_by': None,
-            'shared_at': None,
-            'shared_caption': None,
-            'shared_category': None,
-            'error': str(e)
-        }
-        
-        # Cache the error result for a shorter time
-        cache.set(cache_key, result, 60)
+        result = sharing_status_from_post(None)
+        result['error'] = str(e)
         return result
 
-def get_profile_score_cached(profile_obj):
+def get_profile_score_cached(profile_obj, explain=False):
     """
-    Get profile score with caching for expensive calculations
+    Get profile score from the stored ProfileScore row (kept current by signals),
+    with its details and improvement tips only when `explain` is set
     """
     if not profile_obj or not hasattr(profile_obj, 'id'):
         return {'total': 0, 'details': {}}
     
-    cache_key = get_cache_key('profile_score', profile_obj._meta.model_name, profile_obj.id)
-    
-    # Try to get from cache first
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        return cached_result
-    
-    # Calculate profile score
-    result = profile_obj.get_profile_score()
-    
-    # Cache the result
-    cache.set(cache_key, result, CACHE_TIMEOUTS['profile_score'])
-    return result
+    from .profile_scores import get_stored_score
+    return get_stored_score(profile_obj, explain=explain)
+
+def wants_score_explanation(request):
+    """
+    Whether the client asked for profile score explanations (?explain=1);
+    list and search responses otherwise carry the numeric breakdown only
+    """
+    if request is None or not hasattr(request, 'query_params'):
+        return False
+    return request.query_params.get('explain', '').lower() in ('1', 'true', 'yes')
 
 def get_media_counts_cached(profile_obj):
     """
@@ -143,66 +278,58 @@ def get_media_counts_cached(profile_obj):
     if not profile_obj or not hasattr(profile_obj, 'id'):
         return {'images': 0, 'videos': 0, 'total': 0}
     
-    cache_key = get_cache_key('media_counts', profile_obj._meta.model_name, profile_obj.id)
+    cache_key = get_versioned_cache_key(
+        'media_counts', profile_obj._meta.model_name, profile_obj.id, scopes=[profile_scope(profile_obj)]
+    )
     
-    # Try to get from cache first
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        return cached_result
-    
-    # Calculate media counts
-    media_counts = {
-        'images': profile_obj.media.filter(media_type='image', is_test_video=False).count(),
-        'videos': profile_obj.media.filter(media_type='video', is_test_video=False).count(),
-    }
-    media_counts['total'] = media_counts['images'] + media_counts['videos']
+    def compute():
+        media_counts = {
+            'images': profile_obj.media.filter(media_type='image', is_test_video=False).count(),
+            'videos': profile_obj.media.filter(media_type='video', is_test_video=False).count(),
+        }
+        media_counts['total'] = media_counts['images'] + media_counts['videos']
+        return media_counts
     
-    # Cache the result
-    cache.set(cache_key, media_counts, CACHE_TIMEOUTS['media_counts'])
-    return media_counts
+    return cached_compute(cache_key, compute, CACHE_TIMEOUTS['media_counts'])
 
 def get_user_stats_cached(user_id):
     """
     Get user statistics with caching
     """
-    cache_key = get_cache_key('user_stats', user_id)
-    
-    # Try to get from cache first
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        return cached_result
-    
-    from profiles.models import TalentUserProfile, BackGroundJobsProfile
-    
-    # Calculate user stats
-    talent_profile = TalentUserProfile.objects.filter(user_id=user_id).first()
-    background_profile = BackGroundJobsProfile.objects.filter(user_id=user_id).first()
+    cache_key = get_versioned_cache_key('user_stats', user_id, scopes=[user_scope(user_id)])
     
-    stats = {
-        'has_talent_profile': talent_profile is not None,
-        'has_background_profile': background_profile is not None,
-        'profile_type': None,
-        'account_type': None,
-        'is_verified': False,
-        'profile_complete': False,
-    }
-    
-    if talent_profile:
-        stats.update({
-            'profile_type': 'talent',
-            'account_type': talent_profile.account_type,
-            'is_verified': talent_profile.is_verified,
-            'profile_complete': talent_profile.profile_complete,
-        })
-    elif background_profile:
-        stats.update({
-            'profile_type': 'background',
-            'account_type': background_profile.account_type,
-        })
+    def compute():
+        from profiles.models import TalentUserProfile, BackGroundJobsProfile
+        
+        # Calculate user stats
+        talent_profile = TalentUserProfile.objects.filter(user_id=user_id).first()
+        background_profile = BackGroundJobsProfile.objects.filter(user_id=user_id).first()
+        
+        stats = {
+            'has_talent_profile': talent_profile is not None,
+            'has_background_profile': background_profile is not None,
+            'profile_type': None,
+            'account_type': None,
+            'is_verified': False,
+            'profile_complete': False,
+        }
+        
+        if talent_profile:
+            stats.update({
+                'profile_type': 'talent',
+                'account_type': talent_profile.account_type,
+                'is_verified': talent_profile.is_verified,
+                'profile_complete': talent_profile.profile_complete,
+            })
+        elif background_profile:
+            stats.update({
+                'profile_type': 'background',
+                'account_type': background_profile.account_type,
+            })
+        
+        return stats
     
-    # Cache the result
-    cache.set(cache_key, stats, CACHE_TIMEOUTS['user_stats'])
-    return stats
+    return cached_compute(cache_key, compute, CACHE_TIMEOUTS['user_stats'])
 
 def clear_sharing_status_cache(media_obj=None, content_type=None, object_id=None):
     """
@@ -212,118 +339,148 @@ def clear_sharing_status_cache(media_obj=None, content_type=None, object_id=None
         media_obj: The media object to clear cache for
         content_type: ContentType object (alternative to media_obj)
         object_id: Object ID (alternative to media_obj)
+    
+    Without arguments every cached sharing status is dropped (one generation bump).
     """
     if media_obj:
         content_type = ContentType.objects.get_for_model(media_obj)
         object_id = media_obj.id
     
     if content_type and object_id:
-        cache_key = get_cache_key('sharing_status', content_type.id, object_id)
+        cache_key = get_versioned_cache_key('sharing_status', content_type.id, object_id)
         cache.delete(cache_key)
     else:
-        # Clear all sharing status cache (use with caution)
-        # This is a simple approach - in production you might want a more sophisticated cache invalidation
-        pass
+        invalidate_namespace('sharing_status')
 
 def clear_profile_cache(profile_obj):
     """
-    Clear all cache related to a profile
+    Clear all cache related to a profile: its media counts and its user's stats
+    (every key built on the profile's or user's scope)
     """
     if not profile_obj or not hasattr(profile_obj, 'id'):
         return
     
-    # Clear profile score cache
-    profile_score_key = get_cache_key('profile_score', profile_obj._meta.model_name, profile_obj.id)
-    cache.delete(profile_score_key)
+    invalidate_scope(profile_scope(profile_obj))
+    if hasattr(profile_obj, 'user_id'):
+        invalidate_scope(user_scope(profile_obj.user_id))
+
+def sharing_status_from_post(shared_post):
+    """Sharing status object for an active SharedMediaPost, or for unshared media when None"""
+    if not shared_post:
+        return {
+            'is_shared': False,
+            'shared_post_id': None,
+            'shared_by': None,
+            'shared_at': None,
+            'shared_caption': None,
+            'shared_category': None
+        }
     
-    # Clear media counts cache
-    media_counts_key = get_cache_key('media_counts', profile_obj._meta.model_name, profile_obj.id)
-    cache.delete(media_counts_key)
+    shared_by_name = None
+    if shared_post.shared_by:
+        full_name = f"{shared_post.shared_by.first_name} {shared_post.shared_by.last_name}".strip()
+        shared_by_name = full_name if full_name else shared_post.shared_by.email
     
-    # Clear user stats cache
-    if hasattr(profile_obj, 'user_id'):
-        user_stats_key = get_cache_key('user_stats', profile_obj.user_id)
-        cache.delete(user_stats_key)
+    return {
+        'is_shared': True,
+        'shared_post_id': shared_post.id,
+        'shared_by': shared_by_name,
+        'shared_at': shared_post.shared_at,
+        'shared_caption': shared_post.caption,
+        'shared_category': shared_post.category
+    }
 
-def bulk_get_sharing_status(media_objects):
+class SharingStatusResolver:
     """
-    Get sharing status for multiple media objects efficiently.
-    
-    Args:
-        media_objects: List of media objects
+    Request-scoped sharing statuses of the media and items a response renders.
     
-    Returns:
-        dict: Mapping of object_id to sharing status
+    add() every object up front; the first get() then resolves all of them
+    together: one cache.get_many for the cached statuses (entries shared with
+    get_sharing_status, see cached_compute) and, for the misses, one
+    SharedMediaPost query per content type. Objects not added beforehand
+    are resolved on get() the same way. Search views pass theirs to serializers
+    in the context under 'sharing_status_resolver'.
     """
-    if not media_objects:
-        return {}
     
-    # Group by content type for efficient querying
-    content_type_groups = {}
-    for obj in media_objects:
-        if not hasattr(obj, 'id'):
-            continue
-        content_type = ContentType.objects.get_for_model(obj)
-        if content_type not in content_type_groups:
-            content_type_groups[content_type] = []
-        content_type_groups[content_type].append(obj.id)
+    def __init__(self, objects=()):
+        self._statuses = {}
+        self._pending = set()
+        self.add(objects)
     
-    # Query all shared posts for these objects
-    all_shared_posts = {}
-    for content_type, object_ids in content_type_groups.items():
-        shared_posts = SharedMediaPost.objects.filter(
-            content_type=content_type,
-            object_id__in=object_ids,
-            is_active=True
-        ).select_related('shared_by')
-        
-        for post in shared_posts:
-            all_shared_posts[(content_type.id, post.object_id)] = post
+    def _key(self, obj):
+        return ContentType.objects.get_for_model(obj).id, obj.pk
+    
+    def add(self, objects):
+        """Objects whose sharing status will be read with get()"""
+        for obj in objects:
+            if obj is None or getattr(obj, 'pk', None) is None:
+                continue
+            key = self._key(obj)
+            if key not in self._statuses:
+                self._pending.add(key)
     
-    # Build results
-    results = {}
-    for obj in media_objects:
-        if not hasattr(obj, 'id'):
-            continue
-            
-        content_type = ContentType.objects.get_for_model(obj)
-        cache_key = get_cache_key('sharing_status', content_type.id, obj.id)
+    def resolve(self):
+        """Load the statuses of every pending object"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, set()
         
-        # Check cache first
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            results[obj.id] = cached_result
-            continue
+        # Same keys as get_versioned_cache_key, with the namespace generation read once
+        generation, = get_generations([namespace_label('sharing_status')])
+        cache_keys = {
+            get_cache_key('sharing_status', content_type_id, object_id, generation): (content_type_id, object_id)
+            for content_type_id, object_id in pending
+        }
+        for cache_key, entry in cache.get_many(list(cache_keys)).items():
+            # Stale entries are reloaded with the misses (one query per content type anyway)
+            status, fresh = read_cache_entry(entry)
+            if fresh:
+                self._statuses[cache_keys[cache_key]] = status
         
-        # Check if shared
-        shared_post = all_shared_posts.get((content_type.id, obj.id))
+        missing = {}
+        for content_type_id, object_id in pending:
+            if (content_type_id, object_id) not in self._statuses:
+                missing.setdefault(content_type_id, []).append(object_id)
         
-        if shared_post:
-            shared_by_name = None
-            if shared_post.shared_by:
-                full_name = f"{shared_post.shared_by.first_name} {shared_post.shared_by.last_name}".strip()
-                shared_by_name = full_name if full_name else shared_post.shared_by.email
-            
-            result = {
-                'is_shared': True,
-                'shared_post_id': shared_post.id,
-                'shared_by': shared_by_name,
-                'shared_at': shared_post.shared_at,
-                'shared_caption': shared_post.caption,
-                'shared_category': shared_post.category
-            }
-        else:
-            result = {
-                'is_shared': False,
-                'shared_post_id': None,
-                'shared_by': None,
-                'shared_at': None,
-                'shared_caption': None,
-                'shared_category': None
+        new_entries = {}
+        cache_timeout = 0
+        for content_type_id, object_ids in missing.items():
+            shared_posts = {
+                post.object_id: post
+                for post in SharedMediaPost.objects.filter(
+                    content_type_id=content_type_id,
+                    object_id__in=object_ids,
+                    is_active=True
+                ).select_related('shared_by')
             }
-        
-        # Cache the result
-        cache.set(cache_key, result, CACHE_TIMEOUTS['sharing_status'])
-        results[obj.id] = result
+            for object_id in object_ids:
+                status = sharing_status_from_post(shared_posts.get(object_id))
+                self._statuses[(content_type_id, object_id)] = status
+                entry, entry_timeout = make_cache_entry(status, CACHE_TIMEOUTS['sharing_status'])
+                new_entries[get_cache_key('sharing_status', content_type_id, object_id, generation)] = entry
+                cache_timeout = max(cache_timeout, entry_timeout)
+        if new_entries:
+            cache.set_many(new_entries, cache_timeout)
+    
+    def get(self, obj):
+        """Sharing status object of one media item or item"""
+        if obj is None or getattr(obj, 'pk', None) is None:
+            return sharing_status_from_post(None)
+        key = self._key(obj)
+        if key not in self._statuses:
+            self._pending.add(key)
+            self.resolve()
+        return self._statuses[key]
+
+def bulk_get_sharing_status(media_objects):
+    """
+    Get sharing status for multiple media objects efficiently.
+    
+    Args:
+        media_objects: List of media objects
     
-    return results 
\ No newline at end of file
+    Returns:
+        dict: Mapping of object_id to sharing status
+    """
+    resolver = SharingStatusResolver(media_objects)
+    return {obj.id: resolver.get(obj) for obj in media_objects if hasattr(obj, 'id')}
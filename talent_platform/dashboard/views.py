@@ -2,16 +2,18 @@ from django.shortcuts import render, get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import Http404
+from django.http import Http404, HttpResponse
+from django.conf import settings
 from rest_framework.permissions import IsAdminUser
 from rest_framework.generics import RetrieveAPIView, ListAPIView
-from rest_framework.pagination import PageNumberPagination
 from django.urls import reverse
 from django.utils import timezone
 from django.db.models import Count, Sum, Q
 from datetime import datetime, timedelta
 import logging
 
+from .pagination import KeysetOrPageNumberPagination
+
 # Initialize logger with error handling
 try:
     logger = logging.getLogger(__name__)
@@ -38,7 +40,9 @@ try:
         ExpressiveWorkerDashboardSerializer, HybridWorkerDashboardSerializer,
         BandDashboardSerializer, BackGroundDashboardSerializer
     )
-    from .utils import get_sharing_status
+    from .utils import SharingStatusResolver
+    from .profile_scores import attach_stored_scores
+    from .metrics import endpoint_metrics, measure_serializer, prometheus_metrics
     from profiles.utils.media_url_helper import get_media_url, get_thumbnail_url
 except ImportError as import_error:
     logger.error(f"Import error: {str(import_error)}")
@@ -60,6 +64,31 @@ class HealthCheckView(APIView):
         }, status=status.HTTP_200_OK)
 
 
+class MetricsView(APIView):
+    """
+    Per-endpoint request metrics for the last METRICS_WINDOWS windows of
+    METRICS_WINDOW_SECONDS (see dashboard.metrics): request count, wall time
+    (average, percentiles and histogram), database time and query count,
+    serializer time and cache hits/misses, the most expensive endpoints first.
+    """
+    permission_classes = [IsAdminDashboardUser]
+    
+    def get(self, request):
+        return Response({
+            'window_seconds': settings.METRICS_WINDOW_SECONDS,
+            'windows': settings.METRICS_WINDOWS,
+            'endpoints': endpoint_metrics(),
+        }, status=status.HTTP_200_OK)
+
+
+class PrometheusMetricsView(APIView):
+    """The request metrics of MetricsView in Prometheus text exposition format"""
+    permission_classes = [IsAdminDashboardUser]
+    
+    def get(self, request):
+        return HttpResponse(prometheus_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 class DashboardUserCreateView(APIView):
     """View for creating new dashboard users"""
     permission_classes = [IsAdminDashboardUser]
@@ -242,12 +271,6 @@ class TalentProfileDetailView(RetrieveAPIView):
     serializer_class = TalentDashboardSerializer
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
     
-    def get_sharing_status(self, media):
-        """
-        Get sharing status for a media item using centralized utility.
-        """
-        return get_sharing_status(media)
-    
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -255,10 +278,10 @@ class TalentProfileDetailView(RetrieveAPIView):
         
         # Add all media items associated with this profile with sharing status
         media_items = instance.media.all()
+        sharing_statuses = SharingStatusResolver(media_items)
         data['media_items'] = []
         for media in media_items:
-            # Get sharing status using centralized utility
-            sharing_status = self.get_sharing_status(media)
+            sharing_status = sharing_statuses.get(media)
             
             media_data = {
                 'id': media.id,
@@ -300,6 +323,7 @@ class BackGroundJobsProfileDetailView(RetrieveAPIView):
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
+        BackGroundJobsProfile.load_item_counts([instance])
         serializer = self.get_serializer(instance)
         data = serializer.data
         
@@ -464,12 +488,6 @@ class VisualWorkerDetailView(RetrieveAPIView):
     serializer_class = VisualWorkerDashboardSerializer
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
     
-    def get_sharing_status(self, media):
-        """
-        Get sharing status for a media item using centralized utility.
-        """
-        return get_sharing_status(media)
-    
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -477,10 +495,10 @@ class VisualWorkerDetailView(RetrieveAPIView):
         
         # Add all media items associated with this profile with sharing status
         media_items = instance.profile.media.all()
+        sharing_statuses = SharingStatusResolver(media_items)
         data['media_items'] = []
         for media in media_items:
-            # Get sharing status using centralized utility
-            sharing_status = self.get_sharing_status(media)
+            sharing_status = sharing_statuses.get(media)
             
             media_data = {
                 'id': media.id,
@@ -505,12 +523,6 @@ class ExpressiveWorkerDetailView(RetrieveAPIView):
     serializer_class = ExpressiveWorkerDashboardSerializer
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
     
-    def get_sharing_status(self, media):
-        """
-        Get sharing status for a media item using centralized utility.
-        """
-        return get_sharing_status(media)
-    
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -518,10 +530,10 @@ class ExpressiveWorkerDetailView(RetrieveAPIView):
         
         # Add all media items associated with this profile with sharing status
         media_items = instance.profile.media.all()
+        sharing_statuses = SharingStatusResolver(media_items)
         data['media_items'] = []
         for media in media_items:
-            # Get sharing status using centralized utility
-            sharing_status = self.get_sharing_status(media)
+            sharing_status = sharing_statuses.get(media)
             
             media_data = {
                 'id': media.id,
@@ -597,7 +609,7 @@ class BandDetailView(RetrieveAPIView):
         return Response(data)
 
 
-class AllProfilesPagination(PageNumberPagination):
+class AllProfilesPagination(KeysetOrPageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 50
@@ -608,10 +620,14 @@ class AllProfilesView(ListAPIView):
     serializer_class = TalentDashboardSerializer
     permission_classes = [IsDashboardUser | IsAdminDashboardUser]
     pagination_class = AllProfilesPagination
+    query_budget = 15
     
     def get_queryset(self):
-        # Get base queryset of all talent profiles
-        return TalentUserProfile.objects.all().prefetch_related('media')
+        # Get base queryset of all talent profiles, with the relations the
+        # serializer and the specialization links read on every row
+        return TalentUserProfile.objects.all().select_related(
+            'user', 'visual_worker', 'expressive_worker', 'hybrid_worker'
+        ).prefetch_related('media')
     
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
@@ -650,15 +666,16 @@ class AllProfilesView(ListAPIView):
         page = self.paginate_queryset(combined_queryset)
         
         if page is not None:
+            attach_stored_scores(page)
             serializer = self.get_serializer(page, many=True)
-            data = serializer.data
+            with measure_serializer():
+                data = serializer.data
             
             # Add links to detailed profile views
-            for item in data:
+            for item, profile in zip(data, page):
                 item['profile_url'] = request.build_absolute_uri(reverse('dashboard:talent-profile-detail', args=[item['id']]))
                 
                 # Check for specializations
-                profile = queryset.get(id=item['id'])
                 if hasattr(profile, 'visual_worker'):
                     item['visual_worker_url'] = request.build_absolute_uri(
                         reverse('dashboard:visual-worker-detail', args=[profile.visual_worker.id]))
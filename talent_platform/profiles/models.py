@@ -6,6 +6,7 @@ from users .models import BaseUser
 import os
 import uuid
 from .utils.media_processor import MediaProcessor
+from .score_explanations import add_explanation
 from django.core.files.base import ContentFile
 import tempfile
 import subprocess
@@ -23,7 +24,14 @@ class TalentUserProfile(models.Model):
         ('free', 'Free'),
     ]
     account_type = models.CharField(max_length=10, choices=ACCOUNT_TYPES, default='free', db_index=True)
-    
+
+    # Search ranking boost multiplier per account type
+    SEARCH_BOOSTS = {
+        'free': 0.1,          # Very low visibility
+        'premium': 0.5,       # Medium visibility
+        'platinum': 1.0,      # High visibility
+    }
+
     # Basic profile fields that were missing
     country = models.CharField(max_length=25, blank=True, default='', db_index=True)
     city = models.CharField(max_length=25, blank=True, default='', db_index=True)
@@ -46,6 +54,20 @@ class TalentUserProfile(models.Model):
         has_hybrid = hasattr(self, 'hybrid_worker')
         return has_visual or has_expressive or has_hybrid
     
+    @classmethod
+    def with_score_inputs(cls, queryset=None):
+        """Return a queryset that loads everything get_profile_score() reads in one query.
+        Used to score whole pages or tables without per-profile queries.
+        """
+        from django.db.models import Count, Q
+        
+        queryset = queryset if queryset is not None else cls.objects.all()
+        return queryset.select_related(
+            'user', 'visual_worker', 'expressive_worker', 'hybrid_worker', 'social_media_links'
+        ).annotate(
+            _score_media_count=Count('media', filter=Q(media__is_test_video=False), distinct=True)
+        )
+    
     def update_profile_completion(self):
         """
         Update the profile_complete status based on whether the user has at least one specialization.
@@ -53,7 +75,11 @@ class TalentUserProfile(models.Model):
         self.profile_complete = self.has_specialization()
         self.save(update_fields=['profile_complete'])
         
-    def get_profile_score(self):
+    def get_profile_score(self, explain=True):
+        """Score breakdown: the points per component, `total` and the `state` the
+        explanation is rendered from. The English/Arabic details and improvement
+        tips are only added when `explain` is set (see profiles.score_explanations).
+        """
         score_breakdown = {
             'total': 0,
             'account_tier': 0,
@@ -62,135 +88,106 @@ class TalentUserProfile(models.Model):
             'media_content': 0,
             'specialization': 0,
             'social_media': 0,
-            'details': {},
-            'details_ar': {}
         }
+        state = {}
         
         # Account tier - More balanced scoring
         if self.account_type == 'platinum':
             score_breakdown['account_tier'] = 25
-            score_breakdown['details']['account_tier'] = 'Platinum account: +25 points'
-            score_breakdown['details_ar']['account_tier'] = 'حساب بلاتينيوم: +25 نقطة'
+            state['account_tier'] = 'platinum'
         elif self.account_type == 'premium':
             score_breakdown['account_tier'] = 15
-            score_breakdown['details']['account_tier'] = 'Premium account: +15 points'
-            score_breakdown['details_ar']['account_tier'] = 'حساب بريميوم: +15 نقطة'
+            state['account_tier'] = 'premium'
         else:
             score_breakdown['account_tier'] = 5
-            score_breakdown['details']['account_tier'] = 'Free account: +5 points'
-            score_breakdown['details_ar']['account_tier'] = 'حساب مجاني: +5 نقاط'
+            state['account_tier'] = 'free'
         
         # Verification - Email verification only
         if self.user.email_verified:
             score_breakdown['verification'] = 25
-            score_breakdown['details']['verification'] = 'Email verified: +25 points'
-            score_breakdown['details_ar']['verification'] = 'البريد الإلكتروني موثق: +25 نقطة'
+            state['verification'] = 'verified'
         else:
-            score_breakdown['details']['verification'] = 'Email not verified: +0 points (verify your email for +25 points)'
-            score_breakdown['details_ar']['verification'] = 'البريد الإلكتروني غير موثق: +0 نقطة (وثق بريدك الإلكتروني لـ +25 نقطة)'
+            state['verification'] = 'unverified'
         
         # Profile completion - More detailed scoring
         completion_score = 0
         completion_details = []
         
         # Basic profile fields
-        completion_details_ar = []
         if self.aboutyou and len(self.aboutyou.strip()) > 50:
             completion_score += 5
-            completion_details.append('About section: +5 points')
-            completion_details_ar.append('قسم نبذة عني: +5 نقاط')
+            completion_details.append('about')
         if self.profile_picture:
             completion_score += 5
-            completion_details.append('Profile picture: +5 points')
-            completion_details_ar.append('صورةr الملف الشخصي: +5 نقاط')
+            completion_details.append('picture')
         if self.country and self.country != 'country':
             completion_score += 3
-            completion_details.append('Country specified: +3 points')
-            completion_details_ar.append('البلد محدد: +3 نقاط')
+            completion_details.append('country')
         if self.date_of_birth:
             completion_score += 2
-            completion_details.append('Date of birth: +2 points')
-            completion_details_ar.append('تاريخ الميلاد: +2 نقطة')
+            completion_details.append('date_of_birth')
         
         # Specialization completion
         has_specialization = self.has_specialization()
         if has_specialization:
             completion_score += 10
-            completion_details.append('Specialization added: +10 points')
-            completion_details_ar.append('تم إضافة التخصص: +10 نقاط')
+            completion_details.append('specialization')
         
         score_breakdown['profile_completion'] = completion_score
-        if completion_details:
-            score_breakdown['details']['profile_completion'] = '; '.join(completion_details)
-            score_breakdown['details_ar']['profile_completion'] = '; '.join(completion_details_ar)
-        else:
-            score_breakdown['details']['profile_completion'] = 'Profile incomplete: +0 points (complete your profile for up to +25 points)'
-            score_breakdown['details_ar']['profile_completion'] = 'الملف الشخصي غير مكتمل: +0 نقطة (أكمل ملفك الشخصي لـ +25 نقطة)'
+        state['profile_completion'] = completion_details
         
         # Media content - More granular scoring
-        media_count = self.media.filter(is_test_video=False).count()
+        # (counted in bulk by with_score_inputs() when batch scoring)
+        if hasattr(self, '_score_media_count'):
+            media_count = self._score_media_count
+        else:
+            media_count = self.media.filter(is_test_video=False).count()
         if media_count >= 6:
             score_breakdown['media_content'] = 20
-            score_breakdown['details']['media_content'] = 'Excellent portfolio (6+ items): +20 points'
-            score_breakdown['details_ar']['media_content'] = 'معرض اعمال ممتاز (6+ عناصر): +20 نقطة'
+            state['media_content'] = 'excellent'
         elif media_count >= 4:
             score_breakdown['media_content'] = 15
-            score_breakdown['details']['media_content'] = 'Strong portfolio (4-5 items): +15 points'
-            score_breakdown['details_ar']['media_content'] = 'معرض اعمال قوي (4-5 عناصر): +15 نقطة'
+            state['media_content'] = 'strong'
         elif media_count >= 2:
             score_breakdown['media_content'] = 10
-            score_breakdown['details']['media_content'] = 'Good portfolio (2-3 items): +10 points'
-            score_breakdown['details_ar']['media_content'] = 'معرض اعمال جيد (2-3 عناصر): +10 نقاط'
+            state['media_content'] = 'good'
         elif media_count >= 1:
             score_breakdown['media_content'] = 5
-            score_breakdown['details']['media_content'] = 'Basic portfolio (1 item): +5 points'
-            score_breakdown['details_ar']['media_content'] = 'معرض اعمال أساسي (عنصر واحد): +5 نقاط'
+            state['media_content'] = 'basic'
         else:
             score_breakdown['media_content'] = 0
-            score_breakdown['details']['media_content'] = 'No portfolio items: +0 points (add portfolio items for up to +20 points)'
-            score_breakdown['details_ar']['media_content'] = 'لا توجد عناصر محفظة: +0 نقطة (أضف عناصر المحفظة لـ +20 نقطة)'
+            state['media_content'] = 'none'
         
         # Specialization - More detailed scoring
         specialization_score = 0
         specialization_details = []
-        specialization_details_ar = []
         
         if has_specialization:
             # Count specializations
             spec_count = 0
             if hasattr(self, 'visual_worker'):
                 spec_count += 1
-                specialization_details.append('Visual Worker')
-                specialization_details_ar.append('عامل بصري')
+                specialization_details.append('visual')
             if hasattr(self, 'expressive_worker'):
                 spec_count += 1
-                specialization_details.append('Expressive Worker')
-                specialization_details_ar.append('عامل تعبيري')
+                specialization_details.append('expressive')
             if hasattr(self, 'hybrid_worker'):
                 spec_count += 1
-                specialization_details.append('Hybrid Worker')
-                specialization_details_ar.append('عامل مختلط')
+                specialization_details.append('hybrid')
             
             # Base points for having specialization
             specialization_score = 10
             # Bonus for multiple specializations
             if spec_count > 1:
                 specialization_score += 5
-                specialization_details.append(f'Multi-specialization bonus: +5 points')
-                specialization_details_ar.append(f'مكافأة التخصصات المتعددة: +5 نقاط')
-            
-            score_breakdown['specialization'] = specialization_score
-            score_breakdown['details']['specialization'] = f'Specializations: {", ".join(specialization_details)} (+{specialization_score} points)'
-            score_breakdown['details_ar']['specialization'] = f'التخصصات: {", ".join(specialization_details_ar)} (+{specialization_score} نقطة)'
-        else:
-            score_breakdown['specialization'] = 0
-            score_breakdown['details']['specialization'] = 'No specialization: +0 points (add a specialization for +10 points)'
-            score_breakdown['details_ar']['specialization'] = 'لا يوجد تخصص: +0 نقطة (أضف تخصص لـ +10 نقاط)'
+                specialization_details.append('multi')
+        
+        score_breakdown['specialization'] = specialization_score
+        state['specialization'] = specialization_details
         
         # Social media presence - New scoring category
         social_media_score = 0
-        social_details = []
-        social_details_ar = []
+        state['social_media'] = 'none'
         
         if hasattr(self, 'social_media_links'):
             social_links = self.social_media_links
@@ -203,24 +200,15 @@ class TalentUserProfile(models.Model):
             
             if link_count >= 4:
                 social_media_score = 10
-                social_details.append('Strong social presence (4+ links): +10 points')
-                social_details_ar.append('وجود قوي على وسائل التواصل (4+ روابط): +10 نقاط')
+                state['social_media'] = 'strong'
             elif link_count >= 2:
                 social_media_score = 5
-                social_details.append('Good social presence (2-3 links): +5 points')
-                social_details_ar.append('وجود جيد على وسائل التواصل (2-3 روابط): +5 نقاط')
+                state['social_media'] = 'good'
             elif link_count >= 1:
                 social_media_score = 2
-                social_details.append('Basic social presence (1 link): +2 points')
-                social_details_ar.append('وجود أساسي على وسائل التواصل (رابط واحد): +2 نقطة')
+                state['social_media'] = 'basic'
         
         score_breakdown['social_media'] = social_media_score
-        if social_details:
-            score_breakdown['details']['social_media'] = '; '.join(social_details)
-            score_breakdown['details_ar']['social_media'] = '; '.join(social_details_ar)
-        else:
-            score_breakdown['details']['social_media'] = 'No social media links: +0 points (add social links for up to +10 points)'
-            score_breakdown['details_ar']['social_media'] = 'لا توجد روابط وسائل التواصل: +0 نقطة (أضف روابط وسائل التواصل لـ +10 نقاط)'
         
         # Calculate total
         score_breakdown['total'] = (
@@ -235,27 +223,24 @@ class TalentUserProfile(models.Model):
         
         # Improved improvement tips
         if score_breakdown['total'] < 70:
-            score_breakdown['improvement_tips'] = []
-            score_breakdown['improvement_tips_ar'] = []
+            tips = []
             if self.account_type == 'free':
-                score_breakdown['improvement_tips'].append('Upgrade to Premium (+10) or Platinum (+20) for more points')
-                score_breakdown['improvement_tips_ar'].append('ترقية إلى بريميوم (+10) أو بلاتينيوم (+20) للمزيد من النقاط')
+                tips.append('upgrade')
             if not self.user.email_verified:
-                score_breakdown['improvement_tips'].append('Verify your email for +25 points')
-                score_breakdown['improvement_tips_ar'].append('وثق بريدك الإلكتروني لـ +25 نقطة')
+                tips.append('verify')
             if completion_score < 15:
-                score_breakdown['improvement_tips'].append('Complete your profile details for up to +25 points')
-                score_breakdown['improvement_tips_ar'].append('أكمل تفاصيل ملفك الشخصي لـ +25 نقطة')
+                tips.append('profile')
             if media_count < 4:
-                score_breakdown['improvement_tips'].append('Add more portfolio items for up to +20 points')
-                score_breakdown['improvement_tips_ar'].append('أضف المزيد من عناصر المحفظة لـ +20 نقطة')
+                tips.append('media')
             if not has_specialization:
-                score_breakdown['improvement_tips'].append('Add a specialization for +10 points')
-                score_breakdown['improvement_tips_ar'].append('أضف تخصص لـ +10 نقاط')
+                tips.append('specialization')
             if social_media_score < 5:
-                score_breakdown['improvement_tips'].append('Add social media links for up to +10 points')
-                score_breakdown['improvement_tips_ar'].append('أضف روابط وسائل التواصل لـ +10 نقاط')
+                tips.append('social')
+            state['improvement_tips'] = tips
         
+        score_breakdown['state'] = state
+        if explain:
+            add_explanation(score_breakdown, 'talent')
         return score_breakdown
     
     @property
@@ -335,12 +320,7 @@ class TalentUserProfile(models.Model):
         """
         Get search ranking boost multiplier.
         """
-        boosts = {
-            'free': 0.1,          # Very low visibility
-            'premium': 0.5,       # Medium visibility  
-            'platinum': 1.0        # High visibility
-        }
-        return boosts.get(self.account_type, 0.1)
+        return self.SEARCH_BOOSTS.get(self.account_type, self.SEARCH_BOOSTS['free'])
 
     def can_create_custom_url(self):
         """
@@ -449,18 +429,55 @@ class BackGroundJobsProfile(models.Model):
     ]
     account_type = models.CharField(max_length=20, choices=ACCOUNT_TYPES, default='free', db_index=True)
 
-    def get_profile_score(self):
+    def get_item_counts(self):
+        """Number of items of each type ({'props': n, ...}).
+        Uses caching to reduce database queries; load_item_counts() fills it for many profiles at once.
+        """
+        if not hasattr(self, '_item_counts'):
+            BackGroundJobsProfile.load_item_counts([self])
+        return self._item_counts
+    
+    @classmethod
+    def item_counts_query(cls, profile_ids):
+        """
+        (profile_id, item_type, count) rows for the given profiles: one grouped
+        query per item type, combined with UNION ALL into a single statement.
+        """
+        from django.db.models import Count, Value, CharField
+        
+        grouped = [
+            model.objects.filter(BackGroundJobsProfile_id__in=profile_ids).order_by().values(
+                'BackGroundJobsProfile_id'
+            ).annotate(
+                item_type=Value(name, output_field=CharField()),
+                count=Count('id'),
+            ).values_list('BackGroundJobsProfile_id', 'item_type', 'count')
+            for name, model in ITEM_MODELS.items()
+        ]
+        return grouped[0].union(*grouped[1:], all=True)
+    
+    @classmethod
+    def load_item_counts(cls, profiles):
+        """Fill the item counts of many profiles with one UNION ALL query"""
+        profiles = [profile for profile in profiles if not hasattr(profile, '_item_counts')]
+        if not profiles:
+            return
+        counts = {profile.pk: dict.fromkeys(ITEM_MODELS, 0) for profile in profiles}
+        for profile_id, item_type, count in cls.item_counts_query(list(counts)):
+            counts[profile_id][item_type] = count
+        for profile in profiles:
+            profile._item_counts = counts[profile.pk]
+    
+    def get_profile_score(self, explain=True):
+        """Score breakdown with its explanation only when `explain` is set (see TalentUserProfile.get_profile_score)"""
         score_breakdown = {
             'total': 0,
             'account_tier': 25,  # Reduced from 50 to 25 for more balanced scoring
             'profile_completion': 0,
             'item_diversity': 0,
             'item_quantity': 0,
-            'details': {},
-            'details_ar': {}
         }
-        score_breakdown['details']['account_tier'] = 'All accounts paid: +25 points'
-        score_breakdown['details_ar']['account_tier'] = 'جميع الحسابات مدفوعة: +25 نقطة'
+        state = {'account_tier': 'paid'}
         # Profile completion: 15 points for filling basic fields (more comprehensive check)
         profile_complete = bool(
             self.country and 
@@ -471,60 +488,30 @@ class BackGroundJobsProfile(models.Model):
         )
         if profile_complete:
             score_breakdown['profile_completion'] = 15
-            score_breakdown['details']['profile_completion'] = 'Profile complete: +15 points'
-            score_breakdown['details_ar']['profile_completion'] = 'الملف الشخصي مكتمل: +15 نقطة'
+            state['profile_completion'] = 'complete'
         else:
-            score_breakdown['details']['profile_completion'] = 'Profile incomplete: +0 points (complete your profile for +15 points)'
-            score_breakdown['details_ar']['profile_completion'] = 'الملف الشخصي غير مكتمل: +0 نقطة (أكمل ملفك الشخصي لـ +15 نقطة)'
+            state['profile_completion'] = 'incomplete'
         # Item diversity: 5 points per item type
-        item_types = [
-            Prop.objects.filter(BackGroundJobsProfile=self).exists(),
-            Costume.objects.filter(BackGroundJobsProfile=self).exists(),
-            Location.objects.filter(BackGroundJobsProfile=self).exists(),
-            Memorabilia.objects.filter(BackGroundJobsProfile=self).exists(),
-            Vehicle.objects.filter(BackGroundJobsProfile=self).exists(),
-            ArtisticMaterial.objects.filter(BackGroundJobsProfile=self).exists(),
-            MusicItem.objects.filter(BackGroundJobsProfile=self).exists(),
-            RareItem.objects.filter(BackGroundJobsProfile=self).exists()
-        ]
-        item_type_count = sum(1 for t in item_types if t)
+        item_counts = self.get_item_counts()
+        item_type_count = sum(1 for count in item_counts.values() if count)
         score_breakdown['item_diversity'] = item_type_count * 5
-        if item_type_count > 0:
-            score_breakdown['details']['item_diversity'] = f'{item_type_count} item types: +{item_type_count * 5} points'
-            score_breakdown['details_ar']['item_diversity'] = f'{item_type_count} أنواع عناصر: +{item_type_count * 5} نقطة'
-        else:
-            score_breakdown['details']['item_diversity'] = 'No item types: +0 points (add different item types for +5 points each)'
-            score_breakdown['details_ar']['item_diversity'] = 'لا توجد أنواع عناصر: +0 نقطة (أضف أنواع عناصر مختلفة لـ +5 نقاط لكل نوع)'
+        state['item_diversity'] = item_type_count
         # Item quantity: Up to 25 points based on total items
-        total_items = sum([
-            Prop.objects.filter(BackGroundJobsProfile=self).count(),
-            Costume.objects.filter(BackGroundJobsProfile=self).count(),
-            Location.objects.filter(BackGroundJobsProfile=self).count(),
-            Memorabilia.objects.filter(BackGroundJobsProfile=self).count(),
-            Vehicle.objects.filter(BackGroundJobsProfile=self).count(),
-            ArtisticMaterial.objects.filter(BackGroundJobsProfile=self).count(),
-            MusicItem.objects.filter(BackGroundJobsProfile=self).count(),
-            RareItem.objects.filter(BackGroundJobsProfile=self).count()
-        ])
+        total_items = sum(item_counts.values())
         if total_items > 20:
             score_breakdown['item_quantity'] = 25
-            score_breakdown['details']['item_quantity'] = 'Large collection (20+ items): +25 points'
-            score_breakdown['details_ar']['item_quantity'] = 'مجموعة كبيرة (20+ عنصر): +25 نقطة'
+            state['item_quantity'] = 'large'
         elif total_items > 10:
             score_breakdown['item_quantity'] = 20
-            score_breakdown['details']['item_quantity'] = 'Medium collection (10-20 items): +20 points'
-            score_breakdown['details_ar']['item_quantity'] = 'مجموعة متوسطة (10-20 عنصر): +20 نقطة'
+            state['item_quantity'] = 'medium'
         elif total_items > 5:
             score_breakdown['item_quantity'] = 15
-            score_breakdown['details']['item_quantity'] = 'Small collection (5-10 items): +15 points'
-            score_breakdown['details_ar']['item_quantity'] = 'مجموعة صغيرة (5-10 عناصر): +15 نقطة'
+            state['item_quantity'] = 'small'
         elif total_items > 0:
             score_breakdown['item_quantity'] = 10
-            score_breakdown['details']['item_quantity'] = 'Starter collection (1-5 items): +10 points'
-            score_breakdown['details_ar']['item_quantity'] = 'مجموعة مبتدئة (1-5 عناصر): +10 نقاط'
+            state['item_quantity'] = 'starter'
         else:
-            score_breakdown['details']['item_quantity'] = 'No items: +0 points (add items for up to +25 points)'
-            score_breakdown['details_ar']['item_quantity'] = 'لا توجد عناصر: +0 نقطة (أضف عناصر لـ +25 نقطة)'
+            state['item_quantity'] = 'none'
         # Calculate total
         score_breakdown['total'] = (
             score_breakdown['account_tier'] +
@@ -535,13 +522,17 @@ class BackGroundJobsProfile(models.Model):
         score_breakdown['total'] = min(score_breakdown['total'], 100)
         # Improvement tips
         if score_breakdown['total'] < 80:
-            score_breakdown['improvement_tips'] = []
+            tips = []
             if not profile_complete:
-                score_breakdown['improvement_tips'].append('Complete your profile for +15 points')
+                tips.append('profile')
             if item_type_count < 8:
-                score_breakdown['improvement_tips'].append('Add more item types for +5 points each')
+                tips.append('item_types')
             if total_items < 5:
-                score_breakdown['improvement_tips'].append('Add more items for up to +25 points')
+                tips.append('items')
+            state['improvement_tips'] = tips
+        score_breakdown['state'] = state
+        if explain:
+            add_explanation(score_breakdown, 'background')
         return score_breakdown
 
     def __str__(self):
@@ -808,6 +799,19 @@ class RareItem(Item):
     is_one_of_a_kind = models.BooleanField(default=False)
 
 
+# Item models by the plural name used for item counts
+ITEM_MODELS = {
+    'props': Prop,
+    'costumes': Costume,
+    'locations': Location,
+    'memorabilia': Memorabilia,
+    'vehicles': Vehicle,
+    'artistic_materials': ArtisticMaterial,
+    'music_items': MusicItem,
+    'rare_items': RareItem,
+}
+
+
 # Function to handle band media file paths
 def band_media_path(instance, filename):
     """
@@ -868,16 +872,16 @@ class Band(models.Model):
             status='active'
         ).exists()
     
-    def get_profile_score(self):
+    def get_profile_score(self, explain=True):
+        """Score breakdown with its explanation only when `explain` is set (see TalentUserProfile.get_profile_score)"""
         score_breakdown = {
             'total': 0,
             'profile_completion': 0,
             'media_content': 0,
             'member_count': 0,
             'band_details': 0,
-            'details': {},
-            'details_ar': {}
         }
+        state = {}
         # Profile completion: Up to 30 points based on % of fields completed
         profile_fields = [
             bool(self.name), bool(self.description), bool(self.band_type), 
@@ -888,74 +892,61 @@ class Band(models.Model):
         profile_percent = (completed_fields / len(profile_fields)) * 100
         if profile_percent == 100:
             score_breakdown['profile_completion'] = 30
-            score_breakdown['details']['profile_completion'] = 'Complete band profile: +30 points'
-            score_breakdown['details_ar']['profile_completion'] = 'ملف الفرقة مكتمل: +30 نقطة'
+            state['profile_completion'] = 'complete'
         elif profile_percent >= 75:
             score_breakdown['profile_completion'] = 20
-            score_breakdown['details']['profile_completion'] = 'Mostly complete band profile: +20 points'
-            score_breakdown['details_ar']['profile_completion'] = 'ملف الفرقة مكتمل معظمه: +20 نقطة'
+            state['profile_completion'] = 'mostly'
         elif profile_percent >= 50:
             score_breakdown['profile_completion'] = 10
-            score_breakdown['details']['profile_completion'] = 'Partially complete band profile: +10 points'
-            score_breakdown['details_ar']['profile_completion'] = 'ملف الفرقة مكتمل جزئياً: +10 نقاط'
+            state['profile_completion'] = 'partial'
         else:
-            score_breakdown['details']['profile_completion'] = 'Minimal band profile: +0 points (complete your band profile for up to +30 points)'
-            score_breakdown['details_ar']['profile_completion'] = 'ملف الفرقة ضئيل: +0 نقطة (أكمل ملف فرقتك لـ +30 نقطة)'
+            state['profile_completion'] = 'minimal'
         # Media content: Up to 30 points based on quantity
-        media_count = self.media.count()
+        # (counted in bulk by with_score_inputs() when batch scoring)
+        media_count = self._score_media_count if hasattr(self, '_score_media_count') else self.media.count()
         if media_count >= 6:
             score_breakdown['media_content'] = 30
-            score_breakdown['details']['media_content'] = 'Maximum media (6 items): +30 points'
-            score_breakdown['details_ar']['media_content'] = 'أقصى وسائط (6 عناصر): +30 نقطة'
+            state['media_content'] = 'maximum'
         elif media_count >= 4:
             score_breakdown['media_content'] = 20
-            score_breakdown['details']['media_content'] = 'Good media (4-5 items): +20 points'
-            score_breakdown['details_ar']['media_content'] = 'وسائط جيدة (4-5 عناصر): +20 نقطة'
+            state['media_content'] = 'good'
         elif media_count >= 2:
             score_breakdown['media_content'] = 10
-            score_breakdown['details']['media_content'] = 'Basic media (2-3 items): +10 points'
-            score_breakdown['details_ar']['media_content'] = 'وسائط أساسية (2-3 عناصر): +10 نقاط'
+            state['media_content'] = 'basic'
         elif media_count == 1:
             score_breakdown['media_content'] = 5
-            score_breakdown['details']['media_content'] = 'Minimal media (1 item): +5 points'
-            score_breakdown['details_ar']['media_content'] = 'وسائط ضئيلة (عنصر واحد): +5 نقاط'
+            state['media_content'] = 'minimal'
         else:
-            score_breakdown['details']['media_content'] = 'No media: +0 points (add media for up to +30 points)'
-            score_breakdown['details_ar']['media_content'] = 'لا توجد وسائط: +0 نقطة (أضف وسائط لـ +30 نقطة)'
+            state['media_content'] = 'none'
         # Member count: Up to 30 points based on number of members
         member_count = self.member_count
         if member_count >= 10:
             score_breakdown['member_count'] = 30
-            score_breakdown['details']['member_count'] = 'Large band (10+ members): +30 points'
-            score_breakdown['details_ar']['member_count'] = 'فرقة كبيرة (10+ أعضاء): +30 نقطة'
+            state['member_count'] = 'large'
         elif member_count >= 5:
             score_breakdown['member_count'] = 20
-            score_breakdown['details']['member_count'] = 'Medium band (5-9 members): +20 points'
-            score_breakdown['details_ar']['member_count'] = 'فرقة متوسطة (5-9 أعضاء): +20 نقطة'
+            state['member_count'] = 'medium'
         elif member_count >= 3:
             score_breakdown['member_count'] = 10
-            score_breakdown['details']['member_count'] = 'Small band (3-4 members): +10 points'
-            score_breakdown['details_ar']['member_count'] = 'فرقة صغيرة (3-4 أعضاء): +10 نقاط'
+            state['member_count'] = 'small'
         elif member_count > 0:
             score_breakdown['member_count'] = 5
-            score_breakdown['details']['member_count'] = 'Minimal band (1-2 members): +5 points'
-            score_breakdown['details_ar']['member_count'] = 'فرقة ضئيلة (1-2 عضو): +5 نقاط'
+            state['member_count'] = 'minimal'
         else:
-            score_breakdown['details']['member_count'] = 'No members: +0 points (add members for up to +30 points)'
-            score_breakdown['details_ar']['member_count'] = 'لا يوجد أعضاء: +0 نقطة (أضف أعضاء لـ +30 نقطة)'
+            state['member_count'] = 'none'
         # Band details: Up to 10 points for member positions
-        members_with_positions = BandMembership.objects.filter(band=self, position__isnull=False).exclude(position='').count()
+        if hasattr(self, '_score_positioned_member_count'):
+            members_with_positions = self._score_positioned_member_count
+        else:
+            members_with_positions = BandMembership.objects.filter(band=self, position__isnull=False).exclude(position='').count()
         if members_with_positions == member_count and member_count > 0:
             score_breakdown['band_details'] = 10
-            score_breakdown['details']['band_details'] = 'All members have positions: +10 points'
-            score_breakdown['details_ar']['band_details'] = 'جميع الأعضاء لديهم مناصب: +10 نقاط'
+            state['band_details'] = 'all'
         elif members_with_positions > 0:
             score_breakdown['band_details'] = 5
-            score_breakdown['details']['band_details'] = 'Some members have positions: +5 points'
-            score_breakdown['details_ar']['band_details'] = 'بعض الأعضاء لديهم مناصب: +5 نقاط'
+            state['band_details'] = 'some'
         else:
-            score_breakdown['details']['band_details'] = 'No member positions: +0 points (add positions for up to +10 points)'
-            score_breakdown['details_ar']['band_details'] = 'لا توجد مناصب للأعضاء: +0 نقطة (أضف مناصب لـ +10 نقاط)'
+            state['band_details'] = 'none'
         # Calculate total
         score_breakdown['total'] = (
             score_breakdown['profile_completion'] +
@@ -966,20 +957,19 @@ class Band(models.Model):
         score_breakdown['total'] = min(score_breakdown['total'], 100)
         # Improvement tips
         if score_breakdown['total'] < 80:
-            score_breakdown['improvement_tips'] = []
-            score_breakdown['improvement_tips_ar'] = []
+            tips = []
             if profile_percent < 100:
-                score_breakdown['improvement_tips'].append('Complete your band profile for up to +30 points')
-                score_breakdown['improvement_tips_ar'].append('أكمل ملف فرقتك لـ +30 نقطة')
+                tips.append('profile')
             if media_count < 6:
-                score_breakdown['improvement_tips'].append('Add more media for up to +30 points')
-                score_breakdown['improvement_tips_ar'].append('أضف المزيد من الوسائط لـ +30 نقطة')
+                tips.append('media')
             if member_count < 5:
-                score_breakdown['improvement_tips'].append('Add more members for up to +30 points')
-                score_breakdown['improvement_tips_ar'].append('أضف المزيد من الأعضاء لـ +30 نقطة')
+                tips.append('members')
             if members_with_positions < member_count:
-                score_breakdown['improvement_tips'].append('Add positions for all members for up to +10 points')
-                score_breakdown['improvement_tips_ar'].append('أضف مناصب لجميع الأعضاء لـ +10 نقاط')
+                tips.append('positions')
+            state['improvement_tips'] = tips
+        score_breakdown['state'] = state
+        if explain:
+            add_explanation(score_breakdown, 'band')
         return score_breakdown
     
     @property
@@ -1009,8 +999,24 @@ class Band(models.Model):
         
         queryset = queryset if queryset is not None else cls.objects.all()
         return queryset.annotate(
-            _member_count=Count('bandmembership'),
-            _admin_count=Count('bandmembership', filter=Q(bandmembership__role='admin'))
+            _member_count=Count('bandmembership', distinct=True),
+            _admin_count=Count('bandmembership', filter=Q(bandmembership__role='admin'), distinct=True)
+        )
+    
+    @classmethod
+    def with_score_inputs(cls, queryset=None):
+        """Return a queryset with the counts get_profile_score() reads annotated.
+        Used to score whole pages or tables without per-band queries.
+        """
+        from django.db.models import Count, Q
+        
+        return cls.with_counts(queryset).annotate(
+            _score_media_count=Count('media', distinct=True),
+            _score_positioned_member_count=Count(
+                'bandmembership',
+                filter=Q(bandmembership__position__isnull=False) & ~Q(bandmembership__position=''),
+                distinct=True
+            )
         )
     
     def get_max_admins(self):
@@ -0,0 +1,327 @@
+"""
+Human-readable explanations of profile scores.
+
+get_profile_score() computes the numbers and a compact `state` (which rule
+matched for each component), which is all sorting and storage need. The
+English/Arabic `details` and `improvement_tips` are rendered from the
+templates below only when a caller asks for them, and each rendering is
+cached per (score state, language), so the same handful of strings is reused
+instead of being rebuilt for every profile.
+"""
+import json
+from functools import lru_cache
+
+EXPLANATION_LANGUAGES = ('en', 'ar')
+
+# Key suffix of each language in a score breakdown ('details', 'details_ar', ...)
+LANGUAGE_SUFFIXES = {'en': '', 'ar': '_ar'}
+
+TALENT_TEMPLATES = {
+    'en': {
+        'account_tier': {
+            'platinum': 'Platinum account: +25 points',
+            'premium': 'Premium account: +15 points',
+            'free': 'Free account: +5 points',
+        },
+        'verification': {
+            'verified': 'Email verified: +25 points',
+            'unverified': 'Email not verified: +0 points (verify your email for +25 points)',
+        },
+        'profile_completion': {
+            'about': 'About section: +5 points',
+            'picture': 'Profile picture: +5 points',
+            'country': 'Country specified: +3 points',
+            'date_of_birth': 'Date of birth: +2 points',
+            'specialization': 'Specialization added: +10 points',
+            'none': 'Profile incomplete: +0 points (complete your profile for up to +25 points)',
+        },
+        'media_content': {
+            'excellent': 'Excellent portfolio (6+ items): +20 points',
+            'strong': 'Strong portfolio (4-5 items): +15 points',
+            'good': 'Good portfolio (2-3 items): +10 points',
+            'basic': 'Basic portfolio (1 item): +5 points',
+            'none': 'No portfolio items: +0 points (add portfolio items for up to +20 points)',
+        },
+        'specialization': {
+            'visual': 'Visual Worker',
+            'expressive': 'Expressive Worker',
+            'hybrid': 'Hybrid Worker',
+            'multi': 'Multi-specialization bonus: +5 points',
+            'summary': 'Specializations: {names} (+{points} points)',
+            'none': 'No specialization: +0 points (add a specialization for +10 points)',
+        },
+        'social_media': {
+            'strong': 'Strong social presence (4+ links): +10 points',
+            'good': 'Good social presence (2-3 links): +5 points',
+            'basic': 'Basic social presence (1 link): +2 points',
+            'none': 'No social media links: +0 points (add social links for up to +10 points)',
+        },
+        'improvement_tips': {
+            'upgrade': 'Upgrade to Premium (+10) or Platinum (+20) for more points',
+            'verify': 'Verify your email for +25 points',
+            'profile': 'Complete your profile details for up to +25 points',
+            'media': 'Add more portfolio items for up to +20 points',
+            'specialization': 'Add a specialization for +10 points',
+            'social': 'Add social media links for up to +10 points',
+        },
+    },
+    'ar': {
+        'account_tier': {
+            'platinum': 'حساب بلاتينيوم: +25 نقطة',
+            'premium': 'حساب بريميوم: +15 نقطة',
+            'free': 'حساب مجاني: +5 نقاط',
+        },
+        'verification': {
+            'verified': 'البريد الإلكتروني موثق: +25 نقطة',
+            'unverified': 'البريد الإلكتروني غير موثق: +0 نقطة (وثق بريدك الإلكتروني لـ +25 نقطة)',
+        },
+        'profile_completion': {
+            'about': 'قسم نبذة عني: +5 نقاط',
+            'picture': 'صورةr الملف الشخصي: +5 نقاط',
+            'country': 'البلد محدد: +3 نقاط',
+            'date_of_birth': 'تاريخ الميلاد: +2 نقطة',
+            'specialization': 'تم إضافة التخصص: +10 نقاط',
+            'none': 'الملف الشخصي غير مكتمل: +0 نقطة (أكمل ملفك الشخصي لـ +25 نقطة)',
+        },
+        'media_content': {
+            'excellent': 'معرض اعمال ممتاز (6+ عناصر): +20 نقطة',
+            'strong': 'معرض اعمال قوي (4-5 عناصر): +15 نقطة',
+            'good': 'معرض اعمال جيد (2-3 عناصر): +10 نقاط',
+            'basic': 'معرض اعمال أساسي (عنصر واحد): +5 نقاط',
+            'none': 'لا توجد عناصر محفظة: +0 نقطة (أضف عناصر المحفظة لـ +20 نقطة)',
+        },
+        'specialization': {
+            'visual': 'عامل بصري',
+            'expressive': 'عامل تعبيري',
+            'hybrid': 'عامل مختلط',
+            'multi': 'مكافأة التخصصات المتعددة: +5 نقاط',
+            'summary': 'التخصصات: {names} (+{points} نقطة)',
+            'none': 'لا يوجد تخصص: +0 نقطة (أضف تخصص لـ +10 نقاط)',
+        },
+        'social_media': {
+            'strong': 'وجود قوي على وسائل التواصل (4+ روابط): +10 نقاط',
+            'good': 'وجود جيد على وسائل التواصل (2-3 روابط): +5 نقاط',
+            'basic': 'وجود أساسي على وسائل التواصل (رابط واحد): +2 نقطة',
+            'none': 'لا توجد روابط وسائل التواصل: +0 نقطة (أضف روابط وسائل التواصل لـ +10 نقاط)',
+        },
+        'improvement_tips': {
+            'upgrade': 'ترقية إلى بريميوم (+10) أو بلاتينيوم (+20) للمزيد من النقاط',
+            'verify': 'وثق بريدك الإلكتروني لـ +25 نقطة',
+            'profile': 'أكمل تفاصيل ملفك الشخصي لـ +25 نقطة',
+            'media': 'أضف المزيد من عناصر المحفظة لـ +20 نقطة',
+            'specialization': 'أضف تخصص لـ +10 نقاط',
+            'social': 'أضف روابط وسائل التواصل لـ +10 نقاط',
+        },
+    },
+}
+
+BACKGROUND_TEMPLATES = {
+    'en': {
+        'account_tier': {
+            'paid': 'All accounts paid: +25 points',
+        },
+        'profile_completion': {
+            'complete': 'Profile complete: +15 points',
+            'incomplete': 'Profile incomplete: +0 points (complete your profile for +15 points)',
+        },
+        'item_diversity': {
+            'some': '{count} item types: +{points} points',
+            'none': 'No item types: +0 points (add different item types for +5 points each)',
+        },
+        'item_quantity': {
+            'large': 'Large collection (20+ items): +25 points',
+            'medium': 'Medium collection (10-20 items): +20 points',
+            'small': 'Small collection (5-10 items): +15 points',
+            'starter': 'Starter collection (1-5 items): +10 points',
+            'none': 'No items: +0 points (add items for up to +25 points)',
+        },
+        'improvement_tips': {
+            'profile': 'Complete your profile for +15 points',
+            'item_types': 'Add more item types for +5 points each',
+            'items': 'Add more items for up to +25 points',
+        },
+    },
+    # Background improvement tips are only written in English
+    'ar': {
+        'account_tier': {
+            'paid': 'جميع الحسابات مدفوعة: +25 نقطة',
+        },
+        'profile_completion': {
+            'complete': 'الملف الشخصي مكتمل: +15 نقطة',
+            'incomplete': 'الملف الشخصي غير مكتمل: +0 نقطة (أكمل ملفك الشخصي لـ +15 نقطة)',
+        },
+        'item_diversity': {
+            'some': '{count} أنواع عناصر: +{points} نقطة',
+            'none': 'لا توجد أنواع عناصر: +0 نقطة (أضف أنواع عناصر مختلفة لـ +5 نقاط لكل نوع)',
+        },
+        'item_quantity': {
+            'large': 'مجموعة كبيرة (20+ عنصر): +25 نقطة',
+            'medium': 'مجموعة متوسطة (10-20 عنصر): +20 نقطة',
+            'small': 'مجموعة صغيرة (5-10 عناصر): +15 نقطة',
+            'starter': 'مجموعة مبتدئة (1-5 عناصر): +10 نقاط',
+            'none': 'لا توجد عناصر: +0 نقطة (أضف عناصر لـ +25 نقطة)',
+        },
+    },
+}
+
+BAND_TEMPLATES = {
+    'en': {
+        'profile_completion': {
+            'complete': 'Complete band profile: +30 points',
+            'mostly': 'Mostly complete band profile: +20 points',
+            'partial': 'Partially complete band profile: +10 points',
+            'minimal': 'Minimal band profile: +0 points (complete your band profile for up to +30 points)',
+        },
+        'media_content': {
+            'maximum': 'Maximum media (6 items): +30 points',
+            'good': 'Good media (4-5 items): +20 points',
+            'basic': 'Basic media (2-3 items): +10 points',
+            'minimal': 'Minimal media (1 item): +5 points',
+            'none': 'No media: +0 points (add media for up to +30 points)',
+        },
+        'member_count': {
+            'large': 'Large band (10+ members): +30 points',
+            'medium': 'Medium band (5-9 members): +20 points',
+            'small': 'Small band (3-4 members): +10 points',
+            'minimal': 'Minimal band (1-2 members): +5 points',
+            'none': 'No members: +0 points (add members for up to +30 points)',
+        },
+        'band_details': {
+            'all': 'All members have positions: +10 points',
+            'some': 'Some members have positions: +5 points',
+            'none': 'No member positions: +0 points (add positions for up to +10 points)',
+        },
+        'improvement_tips': {
+            'profile': 'Complete your band profile for up to +30 points',
+            'media': 'Add more media for up to +30 points',
+            'members': 'Add more members for up to +30 points',
+            'positions': 'Add positions for all members for up to +10 points',
+        },
+    },
+    'ar': {
+        'profile_completion': {
+            'complete': 'ملف الفرقة مكتمل: +30 نقطة',
+            'mostly': 'ملف الفرقة مكتمل معظمه: +20 نقطة',
+            'partial': 'ملف الفرقة مكتمل جزئياً: +10 نقاط',
+            'minimal': 'ملف الفرقة ضئيل: +0 نقطة (أكمل ملف فرقتك لـ +30 نقطة)',
+        },
+        'media_content': {
+            'maximum': 'أقصى وسائط (6 عناصر): +30 نقطة',
+            'good': 'وسائط جيدة (4-5 عناصر): +20 نقطة',
+            'basic': 'وسائط أساسية (2-3 عناصر): +10 نقاط',
+            'minimal': 'وسائط ضئيلة (عنصر واحد): +5 نقاط',
+            'none': 'لا توجد وسائط: +0 نقطة (أضف وسائط لـ +30 نقطة)',
+        },
+        'member_count': {
+            'large': 'فرقة كبيرة (10+ أعضاء): +30 نقطة',
+            'medium': 'فرقة متوسطة (5-9 أعضاء): +20 نقطة',
+            'small': 'فرقة صغيرة (3-4 أعضاء): +10 نقاط',
+            'minimal': 'فرقة ضئيلة (1-2 عضو): +5 نقاط',
+            'none': 'لا يوجد أعضاء: +0 نقطة (أضف أعضاء لـ +30 نقطة)',
+        },
+        'band_details': {
+            'all': 'جميع الأعضاء لديهم مناصب: +10 نقاط',
+            'some': 'بعض الأعضاء لديهم مناصب: +5 نقاط',
+            'none': 'لا توجد مناصب للأعضاء: +0 نقطة (أضف مناصب لـ +10 نقاط)',
+        },
+        'improvement_tips': {
+            'profile': 'أكمل ملف فرقتك لـ +30 نقطة',
+            'media': 'أضف المزيد من الوسائط لـ +30 نقطة',
+            'members': 'أضف المزيد من الأعضاء لـ +30 نقطة',
+            'positions': 'أضف مناصب لجميع الأعضاء لـ +10 نقاط',
+        },
+    },
+}
+
+
+def talent_details(templates, state):
+    completion = state['profile_completion']
+    specializations = state['specialization']
+    if specializations:
+        names = [templates['specialization'][code] for code in specializations]
+        points = 15 if 'multi' in specializations else 10
+        specialization = templates['specialization']['summary'].format(names=', '.join(names), points=points)
+    else:
+        specialization = templates['specialization']['none']
+    return {
+        'account_tier': templates['account_tier'][state['account_tier']],
+        'verification': templates['verification'][state['verification']],
+        'profile_completion': (
+            '; '.join(templates['profile_completion'][code] for code in completion)
+            if completion else templates['profile_completion']['none']
+        ),
+        'media_content': templates['media_content'][state['media_content']],
+        'specialization': specialization,
+        'social_media': templates['social_media'][state['social_media']],
+    }
+
+
+def background_details(templates, state):
+    item_type_count = state['item_diversity']
+    return {
+        'account_tier': templates['account_tier'][state['account_tier']],
+        'profile_completion': templates['profile_completion'][state['profile_completion']],
+        'item_diversity': (
+            templates['item_diversity']['some'].format(count=item_type_count, points=item_type_count * 5)
+            if item_type_count else templates['item_diversity']['none']
+        ),
+        'item_quantity': templates['item_quantity'][state['item_quantity']],
+    }
+
+
+def band_details(templates, state):
+    return {
+        component: templates[component][state[component]]
+        for component in ('profile_completion', 'media_content', 'member_count', 'band_details')
+    }
+
+
+EXPLAINERS = {
+    'talent': (TALENT_TEMPLATES, talent_details),
+    'background': (BACKGROUND_TEMPLATES, background_details),
+    'band': (BAND_TEMPLATES, band_details),
+}
+
+
+@lru_cache(maxsize=4096)
+def render_explanation(entity_type, state_key, language):
+    """(details, improvement tips or None) for a serialized score state; cached"""
+    templates, details = EXPLAINERS[entity_type]
+    templates = templates[language]
+    state = json.loads(state_key)
+    tips = state.get('improvement_tips')
+    if tips is not None:
+        tip_templates = templates.get('improvement_tips')
+        tips = tuple(tip_templates[code] for code in tips) if tip_templates else None
+    return details(templates, state), tips
+
+
+def explain_score(entity_type, state, language='en'):
+    """
+    {'details': {...}, 'improvement_tips': [...]} for a score state in one
+    language; 'improvement_tips' is only present when the score has tips.
+    """
+    state_key = json.dumps(state, sort_keys=True, separators=(',', ':'))
+    details, tips = render_explanation(entity_type, state_key, language)
+    explanation = {'details': dict(details)}
+    if tips is not None:
+        explanation['improvement_tips'] = list(tips)
+    return explanation
+
+
+def add_explanation(score_breakdown, entity_type, languages=EXPLANATION_LANGUAGES):
+    """
+    Add details/details_ar and improvement_tips/improvement_tips_ar to a score
+    breakdown, rendered from its state. Breakdowns stored before scores carried
+    a state already include their explanation and are returned unchanged.
+    """
+    state = score_breakdown.get('state')
+    if state is None:
+        return score_breakdown
+    for language in languages:
+        suffix = LANGUAGE_SUFFIXES[language]
+        explanation = explain_score(entity_type, state, language)
+        score_breakdown[f'details{suffix}'] = explanation['details']
+        if 'improvement_tips' in explanation:
+            score_breakdown[f'improvement_tips{suffix}'] = explanation['improvement_tips']
+    return score_breakdown
@@ -114,6 +114,8 @@ INSTALLED_APPS = [
 
     
 MIDDLEWARE = [
+    'dashboard.metrics.RequestMetricsMiddleware',
+    'dashboard.query_budget.QueryBudgetMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -351,7 +353,7 @@ X_FRAME_OPTIONS = 'DENY'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.auth_cache.CachedJWTAuthentication',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
@@ -477,19 +479,116 @@ logs_dir = BASE_DIR / 'logs'
 logs_dir.mkdir(exist_ok=True)
 
 # Cache Configuration
+# REDIS_CACHE_URL switches the default cache from per-process memory to a Redis
+# cache shared by all workers. 'hot' keeps a small per-process LRU in front of
+# it for hot, rarely-changing keys (dashboard.cache_backends.TwoTierCache);
+# writes are broadcast to the other workers over CACHE_INVALIDATION_URL
+# (REDIS_CACHE_URL by default), otherwise local copies live at most
+# HOT_CACHE_LOCAL_TIMEOUT seconds
+REDIS_CACHE_URL = os.getenv('REDIS_CACHE_URL', '')
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'BACKEND': 'dashboard.cache_backends.InstrumentedRedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+    } if REDIS_CACHE_URL else {
+        'BACKEND': 'dashboard.cache_backends.InstrumentedLocMemCache',
         'LOCATION': 'unique-snowflake',
-    }
+    },
+    'hot': {
+        'BACKEND': 'dashboard.cache_backends.TwoTierCache',
+        'LOCATION': 'hot',
+        'OPTIONS': {
+            'SHARED_CACHE': 'default',
+            'LOCAL_MAX_ENTRIES': int(os.getenv('HOT_CACHE_MAX_ENTRIES', 1000)),
+            'LOCAL_TIMEOUT': int(os.getenv('HOT_CACHE_LOCAL_TIMEOUT', 5)),
+            'INVALIDATION_URL': os.getenv('CACHE_INVALIDATION_URL', REDIS_CACHE_URL),
+        },
+    },
 }
 
 # Session Configuration
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Sessions are read from the cache, falling back to (and written through to) the database
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Authenticated users (sessions and JWTs) are cached for AUTH_USER_CACHE_TIMEOUT
+# seconds and dropped when saved (users.auth_cache); ModelBackend stays listed
+# so sessions created before CachedModelBackend keep working
+AUTH_USER_CACHE_ENABLED = os.getenv('AUTH_USER_CACHE_ENABLED', 'True').lower() == 'true'
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', 300))
+AUTHENTICATION_BACKENDS = [
+    'users.auth_cache.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
 
 # Performance optimizations
 CONN_MAX_AGE = 60  # Database connection pooling
 
+# Dashboard search reads the denormalized SearchDocument table when enabled
+# (populate it first with `python manage.py rebuild_search_documents`)
+SEARCH_DOCUMENTS_ENABLED = os.getenv('SEARCH_DOCUMENTS_ENABLED', 'False').lower() == 'true'
+
+# Free-text dashboard search (?q=) considers only the best N full-text matches
+FULLTEXT_MAX_RESULTS = int(os.getenv('FULLTEXT_MAX_RESULTS', 200))
+
+# City/country/location search also matches misspellings by trigram similarity
+# (pg_trgm on PostgreSQL, the LocationTrigram side table elsewhere)
+FUZZY_LOCATION_MATCHING = os.getenv('FUZZY_LOCATION_MATCHING', 'True').lower() == 'true'
+FUZZY_LOCATION_THRESHOLD = float(os.getenv('FUZZY_LOCATION_THRESHOLD', 0.3))
+
+# Ordered search result ids are cached per query (invalidated by model signals);
+# result sets larger than SEARCH_RESULT_CACHE_MAX_IDS are not cached
+SEARCH_RESULT_CACHE_ENABLED = os.getenv('SEARCH_RESULT_CACHE_ENABLED', 'True').lower() == 'true'
+SEARCH_RESULT_CACHE_MAX_IDS = int(os.getenv('SEARCH_RESULT_CACHE_MAX_IDS', 1000))
+
+# Multi-type search (profile_type=all or a comma-separated list): types are
+# searched concurrently in one pool of SEARCH_FANOUT_MAX_WORKERS threads per
+# process, shared by all requests; types slower than SEARCH_FANOUT_TIMEOUT
+# seconds (timed from when each starts running) are left out of the response.
+# SEARCH_FANOUT_MAX_WORKERS=1 searches sequentially, with the same limit.
+SEARCH_FANOUT_MAX_WORKERS = int(os.getenv('SEARCH_FANOUT_MAX_WORKERS', 4))
+SEARCH_FANOUT_TIMEOUT = float(os.getenv('SEARCH_FANOUT_TIMEOUT', 5))
+SEARCH_FANOUT_PER_TYPE = int(os.getenv('SEARCH_FANOUT_PER_TYPE', 5))
+SEARCH_FANOUT_MAX_PER_TYPE = int(os.getenv('SEARCH_FANOUT_MAX_PER_TYPE', 20))
+
+# Rows fetched per database round trip when streaming search exports
+SEARCH_EXPORT_CHUNK_SIZE = int(os.getenv('SEARCH_EXPORT_CHUNK_SIZE', 2000))
+
+# Per-request query budgets (dashboard.query_budget.QueryBudgetMiddleware):
+# requests running more than their view's `query_budget` (else
+# QUERY_BUDGET_DEFAULT) queries, or one query shape more than
+# QUERY_BUDGET_MAX_REPEATS times (an N+1 loop), are logged with the code
+# locations that issued them; QUERY_BUDGET_STRICT raises instead (tests)
+QUERY_BUDGET_ENABLED = os.getenv('QUERY_BUDGET_ENABLED', 'False').lower() == 'true'
+QUERY_BUDGET_STRICT = os.getenv('QUERY_BUDGET_STRICT', 'False').lower() == 'true'
+QUERY_BUDGET_DEFAULT = int(os.getenv('QUERY_BUDGET_DEFAULT', 50))
+QUERY_BUDGET_MAX_REPEATS = int(os.getenv('QUERY_BUDGET_MAX_REPEATS', 10))
+
+# Per-endpoint request metrics (dashboard.metrics.RequestMetricsMiddleware):
+# wall/DB/serializer time, query count and cache hits per URL name, summed in
+# the METRICS_CACHE cache per METRICS_WINDOW_SECONDS window; the last
+# METRICS_WINDOWS windows are reported at /api/dashboard/metrics/. On by
+# default only with Redis or an explicit METRICS_CACHE: counters in a
+# per-process cache aren't shared, and a database cache would add a query per
+# counter to every request
+METRICS_ENABLED = os.getenv(
+    'METRICS_ENABLED', str(bool(REDIS_CACHE_URL or os.getenv('METRICS_CACHE')))
+).lower() == 'true'
+METRICS_CACHE = os.getenv('METRICS_CACHE', 'default')
+METRICS_WINDOW_SECONDS = int(os.getenv('METRICS_WINDOW_SECONDS', 60))
+METRICS_WINDOWS = int(os.getenv('METRICS_WINDOWS', 15))
+
+# Stampede protection for dashboard.utils.cached_compute: values are fresh for
+# their timeout +/- CACHE_TTL_JITTER (a fraction), then served stale for
+# CACHE_STALE_FACTOR timeouts more while one worker, holding a lock for at most
+# CACHE_LOCK_TIMEOUT seconds, recomputes them (in a background thread with
+# CACHE_BACKGROUND_REFRESH); on a miss, other workers wait up to
+# CACHE_LOCK_WAIT seconds for its result
+CACHE_TTL_JITTER = float(os.getenv('CACHE_TTL_JITTER', 0.1))
+CACHE_STALE_FACTOR = float(os.getenv('CACHE_STALE_FACTOR', 1.0))
+CACHE_LOCK_TIMEOUT = int(os.getenv('CACHE_LOCK_TIMEOUT', 30))
+CACHE_LOCK_WAIT = float(os.getenv('CACHE_LOCK_WAIT', 2.0))
+CACHE_BACKGROUND_REFRESH = os.getenv('CACHE_BACKGROUND_REFRESH', 'True').lower() == 'true'
+
 # Celery Configuration (optional)
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
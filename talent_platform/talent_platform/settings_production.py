@@ -212,22 +212,36 @@ import os
 logs_dir = '/var/www/gan7club/logs'
 os.makedirs(logs_dir, exist_ok=True)
 
-# Cache Configuration (Database-based for production)
+# Cache Configuration (Database-based for production unless REDIS_CACHE_URL is set)
+# 'hot' is the per-process tier in front of it (see settings.py)
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'BACKEND': 'dashboard.cache_backends.InstrumentedRedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+    } if REDIS_CACHE_URL else {
+        'BACKEND': 'dashboard.cache_backends.InstrumentedDatabaseCache',
         'LOCATION': 'django_cache',
-    }
+    },
+    'hot': {
+        'BACKEND': 'dashboard.cache_backends.TwoTierCache',
+        'LOCATION': 'hot',
+        'OPTIONS': {
+            'SHARED_CACHE': 'default',
+            'LOCAL_MAX_ENTRIES': int(os.getenv('HOT_CACHE_MAX_ENTRIES', 1000)),
+            'LOCAL_TIMEOUT': int(os.getenv('HOT_CACHE_LOCAL_TIMEOUT', 5)),
+            'INVALIDATION_URL': os.getenv('CACHE_INVALIDATION_URL', REDIS_CACHE_URL),
+        },
+    },
 }
 
-# Session Configuration (Database-based)
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Session Configuration (cached, written through to the database)
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
 
 # Rate Limiting (more restrictive for production)
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.auth_cache.CachedJWTAuthentication',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
@@ -0,0 +1,101 @@
+"""
+Cached authenticated users.
+
+The user behind a session or JWT (with its role flags: is_talent,
+is_background, is_dashboard, is_dashboard_admin) is loaded once and then read
+from the cache for AUTH_USER_CACHE_TIMEOUT seconds. Keys embed the user's
+cache generation (dashboard.utils.user_scope), which every save or delete of
+the user bumps, so a changed user is reloaded on the next request. With
+cached_db sessions, most authenticated requests then run no auth queries.
+
+Used by CachedJWTAuthentication (REST framework) and CachedModelBackend
+(sessions, see AUTHENTICATION_BACKENDS).
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+def auth_user_cache_key(user_id):
+    from dashboard.utils import get_generations, user_scope
+    generation, = get_generations([user_scope(user_id)])
+    return f"auth_user:{user_id}:{generation}"
+
+
+def get_cached_user(user_id):
+    """The active or inactive user with this id, or None when there is none"""
+    user_model = get_user_model()
+    if not settings.AUTH_USER_CACHE_ENABLED:
+        return user_model._default_manager.filter(pk=user_id).first()
+
+    key = auth_user_cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = user_model._default_manager.filter(pk=user_id).first()
+        if user is not None:
+            cache.set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+
+def invalidate_cached_user(user_id):
+    from dashboard.utils import invalidate_scope, user_scope
+    invalidate_scope(user_scope(user_id))
+
+
+def invalidate_user_on_change(sender, instance, raw=False, **kwargs):
+    """
+    Drop the cached user when it is saved or deleted; again on commit, so a
+    copy cached by a request racing the transaction doesn't outlive it
+    """
+    if raw or instance.pk is None:
+        return
+    user_id = instance.pk
+    invalidate_cached_user(user_id)
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
+
+
+def connect_signals():
+    user_model = get_user_model()
+    post_save.connect(invalidate_user_on_change, sender=user_model, dispatch_uid='auth_cache_user_saved')
+    post_delete.connect(invalidate_user_on_change, sender=user_model, dispatch_uid='auth_cache_user_deleted')
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication reading the token's user through get_cached_user"""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend loading the session's user through get_cached_user"""
+
+    def get_user(self, user_id):
+        user = get_cached_user(user_id)
+        if user is not None and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,44 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.auth_cache import get_cached_user
+from users.models import BaseUser
+
+
+class AuthUserCacheTest(TestCase):
+    url = '/api/dashboard/metrics/'
+
+    def setUp(self):
+        cache.clear()
+        self.user = BaseUser.objects.create(
+            email='admin@example.com', first_name='a', last_name='b', is_dashboard=True, is_dashboard_admin=True
+        )
+        self.client = APIClient()
+
+    def test_jwt_requests_run_no_auth_queries(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_session_requests_run_no_auth_queries(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_saving_the_user_invalidates(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.user.is_dashboard_admin = False
+        self.user.save()
+        self.assertFalse(get_cached_user(self.user.id).is_dashboard_admin)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_deleted_user(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.user.delete()
+        self.assertEqual(self.client.get(self.url).data['code'], 'user_not_found')